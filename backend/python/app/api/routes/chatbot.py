@@ -1,9 +1,8 @@
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, AsyncGenerator, Dict, List, Optional, Tuple
 
 from dependency_injector.wiring import inject
 from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import JSONResponse, StreamingResponse
-from jinja2 import Template
 from pydantic import BaseModel
 
 from app.config.configuration_service import ConfigurationService
@@ -11,8 +10,9 @@ from app.config.utils.named_constants.arangodb_constants import (
     AccountType,
     CollectionNames,
 )
-from app.modules.qna.prompt_templates import qna_prompt
-from app.modules.reranker.reranker import RerankerService
+from app.core.answer_cache import AnswerCache, BucketKey
+from app.modules.qna.context_builder import estimate_tokens, render_qna_prompt
+from app.modules.reranker.reranker import RerankCascade, RerankerService
 from app.modules.retrieval.retrieval_arango import ArangoService
 from app.modules.retrieval.retrieval_service import RetrievalService
 from app.setups.query_setup import AppContainer
@@ -21,12 +21,16 @@ from app.utils.query_decompose import QueryDecompositionExpansionService
 from app.utils.query_transform import (
     setup_followup_query_transformation,
 )
-from app.utils.streaming import create_sse_event, stream_llm_response
+from app.utils.streaming import create_sse_event, replay_answer, stream_llm_response
 from app.utils.aircraft_normalizer import normalize_aircraft
 import time
 
 router = APIRouter()
 
+# Rerank cascade of each route, see RerankCascade.from_env
+CHAT_RERANK_CASCADE = RerankCascade.from_env("chat")
+CHAT_STREAM_RERANK_CASCADE = RerankCascade.from_env("chat_stream")
+
 
 # Pydantic models
 class ChatQuery(BaseModel):
@@ -62,6 +66,47 @@ async def get_reranker_service(request: Request) -> RerankerService:
     return reranker_service
 
 
+async def get_answer_cache(request: Request) -> AnswerCache:
+    container: AppContainer = request.app.container
+    answer_cache = await container.answer_cache()
+    return answer_cache
+
+
+async def get_answer_cache_key(
+    answer_cache: AnswerCache,
+    retrieval_service: RetrievalService,
+    arango_service: ArangoService,
+    query_info: ChatQuery,
+    org_id: str,
+    user_id: str,
+    aircraft_canonical: Optional[str],
+    send_user_info: Any,
+    bypass_cache: bool,
+    client: str,
+    strict_scope: bool,
+) -> Tuple[Optional[BucketKey], Optional[List[float]]]:
+    """Answer cache bucket and question embedding, (None, None) when not cacheable"""
+    # Follow-up answers depend on the conversation, not only on the question
+    if not answer_cache.enabled or bypass_cache or query_info.previousConversations:
+        return None, None
+    scope = await retrieval_service.get_accessible_scope(
+        user_id, org_id, query_info.filters, arango_service
+    )
+    if scope is None:
+        return None, None
+    embedding, model_name = await retrieval_service.embed_question(query_info.query)
+    # With user info the prompt carries the asker's name, role and org, so
+    # those answers are only served back to the same user
+    asker = user_id if send_user_info else ""
+    # Client and strict scoping change retrieval for the same aircraft
+    mode = (
+        f"quick={query_info.quickMode}:limit={query_info.limit}:user={asker}"
+        f":client={client}:strict={strict_scope}"
+    )
+    bucket = answer_cache.bucket_key(org_id, scope, aircraft_canonical, model_name, mode)
+    return bucket, embedding
+
+
 
 
 @router.post("/chat/stream")
@@ -71,6 +116,7 @@ async def askAIStream(
     retrieval_service: RetrievalService = Depends(get_retrieval_service),
     arango_service: ArangoService = Depends(get_arango_service),
     reranker_service: RerankerService = Depends(get_reranker_service),
+    answer_cache: AnswerCache = Depends(get_answer_cache),
 ) -> StreamingResponse:
     """Perform semantic search across documents with streaming events"""
     query_info = ChatQuery(**(await request.json()))
@@ -110,12 +156,10 @@ async def askAIStream(
 
                 yield create_sse_event("query_transformed", {"original_query": query_info.query, "transformed_query": followup_query})
 
-            # Query decomposition
-            yield create_sse_event("status", {"status": "decomposing", "message": "Decomposing query..."})
-
             # Aircraft scoping headers and behavior (stream)
             client = (request.headers.get("x-client") or "generic_rag").lower()
             strict_scope = (request.headers.get("x-strict-scope", "").lower() in ("1", "true", "yes"))
+            bypass_cache = (request.headers.get("x-bypass-cache", "").lower() in ("1", "true", "yes"))
 
             aircraft_input = request.headers.get("x-aircraft")
             try:
@@ -134,6 +178,27 @@ async def askAIStream(
                 if canonical_candidate != "unknown":
                     aircraft_canonical = canonical_candidate
 
+            org_id = request.state.user.get('orgId')
+            user_id = request.state.user.get('userId')
+            send_user_info = request.query_params.get('sendUserInfo', True)
+
+            # Repeated questions are answered from the cache, skipping the LLM
+            cache_bucket, question_embedding = await get_answer_cache_key(
+                answer_cache, retrieval_service, arango_service, query_info,
+                org_id, user_id, aircraft_canonical, send_user_info, bypass_cache,
+                client, strict_scope,
+            )
+            if cache_bucket:
+                cached_answer = await answer_cache.lookup(cache_bucket, question_embedding)
+                if cached_answer is not None:
+                    yield create_sse_event("status", {"status": "cache_hit", "message": "Answering from a previous answer..."})
+                    async for stream_event in replay_answer(cached_answer):
+                        yield create_sse_event(stream_event["event"], stream_event["data"])
+                    return
+
+            # Query decomposition
+            yield create_sse_event("status", {"status": "decomposing", "message": "Decomposing query..."})
+
             decomposed_queries = []
 
             if not query_info.quickMode:
@@ -148,11 +213,6 @@ async def askAIStream(
 
             yield create_sse_event("query_decomposed", {"queries": all_queries})
 
-            # Execute all query processing in parallel
-            org_id = request.state.user.get('orgId')
-            user_id = request.state.user.get('userId')
-            send_user_info = request.query_params.get('sendUserInfo', True)
-
             # Process queries and yield status updates
             yield create_sse_event("status", {"status": "parallel_processing", "message": f"Processing {len(all_queries)} queries in parallel..."})
 
@@ -170,6 +230,7 @@ async def askAIStream(
                 filter_groups=query_info.filters,
                 aircraft_canonical=aircraft_canonical,
                 arango_service=arango_service,
+                bypass_cache=bypass_cache,
             )
             latency = time.monotonic() - start_ts
             candidates = len(result.get("searchResults", []) or [])
@@ -214,6 +275,7 @@ async def askAIStream(
                     query=query_info.query,
                     documents=flattened_results,
                     top_k=query_info.limit,
+                    cascade=CHAT_STREAM_RERANK_CASCADE,
                 )
             else:
                 final_results = flattened_results
@@ -246,13 +308,9 @@ async def askAIStream(
             else:
                 user_data = ""
 
-            # Prepare prompt
-            template = Template(qna_prompt)
-            rendered_form = template.render(
-                user_data=user_data,
-                query=query_info.query,
-                rephrased_queries=[],
-                chunks=final_results,
+            # Prepare prompt; citations refer to the chunks that fit in it
+            rendered_form, final_results = render_qna_prompt(
+                user_data, query_info.query, final_results
             )
 
             # Check if using Gemini model and adjust message format
@@ -283,6 +341,16 @@ async def askAIStream(
                 event_data = stream_event["data"]
                 yield create_sse_event(event_type, event_data)
 
+                # Only cited answers can be invalidated when their records change
+                if cache_bucket and event_type == "complete" and event_data.get("citations"):
+                    await answer_cache.store(
+                        cache_bucket,
+                        question_embedding,
+                        query_info.query,
+                        event_data,
+                        llm_tokens=estimate_tokens(rendered_form) + estimate_tokens(event_data["answer"]),
+                    )
+
         except Exception as e:
             logger.error(f"Error in streaming AI: {str(e)}", exc_info=True)
             yield create_sse_event("error", {"error": str(e)})
@@ -307,6 +375,7 @@ async def askAI(
     retrieval_service: RetrievalService = Depends(get_retrieval_service),
     arango_service: ArangoService = Depends(get_arango_service),
     reranker_service: RerankerService = Depends(get_reranker_service),
+    answer_cache: AnswerCache = Depends(get_answer_cache),
 ) -> JSONResponse:
     """Perform semantic search across documents"""
     try:
@@ -340,22 +409,6 @@ async def askAI(
 
         logger.debug(f"query_info.query {query_info.query}")
 
-        decomposed_queries = []
-        if not query_info.quickMode:
-            decomposition_service = QueryDecompositionExpansionService(llm, logger=logger)
-            decomposition_result = await decomposition_service.transform_query(
-                query_info.query
-            )
-            decomposed_queries = decomposition_result["queries"]
-
-        logger.debug(f"decomposed_queries {decomposed_queries}")
-        if not decomposed_queries:
-            all_queries = [query_info.query]
-        else:
-            all_queries = [query.get("query") for query in decomposed_queries]
-
-
-        # Execute all query processing in parallel
         org_id = request.state.user.get('orgId')
         user_id = request.state.user.get('userId')
         send_user_info = request.query_params.get('sendUserInfo', True)
@@ -363,6 +416,7 @@ async def askAI(
         # Aircraft scoping headers and behavior (non-stream)
         client = (request.headers.get("x-client") or "generic_rag").lower()
         strict_scope = (request.headers.get("x-strict-scope", "").lower() in ("1", "true", "yes"))
+        bypass_cache = (request.headers.get("x-bypass-cache", "").lower() in ("1", "true", "yes"))
 
         aircraft_input = request.headers.get("x-aircraft")
         try:
@@ -380,6 +434,32 @@ async def askAI(
             if canonical_candidate != "unknown":
                 aircraft_canonical = canonical_candidate
 
+        # Repeated questions are answered from the cache, skipping the LLM
+        cache_bucket, question_embedding = await get_answer_cache_key(
+            answer_cache, retrieval_service, arango_service, query_info,
+            org_id, user_id, aircraft_canonical, send_user_info, bypass_cache,
+            client, strict_scope,
+        )
+        if cache_bucket:
+            cached_answer = await answer_cache.lookup(cache_bucket, question_embedding)
+            if cached_answer is not None:
+                return cached_answer
+
+        decomposed_queries = []
+        if not query_info.quickMode:
+            decomposition_service = QueryDecompositionExpansionService(llm, logger=logger)
+            decomposition_result = await decomposition_service.transform_query(
+                query_info.query
+            )
+            decomposed_queries = decomposition_result["queries"]
+
+        logger.debug(f"decomposed_queries {decomposed_queries}")
+        if not decomposed_queries:
+            all_queries = [query_info.query]
+        else:
+            all_queries = [query.get("query") for query in decomposed_queries]
+
+
         start_ts = time.monotonic()
         result = await retrieval_service.search_with_filters(
             queries=all_queries,
@@ -389,6 +469,7 @@ async def askAI(
             filter_groups=query_info.filters,
             aircraft_canonical=aircraft_canonical,
             arango_service=arango_service,
+            bypass_cache=bypass_cache,
         )
         latency = time.monotonic() - start_ts
         candidates = len(result.get("searchResults", []) or [])
@@ -427,6 +508,7 @@ async def askAI(
                 query=query_info.query,  # Use original query for final ranking
                 documents=flattened_results,
                 top_k=query_info.limit,
+                cascade=CHAT_RERANK_CASCADE,
             )
         else:
             final_results = flattened_results
@@ -460,12 +542,9 @@ async def askAI(
         else:
             user_data = ""
 
-        template = Template(qna_prompt)
-        rendered_form = template.render(
-            user_data=user_data,
-            query=query_info.query,
-            rephrased_queries=[],  # This keeps all query results for reference
-            chunks=final_results,
+        # Citations refer to the chunks that fit in the prompt
+        rendered_form, final_results = render_qna_prompt(
+            user_data, query_info.query, final_results
         )
 
         # Check if using Gemini model and adjust message format
@@ -498,7 +577,18 @@ async def askAI(
         # Make async LLM call
         response = await llm.ainvoke(messages)
         # Process citations and return response
-        return process_citations(response, final_results)
+        answer = process_citations(response, final_results)
+
+        # Only cited answers can be invalidated when their records change
+        if cache_bucket and "error" not in answer and answer.get("citations"):
+            await answer_cache.store(
+                cache_bucket,
+                question_embedding,
+                query_info.query,
+                answer,
+                llm_tokens=estimate_tokens(rendered_form) + estimate_tokens(answer["answer"]),
+            )
+        return answer
 
     except HTTPException as he:
         # Re-raise HTTP exceptions with their original status codes
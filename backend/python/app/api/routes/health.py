@@ -302,6 +302,27 @@ async def aircraft_index_health(
             },
         )
 
+@router.get("/cache-stats")
+async def cache_stats(
+    request: Request,
+    retrieval_service: RetrievalService = Depends(get_retrieval_service),
+) -> JSONResponse:
+    """Hit/miss counters of the query service caches"""
+    accessible_records_cache = retrieval_service.accessible_records_cache
+    embedding_cache = retrieval_service.embedding_cache
+    answer_cache = await request.app.container.answer_cache()
+    return JSONResponse(
+        status_code=200,
+        content={
+            "accessibleRecords": (
+                accessible_records_cache.stats() if accessible_records_cache else None
+            ),
+            "queryEmbeddings": embedding_cache.stats() if embedding_cache else None,
+            "answers": answer_cache.stats(),
+            "timestamp": get_epoch_timestamp_in_ms(),
+        },
+    )
+
 @router.post("/embedding-health-check")
 async def embedding_health_check(request: Request, embedding_configs: list[dict] = Body(...)) -> JSONResponse:
     """Health check endpoint to validate embedding configurations."""
@@ -315,8 +336,9 @@ async def embedding_health_check(request: Request, embedding_configs: list[dict]
         # Check collection info and handle model changes
         await check_collection_info(retrieval_service, dense_embeddings, embedding_size, logger)
 
-        # Initialize vector store as None
+        # Rebuild the model and vector store on the next search
         retrieval_service.vector_store = None
+        retrieval_service.model_registry.invalidate()
 
         logger.info("Embedding health check completed successfully")
 
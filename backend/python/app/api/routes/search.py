@@ -78,6 +78,7 @@ async def search(
         # Aircraft scoping headers and behavior
         client = (request.headers.get("x-client") or "generic_rag").lower()
         strict_scope = (request.headers.get("x-strict-scope", "").lower() in ("1", "true", "yes"))
+        bypass_cache = (request.headers.get("x-bypass-cache", "").lower() in ("1", "true", "yes"))
 
         # Prefer header x-aircraft; fallback to body.filters.aircraft[0] if present
         aircraft_input = request.headers.get("x-aircraft")
@@ -125,6 +126,7 @@ async def search(
             filter_groups=body.filters,
             aircraft_canonical=aircraft_canonical,
             arango_service=arango_service,
+            bypass_cache=bypass_cache,
         )
         latency = time.monotonic() - start_ts
         candidate_count = len((results or {}).get("searchResults", []) or [])
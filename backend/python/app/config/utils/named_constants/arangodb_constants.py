@@ -89,6 +89,8 @@ class EventTypes(Enum):
     DELETE_RECORD = "deleteRecord"
     REINDEX_RECORD = "reindexRecord"
     REINDEX_FAILED = "reindexFailed"
+    # Record permissions changed without a content change
+    UPDATE_PERMISSIONS = "updatePermissions"
 
 
 class CollectionNames(Enum):
@@ -156,6 +158,12 @@ class QdrantCollectionNames(Enum):
     RECORDS = "records"
 
 
+class QdrantPayloadFields(Enum):
+    # Arango _ids (users/..., groups/..., organizations/..., knowledgeBase/...,
+    # anyone/<orgId>) that are granted access to a point's record
+    PERMISSION_PRINCIPALS = "permission_principals"
+
+
 class ExtensionTypes(Enum):
     PDF = "pdf"
     DOCX = "docx"
@@ -10,6 +10,7 @@ from app.config.utils.named_constants.arangodb_constants import (
     CollectionNames,
     AircraftNames,
 )
+from app.core.arango_executor import get_arango_executor
 from app.schema.arango.documents import (
     app_schema,
     aircraft_schema,
@@ -83,6 +84,8 @@ class BaseArangoService:
         self.config_service = config
         self.client = arango_client
         self.db = None
+        # AQL calls are offloaded so they never block the event loop
+        self.executor = get_arango_executor()
 
         # Initialize collections dictionary
         self._collections = {
@@ -109,8 +112,12 @@ class BaseArangoService:
 
             # Connect to system db to ensure our db exists
             self.logger.debug("Connecting to system db")
-            sys_db = self.client.db(
-                "_system", username=arango_user, password=arango_password, verify=True
+            sys_db = await self.executor.run(
+                self.client.db,
+                "_system",
+                username=arango_user,
+                password=arango_password,
+                verify=True,
             )
             self.logger.debug("System DB: %s", sys_db)
 
@@ -133,8 +140,12 @@ class BaseArangoService:
 
             # Connect to our database
             self.logger.debug("Connecting to our database")
-            self.db = self.client.db(
-                arango_db, username=arango_user, password=arango_password, verify=True
+            self.db = await self.executor.run(
+                self.client.db,
+                arango_db,
+                username=arango_user,
+                password=arango_password,
+                verify=True,
             )
             self.logger.debug("Our DB: %s", self.db)
 
@@ -324,7 +335,9 @@ class BaseArangoService:
         """Get all aircraft for an organization"""
         try:
             # For now, return all aircraft. Later this could be org-specific
-            aircraft_docs = list(self._collections[CollectionNames.AIRCRAFT.value].all())
+            aircraft_docs = await self.executor.run(
+                lambda: list(self._collections[CollectionNames.AIRCRAFT.value].all())
+            )
             return [doc["aircraftName"] for doc in aircraft_docs]
         except Exception as e:
             self.logger.error(f"❌ Error getting aircraft for org {org_id}: {str(e)}")
@@ -351,8 +364,7 @@ class BaseArangoService:
             FILTER app.isActive == true
             RETURN app
             """
-            cursor = self.db.aql.execute(query)
-            return list(cursor)
+            return await self.executor.execute(self.db, query)
         except Exception as e:
             self.logger.error(f"Failed to get org apps: {str(e)}")
             raise
@@ -366,8 +378,7 @@ class BaseArangoService:
                 {CollectionNames.USER_APP_RELATION.value}
             RETURN app
             """
-            cursor = self.db.aql.execute(query)
-            return list(cursor)
+            return await self.executor.execute(self.db, query)
         except Exception as e:
             self.logger.error(f"Failed to get user apps: {str(e)}")
             raise
@@ -383,8 +394,7 @@ class BaseArangoService:
 
             bind_vars = {"active": active}
 
-            cursor = self.db.aql.execute(query, bind_vars=bind_vars)
-            return list(cursor)
+            return await self.executor.execute(self.db, query, bind_vars=bind_vars)
         except Exception as e:
             self.logger.error(f"Failed to get organizations: {str(e)}")
             raise
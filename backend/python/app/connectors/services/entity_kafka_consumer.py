@@ -22,7 +22,13 @@ from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
 class EntityKafkaRouteConsumer:
     def __init__(
-        self, logger, config_service, arango_service, routes=[], app_container=None
+        self,
+        logger,
+        config_service,
+        arango_service,
+        routes=[],
+        app_container=None,
+        cache_invalidator=None,
     ) -> None:
         self.logger = logger
         self.producer = None
@@ -33,6 +39,8 @@ class EntityKafkaRouteConsumer:
         self.routes = routes
         self.processed_messages: Dict[str, List[int]] = {}
         self.app_container = app_container  # Store the app container reference
+        # Invalidates cached accessible records in the query service
+        self.cache_invalidator = cache_invalidator
         self.route_mapping = {
             "entity-events": {
                 "orgCreated": self.handle_org_created,
@@ -244,6 +252,17 @@ class EntityKafkaRouteConsumer:
 
         return await handler(value["payload"])
 
+    async def _invalidate_accessible_records(
+        self, org_id: str, user_id: str = None
+    ) -> None:
+        """Drop cached accessible records for a user, or the whole org"""
+        if not self.cache_invalidator:
+            return
+        if user_id:
+            await self.cache_invalidator.invalidate_user(org_id, user_id)
+        else:
+            await self.cache_invalidator.invalidate_org(org_id)
+
     async def _get_or_create_knowledge_base(self, user_key: str, userId: str, orgId: str, name: str = "Default") -> dict:
         """Get or create a knowledge base for a user"""
         try:
@@ -409,6 +428,7 @@ class EntityKafkaRouteConsumer:
             await self.arango_service.batch_upsert_nodes(
                 [org_data], CollectionNames.ORGS.value
             )
+            await self._invalidate_accessible_records(payload["orgId"])
             self.logger.info(
                 f"✅ Successfully soft-deleted organization: {payload['orgId']}"
             )
@@ -502,6 +522,9 @@ class EntityKafkaRouteConsumer:
                         value={"email": payload["email"]},
                     )
 
+            await self._invalidate_accessible_records(
+                payload["orgId"], payload["userId"]
+            )
             self.logger.info(
                 f"✅ Successfully created/updated user: {payload['email']}"
             )
@@ -559,6 +582,9 @@ class EntityKafkaRouteConsumer:
             await self.arango_service.batch_upsert_nodes(
                 [user_data], CollectionNames.USERS.value
             )
+            await self._invalidate_accessible_records(
+                payload["orgId"], payload["userId"]
+            )
             self.logger.info(f"✅ Successfully updated user: {payload['email']}")
             return True
 
@@ -590,6 +616,9 @@ class EntityKafkaRouteConsumer:
             await self.arango_service.batch_upsert_nodes(
                 [user_data], CollectionNames.USERS.value
             )
+            await self._invalidate_accessible_records(
+                payload["orgId"], payload.get("userId")
+            )
             self.logger.info(f"✅ Successfully soft-deleted user: {payload['email']}")
             return True
 
@@ -751,6 +780,7 @@ class EntityKafkaRouteConsumer:
                                 )
                                 await asyncio.sleep(5)
 
+            await self._invalidate_accessible_records(org_id)
             self.logger.info(f"✅ Successfully enabled apps for org: {org_id}")
             return True
 
@@ -790,6 +820,7 @@ class EntityKafkaRouteConsumer:
                 app_updates, CollectionNames.APPS.value
             )
 
+            await self._invalidate_accessible_records(org_id)
             self.logger.info(f"✅ Successfully disabled apps for org: {org_id}")
             return True
 
@@ -13,10 +13,14 @@ from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
 
 class GmailChangeHandler:
-    def __init__(self, config_service, arango_service, logger) -> None:
+    def __init__(
+        self, config_service, arango_service, logger, cache_invalidator=None
+    ) -> None:
         self.config_service = config_service
         self.arango_service = arango_service
         self.logger = logger
+        # Invalidates cached accessible records in the query service
+        self.cache_invalidator = cache_invalidator
 
     async def process_changes(self, user_service, changes, org_id, user) -> bool:
         """Process changes since last sync time"""
@@ -29,6 +33,7 @@ class GmailChangeHandler:
             connector_endpoint = endpoints.get("connectors").get("endpoint", DefaultEndpoints.CONNECTOR_ENDPOINT.value)
 
             user_id = user.get("userId")
+            records_changed = False
             for change in changes.get("history", []):
                 self.logger.info(f"🚀 Processing change: {change}")
 
@@ -54,6 +59,7 @@ class GmailChangeHandler:
                             seen_message_ids.add(message_id)
                             messages_to_add.append(message)
 
+                records_changed = records_changed or bool(messages_to_add)
                 for message in messages_to_add:
                     message_id = message.get("id")
                     if not message_id:
@@ -453,6 +459,7 @@ class GmailChangeHandler:
                             seen_message_ids.add(message_id)
                             messages_to_delete.append(message)
 
+                records_changed = records_changed or bool(messages_to_delete)
                 for message in messages_to_delete:
                     message_id = message.get("id")
                     if not message_id:
@@ -641,6 +648,10 @@ class GmailChangeHandler:
                                 {'org_id': org_id, 'error_type': type(e).__name__}
                             )
                         continue
+
+            # Mail permissions span every recipient in the org
+            if records_changed and self.cache_invalidator:
+                await self.cache_invalidator.invalidate_org(org_id)
             return True
         except Exception as e:
             self.logger.error(
@@ -15,10 +15,14 @@ from app.utils.time_conversion import get_epoch_timestamp_in_ms, parse_timestamp
 
 
 class DriveChangeHandler:
-    def __init__(self, logger, config_service, arango_service) -> None:
+    def __init__(
+        self, logger, config_service, arango_service, cache_invalidator=None
+    ) -> None:
         self.logger = logger
         self.config_service = config_service
         self.arango_service = arango_service
+        # Invalidates cached accessible records in the query service
+        self.cache_invalidator = cache_invalidator
 
     async def process_change(self, change: Dict, user_service, org_id, user_id) -> None:
         """Process a single change with revision checking"""
@@ -128,16 +132,19 @@ class DriveChangeHandler:
                 ],
             )
 
+            records_changed = False
             if not file_key:
                 if removed or is_trashed:
                     change_type = ""
                 else:
                     await self.handle_insert(new_file, org_id, transaction=txn)
                     change_type = EventTypes.NEW_RECORD.value
+                    records_changed = True
             else:
                 if removed or is_trashed:
                     await self.handle_removal(db_file, db_record, transaction=txn)
                     change_type = EventTypes.DELETE_RECORD.value
+                    records_changed = True
                 else:
                     if not new_file:
                         return
@@ -148,6 +155,7 @@ class DriveChangeHandler:
                         await self.handle_update(
                             new_file, db_file, db_record, org_id, transaction=txn
                         )
+                        records_changed = True
                         if reindex_var:
                             change_type = EventTypes.UPDATE_RECORD.value
                         else:
@@ -162,6 +170,10 @@ class DriveChangeHandler:
             txn = None
             self.logger.info("Transaction committed for file: %s", {file_id})
 
+            # Records or their permissions changed for some users of the org
+            if records_changed and self.cache_invalidator:
+                await self.cache_invalidator.invalidate_org(org_id)
+
             # SEND KAFKA EVENT FOR REINDEXING
             self.logger.info(f"🚀 Change: {change_type}")
             if (
@@ -273,6 +285,26 @@ class DriveChangeHandler:
                 )
                 self.logger.info("📨 Sent Kafka reindexing event for file %s", file_id)
 
+            # Permissions may have changed; the indexing service refreshes the
+            # permission principals stored on the record's points
+            if records_changed and change_type not in (
+                EventTypes.NEW_RECORD.value,
+                EventTypes.DELETE_RECORD.value,
+            ):
+                await self.arango_service.kafka_service.send_event_to_kafka(
+                    {
+                        "orgId": org_id,
+                        "recordId": file_key,
+                        "virtualRecordId": db_record.get("virtualRecordId", None),
+                        "recordName": db_record.get("recordName", ""),
+                        "recordType": db_record.get("recordType", ""),
+                        "eventType": EventTypes.UPDATE_PERMISSIONS.value,
+                        "connectorName": Connectors.GOOGLE_DRIVE.value,
+                        "origin": OriginTypes.CONNECTOR.value,
+                    }
+                )
+                self.logger.info("📨 Sent Kafka permissions event for file %s", file_id)
+
         except Exception as e:
             if txn:
                 txn.abort_transaction()
@@ -174,6 +174,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         arango_service=await app.container.arango_service(),
         routes=kafka_routes,  # Pass the list of route patterns
         app_container=app.container,
+        cache_invalidator=await app.container.accessible_records_invalidator(),
     )
 
     # Initialize Kafka consumer
@@ -0,0 +1,373 @@
+"""Per-user cache of permission-filtered accessible records
+
+get_accessible_records walks every permission path of a user (direct, group,
+org, knowledge base and `anyone` records) and then applies the category,
+topic and aircraft filters. The cache below keeps the result per
+(orgId, userId, filter fingerprint) with TTL and LRU eviction.
+
+Freshness is tracked with generation counters stored in Redis. The connector
+service bumps the org or user generation whenever permissions or records
+change, and every cache lookup compares the generation an entry was built at
+with the current one, so all query service replicas drop stale entries
+without having to be reached individually.
+
+The indexing service adds records to an org one by one, thousands at a time
+during a bulk sync. It invalidates through CoalescingAccessibleRecordsInvalidator,
+which merges the org bumps of a burst into one, so the cache stays warm while
+a sync is running. A newly indexed record can then take up to
+ACCESSIBLE_RECORDS_INVALIDATION_MAX_DELAY seconds to show up for users with
+a cached entry.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from redis.asyncio import Redis
+
+ACCESSIBLE_RECORDS_CACHE_ENABLED = os.getenv(
+    "ACCESSIBLE_RECORDS_CACHE_ENABLED", "true"
+).lower() in ("1", "true", "yes")
+ACCESSIBLE_RECORDS_CACHE_TTL = int(os.getenv("ACCESSIBLE_RECORDS_CACHE_TTL", "300"))
+ACCESSIBLE_RECORDS_CACHE_MAX_ENTRIES = int(
+    os.getenv("ACCESSIBLE_RECORDS_CACHE_MAX_ENTRIES", "512")
+)
+# Also share cached record lists between replicas through Redis
+ACCESSIBLE_RECORDS_CACHE_SHARED = os.getenv(
+    "ACCESSIBLE_RECORDS_CACHE_SHARED", "false"
+).lower() in ("1", "true", "yes")
+
+# Org invalidations of the indexing service are merged until no new one came
+# in for the delay, and held back at most for the max delay
+ACCESSIBLE_RECORDS_INVALIDATION_DELAY = float(
+    os.getenv("ACCESSIBLE_RECORDS_INVALIDATION_DELAY", "5")
+)
+ACCESSIBLE_RECORDS_INVALIDATION_MAX_DELAY = float(
+    os.getenv("ACCESSIBLE_RECORDS_INVALIDATION_MAX_DELAY", "30")
+)
+
+GENERATION_KEY_PREFIX = "accessible_records:generation"
+ENTRY_KEY_PREFIX = "accessible_records:entry"
+
+CacheKey = Tuple[str, str, str]
+Generation = Tuple[int, int]
+
+
+def filters_fingerprint(filters: Optional[Dict[str, Any]]) -> str:
+    """Stable short hash of a filter dict, independent of key and value order"""
+    normalized = {
+        key: sorted(values, key=str) if isinstance(values, list) else values
+        for key, values in (filters or {}).items()
+        if values
+    }
+    payload = json.dumps(normalized, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def org_generation_key(org_id: str) -> str:
+    return f"{GENERATION_KEY_PREFIX}:{org_id}"
+
+
+def user_generation_key(org_id: str, user_id: str) -> str:
+    return f"{GENERATION_KEY_PREFIX}:{org_id}:{user_id}"
+
+
+class AccessibleRecordsCacheInvalidator:
+    """Publishes permission changes by bumping the Redis generation counters"""
+
+    def __init__(self, logger, redis_client: Optional[Redis] = None) -> None:
+        self.logger = logger
+        self.redis_client = redis_client
+
+    async def invalidate_org(self, org_id: str) -> None:
+        """Invalidate the cached records of every user in an organization"""
+        if not org_id:
+            return
+        await self._bump(org_generation_key(org_id))
+
+    async def invalidate_user(self, org_id: str, user_id: str) -> None:
+        """Invalidate the cached records of a single user"""
+        if not org_id or not user_id:
+            return
+        await self._bump(user_generation_key(org_id, user_id))
+
+    async def _bump(self, key: str) -> None:
+        if not self.redis_client:
+            return
+        try:
+            await self.redis_client.incr(key)
+            self.logger.debug(f"Bumped accessible records generation {key}")
+        except Exception as e:
+            # Entries still expire through their TTL
+            self.logger.warning(
+                f"Failed to invalidate accessible records cache ({key}): {str(e)}"
+            )
+
+
+class CoalescingAccessibleRecordsInvalidator(AccessibleRecordsCacheInvalidator):
+    """Invalidator that merges bursts of org invalidations into one bump"""
+
+    def __init__(
+        self,
+        logger,
+        redis_client: Optional[Redis] = None,
+        delay_seconds: float = ACCESSIBLE_RECORDS_INVALIDATION_DELAY,
+        max_delay_seconds: float = ACCESSIBLE_RECORDS_INVALIDATION_MAX_DELAY,
+    ) -> None:
+        super().__init__(logger, redis_client)
+        self.delay_seconds = delay_seconds
+        self.max_delay_seconds = max_delay_seconds
+        # Per org: pending bump task, first and last request of the burst
+        self._pending: Dict[str, asyncio.Task] = {}
+        self._requested: Dict[str, Tuple[float, float]] = {}
+        self.coalesced = 0
+
+    async def invalidate_org(self, org_id: str) -> None:
+        """Schedule one bump of the org generation for the current burst"""
+        if not org_id:
+            return
+        now = time.monotonic()
+        if org_id in self._pending:
+            first, _ = self._requested[org_id]
+            self._requested[org_id] = (first, now)
+            self.coalesced += 1
+            return
+        self._requested[org_id] = (now, now)
+        self._pending[org_id] = asyncio.create_task(self._bump_org_when_quiet(org_id))
+
+    async def flush(self) -> None:
+        """Bump every org with a pending invalidation now"""
+        org_ids = list(self._pending)
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+        self._requested.clear()
+        for org_id in org_ids:
+            await super().invalidate_org(org_id)
+
+    async def _bump_org_when_quiet(self, org_id: str) -> None:
+        while True:
+            first, last = self._requested[org_id]
+            due = min(last + self.delay_seconds, first + self.max_delay_seconds)
+            remaining = due - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(remaining)
+        # Requests from now on start a new burst
+        self._pending.pop(org_id, None)
+        self._requested.pop(org_id, None)
+        await super().invalidate_org(org_id)
+
+
+@dataclass
+class _CacheEntry:
+    records: List[Dict[str, Any]]
+    generation: Generation
+    expires_at: float
+
+
+class AccessibleRecordsCache(AccessibleRecordsCacheInvalidator):
+    """TTL + LRU cache in front of ArangoService.get_accessible_records"""
+
+    def __init__(
+        self,
+        logger,
+        redis_client: Optional[Redis] = None,
+        ttl_seconds: int = ACCESSIBLE_RECORDS_CACHE_TTL,
+        max_entries: int = ACCESSIBLE_RECORDS_CACHE_MAX_ENTRIES,
+        enabled: bool = ACCESSIBLE_RECORDS_CACHE_ENABLED,
+        shared: bool = ACCESSIBLE_RECORDS_CACHE_SHARED,
+    ) -> None:
+        super().__init__(logger, redis_client)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.shared = shared and redis_client is not None
+        self._entries: "OrderedDict[CacheKey, _CacheEntry]" = OrderedDict()
+        # Generations used when Redis is not configured
+        self._local_generations: Dict[str, int] = {}
+
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.evictions = 0
+        self.bypassed = 0
+        self.redis_errors = 0
+        self.load_time_seconds = 0.0
+
+    async def get_or_load(
+        self,
+        org_id: str,
+        user_id: str,
+        filters: Optional[Dict[str, Any]],
+        loader: Callable[[], Awaitable[List[Dict[str, Any]]]],
+        bypass: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the cached accessible records or load and cache them
+
+        Args:
+            org_id (str): Organization of the user
+            user_id (str): The userId field value in users collection
+            filters (Optional[Dict[str, Any]]): Filters passed to get_accessible_records
+            loader (Callable): Coroutine factory that runs the Arango traversal
+            bypass (bool): Skip the cache entirely (debugging)
+        """
+        if bypass or not self.enabled:
+            self.bypassed += 1
+            return await self._load(loader)
+
+        key = (org_id, user_id, filters_fingerprint(filters))
+        generation = await self._current_generation(org_id, user_id)
+        if generation is None:
+            # Freshness cannot be verified, serve straight from Arango
+            self.bypassed += 1
+            return await self._load(loader)
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.expires_at > time.monotonic() and entry.generation == generation:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry.records
+            self.stale += 1
+            del self._entries[key]
+
+        if self.shared:
+            records = await self._get_shared(key, generation)
+            if records is not None:
+                self.shared_hits += 1
+                self._store(key, records, generation)
+                return records
+
+        self.misses += 1
+        records = await self._load(loader)
+        self._store(key, records, generation)
+        if self.shared:
+            await self._set_shared(key, records, generation)
+        return records
+
+    async def invalidate_org(self, org_id: str) -> None:
+        self._drop_local(lambda key: key[0] == org_id)
+        self._local_generations[org_generation_key(org_id)] = (
+            self._local_generations.get(org_generation_key(org_id), 0) + 1
+        )
+        await super().invalidate_org(org_id)
+
+    async def invalidate_user(self, org_id: str, user_id: str) -> None:
+        self._drop_local(lambda key: key[0] == org_id and key[1] == user_id)
+        generation_key = user_generation_key(org_id, user_id)
+        self._local_generations[generation_key] = (
+            self._local_generations.get(generation_key, 0) + 1
+        )
+        await super().invalidate_user(org_id, user_id)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.shared_hits + self.misses + self.stale
+        return {
+            "enabled": self.enabled,
+            "shared": self.shared,
+            "entries": len(self._entries),
+            "maxEntries": self.max_entries,
+            "ttlSeconds": self.ttl_seconds,
+            "hits": self.hits,
+            "sharedHits": self.shared_hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "evictions": self.evictions,
+            "bypassed": self.bypassed,
+            "redisErrors": self.redis_errors,
+            "hitRatio": (
+                round((self.hits + self.shared_hits) / lookups, 4) if lookups else 0.0
+            ),
+            "loadTimeSeconds": round(self.load_time_seconds, 3),
+        }
+
+    async def _load(
+        self, loader: Callable[[], Awaitable[List[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        start = time.monotonic()
+        try:
+            return await loader()
+        finally:
+            self.load_time_seconds += time.monotonic() - start
+
+    async def _current_generation(
+        self, org_id: str, user_id: str
+    ) -> Optional[Generation]:
+        org_key = org_generation_key(org_id)
+        user_key = user_generation_key(org_id, user_id)
+        if not self.redis_client:
+            return (
+                self._local_generations.get(org_key, 0),
+                self._local_generations.get(user_key, 0),
+            )
+        try:
+            org_generation, user_generation = await self.redis_client.mget(
+                org_key, user_key
+            )
+            return (int(org_generation or 0), int(user_generation or 0))
+        except Exception as e:
+            self.redis_errors += 1
+            self.logger.warning(
+                f"Failed to read accessible records generation: {str(e)}"
+            )
+            return None
+
+    def _store(
+        self, key: CacheKey, records: List[Dict[str, Any]], generation: Generation
+    ) -> None:
+        self._entries[key] = _CacheEntry(
+            records=records,
+            generation=generation,
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _drop_local(self, predicate: Callable[[CacheKey], bool]) -> None:
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+
+    @staticmethod
+    def _shared_key(key: CacheKey) -> str:
+        return f"{ENTRY_KEY_PREFIX}:{key[0]}:{key[1]}:{key[2]}"
+
+    async def _get_shared(
+        self, key: CacheKey, generation: Generation
+    ) -> Optional[List[Dict[str, Any]]]:
+        try:
+            value = await self.redis_client.get(self._shared_key(key))
+            if not value:
+                return None
+            payload = json.loads(value)
+            if tuple(payload.get("generation", ())) != generation:
+                return None
+            return payload.get("records", [])
+        except Exception as e:
+            self.redis_errors += 1
+            self.logger.warning(f"Failed to read shared accessible records: {str(e)}")
+            return None
+
+    async def _set_shared(
+        self, key: CacheKey, records: List[Dict[str, Any]], generation: Generation
+    ) -> None:
+        try:
+            payload = json.dumps({"generation": list(generation), "records": records})
+            await self.redis_client.set(
+                self._shared_key(key), payload, ex=self.ttl_seconds
+            )
+        except Exception as e:
+            self.redis_errors += 1
+            self.logger.warning(f"Failed to write shared accessible records: {str(e)}")
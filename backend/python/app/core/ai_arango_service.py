@@ -8,6 +8,7 @@ from arango.database import TransactionDatabase
 
 from app.config.configuration_service import ConfigurationService, config_node_constants
 from app.config.utils.named_constants.arangodb_constants import CollectionNames
+from app.core.arango_executor import get_arango_executor
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
 
@@ -22,6 +23,8 @@ class ArangoService:
         self.config_service = config
         self.client = arango_client
         self.db = None
+        # AQL calls are offloaded so they never block the event loop
+        self.executor = get_arango_executor()
 
     async def connect(self) -> bool:
         """Connect to ArangoDB and initialize collections"""
@@ -43,8 +46,12 @@ class ArangoService:
 
             # Connect to system db to ensure our db exists
             self.logger.debug("Connecting to system db")
-            sys_db = self.client.db(
-                "_system", username=arango_user, password=arango_password, verify=True
+            sys_db = await self.executor.run(
+                self.client.db,
+                "_system",
+                username=arango_user,
+                password=arango_password,
+                verify=True,
             )
             self.logger.debug("System DB: %s", sys_db)
 
@@ -60,8 +67,12 @@ class ArangoService:
 
             # Connect to our database
             self.logger.debug("Connecting to our database")
-            self.db = self.client.db(
-                arango_db, username=arango_user, password=arango_password, verify=True
+            self.db = await self.executor.run(
+                self.client.db,
+                arango_db,
+                username=arango_user,
+                password=arango_password,
+                verify=True,
             )
 
             return True
@@ -108,10 +119,9 @@ class ArangoService:
                 RETURN record._key
             """
             db = transaction if transaction else self.db
-            cursor = db.aql.execute(
-                query, bind_vars={"external_file_id": external_file_id}
+            result = await self.executor.execute_first(
+                db, query, bind_vars={"external_file_id": external_file_id}
             )
-            result = next(cursor, None)
 
             if result:
                 self.logger.info(
@@ -160,10 +170,9 @@ class ArangoService:
                 RETURN doc._key
             """
             db = transaction if transaction else self.db
-            cursor = db.aql.execute(
-                query, bind_vars={"external_message_id": external_message_id}
+            result = await self.executor.execute_first(
+                db, query, bind_vars={"external_message_id": external_message_id}
             )
-            result = next(cursor, None)
 
             if result:
                 self.logger.info(
@@ -213,10 +222,9 @@ class ArangoService:
                 RETURN attachment._key
             """
             db = transaction if transaction else self.db
-            cursor = db.aql.execute(
-                query, bind_vars={"external_attachment_id": external_attachment_id}
+            result = await self.executor.execute_first(
+                db, query, bind_vars={"external_attachment_id": external_attachment_id}
             )
-            result = next(cursor, None)
 
             if result:
                 self.logger.info(
@@ -247,11 +255,11 @@ class ArangoService:
                 FILTER doc._key == @document_key
                 RETURN doc
             """
-            cursor = self.db.aql.execute(
+            result = await self.executor.execute(
+                self.db,
                 query,
                 bind_vars={"document_key": document_key, "@collection": collection},
             )
-            result = list(cursor)
             return result[0] if result else None
         except Exception as e:
             self.logger.error("❌ Error getting document: %s", str(e))
@@ -280,8 +288,7 @@ class ArangoService:
 
             db = transaction if transaction else self.db
 
-            cursor = db.aql.execute(batch_query, bind_vars=bind_vars)
-            results = list(cursor)
+            results = await self.executor.execute(db, batch_query, bind_vars=bind_vars)
             self.logger.info(
                 "✅ Successfully upserted %d nodes in collection '%s'.",
                 len(results),
@@ -317,8 +324,7 @@ class ArangoService:
 
             db = transaction if transaction else self.db
 
-            cursor = db.aql.execute(batch_query, bind_vars=bind_vars)
-            results = list(cursor)
+            results = await self.executor.execute(db, batch_query, bind_vars=bind_vars)
             self.logger.info(
                 "✅ Successfully created %d edges in collection '%s'.",
                 len(results),
@@ -337,8 +343,7 @@ class ArangoService:
                     FILTER user.userId == @user_id
                     RETURN user
             """
-            cursor = self.db.aql.execute(query, bind_vars={"user_id": user_id})
-            result = next(cursor, None)
+            result = await self.executor.execute_first(self.db, query, bind_vars={"user_id": user_id})
             return result
         except Exception as e:
             self.logger.error(f"Error getting user by user ID: {str(e)}")
@@ -359,8 +364,7 @@ class ArangoService:
                 FILTER department.orgId == null OR department.orgId == '{org_id}'
                 RETURN department.departmentName
         """
-        cursor = self.db.aql.execute(query)
-        return list(cursor)
+        return await self.executor.execute(self.db, query)
 
     async def get_aircraft(self, org_id: str) -> List[str]:
         """
@@ -379,8 +383,7 @@ class ArangoService:
                     FILTER aircraft.orgId == null OR aircraft.orgId == @org_id
                     RETURN aircraft.aircraftName
             """
-            cursor = self.db.aql.execute(query, bind_vars={"org_id": org_id})
-            aircraft_names = list(cursor)
+            aircraft_names = await self.executor.execute(self.db, query, bind_vars={"org_id": org_id})
             self.logger.info(f"✅ Found {len(aircraft_names)} aircraft for org {org_id}")
             return aircraft_names
         except Exception as e:
@@ -426,7 +429,8 @@ class ArangoService:
             """
 
             db = transaction if transaction else self.db
-            cursor = db.aql.execute(
+            duplicate_records = await self.executor.execute(
+                db,
                 query,
                 bind_vars={
                     "md5_checksum": md5_checksum,
@@ -435,8 +439,6 @@ class ArangoService:
                 }
             )
 
-            duplicate_records = list(cursor)
-
             if duplicate_records:
                 self.logger.info(
                     "✅ Found %d duplicate record(s) matching criteria",
@@ -489,15 +491,14 @@ class ArangoService:
                     }}
                 """
 
-                cursor = self.db.aql.execute(
+                edges = await self.executor.execute(
+                    self.db,
                     query,
                     bind_vars={
                         "source_doc": f"{CollectionNames.RECORDS.value}/{source_key}"
                     }
                 )
 
-                edges = list(cursor)
-
                 if edges:
                     # Create new edges for target document
                     new_edges = []
@@ -564,8 +565,7 @@ class ArangoService:
             if accessible_record_ids:
                 bind_vars["accessible_record_ids"] = accessible_record_ids
 
-            cursor = self.db.aql.execute(query, bind_vars=bind_vars)
-            results = list(cursor)
+            results = await self.executor.execute(self.db, query, bind_vars=bind_vars)
 
             self.logger.info(
                 "✅ Found %d records with virtualRecordId %s",
@@ -582,6 +582,68 @@ class ArangoService:
             )
             return []
 
+    async def get_permission_principals(
+        self, virtual_record_id: str, record_id: Optional[str] = None
+    ) -> List[str]:
+        """
+        Get every principal granted access to records sharing a virtualRecordId
+
+        Args:
+            virtual_record_id (str): Virtual record ID whose records to inspect
+            record_id (Optional[str]): Record being indexed, which may not carry
+                its virtualRecordId in Arango yet
+
+        Returns:
+            List[str]: Arango _ids of users, groups, orgs and knowledge bases with
+                access, plus `anyone/<orgId>` for records shared with the org
+        """
+        try:
+            query = f"""
+            LET records = (
+                FOR record IN {CollectionNames.RECORDS.value}
+                    FILTER record.virtualRecordId == @virtual_record_id
+                        OR record._key == @record_id
+                    RETURN record
+            )
+
+            LET direct = (
+                FOR record IN records
+                    FOR entity IN 1..1 ANY record._id {CollectionNames.PERMISSIONS.value}
+                    RETURN entity._id
+            )
+
+            LET knowledgeBases = (
+                FOR record IN records
+                    FOR kb IN 1..1 ANY record._id {CollectionNames.BELONGS_TO_KNOWLEDGE_BASE.value}
+                    RETURN kb._id
+            )
+
+            LET anyone = (
+                FOR record IN records
+                    FOR entry IN {CollectionNames.ANYONE.value}
+                        FILTER entry.file_key == record._key
+                        RETURN CONCAT('{CollectionNames.ANYONE.value}/', entry.organization)
+            )
+
+            RETURN UNION_DISTINCT(direct, knowledgeBases, anyone)
+            """
+            principals = await self.executor.execute_first(
+                self.db,
+                query,
+                bind_vars={
+                    "virtual_record_id": virtual_record_id,
+                    "record_id": record_id,
+                },
+            )
+            return principals or []
+        except Exception as e:
+            self.logger.error(
+                "❌ Error getting permission principals for virtualRecordId %s: %s",
+                virtual_record_id,
+                str(e),
+            )
+            return []
+
     async def get_documents_by_status(self, collection: str, status: str) -> List[Dict]:
         """
         Get all documents with a specific indexing status
@@ -604,5 +666,4 @@ class ArangoService:
             "status": status
         }
 
-        cursor = self.db.aql.execute(query, bind_vars=bind_vars)
-        return list(cursor)
+        return await self.executor.execute(self.db, query, bind_vars=bind_vars)
@@ -0,0 +1,310 @@
+"""Semantic cache of chat answers for repeated questions
+
+Pilots and technicians ask the same questions over and over in slightly
+different words. Each one costs query decomposition, retrieval, reranking and
+a full LLM generation. The cache below keeps finished answers, with their
+citations, and serves one when a new question is close enough to a cached one.
+
+Entries are grouped in buckets of (orgId, accessible scope fingerprint,
+aircraft_canonical, embedding model, answer mode). The scope fingerprint is a
+hash of the virtualRecordIds the user may read with the request's filters, so
+an answer is only served to users who can read every record it was built
+from. Answers whose prompt carried the asker's profile are keyed by user
+through the mode. Within a bucket the question embedding with the highest cosine
+similarity above ANSWER_CACHE_SIMILARITY_THRESHOLD wins.
+
+Freshness is tracked with per-virtualRecordId generation counters in Redis.
+The indexing service bumps the counter of a record whenever its embeddings
+are deleted, re-created or get new domain metadata, and a hit is only served
+when the generations of all its cited records are unchanged. Without Redis
+the indexing service cannot reach the cache and it stays disabled.
+
+Entries live in process, per query service replica, with TTL and LRU
+eviction. The cache is opt-in through ANSWER_CACHE_ENABLED.
+"""
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from redis.asyncio import Redis
+
+ANSWER_CACHE_ENABLED = os.getenv("ANSWER_CACHE_ENABLED", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+ANSWER_CACHE_TTL = int(os.getenv("ANSWER_CACHE_TTL", "3600"))
+ANSWER_CACHE_MAX_ENTRIES = int(os.getenv("ANSWER_CACHE_MAX_ENTRIES", "2048"))
+# Cosine similarity of two question embeddings for them to share an answer
+ANSWER_CACHE_SIMILARITY_THRESHOLD = float(
+    os.getenv("ANSWER_CACHE_SIMILARITY_THRESHOLD", "0.95")
+)
+
+GENERATION_KEY_PREFIX = "answer_cache:record_generation"
+
+BucketKey = Tuple[str, str, str, str, str]
+EntryKey = Tuple[BucketKey, int]
+
+
+def record_generation_key(virtual_record_id: str) -> str:
+    return f"{GENERATION_KEY_PREFIX}:{virtual_record_id}"
+
+
+def scope_fingerprint(accessible_records: Iterable[Optional[Dict[str, Any]]]) -> str:
+    """Stable short hash of the virtualRecordIds a user may read"""
+    virtual_record_ids = sorted(
+        {
+            str(record["virtualRecordId"])
+            for record in accessible_records
+            if record and record.get("virtualRecordId") is not None
+        }
+    )
+    digest = hashlib.sha256("\n".join(virtual_record_ids).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def cited_virtual_record_ids(citations: List[Dict[str, Any]]) -> List[str]:
+    return sorted(
+        {
+            str(citation["metadata"]["virtualRecordId"])
+            for citation in citations
+            if (citation.get("metadata") or {}).get("virtualRecordId") is not None
+        }
+    )
+
+
+class AnswerCacheInvalidator:
+    """Publishes record re-indexing and deletion by bumping Redis generations"""
+
+    def __init__(self, logger, redis_client: Optional[Redis] = None) -> None:
+        self.logger = logger
+        self.redis_client = redis_client
+
+    async def invalidate_records(self, virtual_record_ids: Iterable[str]) -> None:
+        """Invalidate every cached answer citing one of the records"""
+        keys = [record_generation_key(vrid) for vrid in virtual_record_ids if vrid]
+        if not keys or not self.redis_client:
+            return
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.incr(key)
+                await pipe.execute()
+            self.logger.debug(f"Bumped answer cache generation of {len(keys)} records")
+        except Exception as e:
+            # Entries still expire through their TTL
+            self.logger.warning(f"Failed to invalidate cached answers: {str(e)}")
+
+
+@dataclass
+class _CacheEntry:
+    embedding: np.ndarray
+    query: str
+    answer: Dict[str, Any]
+    generations: Dict[str, int]
+    llm_tokens: int
+    expires_at: float
+    hits: int = field(default=0)
+
+
+class AnswerCache:
+    """TTL + LRU cache of chat answers matched by question similarity"""
+
+    def __init__(
+        self,
+        logger,
+        redis_client: Optional[Redis] = None,
+        ttl_seconds: int = ANSWER_CACHE_TTL,
+        max_entries: int = ANSWER_CACHE_MAX_ENTRIES,
+        similarity_threshold: float = ANSWER_CACHE_SIMILARITY_THRESHOLD,
+        enabled: bool = ANSWER_CACHE_ENABLED,
+    ) -> None:
+        self.logger = logger
+        self.redis_client = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self.enabled = enabled and redis_client is not None
+        self._entries: "OrderedDict[EntryKey, _CacheEntry]" = OrderedDict()
+        self._buckets: Dict[BucketKey, List[int]] = {}
+        self._next_id = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+        self.stores = 0
+        self.evictions = 0
+        self.bypassed = 0
+        self.redis_errors = 0
+        self.llm_tokens_saved = 0
+
+    @staticmethod
+    def bucket_key(
+        org_id: str,
+        scope: str,
+        aircraft_canonical: Optional[str],
+        model_name: Optional[str],
+        mode: str,
+    ) -> BucketKey:
+        return (org_id, scope, aircraft_canonical or "", model_name or "", mode)
+
+    async def lookup(
+        self, bucket: BucketKey, embedding: List[float]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached answer of the most similar question in the bucket
+
+        Args:
+            bucket (BucketKey): Key built with bucket_key
+            embedding (List[float]): Dense embedding of the question
+
+        Returns:
+            Optional[Dict[str, Any]]: The stored answer payload, or None
+        """
+        if not self.enabled:
+            self.bypassed += 1
+            return None
+
+        vector = self._normalize(embedding)
+        now = time.monotonic()
+        best_key: Optional[EntryKey] = None
+        best_similarity = self.similarity_threshold
+        for entry_id in list(self._buckets.get(bucket, ())):
+            key = (bucket, entry_id)
+            entry = self._entries[key]
+            if entry.expires_at <= now:
+                self._drop(key)
+                self.stale += 1
+                continue
+            similarity = float(np.dot(vector, entry.embedding))
+            if similarity >= best_similarity:
+                best_key, best_similarity = key, similarity
+
+        if best_key is None:
+            self.misses += 1
+            return None
+
+        entry = self._entries[best_key]
+        generations = await self._current_generations(list(entry.generations))
+        if generations is None:
+            # Freshness cannot be verified, answer from the documents
+            self.bypassed += 1
+            return None
+        if generations != entry.generations:
+            self._drop(best_key)
+            self.stale += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(best_key)
+        entry.hits += 1
+        self.hits += 1
+        self.llm_tokens_saved += entry.llm_tokens
+        self.logger.info(
+            f"💾 Answer cache hit (similarity {best_similarity:.3f}) for "
+            f"'{entry.query[:80]}'"
+        )
+        return entry.answer
+
+    async def store(
+        self,
+        bucket: BucketKey,
+        embedding: List[float],
+        query: str,
+        answer: Dict[str, Any],
+        llm_tokens: int,
+    ) -> None:
+        """
+        Cache an answer and the generations of the records it cites
+
+        Args:
+            bucket (BucketKey): Key built with bucket_key
+            embedding (List[float]): Dense embedding of the question
+            query (str): The question, for logging
+            answer (Dict[str, Any]): Answer payload with its "citations"
+            llm_tokens (int): Estimated LLM tokens a hit saves
+        """
+        if not self.enabled:
+            return
+        virtual_record_ids = cited_virtual_record_ids(answer.get("citations") or [])
+        generations = await self._current_generations(virtual_record_ids)
+        if generations is None:
+            return
+
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[(bucket, entry_id)] = _CacheEntry(
+            embedding=self._normalize(embedding),
+            query=query,
+            answer=answer,
+            generations=generations,
+            llm_tokens=llm_tokens,
+            expires_at=time.monotonic() + self.ttl_seconds,
+        )
+        self._buckets.setdefault(bucket, []).append(entry_id)
+        self.stores += 1
+        while len(self._entries) > self.max_entries:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._buckets.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "buckets": len(self._buckets),
+            "maxEntries": self.max_entries,
+            "ttlSeconds": self.ttl_seconds,
+            "similarityThreshold": self.similarity_threshold,
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "bypassed": self.bypassed,
+            "redisErrors": self.redis_errors,
+            "hitRatio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "llmTokensSaved": self.llm_tokens_saved,
+        }
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm else vector
+
+    def _drop(self, key: EntryKey) -> None:
+        self._entries.pop(key, None)
+        bucket, entry_id = key
+        entry_ids = self._buckets.get(bucket)
+        if entry_ids is None:
+            return
+        entry_ids.remove(entry_id)
+        if not entry_ids:
+            del self._buckets[bucket]
+
+    async def _current_generations(
+        self, virtual_record_ids: List[str]
+    ) -> Optional[Dict[str, int]]:
+        if not virtual_record_ids:
+            return {}
+        try:
+            values = await self.redis_client.mget(
+                [record_generation_key(vrid) for vrid in virtual_record_ids]
+            )
+            return {
+                vrid: int(value or 0) for vrid, value in zip(virtual_record_ids, values)
+            }
+        except Exception as e:
+            self.redis_errors += 1
+            self.logger.warning(f"Failed to read answer cache generations: {str(e)}")
+            return None
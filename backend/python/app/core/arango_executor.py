@@ -0,0 +1,101 @@
+"""Bounded thread-pool offload for the synchronous python-arango driver
+
+python-arango performs blocking HTTP round-trips, both when a query is
+submitted and while a cursor fetches its remaining batches. Running those
+calls directly inside ``async def`` methods stalls the event loop for the
+duration of every AQL query. ArangoExecutor runs the submit *and* the cursor
+drain on a dedicated, bounded pool of worker threads so that concurrent
+requests overlap their database time instead of serializing on the loop.
+"""
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, List, Optional
+
+from arango.http import DefaultHTTPClient
+
+# Number of worker threads (and pooled HTTP connections) used for AQL calls
+ARANGO_EXECUTOR_WORKERS = int(os.getenv("ARANGO_EXECUTOR_WORKERS", "16"))
+
+
+class ArangoExecutor:
+    """Runs blocking python-arango calls on a bounded thread pool"""
+
+    def __init__(
+        self,
+        max_workers: int = ARANGO_EXECUTOR_WORKERS,
+        thread_name_prefix: str = "arango",
+    ) -> None:
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=thread_name_prefix
+        )
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Run ``fn(*args, **kwargs)`` on the pool and await its result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(fn, *args, **kwargs))
+
+    async def execute(
+        self,
+        db,
+        query: str,
+        bind_vars: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """
+        Execute an AQL query and drain its cursor off the event loop
+
+        Args:
+            db: StandardDatabase or TransactionDatabase to run the query on
+            query (str): AQL query string
+            bind_vars (Optional[Dict[str, Any]]): Query bind variables
+            **kwargs: Extra arguments forwarded to ``db.aql.execute``
+
+        Returns:
+            List[Any]: All documents produced by the cursor
+        """
+
+        def _execute() -> List[Any]:
+            cursor = db.aql.execute(query, bind_vars=bind_vars or {}, **kwargs)
+            return list(cursor)
+
+        return await self.run(_execute)
+
+    async def execute_first(
+        self,
+        db,
+        query: str,
+        bind_vars: Optional[Dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Optional[Any]:
+        """Execute an AQL query off the event loop and return its first result"""
+
+        def _execute_first() -> Optional[Any]:
+            cursor = db.aql.execute(query, bind_vars=bind_vars or {}, **kwargs)
+            return next(cursor, None)
+
+        return await self.run(_execute_first)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and release the worker threads"""
+        self._executor.shutdown(wait=wait)
+
+
+@lru_cache(maxsize=1)
+def get_arango_executor() -> ArangoExecutor:
+    """Process-wide executor shared by every ArangoService implementation"""
+    return ArangoExecutor()
+
+
+def create_arango_http_client() -> DefaultHTTPClient:
+    """
+    HTTP client whose connection pool matches the executor size, so that
+    every worker thread can hold a keep-alive connection to ArangoDB
+    """
+    return DefaultHTTPClient(
+        pool_connections=ARANGO_EXECUTOR_WORKERS,
+        pool_maxsize=ARANGO_EXECUTOR_WORKERS,
+    )
@@ -0,0 +1,230 @@
+"""Cache of query embeddings keyed by (model name, normalized text)
+
+Chat turns re-embed the same user questions and decomposed sub-queries over
+and over, with both the dense model and the BM25 sparse model. The cache
+below keeps query vectors in a byte-bounded in-process LRU and, optionally,
+in Redis so that every query service replica can reuse them.
+
+Vectors are deterministic for a given model, so entries never go stale; the
+model name is part of the key and a model change simply misses the cache.
+"""
+
+import hashlib
+import json
+import os
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from redis.asyncio import Redis
+
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+EMBEDDING_CACHE_MAX_BYTES = int(
+    os.getenv("EMBEDDING_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+# Also share query embeddings between replicas through Redis
+EMBEDDING_CACHE_SHARED = os.getenv("EMBEDDING_CACHE_SHARED", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+EMBEDDING_CACHE_REDIS_TTL = int(os.getenv("EMBEDDING_CACHE_REDIS_TTL", "86400"))
+
+ENTRY_KEY_PREFIX = "query_embedding"
+
+# Rough per-entry bookkeeping cost (key, OrderedDict node, list headers)
+_ENTRY_OVERHEAD_BYTES = 200
+_FLOAT_BYTES = 8
+
+Embedding = Any
+EmbedFn = Callable[[List[str]], Awaitable[List[Embedding]]]
+
+
+def normalize_query_text(text: str) -> str:
+    """Unicode-normalize and collapse whitespace"""
+    return " ".join(unicodedata.normalize("NFKC", text or "").split())
+
+
+def embedding_cache_key(model_name: str, text: str) -> str:
+    digest = hashlib.sha256(
+        f"{model_name}\x00{normalize_query_text(text)}".encode("utf-8")
+    ).hexdigest()
+    return f"{ENTRY_KEY_PREFIX}:{digest}"
+
+
+def _estimate_size(embedding: Embedding) -> int:
+    if isinstance(embedding, dict):
+        values = len(embedding.get("indices", ())) + len(embedding.get("values", ()))
+    else:
+        values = len(embedding)
+    return _ENTRY_OVERHEAD_BYTES + values * _FLOAT_BYTES
+
+
+class EmbeddingCache:
+    """Byte-bounded LRU of query embeddings with an optional Redis tier
+
+    Dense embeddings are stored as lists of floats, sparse ones as
+    ``{"indices": [...], "values": [...]}`` dicts.
+    """
+
+    def __init__(
+        self,
+        logger,
+        redis_client: Optional[Redis] = None,
+        max_bytes: int = EMBEDDING_CACHE_MAX_BYTES,
+        enabled: bool = EMBEDDING_CACHE_ENABLED,
+        shared: bool = EMBEDDING_CACHE_SHARED,
+        redis_ttl_seconds: int = EMBEDDING_CACHE_REDIS_TTL,
+    ) -> None:
+        self.logger = logger
+        self.redis_client = redis_client
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.shared = shared and redis_client is not None
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self._entries: "OrderedDict[str, Embedding]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self.current_bytes = 0
+
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.redis_errors = 0
+        self.embedded_texts = 0
+        self.embed_time_seconds = 0.0
+        self.time_saved_seconds = 0.0
+
+    async def get_or_embed(
+        self, model_name: str, texts: Sequence[str], embed_fn: EmbedFn
+    ) -> List[Embedding]:
+        """
+        Return embeddings for texts, embedding only the ones not cached
+
+        Args:
+            model_name (str): Name of the model producing the embeddings
+            texts (Sequence[str]): Query texts, in order
+            embed_fn (EmbedFn): Coroutine embedding a list of texts
+
+        Returns:
+            List[Embedding]: Embeddings in the order of texts
+        """
+        texts = list(texts)
+        if not self.enabled or not texts:
+            return await self._embed(embed_fn, texts)
+
+        keys = [embedding_cache_key(model_name, text) for text in texts]
+        results: List[Optional[Embedding]] = [None] * len(texts)
+        missing: Dict[str, List[int]] = OrderedDict()
+        for index, key in enumerate(keys):
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                results[index] = embedding
+            else:
+                missing.setdefault(key, []).append(index)
+
+        if missing and self.shared:
+            for key, embedding in (await self._get_shared(list(missing))).items():
+                self.shared_hits += len(missing[key])
+                self._store(key, embedding)
+                for index in missing.pop(key):
+                    results[index] = embedding
+
+        cached = sum(result is not None for result in results)
+        self.time_saved_seconds += cached * self._average_embed_time()
+
+        if missing:
+            self.misses += sum(len(indexes) for indexes in missing.values())
+            missing_texts = [texts[indexes[0]] for indexes in missing.values()]
+            embeddings = await self._embed(embed_fn, missing_texts)
+            for (key, indexes), embedding in zip(missing.items(), embeddings):
+                self._store(key, embedding)
+                for index in indexes:
+                    results[index] = embedding
+            if self.shared:
+                await self._set_shared(dict(zip(missing, embeddings)))
+
+        return results
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._sizes.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.shared_hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "shared": self.shared,
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "maxBytes": self.max_bytes,
+            "hits": self.hits,
+            "sharedHits": self.shared_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "redisErrors": self.redis_errors,
+            "hitRatio": (
+                round((self.hits + self.shared_hits) / lookups, 4) if lookups else 0.0
+            ),
+            "embedTimeSeconds": round(self.embed_time_seconds, 3),
+            "timeSavedSeconds": round(self.time_saved_seconds, 3),
+        }
+
+    async def _embed(self, embed_fn: EmbedFn, texts: List[str]) -> List[Embedding]:
+        if not texts:
+            return []
+        start = time.monotonic()
+        try:
+            return await embed_fn(texts)
+        finally:
+            self.embed_time_seconds += time.monotonic() - start
+            self.embedded_texts += len(texts)
+
+    def _average_embed_time(self) -> float:
+        if not self.embedded_texts:
+            return 0.0
+        return self.embed_time_seconds / self.embedded_texts
+
+    def _store(self, key: str, embedding: Embedding) -> None:
+        size = _estimate_size(embedding)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self.current_bytes -= self._sizes[key]
+        self._entries[key] = embedding
+        self._sizes[key] = size
+        self.current_bytes += size
+        self._entries.move_to_end(key)
+        while self.current_bytes > self.max_bytes:
+            evicted_key, _ = self._entries.popitem(last=False)
+            self.current_bytes -= self._sizes.pop(evicted_key)
+            self.evictions += 1
+
+    async def _get_shared(self, keys: List[str]) -> Dict[str, Embedding]:
+        try:
+            values = await self.redis_client.mget(keys)
+            return {
+                key: json.loads(value) for key, value in zip(keys, values) if value
+            }
+        except Exception as e:
+            self.redis_errors += 1
+            self.logger.warning(f"Failed to read shared query embeddings: {str(e)}")
+            return {}
+
+    async def _set_shared(self, embeddings: Dict[str, Embedding]) -> None:
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, embedding in embeddings.items():
+                    pipe.set(key, json.dumps(embedding), ex=self.redis_ttl_seconds)
+                await pipe.execute()
+        except Exception as e:
+            self.redis_errors += 1
+            self.logger.warning(f"Failed to write shared query embeddings: {str(e)}")
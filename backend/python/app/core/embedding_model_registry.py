@@ -0,0 +1,206 @@
+"""Resolve the configured dense embedding model once per config version
+
+Building an embedding model (loading local weights or creating a provider
+client) and learning its vector size used to happen on every indexing,
+delete and search initialization, each time with an ``embed_query("test")``
+probe that costs a paid API call on remote providers.
+
+EmbeddingModelRegistry resolves the model, its dimension and the
+QdrantVectorStores built on it once, and keeps them until the embedding
+configuration changes. The configuration version is a fingerprint of the
+``embedding`` section of the AI models config, which the configuration
+service serves from its etcd-watched cache; config-change events can also
+drop the cached model explicitly through ``invalidate``.
+"""
+
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from langchain.embeddings.base import Embeddings
+from langchain_qdrant import QdrantVectorStore, RetrievalMode
+from qdrant_client import QdrantClient
+
+from app.config.configuration_service import config_node_constants
+from app.config.utils.named_constants.ai_models_named_constants import (
+    DEFAULT_EMBEDDING_MODEL,
+)
+from app.exceptions.embedding_exceptions import EmbeddingModelCreationError
+from app.utils.aimodels import get_default_embedding_model, get_embedding_model
+
+# Output sizes of common models, so the dimension is known without a probe
+KNOWN_EMBEDDING_DIMENSIONS = {
+    "BAAI/bge-large-en-v1.5": 1024,
+    "BAAI/bge-base-en-v1.5": 768,
+    "BAAI/bge-small-en-v1.5": 384,
+    "sentence-transformers/all-MiniLM-L6-v2": 384,
+    "sentence-transformers/all-mpnet-base-v2": 768,
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+    "text-embedding-ada-002": 1536,
+    "embed-english-v3.0": 1024,
+    "embed-multilingual-v3.0": 1024,
+    "embed-english-light-v3.0": 384,
+    "nomic-ai/nomic-embed-text-v1.5": 768,
+}
+
+
+@dataclass(frozen=True)
+class EmbeddingModelInfo:
+    dense_embeddings: Embeddings
+    model_name: str
+    dimension: int
+    config_version: str
+
+
+VectorStoreHook = Callable[[EmbeddingModelInfo], Optional[Awaitable[None]]]
+
+
+def embedding_config_version(ai_models: Optional[Dict[str, Any]]) -> str:
+    """Fingerprint of the embedding section of the AI models config"""
+    embedding_configs = (ai_models or {}).get("embedding") or []
+    payload = json.dumps(embedding_configs, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def get_embedding_model_name(dense_embeddings: Embeddings) -> str:
+    if hasattr(dense_embeddings, "model_name"):
+        return dense_embeddings.model_name
+    if hasattr(dense_embeddings, "model"):
+        return dense_embeddings.model
+    return "unknown"
+
+
+class EmbeddingModelRegistry:
+    """Caches the dense embedding model and its vector stores per config version"""
+
+    def __init__(self, logger, config_service, qdrant_client: QdrantClient) -> None:
+        self.logger = logger
+        self.config_service = config_service
+        self.qdrant_client = qdrant_client
+        self._model: Optional[EmbeddingModelInfo] = None
+        self._vector_stores: Dict[Tuple[str, str], QdrantVectorStore] = {}
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        """Drop the cached model and vector stores, e.g. on config change events"""
+        self._model = None
+        self._vector_stores.clear()
+        self.logger.info("Embedding model registry invalidated")
+
+    async def get_model(self) -> EmbeddingModelInfo:
+        """Return the configured dense model, building it only on config changes"""
+        ai_models = await self.config_service.get_config(
+            config_node_constants.AI_MODELS.value
+        )
+        config_version = embedding_config_version(ai_models)
+        model = self._model
+        if model and model.config_version == config_version:
+            return model
+
+        async with self._lock:
+            if self._model and self._model.config_version == config_version:
+                return self._model
+            model = await self._build_model(ai_models, config_version)
+            self._model = model
+            self._vector_stores.clear()
+            return model
+
+    async def get_vector_store(
+        self,
+        collection_name: str,
+        sparse_embeddings,
+        on_create: Optional[VectorStoreHook] = None,
+    ) -> QdrantVectorStore:
+        """
+        Return the hybrid QdrantVectorStore of a collection for the current model
+
+        Args:
+            collection_name (str): Qdrant collection
+            sparse_embeddings: Sparse (BM25) embeddings of the store
+            on_create (Optional[VectorStoreHook]): Called once per model version
+                before the store is built, e.g. to check or create the collection.
+                Nothing is cached if it raises.
+        """
+        model = await self.get_model()
+        key = (collection_name, model.config_version)
+        vector_store = self._vector_stores.get(key)
+        if vector_store is not None:
+            return vector_store
+
+        async with self._lock:
+            vector_store = self._vector_stores.get(key)
+            if vector_store is not None:
+                return vector_store
+            if on_create:
+                result = on_create(model)
+                if asyncio.iscoroutine(result):
+                    await result
+            vector_store = QdrantVectorStore(
+                client=self.qdrant_client,
+                collection_name=collection_name,
+                vector_name="dense",
+                sparse_vector_name="sparse",
+                embedding=model.dense_embeddings,
+                sparse_embedding=sparse_embeddings,
+                retrieval_mode=RetrievalMode.HYBRID,
+            )
+            self._vector_stores[key] = vector_store
+            return vector_store
+
+    async def _build_model(
+        self, ai_models: Optional[Dict[str, Any]], config_version: str
+    ) -> EmbeddingModelInfo:
+        embedding_configs = (ai_models or {}).get("embedding") or []
+        try:
+            if not embedding_configs:
+                self.logger.info("Using default embedding model")
+                dense_embeddings = await asyncio.to_thread(get_default_embedding_model)
+            else:
+                config = embedding_configs[0]
+                dense_embeddings = await asyncio.to_thread(
+                    get_embedding_model, config["provider"], config
+                )
+        except Exception as e:
+            self.logger.error(f"Error creating embedding model: {str(e)}")
+            raise EmbeddingModelCreationError(
+                f"Failed to create embedding model: {str(e)}"
+            ) from e
+
+        model_name = get_embedding_model_name(dense_embeddings) or DEFAULT_EMBEDDING_MODEL
+        dimension = await self._resolve_dimension(dense_embeddings, model_name)
+        self.logger.info(
+            f"Using embedding model: {model_name}, embedding_size: {dimension}"
+        )
+        return EmbeddingModelInfo(
+            dense_embeddings=dense_embeddings,
+            model_name=model_name,
+            dimension=dimension,
+            config_version=config_version,
+        )
+
+    async def _resolve_dimension(
+        self, dense_embeddings: Embeddings, model_name: str
+    ) -> int:
+        """Vector size from the local model or the known models table, probing only as a last resort"""
+        client = getattr(dense_embeddings, "_client", None)
+        if client is not None and hasattr(client, "get_sentence_embedding_dimension"):
+            dimension = client.get_sentence_embedding_dimension()
+            if dimension:
+                return dimension
+
+        dimension = KNOWN_EMBEDDING_DIMENSIONS.get(str(model_name).removeprefix("models/"))
+        if dimension:
+            return dimension
+
+        # Unknown model: a single probe per config version
+        try:
+            sample_embedding = await dense_embeddings.aembed_query("test")
+        except Exception as e:
+            self.logger.error(f"Error probing embedding model dimension: {str(e)}")
+            raise EmbeddingModelCreationError(
+                f"Failed to get embedding model dimension: {str(e)}"
+            ) from e
+        return len(sample_embedding)
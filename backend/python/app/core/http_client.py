@@ -0,0 +1,52 @@
+"""Shared aiohttp session of the indexing service
+
+Resolving signed URLs, downloading files and uploading summaries used to open
+a new ClientSession per message and per retry, paying a DNS lookup and a
+TCP/TLS handshake every time. The indexing container now owns one long-lived
+session whose connector keeps connections alive, limits connections per host
+and caches DNS results.
+"""
+
+import os
+from typing import AsyncIterator
+
+import aiohttp
+
+# Total and per-host simultaneous connections
+HTTP_CLIENT_LIMIT = int(os.getenv("HTTP_CLIENT_LIMIT", "100"))
+HTTP_CLIENT_LIMIT_PER_HOST = int(os.getenv("HTTP_CLIENT_LIMIT_PER_HOST", "20"))
+# Seconds an idle connection is kept open for reuse
+HTTP_CLIENT_KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_CLIENT_KEEPALIVE_TIMEOUT", "30"))
+HTTP_CLIENT_DNS_CACHE_TTL = int(os.getenv("HTTP_CLIENT_DNS_CACHE_TTL", "300"))
+HTTP_CLIENT_CONNECT_TIMEOUT = float(os.getenv("HTTP_CLIENT_CONNECT_TIMEOUT", "120"))
+
+# Default timeout of the session; long downloads pass their own per request
+DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=300, connect=HTTP_CLIENT_CONNECT_TIMEOUT)
+
+
+def create_http_session(**session_kwargs) -> aiohttp.ClientSession:
+    """Connection-pooled session; must be created inside the running event loop"""
+    connector = aiohttp.TCPConnector(
+        limit=HTTP_CLIENT_LIMIT,
+        limit_per_host=HTTP_CLIENT_LIMIT_PER_HOST,
+        keepalive_timeout=HTTP_CLIENT_KEEPALIVE_TIMEOUT,
+        ttl_dns_cache=HTTP_CLIENT_DNS_CACHE_TTL,
+        use_dns_cache=True,
+    )
+    return aiohttp.ClientSession(
+        connector=connector, timeout=DEFAULT_TIMEOUT, **session_kwargs
+    )
+
+
+async def http_session_resource(logger) -> AsyncIterator[aiohttp.ClientSession]:
+    """dependency_injector Resource: yields the shared session and closes it on shutdown"""
+    session = create_http_session()
+    logger.info(
+        f"🌐 Shared HTTP session created (limit {HTTP_CLIENT_LIMIT}, "
+        f"per host {HTTP_CLIENT_LIMIT_PER_HOST})"
+    )
+    try:
+        yield session
+    finally:
+        await session.close()
+        logger.info("🌐 Shared HTTP session closed")
@@ -0,0 +1,217 @@
+"""Content-addressed cache of OCR and document parsing results
+
+Re-syncs, duplicate uploads and re-index requests (reindex_failed_records)
+send byte-identical files through OCR and layout parsing again, including
+paid Azure Document Intelligence calls.
+
+ParseResultCache keys results by the SHA-256 of the input, the parsing task,
+the OCR provider, PARSE_CACHE_VERSION and the installed parser library
+versions, so a changed file, provider or parser simply misses the cache.
+Entries are pickled and zlib-compressed into PARSE_CACHE_DIR and evicted
+least recently used first once the directory exceeds PARSE_CACHE_MAX_BYTES.
+Writes are atomic, so the directory can be a volume shared by indexing
+replicas.
+"""
+
+import asyncio
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import zlib
+from importlib import metadata
+from typing import Any, Dict, List, Optional, Tuple
+
+PARSE_CACHE_ENABLED = os.getenv("PARSE_CACHE_ENABLED", "true").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+PARSE_CACHE_DIR = os.getenv("PARSE_CACHE_DIR") or os.path.join(
+    tempfile.gettempdir(), "parse_result_cache"
+)
+PARSE_CACHE_MAX_BYTES = int(
+    os.getenv("PARSE_CACHE_MAX_BYTES", str(2 * 1024 * 1024 * 1024))
+)
+# Bump when the extraction output changes without a library upgrade
+PARSE_CACHE_VERSION = os.getenv("PARSE_CACHE_VERSION", "1")
+
+# Libraries whose upgrades can change parsing results
+PARSER_DISTRIBUTIONS = (
+    "docling",
+    "PyMuPDF",
+    "ocrmypdf",
+    "spacy",
+    "azure-ai-formrecognizer",
+)
+
+ENTRY_SUFFIX = ".bin"
+# Eviction frees space down to this fraction of the limit
+_EVICTION_TARGET = 0.9
+
+
+def parser_versions() -> str:
+    versions = []
+    for distribution in PARSER_DISTRIBUTIONS:
+        try:
+            versions.append(f"{distribution}={metadata.version(distribution)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{distribution}=")
+    return ",".join(versions)
+
+
+class ParseResultCache:
+    """Size-bounded on-disk LRU of parsing results keyed by content hash"""
+
+    def __init__(
+        self,
+        logger,
+        cache_dir: str = PARSE_CACHE_DIR,
+        max_bytes: int = PARSE_CACHE_MAX_BYTES,
+        enabled: bool = PARSE_CACHE_ENABLED,
+    ) -> None:
+        self.logger = logger
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self._key_prefix = f"{PARSE_CACHE_VERSION}\x00{parser_versions()}"
+        self._size: Optional[int] = None
+        # Guards size accounting and eviction across writer threads
+        self._size_lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.errors = 0
+
+        if self.enabled:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self.logger.info(
+                f"🗃️ Parse result cache at {self.cache_dir} "
+                f"(max {self.max_bytes / 1024 / 1024:.0f} MB)"
+            )
+
+    def key(self, content_sha256: str, task: str, provider: str = "") -> str:
+        """Cache key of a task's result for the given content and provider"""
+        return hashlib.sha256(
+            f"{self._key_prefix}\x00{task}\x00{provider}\x00{content_sha256}".encode("utf-8")
+        ).hexdigest()
+
+    async def get(self, key: str) -> Optional[Any]:
+        if not self.enabled:
+            return None
+        value = await asyncio.to_thread(self._read, key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def put(self, key: str, value: Any) -> None:
+        if not self.enabled or value is None:
+            return
+        await asyncio.to_thread(self._write, key, value)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "bytes": self._size,
+            "maxBytes": self.max_bytes,
+        }
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + ENTRY_SUFFIX)
+
+    def _read(self, key: str) -> Optional[Any]:
+        path = self._entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            value = pickle.loads(zlib.decompress(data))
+        except Exception as e:
+            self.errors += 1
+            self.logger.warning(f"⚠️ Dropping unreadable parse cache entry {key}: {str(e)}")
+            self._remove(path)
+            return None
+        # Recency for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def _write(self, key: str, value: Any) -> None:
+        path = self._entry_path(key)
+        try:
+            data = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=os.path.dirname(path), suffix=".tmp", delete=False
+            ) as temp_file:
+                temp_file.write(data)
+            os.replace(temp_file.name, path)
+        except Exception as e:
+            self.errors += 1
+            self.logger.warning(f"⚠️ Could not write parse cache entry {key}: {str(e)}")
+            return
+
+        with self._size_lock:
+            self.writes += 1
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(ENTRY_SUFFIX):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _scan_size(self) -> int:
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries())
+        size = sum(size for _, size, _ in entries)
+        target = self.max_bytes * _EVICTION_TARGET
+        evicted = 0
+        for _, entry_size, path in entries:
+            if size <= target:
+                break
+            if self._remove(path):
+                size -= entry_size
+                evicted += 1
+        self._size = size
+        self.evictions += evicted
+        self.logger.info(
+            f"🧹 Evicted {evicted} parse cache entries, "
+            f"{size / 1024 / 1024:.0f} MB remaining"
+        )
+
+    def _remove(self, path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except FileNotFoundError:
+            return False
@@ -0,0 +1,108 @@
+"""Load the NLP and conversion models used by parsers once per process
+
+The OCR strategies used to call ``spacy.load`` and rebuild their custom
+sentence-boundary tokenizer for every PDF, and DocxParser created a new
+Docling DocumentConverter for every document. That cost seconds of model
+loading per document.
+
+ParserModelRegistry builds each model lazily on first use and keeps it for
+the lifetime of the process. Parsing runs in the ParsingPool workers, which
+warm the registry up in their initializer and report how long each model
+took to load.
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict
+
+SPACY_MODEL_NAME = os.getenv("SPACY_MODEL_NAME", "en_core_web_sm")
+
+
+class ParserModelRegistry:
+    """Process-wide cache of spaCy pipelines and Docling converters"""
+
+    def __init__(self, logger=None) -> None:
+        self.logger = logger
+        self._models: Dict[str, Any] = {}
+        self._load_seconds: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    def get(self, name: str, factory: Callable[[], Any]) -> Any:
+        """Return the model registered under name, building it with factory once"""
+        model = self._models.get(name)
+        if model is not None:
+            return model
+
+        with self._lock:
+            model = self._models.get(name)
+            if model is not None:
+                return model
+            start = time.monotonic()
+            model = factory()
+            elapsed = time.monotonic() - start
+            self._models[name] = model
+            self._load_seconds[name] = elapsed
+            self._log("info", f"🧠 Loaded {name} in {elapsed:.2f}s")
+            return model
+
+    def spacy_pipeline(self, name: str, configure: Callable[[Any], Any]) -> Any:
+        """
+        Shared spaCy pipeline customized by configure
+
+        Each name gets its own copy of the base model, since configure adds
+        pipes and tokenizer special cases to it.
+
+        Args:
+            name (str): Name of the customized pipeline
+            configure (Callable): Adds components to a freshly loaded model
+                and returns it
+        """
+        return self.get(
+            f"spacy:{name}", lambda: configure(self._load_spacy_model())
+        )
+
+    def document_converter(self) -> Any:
+        """Shared Docling DocumentConverter for DOCX, PPTX, HTML and Markdown"""
+        return self.get("docling:converter", self._create_document_converter)
+
+    def load_times(self) -> Dict[str, float]:
+        """Seconds spent loading each model of this process"""
+        return {name: round(seconds, 3) for name, seconds in self._load_seconds.items()}
+
+    def _load_spacy_model(self) -> Any:
+        import spacy
+
+        try:
+            return spacy.load(SPACY_MODEL_NAME)
+        except Exception as e:
+            self._log(
+                "warning",
+                f"spaCy model '{SPACY_MODEL_NAME}' not available, falling back to blank 'en': {e}",
+            )
+            return spacy.blank("en")
+
+    def _create_document_converter(self) -> Any:
+        from docling.datamodel.base_models import InputFormat
+        from docling.document_converter import DocumentConverter
+
+        converter = DocumentConverter()
+        # Build the format pipelines now rather than on the first document
+        for input_format in (InputFormat.DOCX, InputFormat.PPTX, InputFormat.HTML):
+            converter.initialize_pipeline(input_format)
+        return converter
+
+    def _log(self, level: str, message: str) -> None:
+        if self.logger is not None:
+            getattr(self.logger, level)(message)
+
+
+# Models are only built on first use, so creating the registry is cheap
+_registry = ParserModelRegistry()
+
+
+def get_parser_model_registry(logger=None) -> ParserModelRegistry:
+    """Registry of the current process"""
+    if logger is not None and _registry.logger is None:
+        _registry.logger = logger
+    return _registry
@@ -0,0 +1,244 @@
+"""Process pool for CPU-bound document parsing and OCR
+
+OCRmyPDF, PyMuPDF text extraction, spaCy sentence splitting and Docling
+conversions are CPU-bound and used to run inside ``async def`` methods of the
+indexing service. While one large PDF was being OCR'd the event loop could
+not consume Kafka, answer health checks or download other files.
+
+ParsingPool runs those tasks (see app.modules.parsers.parsing_tasks) in
+worker processes:
+
+* workers are spawned and warmed up at startup, with parsers and models
+  (app.core.parser_model_registry) preloaded; load times are reported
+* every task has a timeout; a task that overruns takes its pool generation
+  down with it, since a single worker of a ProcessPoolExecutor cannot be
+  killed, and a fresh generation takes over
+* workers can be capped with RLIMIT_AS, and a generation is recycled
+  gracefully after PARSING_POOL_MAX_TASKS tasks or once a worker's peak RSS
+  exceeds PARSING_WORKER_MAX_RSS_MB
+"""
+
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+from app.exceptions.indexing_exceptions import DocumentProcessingError
+from app.modules.parsers import parsing_tasks
+
+PARSING_POOL_WORKERS = int(
+    os.getenv("PARSING_POOL_WORKERS", str(max(1, (os.cpu_count() or 2) - 1)))
+)
+PARSING_TASK_TIMEOUT_SECONDS = float(os.getenv("PARSING_TASK_TIMEOUT_SECONDS", "900"))
+# Hard address-space cap per worker (RLIMIT_AS); 0 disables it
+PARSING_WORKER_MEMORY_LIMIT_MB = int(os.getenv("PARSING_WORKER_MEMORY_LIMIT_MB", "0"))
+# Recycle the workers once one of them has grown beyond this peak RSS
+PARSING_WORKER_MAX_RSS_MB = int(os.getenv("PARSING_WORKER_MAX_RSS_MB", "3072"))
+# Recycle the workers after this many tasks per generation; 0 disables it
+PARSING_POOL_MAX_TASKS = int(os.getenv("PARSING_POOL_MAX_TASKS", "200"))
+
+
+class ParsingPool:
+    """Runs parsing tasks in recyclable, warm worker processes"""
+
+    def __init__(
+        self,
+        logger,
+        max_workers: int = PARSING_POOL_WORKERS,
+        task_timeout_seconds: float = PARSING_TASK_TIMEOUT_SECONDS,
+        memory_limit_mb: int = PARSING_WORKER_MEMORY_LIMIT_MB,
+        max_rss_mb: int = PARSING_WORKER_MAX_RSS_MB,
+        max_tasks_per_generation: int = PARSING_POOL_MAX_TASKS,
+    ) -> None:
+        self.logger = logger
+        self.max_workers = max(1, max_workers)
+        self.task_timeout_seconds = task_timeout_seconds
+        self.memory_limit_mb = memory_limit_mb
+        self.max_rss_mb = max_rss_mb
+        self.max_tasks_per_generation = max_tasks_per_generation
+        # spawn: forking a process that runs an event loop and threads is unsafe
+        self._context = multiprocessing.get_context("spawn")
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._generation = 0
+        self._generation_tasks = 0
+
+        self.tasks = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.recycles = 0
+        self.busy_seconds = 0.0
+        self.in_flight = 0
+        self.warm_up_seconds = 0.0
+        self.model_load_seconds: Dict[str, float] = {}
+
+    async def start(self) -> None:
+        """Spawn the workers and wait until each one has preloaded its parsers and models"""
+        self._new_generation()
+        await self._warm_up()
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Run a module-level function of parsing_tasks in a worker process
+
+        Args:
+            func (Callable): Picklable task function
+            *args: Positional arguments of the task
+            timeout (Optional[float]): Seconds before the task is abandoned,
+                PARSING_TASK_TIMEOUT_SECONDS by default
+            **kwargs: Keyword arguments of the task
+
+        Returns:
+            Any: The task's result
+
+        Raises:
+            DocumentProcessingError: If the task times out
+        """
+        timeout = timeout or self.task_timeout_seconds
+        for attempt in range(2):
+            if self._executor is None:
+                self._new_generation()
+            executor, generation = self._executor, self._generation
+            self._generation_tasks += 1
+            self.tasks += 1
+            self.in_flight += 1
+            start = time.monotonic()
+            try:
+                future = asyncio.wrap_future(
+                    executor.submit(parsing_tasks.run_task, func, args, kwargs)
+                )
+                result, peak_rss_mb = await asyncio.wait_for(future, timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                self.failures += 1
+                self.logger.error(
+                    f"⏱️ Parsing task {func.__name__} exceeded {timeout:.0f}s, "
+                    f"terminating worker generation {generation}"
+                )
+                self._terminate(executor, generation)
+                raise DocumentProcessingError(
+                    f"Parsing timed out after {timeout:.0f} seconds",
+                    details={"task": func.__name__, "timeoutSeconds": timeout},
+                )
+            except BrokenProcessPool:
+                # A worker died (killed, out of memory or terminated after a
+                # timeout of another task): retry once on a fresh generation
+                self.failures += 1
+                self.logger.warning(
+                    f"⚠️ Parsing worker generation {generation} broke during "
+                    f"{func.__name__} (attempt {attempt + 1})"
+                )
+                self._terminate(executor, generation)
+                if attempt:
+                    raise
+                continue
+            except Exception:
+                self.failures += 1
+                raise
+            finally:
+                self.in_flight -= 1
+                self.busy_seconds += time.monotonic() - start
+
+            self._maybe_recycle(generation, peak_rss_mb)
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.max_workers,
+            "generation": self._generation,
+            "tasks": self.tasks,
+            "inFlight": self.in_flight,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "recycles": self.recycles,
+            "busySeconds": round(self.busy_seconds, 3),
+            "warmUpSeconds": round(self.warm_up_seconds, 3),
+            "modelLoadSeconds": self.model_load_seconds,
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def _new_generation(self) -> None:
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self._context,
+            initializer=parsing_tasks.init_worker,
+            initargs=(self.memory_limit_mb,),
+        )
+        self._generation += 1
+        self._generation_tasks = 0
+        self.logger.info(
+            f"🏭 Parsing pool generation {self._generation} with {self.max_workers} workers"
+        )
+
+    async def _warm_up(self) -> None:
+        executor = self._executor
+        loop = asyncio.get_running_loop()
+        start = time.monotonic()
+        reports = await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, parsing_tasks.warm_up)
+                for _ in range(self.max_workers)
+            )
+        )
+        self.warm_up_seconds = time.monotonic() - start
+        # Slowest load of each model across the workers
+        model_load_seconds: Dict[str, float] = {}
+        for report in reports:
+            for name, seconds in report["models"].items():
+                model_load_seconds[name] = max(seconds, model_load_seconds.get(name, 0.0))
+        self.model_load_seconds = model_load_seconds
+        pids = sorted({report["pid"] for report in reports})
+        self.logger.info(
+            f"✅ Parsing workers {pids} warm in {self.warm_up_seconds:.1f}s, "
+            f"model load seconds: {model_load_seconds}"
+        )
+
+    def _maybe_recycle(self, generation: int, peak_rss_mb: float) -> None:
+        if generation != self._generation:
+            return
+        reason = None
+        if self.max_rss_mb and peak_rss_mb > self.max_rss_mb:
+            reason = f"worker peak RSS {peak_rss_mb:.0f} MB > {self.max_rss_mb} MB"
+        elif self.max_tasks_per_generation and self._generation_tasks >= self.max_tasks_per_generation:
+            reason = f"{self._generation_tasks} tasks"
+        if reason is None:
+            return
+
+        self.recycles += 1
+        self.logger.info(f"♻️ Recycling parsing workers of generation {generation}: {reason}")
+        old_executor = self._executor
+        self._new_generation()
+        # Running tasks of the old generation finish before its workers exit
+        old_executor.shutdown(wait=False)
+
+    def _terminate(self, executor: ProcessPoolExecutor, generation: int) -> None:
+        if generation == self._generation:
+            self._executor = None
+        # ProcessPoolExecutor has no public way to stop a busy worker
+        for process in list((executor._processes or {}).values()):
+            if process.is_alive():
+                process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def parsing_pool_resource(logger) -> AsyncIterator[ParsingPool]:
+    """dependency_injector Resource: starts the pool and shuts it down with the container"""
+    pool = ParsingPool(logger)
+    await pool.start()
+    try:
+        yield pool
+    finally:
+        pool.shutdown(wait=False)
+        logger.info("🏭 Parsing pool shut down")
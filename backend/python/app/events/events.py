@@ -15,29 +15,46 @@ from app.config.utils.named_constants.arangodb_constants import (
     RecordTypes,
 )
 from app.config.utils.named_constants.http_status_code_constants import HttpStatusCode
+from app.utils.downloaded_file import DownloadedFile
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
+# Extensions whose processors accept a DownloadedFile and read it by path
+PATH_READABLE_EXTENSIONS = {
+    ExtensionTypes.PDF.value,
+    ExtensionTypes.CSV.value,
+    ExtensionTypes.XLSX.value,
+    ExtensionTypes.XLS.value,
+    ExtensionTypes.DOC.value,
+    ExtensionTypes.PPT.value,
+}
+
 
 class EventProcessor:
-    def __init__(self, logger, processor, arango_service) -> None:
+    def __init__(self, logger, processor, arango_service, http_session: aiohttp.ClientSession) -> None:
         self.logger = logger
         self.logger.info("🚀 Initializing EventProcessor")
         self.processor = processor
         self.arango_service = arango_service
+        # Shared connection-pooled session owned by the container
+        self.http_session = http_session
 
     async def _download_from_signed_url(
-        self, signed_url: str, record_id: str, doc: dict
-    ) -> bytes:
+        self, signed_url: str, record_id: str, doc: dict, extension: str = ""
+    ) -> DownloadedFile:
         """
         Download file from signed URL with exponential backoff retry
 
+        The body is streamed into a DownloadedFile, which spills to a temporary
+        file on disk past DOWNLOAD_SPOOL_MAX_MEMORY_BYTES. The caller closes it.
+
         Args:
             signed_url: The signed URL to download from
             record_id: Record ID for logging
             doc: Document object for status updates
+            extension: File extension, used as suffix of the spilled file
 
         Returns:
-            bytes: The downloaded file content
+            DownloadedFile: The downloaded file content
         """
         chunk_size = 1024 * 1024 * 3  # 3MB chunks
         max_retries = 3
@@ -51,53 +68,49 @@ class EventProcessor:
 
         for attempt in range(max_retries):
             delay = base_delay * (2**attempt)  # Exponential backoff
-            file_buffer = BytesIO()
+            file_buffer = DownloadedFile(suffix=f".{extension}" if extension else "")
             try:
-                async with aiohttp.ClientSession(timeout=timeout) as session:
-                    try:
-                        async with session.get(signed_url) as response:
-                            if response.status != HttpStatusCode.SUCCESS.value:
-                                raise aiohttp.ClientError(
-                                    f"Failed to download file: {response.status}"
-                                )
+                async with self.http_session.get(
+                    signed_url, timeout=timeout
+                ) as response:
+                    if response.status != HttpStatusCode.SUCCESS.value:
+                        raise aiohttp.ClientError(
+                            f"Failed to download file: {response.status}"
+                        )
 
-                            content_length = response.headers.get("Content-Length")
-                            if content_length:
-                                self.logger.info(
-                                    f"Expected file size: {int(content_length) / (1024*1024):.2f} MB"
-                                )
+                    content_length = response.headers.get("Content-Length")
+                    if content_length:
+                        self.logger.info(
+                            f"Expected file size: {int(content_length) / (1024*1024):.2f} MB"
+                        )
 
-                            last_logged_size = 0
-                            total_size = 0
-                            log_interval = chunk_size
-
-                            self.logger.info("Starting chunked download...")
-                            try:
-                                async for chunk in response.content.iter_chunked(
-                                    chunk_size
-                                ):
-                                    file_buffer.write(chunk)
-                                    total_size += len(chunk)
-                                    if total_size - last_logged_size >= log_interval:
-                                        self.logger.debug(
-                                            f"Total size so far: {total_size / (1024*1024):.2f} MB"
-                                        )
-                                        last_logged_size = total_size
-                            except IOError as io_err:
-                                raise aiohttp.ClientError(
-                                    f"IO error during chunk download: {str(io_err)}"
-                                )
+                    last_logged_size = 0
+                    total_size = 0
+                    log_interval = chunk_size
 
-                            file_content = file_buffer.getvalue()
-                            self.logger.info(
-                                f"✅ Download complete. Total size: {total_size / (1024*1024):.2f} MB"
-                            )
-                            return file_content
+                    self.logger.info("Starting chunked download...")
+                    try:
+                        async for chunk in response.content.iter_chunked(
+                            chunk_size
+                        ):
+                            file_buffer.write(chunk)
+                            total_size += len(chunk)
+                            if total_size - last_logged_size >= log_interval:
+                                self.logger.debug(
+                                    f"Total size so far: {total_size / (1024*1024):.2f} MB"
+                                )
+                                last_logged_size = total_size
+                    except IOError as io_err:
+                        raise aiohttp.ClientError(
+                            f"IO error during chunk download: {str(io_err)}"
+                        )
 
-                    except aiohttp.ServerDisconnectedError as sde:
-                        raise aiohttp.ClientError(f"Server disconnected: {str(sde)}")
-                    except aiohttp.ClientConnectorError as cce:
-                        raise aiohttp.ClientError(f"Connection error: {str(cce)}")
+                    self.logger.info(
+                        f"✅ Download complete. Total size: {total_size / (1024*1024):.2f} MB"
+                        f"{'' if file_buffer.in_memory else ' (spooled to disk)'}"
+                    )
+                    downloaded, file_buffer = file_buffer, None
+                    return downloaded
 
             except (aiohttp.ClientError, asyncio.TimeoutError, IOError) as e:
                 error_type = type(e).__name__
@@ -132,7 +145,7 @@ class EventProcessor:
                 await asyncio.sleep(delay)
 
             finally:
-                if not file_buffer.closed:
+                if file_buffer is not None:
                     file_buffer.close()
 
     async def on_event(self, event_data: dict) -> None:
@@ -147,6 +160,7 @@ class EventProcessor:
                 - connector_name: Name of the connector
                 - metadata_route: Route to get metadata
         """
+        downloaded_file = None
         try:
             # Extract event type and record ID
             event_type = event_data.get(
@@ -169,7 +183,9 @@ class EventProcessor:
                 self.logger.info(
                     f"""🔄 Updating record {record_id} - deleting existing embeddings"""
                 )
-                await self.processor.indexing_pipeline.delete_embeddings(record_id, virtual_record_id)
+                await self.processor.indexing_pipeline.delete_embeddings(
+                    record_id, virtual_record_id, org_id=org_id
+                )
 
             if virtual_record_id is None:
                 virtual_record_id = str(uuid4())
@@ -209,14 +225,20 @@ class EventProcessor:
 
             if signed_url:
                 self.logger.debug("Signed URL received")
-                file_content = await self._download_from_signed_url(
-                    signed_url, record_id, doc
+                downloaded_file = await self._download_from_signed_url(
+                    signed_url, record_id, doc, extension
                 )
+                file_content = downloaded_file
             else:
                 file_content = event_data.get("buffer")
 
             self.logger.debug(f"file_content type: {type(file_content)}")
 
+            # PDF, CSV, Excel and LibreOffice conversions read spooled downloads
+            # from disk; the remaining parsers take the content as bytes
+            if downloaded_file is not None and extension not in PATH_READABLE_EXTENSIONS:
+                file_content = downloaded_file.read_bytes()
+
             record_type = doc.get("recordType")
             if record_type == RecordTypes.FILE.value:
                 try:
@@ -228,7 +250,11 @@ class EventProcessor:
                     md5_checksum = file_doc.get("md5Checksum")
                     size_in_bytes = file_doc.get("sizeInBytes")
                     if md5_checksum is None:
-                        md5_checksum = hashlib.md5(file_content).hexdigest()
+                        md5_checksum = (
+                            downloaded_file.md5_hexdigest
+                            if downloaded_file is not None
+                            else hashlib.md5(file_content).hexdigest()
+                        )
                         file_doc.update({"md5Checksum": md5_checksum})
                         self.logger.info(f"🚀 Calculated md5_checksum: {md5_checksum}")
                         await self.arango_service.batch_upsert_nodes([file_doc], CollectionNames.FILES.value)
@@ -477,3 +503,6 @@ class EventProcessor:
             # Let the error bubble up to Kafka consumer
             self.logger.error(f"❌ Error in event processor: {repr(e)}")
             raise
+        finally:
+            if downloaded_file is not None:
+                downloaded_file.close()
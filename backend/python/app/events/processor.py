@@ -1,5 +1,5 @@
+import asyncio
 import json
-import os
 from datetime import datetime
 
 from app.config.configuration_service import config_node_constants
@@ -11,11 +11,24 @@ from app.config.utils.named_constants.arangodb_constants import (
     CollectionNames,
     ExtensionTypes,
 )
-from app.modules.parsers.pdf.ocr_handler import OCRHandler
+from app.modules.parsers import parsing_tasks
+from app.utils.downloaded_file import (
+    DownloadedFile,
+    FileContent,
+    content_path,
+    content_sha256,
+)
 from app.utils.llm import get_llm
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
 
+def _worker_source(content: FileContent):
+    """Spooled downloads go to parsing workers by path, anything else as bytes"""
+    if isinstance(content, DownloadedFile):
+        return content.read_bytes() if content.in_memory else content.path
+    return content
+
+
 class Processor:
     def __init__(
         self,
@@ -25,15 +38,103 @@ class Processor:
         indexing_pipeline,
         arango_service,
         parsers,
+        parsing_pool,
+        parse_cache=None,
     ) -> None:
         self.logger = logger
         self.logger.info("🚀 Initializing Processor")
+        # CPU-bound parsing and OCR run in worker processes
+        self.parsing_pool = parsing_pool
+        # Results of identical content are reused instead of re-parsed
+        self.parse_cache = parse_cache
         self.domain_extractor = domain_extractor
         self.indexing_pipeline = indexing_pipeline
         self.arango_service = arango_service
         self.parsers = parsers
         self.config_service = config_service
 
+    async def _parse(self, task, content, *args, provider: str = ""):
+        """
+        Run a parsing task on content in the parsing pool, reusing the cached
+        result when byte-identical content was parsed before
+
+        Args:
+            task: parsing_tasks function, called with args followed by the content
+            content: Bytes, text or DownloadedFile to parse
+            provider (str): OCR provider and model the result depends on
+        """
+        if self.parse_cache is None:
+            return await self.parsing_pool.run(task, *args, _worker_source(content))
+
+        key = self.parse_cache.key(content_sha256(content), task.__name__, provider)
+        result = await self.parse_cache.get(key)
+        if result is not None:
+            self.logger.info(f"♻️ Reusing cached {task.__name__} result")
+            return result
+
+        result = await self.parsing_pool.run(task, *args, _worker_source(content))
+        await self.parse_cache.put(key, result)
+        return result
+
+    def _extract_domain_metadata(
+        self, text, org_id, record_id, virtual_record_id
+    ) -> asyncio.Task:
+        """
+        Start domain metadata extraction and saving in the background, so the
+        LLM calls overlap chunking and embedding of the same document
+
+        Returns:
+            Task resolving to the record with its domain fields, or None
+        """
+
+        async def extract():
+            if not text:
+                return None
+            try:
+                metadata = await self.domain_extractor.extract_metadata(text, org_id)
+                return await self.domain_extractor.save_metadata_to_db(
+                    org_id, record_id, metadata, virtual_record_id
+                )
+            except Exception as e:
+                self.logger.error(f"❌ Error extracting metadata: {str(e)}")
+                return None
+
+        self.logger.info("🎯 Extracting domain metadata")
+        return asyncio.create_task(extract())
+
+    async def _record_metadata(self, record_id, collection=CollectionNames.FILES.value) -> dict:
+        """Record and file (or mail) fields carried by every indexed sentence"""
+        record, file = await asyncio.gather(
+            self.arango_service.get_document(record_id, CollectionNames.RECORDS.value),
+            self.arango_service.get_document(record_id, collection),
+        )
+        return {**(record or {}), **(file or {})}
+
+    async def _index_sentences(
+        self, sentence_data, virtual_record_id, domain_extraction, merge_documents=None
+    ):
+        """
+        Chunk and embed sentences while domain extraction finishes, then attach
+        the extracted fields to the indexed points
+
+        Returns:
+            The record with its domain fields, or None if extraction failed
+        """
+        try:
+            if sentence_data:
+                self.logger.debug(f"📑 Indexing {len(sentence_data)} sentences")
+                await self.indexing_pipeline.index_documents(
+                    sentence_data, merge_documents=merge_documents
+                )
+        finally:
+            domain_metadata = await domain_extraction
+
+        if sentence_data and domain_metadata:
+            await self.indexing_pipeline.set_domain_metadata(
+                virtual_record_id, domain_metadata
+            )
+        return domain_metadata
+
     async def process_google_slides(self, record_id, record_version, orgId, content, virtual_record_id) -> None:
         """Process Google Slides presentation and extract structured content
 
@@ -96,22 +197,11 @@ class Processor:
             # Join all text content with newlines
             full_text_content = "\n".join(text for text in text_content if text)
 
-            # Extract metadata using domain extractor
-            self.logger.info("🎯 Extracting metadata from content")
-            domain_metadata = None
-            try:
-                metadata = await self.domain_extractor.extract_metadata(
-                    full_text_content, orgId
-                )
-                record = await self.domain_extractor.save_metadata_to_db(
-                    orgId, record_id, metadata, virtual_record_id
-                )
-                file = await self.arango_service.get_document(
-                    record_id, CollectionNames.FILES.value
-                )
-                domain_metadata = {**record, **file}
-            except Exception as e:
-                self.logger.error(f"❌ Error extracting metadata: {str(e)}")
+            # Extract domain metadata in the background while indexing
+            domain_extraction = self._extract_domain_metadata(
+                full_text_content, orgId, record_id, virtual_record_id
+            )
+            record_metadata = await self._record_metadata(record_id)
 
             # Format content for output
             formatted_content = ""
@@ -135,7 +225,6 @@ class Processor:
             # Prepare metadata
             self.logger.debug("📋 Preparing metadata")
             metadata = {
-                "domain_metadata": domain_metadata,
                 "recordId": record_id,
                 "version": record_version,
                 "presentation_metadata": presentation_data["metadata"],
@@ -164,7 +253,7 @@ class Processor:
                                     {
                                         "text": sentence,
                                         "metadata": {
-                                            **(domain_metadata or {}),
+                                            **record_metadata,
                                             "recordId": record_id,
                                             "blockType": "slide_text",
                                             "pageNum": slide_number,
@@ -185,7 +274,7 @@ class Processor:
                                     {
                                         "text": cell_text,
                                         "metadata": {
-                                            **(domain_metadata or {}),
+                                            **record_metadata,
                                             "recordId": record_id,
                                             "blockType": "slide_table_cell",
                                             "pageNum": slide_number,
@@ -198,11 +287,10 @@ class Processor:
                                     }
                                 )
 
-            # Index sentences if available
-            if sentence_data:
-                self.logger.debug(f"📑 Indexing {len(sentence_data)} sentences")
-                pipeline = self.indexing_pipeline
-                await pipeline.index_documents(sentence_data)
+            # Index sentences while domain extraction finishes
+            metadata["domain_metadata"] = await self._index_sentences(
+                sentence_data, virtual_record_id, domain_extraction
+            )
 
             self.logger.info("✅ Google Slides processing completed successfully")
             return {
@@ -251,22 +339,11 @@ class Processor:
             # Join all text content with newlines
             full_text_content = "\n".join(text for text in text_content if text)
 
-            # Extract metadata using domain extractor
-            self.logger.info("🎯 Extracting metadata from content")
-            domain_metadata = None
-            try:
-                metadata = await self.domain_extractor.extract_metadata(
-                    full_text_content, orgId
-                )
-                record = await self.domain_extractor.save_metadata_to_db(
-                    orgId, record_id, metadata, virtual_record_id
-                )
-                file = await self.arango_service.get_document(
-                    record_id, CollectionNames.FILES.value
-                )
-                domain_metadata = {**record, **file}
-            except Exception as e:
-                self.logger.error(f"❌ Error extracting metadata: {str(e)}")
+            # Extract domain metadata in the background while indexing
+            domain_extraction = self._extract_domain_metadata(
+                full_text_content, orgId, record_id, virtual_record_id
+            )
+            record_metadata = await self._record_metadata(record_id)
 
             # Format content for output
             formatted_content = ""
@@ -321,7 +398,6 @@ class Processor:
             # Prepare metadata
             self.logger.debug("📋 Preparing metadata")
             metadata = {
-                "domain_metadata": domain_metadata,
                 "recordId": record_id,
                 "version": record_version,
                 "has_header": bool(headers),
@@ -370,7 +446,7 @@ class Processor:
                                 {
                                     "text": sentence,
                                     "metadata": {
-                                        **(domain_metadata or {}),
+                                        **record_metadata,
                                         "recordId": record_id,
                                         "blockType": "text",
                                         "blockNum": [idx],
@@ -396,7 +472,7 @@ class Processor:
                                 {
                                     "text": cell_text,
                                     "metadata": {
-                                        **(domain_metadata or {}),
+                                        **record_metadata,
                                         "recordId": record_id,
                                         "blockType": "table_cell",
                                         "blockNum": [idx],
@@ -409,11 +485,10 @@ class Processor:
                                 }
                             )
 
-            # Index sentences if available
-            if sentence_data:
-                self.logger.debug(f"📑 Indexing {len(sentence_data)} sentences")
-                pipeline = self.indexing_pipeline
-                await pipeline.index_documents(sentence_data)
+            # Index sentences while domain extraction finishes
+            metadata["domain_metadata"] = await self._index_sentences(
+                sentence_data, virtual_record_id, domain_extraction
+            )
 
             self.logger.info("✅ Google Docs processing completed successfully")
             return {
@@ -437,7 +512,6 @@ class Processor:
 
             combined_texts = []
             row_counter = 1
-            domain_metadata = None
             sentence_data = []
 
             for sheet_result in all_sheets_result:
@@ -449,23 +523,11 @@ class Processor:
                         row_counter += 1
 
             combined_text = "\n".join(combined_texts)
-            if combined_text:
-                try:
-                    self.logger.info("🎯 Extracting metadata from Excel content")
-                    metadata = await self.domain_extractor.extract_metadata(
-                        combined_text, orgId
-                    )
-                    record = await self.domain_extractor.save_metadata_to_db(
-                        orgId, record_id, metadata, virtual_record_id
-                    )
-                    file = await self.arango_service.get_document(
-                        record_id, CollectionNames.FILES.value
-                    )
-
-                    domain_metadata = {**record, **file}
-                except Exception as e:
-                    self.logger.error(f"❌ Error extracting metadata: {str(e)}")
-                    domain_metadata = None
+            # Extract domain metadata in the background while indexing
+            domain_extraction = self._extract_domain_metadata(
+                combined_text, orgId, record_id, virtual_record_id
+            )
+            record_metadata = await self._record_metadata(record_id)
 
             for sheet_idx, sheet_result in enumerate(all_sheets_result, 1):
                 self.logger.info(f"sheet_name: {sheet_result['sheet_name']}")
@@ -480,7 +542,7 @@ class Processor:
                             {
                                 "text": row["natural_language_text"],
                                 "metadata": {
-                                    **domain_metadata,
+                                    **record_metadata,
                                     "recordId": record_id,
                                     "sheetName": sheet_result["sheet_name"],
                                     "sheetNum": sheet_idx,
@@ -492,17 +554,16 @@ class Processor:
                             }
                         )
 
-            # Index sentences if available
-            if sentence_data:
-                self.logger.debug(f"📑 Indexing {len(sentence_data)} sentences")
-                pipeline = self.indexing_pipeline
-                await pipeline.index_documents(sentence_data, merge_documents=False)
+            # Index sentences while domain extraction finishes
+            domain_metadata = await self._index_sentences(
+                sentence_data, virtual_record_id, domain_extraction, merge_documents=False
+            )
 
             self.logger.info("✅ Google sheets processing completed successfully")
             return {
                 "formatted_content": combined_text,
                 "numbered_items": [],
-                "metadata": metadata,
+                "metadata": domain_metadata,
             }
         except Exception as e:
             self.logger.error(f"❌ Error processing Google Sheets document: {str(e)}")
@@ -522,10 +583,9 @@ class Processor:
             )
             self.logger.debug(f"📄 Decoded HTML content length: {len(html_content)}")
 
-            # Initialize HTML parser and parse content
+            # Parse HTML content in a parsing worker
             self.logger.debug("📄 Processing HTML content")
-            parser = self.parsers["html"]
-            html_result = parser.parse_string(html_content)
+            html_result = await self._parse(parsing_tasks.parse_html, html_content)
 
             # Get the full document structure
             doc_dict = html_result.export_to_dict()
@@ -540,26 +600,15 @@ class Processor:
                 item["text"].strip() for item in ordered_content if item["text"].strip()
             )
 
-            # Extract domain metadata
-            self.logger.info("🎯 Extracting domain metadata")
-            domain_metadata = None
-            if text_content:
-                try:
-                    metadata = await self.domain_extractor.extract_metadata(
-                        text_content, orgId
-                    )
-                    record = await self.domain_extractor.save_metadata_to_db(
-                        orgId, recordId, metadata, virtual_record_id
-                    )
-                    mail = await self.arango_service.get_document(
-                        recordId, CollectionNames.MAILS.value
-                    )
-                    domain_metadata = {**record, **mail}
-                    domain_metadata["extension"] = "html"
-                    domain_metadata["mimeType"] = "text/html"
-                except Exception as e:
-                    self.logger.error(f"❌ Error extracting metadata: {str(e)}")
-                    domain_metadata = None
+            # Extract domain metadata in the background while indexing
+            domain_extraction = self._extract_domain_metadata(
+                text_content, orgId, recordId, virtual_record_id
+            )
+            record_metadata = await self._record_metadata(
+                recordId, CollectionNames.MAILS.value
+            )
+            record_metadata["extension"] = "html"
+            record_metadata["mimeType"] = "text/html"
 
             # Create sentence data for indexing
             self.logger.debug("📑 Creating semantic sentences")
@@ -591,7 +640,7 @@ class Processor:
                         {
                             "text": item["text"].strip(),
                             "metadata": {
-                                **(domain_metadata or {}),
+                                **record_metadata,
                                 "recordId": recordId,
                                 "blockType": context.get("label", "text"),
                                 "blockNum": [idx],
@@ -606,12 +655,11 @@ class Processor:
                     if len(context_window) > context_window_size:
                         context_window.pop(0)
 
-            # Index sentences if available
-            if sentence_data:
-                self.logger.debug(f"📑 Indexing {len(sentence_data)} sentences")
-                pipeline = self.indexing_pipeline
-                await pipeline.index_documents(sentence_data)
-            else:
+            # Index sentences while domain extraction finishes
+            domain_metadata = await self._index_sentences(
+                sentence_data, virtual_record_id, domain_extraction
+            )
+            if not sentence_data:
                 self.logger.info(" NO SENTENCES TO INDEX")
                 record = await self.arango_service.get_document(
                     recordId, CollectionNames.RECORDS.value
@@ -698,9 +746,10 @@ class Processor:
             )
             ocr_configs = ai_models["ocr"]
 
-            # Configure OCR handler
+            # Configure OCR handler; it is built inside the parsing worker
             self.logger.debug("🛠️ Configuring OCR handler")
-            handler = None
+            handler_provider = None
+            handler_kwargs = {}
 
             for config in ocr_configs:
                 provider = config["provider"]
@@ -708,61 +757,48 @@ class Processor:
 
                 if provider == OCRProvider.AZURE_DI.value:
                     self.logger.debug("☁️ Setting up Azure OCR handler")
-                    handler = OCRHandler(
-                        self.logger,
-                        OCRProvider.AZURE_DI.value,
-                        endpoint=config["configuration"]["endpoint"],
-                        key=config["configuration"]["apiKey"],
-                        model_id=AzureDocIntelligenceModel.PREBUILT_DOCUMENT.value,
-                    )
+                    handler_provider = OCRProvider.AZURE_DI.value
+                    handler_kwargs = {
+                        "endpoint": config["configuration"]["endpoint"],
+                        "key": config["configuration"]["apiKey"],
+                        "model_id": AzureDocIntelligenceModel.PREBUILT_DOCUMENT.value,
+                    }
                     break
                 elif provider == OCRProvider.OCRMYPDF.value:
                     self.logger.debug("📚 Setting up PyMuPDF OCR handler")
-                    handler = OCRHandler(
-                        self.logger, OCRProvider.OCRMYPDF.value
-                    )
+                    handler_provider = OCRProvider.OCRMYPDF.value
                     break
 
-            if not handler:
+            if not handler_provider:
                 self.logger.debug("📚 Setting up PyMuPDF OCR handler")
-                handler = OCRHandler(self.logger, OCRProvider.OCRMYPDF.value)
+                handler_provider = OCRProvider.OCRMYPDF.value
                 provider = OCRProvider.OCRMYPDF.value
 
-            # Process document
+            # Process document in a parsing worker; spooled downloads are
+            # passed by path instead of being copied to the worker
             self.logger.info("🔄 Processing document with OCR handler")
-            ocr_result = await handler.process_document(pdf_binary)
+            ocr_result = await self._parse(
+                parsing_tasks.ocr_pdf,
+                pdf_binary,
+                handler_provider,
+                handler_kwargs,
+                provider=f"{handler_provider}:{handler_kwargs.get('model_id', '')}",
+            )
             self.logger.debug("✅ OCR processing completed")
 
-            # Extract domain metadata from paragraphs
-            self.logger.info("🎯 Extracting domain metadata")
-            domain_metadata = None
+            # Join all paragraph content with newlines
             paragraphs = ocr_result.get("paragraphs", [])
-            sentences = ocr_result.get("sentences", [])
-            if paragraphs:
-                # Join all paragraph content with newlines
-                paragraphs_text = "\n ".join(
-                    p["content"].strip()
-                    for p in paragraphs
-                    if p.get("content") and p["content"].strip()
-                )
+            paragraphs_text = "\n ".join(
+                p["content"].strip()
+                for p in paragraphs
+                if p.get("content") and p["content"].strip()
+            )
 
-                # Extract metadata using domain extractor
-                try:
-                    metadata = await self.domain_extractor.extract_metadata(
-                        paragraphs_text, orgId
-                    )
-                    record = await self.domain_extractor.save_metadata_to_db(
-                        orgId, recordId, metadata, virtual_record_id
-                    )
-                    file = await self.arango_service.get_document(
-                        recordId, CollectionNames.FILES.value
-                    )
-                    domain_metadata = record
-                    ocr_result["metadata"] = {**record, **file}
-                except Exception as e:
-                    self.logger.error(f"❌ Error extracting metadata: {str(e)}")
-                    domain_metadata = None
-                    ocr_result["metadata"] = None
+            # Extract domain metadata in the background while indexing
+            domain_extraction = self._extract_domain_metadata(
+                paragraphs_text, orgId, recordId, virtual_record_id
+            )
+            ocr_result["metadata"] = await self._record_metadata(recordId)
 
             # Use the OCR-processed PDF for highlighting if available
 
@@ -811,11 +847,10 @@ class Processor:
                     if s.get("content")
                 ]
 
-            # Index sentences if available
-            if sentence_data:
-                pipeline = self.indexing_pipeline
-                # Get chunks (these will be merged based on semantic similarity)
-                await pipeline.index_documents(sentence_data)
+            # Index sentences while domain extraction finishes
+            domain_metadata = await self._index_sentences(
+                sentence_data, virtual_record_id, domain_extraction
+            )
 
             # Prepare metadata
             self.logger.debug("📋 Preparing metadata")
@@ -870,7 +905,8 @@ class Processor:
         )
         # Implement DOC processing logic here
         parser = self.parsers[ExtensionTypes.DOC.value]
-        doc_result = parser.convert_doc_to_docx(doc_binary)
+        # LibreOffice runs as a subprocess; wait for it off the event loop
+        doc_result = await asyncio.to_thread(parser.convert_doc_to_docx, doc_binary)
         await self.process_docx_document(
             recordName, recordId, version, source, orgId, doc_result, virtual_record_id
         )
@@ -896,10 +932,11 @@ class Processor:
 
         try:
             # Convert binary to string if necessary
-            # Initialize DocxParser and parse content
+            # Parse DOCX content in a parsing worker
             self.logger.debug("📄 Processing DOCX content")
-            parser = self.parsers[ExtensionTypes.DOCX.value]
-            docx_result = parser.parse(docx_binary)
+            docx_result = await self._parse(
+                parsing_tasks.parse_docx, docx_binary.getvalue()
+            )
 
             # Get the full document structure
             doc_dict = docx_result.export_to_dict()
@@ -913,25 +950,11 @@ class Processor:
                 item["text"].strip() for item in ordered_content if item["text"].strip()
             )
 
-            # Extract domain metadata
-            self.logger.info("🎯 Extracting domain metadata")
-            domain_metadata = None
-            if text_content:
-                try:
-                    self.logger.info("🎯 Extracting metadata from DOCX content")
-                    metadata = await self.domain_extractor.extract_metadata(
-                        text_content, orgId
-                    )
-                    record = await self.domain_extractor.save_metadata_to_db(
-                        orgId, recordId, metadata, virtual_record_id
-                    )
-                    file = await self.arango_service.get_document(
-                        recordId, CollectionNames.FILES.value
-                    )
-                    domain_metadata = {**record, **file}
-                except Exception as e:
-                    self.logger.error(f"❌ Error extracting metadata: {str(e)}")
-                    domain_metadata = None
+            # Extract domain metadata in the background while indexing
+            domain_extraction = self._extract_domain_metadata(
+                text_content, orgId, recordId, virtual_record_id
+            )
+            record_metadata = await self._record_metadata(recordId)
 
             # Create sentence data for indexing
             self.logger.debug("📑 Creating semantic sentences")
@@ -960,7 +983,7 @@ class Processor:
                         {
                             "text": item["text"].strip(),
                             "metadata": {
-                                **(domain_metadata or {}),
+                                **record_metadata,
                                 "recordId": recordId,
                                 "blockType": context.get("label", "text"),
                                 "blockNum": [idx],
@@ -975,11 +998,10 @@ class Processor:
                     if len(context_window) > context_window_size:
                         context_window.pop(0)
 
-            # Index sentences if available
-            if sentence_data:
-                self.logger.debug(f"📑 Indexing {len(sentence_data)} sentences")
-                pipeline = self.indexing_pipeline
-                await pipeline.index_documents(sentence_data)
+            # Index sentences while domain extraction finishes
+            domain_metadata = await self._index_sentences(
+                sentence_data, virtual_record_id, domain_extraction
+            )
 
             # Prepare metadata
             metadata = {
@@ -1045,30 +1067,24 @@ class Processor:
             self.logger.debug("📊 Processing Excel content")
             llm = await get_llm(self.config_service)
             parser = self.parsers[ExtensionTypes.XLSX.value]
-            excel_result = parser.parse(excel_binary)
+            # openpyxl reads spooled downloads from disk. The parser keeps the
+            # workbook for the per-sheet summaries below, so it is loaded in a
+            # thread rather than in a parsing worker
+            if isinstance(excel_binary, DownloadedFile):
+                excel_result = await asyncio.to_thread(parser.parse, excel_binary.path)
+            else:
+                excel_result = await asyncio.to_thread(parser.parse, excel_binary)
 
-            # Extract domain metadata from text content
-            self.logger.info("🎯 Extracting domain metadata")
-            if excel_result["text_content"]:
-                try:
-                    self.logger.info("🎯 Extracting metadata from Excel content")
-                    metadata = await self.domain_extractor.extract_metadata(
-                        excel_result["text_content"], orgId
-                    )
-                    record = await self.domain_extractor.save_metadata_to_db(
-                        orgId, recordId, metadata, virtual_record_id
-                    )
-                    file = await self.arango_service.get_document(
-                        recordId, CollectionNames.FILES.value
-                    )
-                    # Convert datetime objects to strings
-                    domain_metadata = {
-                        k: (v.isoformat() if isinstance(v, datetime) else v)
-                        for k, v in {**record, **file}.items()
-                    }
-                except Exception as e:
-                    self.logger.error(f"❌ Error extracting metadata: {str(e)}")
-                    domain_metadata = None
+            # Extract domain metadata in the background while the sheets are
+            # summarized and indexed
+            domain_extraction = self._extract_domain_metadata(
+                excel_result["text_content"], orgId, recordId, virtual_record_id
+            )
+            # Convert datetime objects to strings
+            record_metadata = {
+                k: (v.isoformat() if isinstance(v, datetime) else v)
+                for k, v in (await self._record_metadata(recordId)).items()
+            }
 
             # Format content for output
             formatted_content = ""
@@ -1117,16 +1133,7 @@ class Processor:
                             {
                                 "text": row["natural_language_text"],
                                 "metadata": {
-                                    **(
-                                        {
-                                            k: (
-                                                v.isoformat()
-                                                if isinstance(v, datetime)
-                                                else v
-                                            )
-                                            for k, v in domain_metadata.items()
-                                        }
-                                    ),
+                                    **record_metadata,
                                     "recordId": recordId,
                                     "sheetName": sheet_name,
                                     "sheetNum": sheet_idx,
@@ -1137,11 +1144,10 @@ class Processor:
                                 },
                             }
                         )
-            # Index sentences if available
-            if sentence_data:
-                self.logger.debug(f"📑 Indexing {len(sentence_data)} sentences")
-                pipeline = self.indexing_pipeline
-                await pipeline.index_documents(sentence_data, merge_documents=False)
+            # Index sentences while domain extraction finishes
+            await self._index_sentences(
+                sentence_data, virtual_record_id, domain_extraction, merge_documents=False
+            )
             # Prepare metadata
             self.logger.debug("📋 Preparing metadata")
             metadata = {
@@ -1181,7 +1187,9 @@ class Processor:
         try:
             # Convert XLS to XLSX binary
             xls_parser = self.parsers[ExtensionTypes.XLS.value]
-            xlsx_binary = xls_parser.convert_xls_to_xlsx(xls_binary)
+            xlsx_binary = await asyncio.to_thread(
+                xls_parser.convert_xls_to_xlsx, xls_binary
+            )
 
             # Process the converted XLSX using the Excel parser
             result = await self.process_excel_document(
@@ -1205,7 +1213,7 @@ class Processor:
             version (str): Version of the record
             source (str): Source of the document
             orgId (str): Organization ID
-            csv_binary (bytes): Binary content of the CSV file
+            csv_binary (bytes | DownloadedFile): Content of the CSV file
         """
         self.logger.info(
             f"🚀 Starting CSV document processing for record: {recordName}"
@@ -1218,28 +1226,15 @@ class Processor:
 
             llm = await get_llm(self.config_service)
 
-            # Save temporary file to process CSV
-            temp_file_path = f"/tmp/{recordName}_temp.csv"
-            try:
-                with open(temp_file_path, "wb") as f:
-                    f.write(csv_binary)
-
+            # Read the CSV from disk; spooled downloads are used in place
+            with content_path(csv_binary, ".csv") as temp_file_path:
                 # Try different encodings
                 encodings = ["utf-8", "latin1", "cp1252", "iso-8859-1"]
-                csv_result = None
-
-                for encoding in encodings:
-                    try:
-                        self.logger.debug(
-                            f"Attempting to read CSV with {encoding} encoding"
-                        )
-                        csv_result = parser.read_file(temp_file_path, encoding=encoding)
-                        self.logger.debug(
-                            f"Successfully read CSV with {encoding} encoding"
-                        )
-                        break
-                    except UnicodeDecodeError:
-                        continue
+                csv_result, encoding = await self.parsing_pool.run(
+                    parsing_tasks.read_csv, temp_file_path, encodings
+                )
+                if encoding:
+                    self.logger.debug(f"Successfully read CSV with {encoding} encoding")
 
                 if csv_result is None:
                     raise ValueError(
@@ -1248,37 +1243,20 @@ class Processor:
 
                 self.logger.debug("📑 CSV result processed")
 
-                # Extract domain metadata from CSV content
-                self.logger.info("🎯 Extracting domain metadata")
-                if csv_result:
-                    # Convert CSV data to text for metadata extraction
-                    csv_text = "\n".join(
-                        [
-                            " ".join(str(value) for value in row.values())
-                            for row in csv_result
-                        ]
-                    )
-
-                    try:
-                        self.logger.info("🎯 Extracting metadata from CSV content")
-                        metadata = await self.domain_extractor.extract_metadata(
-                            csv_text, orgId
-                        )
-                        record = await self.domain_extractor.save_metadata_to_db(
-                            orgId, recordId, metadata, virtual_record_id
-                        )
-                        file = await self.arango_service.get_document(
-                            recordId, CollectionNames.FILES.value
-                        )
-                        domain_metadata = {**record, **file}
-                    except Exception as e:
-                        self.logger.error(f"❌ Error extracting metadata: {str(e)}")
-                        domain_metadata = None
+                # Convert CSV data to text for metadata extraction
+                csv_text = "\n".join(
+                    [
+                        " ".join(str(value) for value in row.values())
+                        for row in csv_result
+                    ]
+                )
 
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_file_path):
-                    os.remove(temp_file_path)
+                # Extract domain metadata in the background while the rows are
+                # described and indexed
+                domain_extraction = self._extract_domain_metadata(
+                    csv_text, orgId, recordId, virtual_record_id
+                )
+                record_metadata = await self._record_metadata(recordId)
 
             # Format content for output
             formatted_content = ""
@@ -1305,7 +1283,7 @@ class Processor:
                         {
                             "text": row_text,
                             "metadata": {
-                                **(domain_metadata or {}),
+                                **record_metadata,
                                 "recordId": recordId,
                                 "blockType": "table_row",
                                 "blockText": json.dumps(row),
@@ -1315,11 +1293,10 @@ class Processor:
                         }
                     )
 
-            # Index sentences if available
-            if sentence_data:
-                self.logger.debug(f"📑 Indexing {len(sentence_data)} sentences")
-                pipeline = self.indexing_pipeline
-                await pipeline.index_documents(sentence_data, merge_documents=False)
+            # Index sentences while domain extraction finishes
+            domain_metadata = await self._index_sentences(
+                sentence_data, virtual_record_id, domain_extraction, merge_documents=False
+            )
 
             # Prepare metadata
             self.logger.debug("📋 Preparing metadata")
@@ -1446,10 +1423,9 @@ class Processor:
             )
             self.logger.debug(f"📄 Decoded HTML content length: {len(html_content)}")
 
-            # Initialize HTML parser and parse content
+            # Parse HTML content in a parsing worker
             self.logger.debug("📄 Processing HTML content")
-            parser = self.parsers[ExtensionTypes.HTML.value]
-            html_result = parser.parse_string(html_content)
+            html_result = await self._parse(parsing_tasks.parse_html, html_content)
 
             # Get the full document structure
             doc_dict = html_result.export_to_dict()
@@ -1464,26 +1440,11 @@ class Processor:
                 item["text"].strip() for item in ordered_content if item["text"].strip()
             )
 
-            # Extract domain metadata
-            self.logger.info("🎯 Extracting domain metadata")
-            domain_metadata = None
-            if text_content:
-                try:
-                    self.logger.info("🎯 Extracting metadata from HTML content")
-                    metadata = await self.domain_extractor.extract_metadata(
-                        text_content, orgId
-                    )
-                    record = await self.domain_extractor.save_metadata_to_db(
-                        orgId, recordId, metadata, virtual_record_id
-                    )
-                    file = await self.arango_service.get_document(
-                        recordId, CollectionNames.FILES.value
-                    )
-                    domain_metadata = {**record, **file}
-
-                except Exception as e:
-                    self.logger.error(f"❌ Error extracting metadata: {str(e)}")
-                    domain_metadata = None
+            # Extract domain metadata in the background while indexing
+            domain_extraction = self._extract_domain_metadata(
+                text_content, orgId, recordId, virtual_record_id
+            )
+            record_metadata = await self._record_metadata(recordId)
 
             # Create sentence data for indexing
             self.logger.debug("📑 Creating semantic sentences")
@@ -1512,7 +1473,7 @@ class Processor:
                         {
                             "text": item["text"].strip(),
                             "metadata": {
-                                **(domain_metadata or {}),
+                                **record_metadata,
                                 "recordId": recordId,
                                 "blockType": context.get("label", "text"),
                                 "blockNum": [idx],
@@ -1527,11 +1488,10 @@ class Processor:
                     if len(context_window) > context_window_size:
                         context_window.pop(0)
 
-            # Index sentences if available
-            if sentence_data:
-                self.logger.debug(f"📑 Indexing {len(sentence_data)} sentences")
-                pipeline = self.indexing_pipeline
-                await pipeline.index_documents(sentence_data)
+            # Index sentences while domain extraction finishes
+            domain_metadata = await self._index_sentences(
+                sentence_data, virtual_record_id, domain_extraction
+            )
 
             # Prepare metadata
             metadata = {
@@ -1627,10 +1587,9 @@ class Processor:
             # Convert binary to string
             md_content = md_binary.decode("utf-8")
 
-            # Initialize Markdown parser
+            # Parse Markdown content in a parsing worker
             self.logger.debug("📄 Processing Markdown content")
-            parser = self.parsers[ExtensionTypes.MD.value]
-            md_result = parser.parse_string(md_content)
+            md_result = await self._parse(parsing_tasks.parse_markdown, md_content)
             # Get the full document structure
             doc_dict = md_result.export_to_dict()
 
@@ -1641,24 +1600,11 @@ class Processor:
                 if text_item.get("text", "").strip()
             )
 
-            # Extract domain metadata from content
-            self.logger.info("🎯 Extracting domain metadata")
-            domain_metadata = None
-            if text_content:
-                try:
-                    metadata = await self.domain_extractor.extract_metadata(
-                        text_content, orgId
-                    )
-                    record = await self.domain_extractor.save_metadata_to_db(
-                        orgId, recordId, metadata, virtual_record_id
-                    )
-                    file = await self.arango_service.get_document(
-                        recordId, CollectionNames.FILES.value
-                    )
-                    domain_metadata = {**record, **file}
-                except Exception as e:
-                    self.logger.error(f"❌ Error extracting metadata: {str(e)}")
-                    domain_metadata = None
+            # Extract domain metadata in the background while indexing
+            domain_extraction = self._extract_domain_metadata(
+                text_content, orgId, recordId, virtual_record_id
+            )
+            record_metadata = await self._record_metadata(recordId)
 
             # Format content for output
             formatted_content = ""
@@ -1711,7 +1657,7 @@ class Processor:
                     {
                         "text": item["text"].strip(),
                         "metadata": {
-                            **(domain_metadata or {}),
+                            **record_metadata,
                             "recordId": recordId,
                             "blockType": item.get("label", "text"),
                             "blockNum": [idx],
@@ -1731,10 +1677,10 @@ class Processor:
                 if len(context_window) > context_window_size:
                     context_window.pop(0)
 
-            # Index sentences if available
-            if sentence_data:
-                pipeline = self.indexing_pipeline
-                await pipeline.index_documents(sentence_data)
+            # Index sentences while domain extraction finishes
+            domain_metadata = await self._index_sentences(
+                sentence_data, virtual_record_id, domain_extraction
+            )
 
             # Prepare metadata
             self.logger.debug("📋 Preparing metadata")
@@ -1819,23 +1765,11 @@ class Processor:
                     "Unable to decode text file with any supported encoding"
                 )
 
-            # Extract domain metadata
-            self.logger.info("🎯 Extracting domain metadata")
-            domain_metadata = None
-            try:
-                metadata = await self.domain_extractor.extract_metadata(
-                    text_content, orgId
-                )
-                record = await self.domain_extractor.save_metadata_to_db(
-                    orgId, recordId, metadata, virtual_record_id
-                )
-                file = await self.arango_service.get_document(
-                    recordId, CollectionNames.FILES.value
-                )
-                domain_metadata = {**record, **file}
-            except Exception as e:
-                self.logger.error(f"❌ Error extracting metadata: {str(e)}")
-                domain_metadata = None
+            # Extract domain metadata in the background while indexing
+            domain_extraction = self._extract_domain_metadata(
+                text_content, orgId, recordId, virtual_record_id
+            )
+            record_metadata = await self._record_metadata(recordId)
 
             # Split content into blocks (paragraphs)
             blocks = [
@@ -1868,7 +1802,7 @@ class Processor:
                     {
                         "text": block,
                         "metadata": {
-                            **(domain_metadata or {}),
+                            **record_metadata,
                             "recordId": recordId,
                             "blockType": "text",
                             "blockNum": [idx],
@@ -1883,11 +1817,10 @@ class Processor:
                 if len(context_window) > context_window_size:
                     context_window.pop(0)
 
-            # Index sentences if available
-            if sentence_data:
-                self.logger.debug(f"📑 Indexing {len(sentence_data)} sentences")
-                pipeline = self.indexing_pipeline
-                await pipeline.index_documents(sentence_data)
+            # Index sentences while domain extraction finishes
+            domain_metadata = await self._index_sentences(
+                sentence_data, virtual_record_id, domain_extraction
+            )
 
             # Prepare metadata
             metadata = {
@@ -1939,10 +1872,9 @@ class Processor:
         )
 
         try:
-            # Initialize PPTX parser
+            # Parse PPTX content in a parsing worker
             self.logger.debug("📄 Processing PPTX content")
-            parser = self.parsers[ExtensionTypes.PPTX.value]
-            pptx_result = parser.parse_binary(pptx_binary)
+            pptx_result = await self._parse(parsing_tasks.parse_pptx, pptx_binary)
 
             # Get the full document structure
             doc_dict = pptx_result.export_to_dict()
@@ -2027,25 +1959,11 @@ class Processor:
                 item["text"].strip() for item in ordered_items if item["text"].strip()
             )
 
-            # Extract domain metadata
-            self.logger.info("🎯 Extracting domain metadata")
-            domain_metadata = None
-            if text_content:
-                try:
-                    metadata = await self.domain_extractor.extract_metadata(
-                        text_content, orgId
-                    )
-                    record = await self.domain_extractor.save_metadata_to_db(
-                        orgId, recordId, metadata, virtual_record_id
-                    )
-                    file = await self.arango_service.get_document(
-                        recordId, CollectionNames.FILES.value
-                    )
-                    domain_metadata = {**record, **file}
-
-                except Exception as e:
-                    self.logger.error(f"❌ Error extracting metadata: {str(e)}")
-                    domain_metadata = None
+            # Extract domain metadata in the background while indexing
+            domain_extraction = self._extract_domain_metadata(
+                text_content, orgId, recordId, virtual_record_id
+            )
+            record_metadata = await self._record_metadata(recordId)
 
             # Create numbered items with slide information
             numbered_items = []
@@ -2102,7 +2020,7 @@ class Processor:
                         {
                             "text": item["text"].strip(),
                             "metadata": {
-                                **(domain_metadata or {}),
+                                **record_metadata,
                                 "recordId": recordId,
                                 "blockType": context.get("label", "text"),
                                 "blockNum": [idx],
@@ -2118,11 +2036,10 @@ class Processor:
                     if len(context_window) > context_window_size:
                         context_window.pop(0)
 
-            # Index sentences if available
-            if sentence_data:
-                self.logger.debug("📑 Indexing %s sentences", len(sentence_data))
-                pipeline = self.indexing_pipeline
-                await pipeline.index_documents(sentence_data)
+            # Index sentences while domain extraction finishes
+            domain_metadata = await self._index_sentences(
+                sentence_data, virtual_record_id, domain_extraction
+            )
 
             # Prepare metadata
             metadata = {
@@ -2188,7 +2105,7 @@ class Processor:
             f"🚀 Starting PPT document processing for record: {recordName}"
         )
         parser = self.parsers[ExtensionTypes.PPT.value]
-        ppt_result = parser.convert_ppt_to_pptx(ppt_binary)
+        ppt_result = await asyncio.to_thread(parser.convert_ppt_to_pptx, ppt_binary)
         await self.process_pptx_document(
             recordName, recordId, version, source, orgId, ppt_result, virtual_record_id
         )
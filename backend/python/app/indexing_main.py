@@ -49,6 +49,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except asyncio.CancelledError:
         logger.info("Kafka consumer task cancelled")
 
+    # Publish the accessible records invalidations held back for a burst
+    accessible_records_invalidator = await container.accessible_records_invalidator()
+    await accessible_records_invalidator.flush()
+
+    # Close generator resources such as the shared HTTP session
+    await container.shutdown_resources()
+
 
 app = FastAPI(
     lifespan=lifespan,
@@ -107,6 +114,25 @@ async def health_check() -> JSONResponse:
         )
 
 
+@app.get("/indexing-stats")
+async def indexing_stats() -> JSONResponse:
+    """Indexing pipeline throughput, record-events consumer, parsing pool and parse cache state"""
+    indexing_pipeline = await app.container.indexing_pipeline()
+    kafka_consumer = await app.container.kafka_consumer()
+    parsing_pool = await app.container.parsing_pool()
+    parse_cache = app.container.parse_cache()
+    return JSONResponse(
+        status_code=200,
+        content={
+            "indexing": indexing_pipeline.get_indexing_stats(),
+            "consumer": kafka_consumer.get_stats(),
+            "parsingPool": parsing_pool.stats(),
+            "parseCache": parse_cache.stats(),
+            "timestamp": get_epoch_timestamp_in_ms(),
+        },
+    )
+
+
 def run(host: str = "0.0.0.0", port: int = 8091, reload: bool = True) -> None:
     """Run the application"""
     uvicorn.run(
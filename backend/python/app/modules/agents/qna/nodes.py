@@ -8,11 +8,15 @@ from app.config.utils.named_constants.arangodb_constants import (
     CollectionNames,
 )
 from app.modules.agents.qna.chat_state import ChatState
-from app.modules.qna.prompt_templates import qna_prompt
+from app.modules.qna.context_builder import render_qna_prompt
+from app.modules.reranker.reranker import RerankCascade
 from app.utils.citations import process_citations
 from app.utils.query_transform import setup_query_transformation
 from app.utils.streaming import stream_llm_response
 
+# Rerank cascade of the agent chat route, see RerankCascade.from_env
+AGENT_RERANK_CASCADE = RerankCascade.from_env("agent")
+
 
 # 1. Decomposition Node (OPTIMIZED - reduced streaming overhead)
 async def decompose_query_node(
@@ -220,6 +224,7 @@ async def rerank_results_node(
                 query=state["query"],  # Use original query for final ranking
                 documents=flattened_results,
                 top_k=state["limit"],
+                cascade=AGENT_RERANK_CASCADE,
             )
         else:
             final_results = flattened_results
@@ -262,13 +267,9 @@ def prepare_prompt_node(
                     "Please provide accurate and relevant information based on the available context."
                 )
 
-        from jinja2 import Template
-        template = Template(qna_prompt)
-        rendered_prompt = template.render(
-            user_data=user_data,
-            query=state["query"],
-            rephrased_queries=[],  # This keeps all query results for reference
-            chunks=state["final_results"],
+        # Citations refer to the chunks that fit in the prompt
+        rendered_prompt, state["final_results"] = render_qna_prompt(
+            user_data, state["query"], state["final_results"]
         )
 
         # Add conversation history to the messages
@@ -65,10 +65,12 @@ class DocumentClassification(BaseModel):
 
 
 class DomainExtractor:
-    def __init__(self, logger, base_arango_service, config_service) -> None:
+    def __init__(self, logger, base_arango_service, config_service, http_session: aiohttp.ClientSession) -> None:
         self.logger = logger
         self.arango_service = base_arango_service
         self.config_service = config_service
+        # Shared connection-pooled session owned by the container
+        self.http_session = http_session
         self.logger.info("🚀 self.arango_service: %s", self.arango_service)
         self.logger.info("🚀 self.arango_service.db: %s", self.arango_service.db)
 
@@ -637,14 +639,14 @@ class DomainExtractor:
                 f"🚀 Metadata saved successfully for document: {document_id}"
             )
 
-            doc.update(
-                {
-                    "summaryDocumentId": document_id,
-                    "extractionStatus": "COMPLETED",
-                    "lastExtractionTimestamp": get_epoch_timestamp_in_ms(),
-                }
-            )
-            docs = [doc]
+            extraction_fields = {
+                "summaryDocumentId": document_id,
+                "extractionStatus": "COMPLETED",
+                "lastExtractionTimestamp": get_epoch_timestamp_in_ms(),
+            }
+            doc.update(extraction_fields)
+            # Only the extraction fields: indexing updates the same record concurrently
+            docs = [{"_key": doc["_key"], **extraction_fields}]
 
             self.logger.info(
                 f"🎯 Upserting domain metadata for document: {document_id}"
@@ -824,53 +826,52 @@ class DomainExtractor:
 
             if storage_type == "local":
                 try:
-                    async with aiohttp.ClientSession() as session:
-                        # Convert summary_doc to JSON string and then to bytes
-                        upload_data = {
-                            "summary": summary_doc,
-                            "virtualRecordId": virtual_record_id
-                        }
-                        json_data = json.dumps(upload_data).encode('utf-8')
-
-                        # Create form data
-                        form_data = aiohttp.FormData()
-                        form_data.add_field('file',
-                                        json_data,
-                                        filename=f'summary_{record_id}.json',
-                                        content_type='application/json')
-                        form_data.add_field('documentName', f'summary_{record_id}')
-                        form_data.add_field('documentPath', 'summaries')
-                        form_data.add_field('isVersionedFile', 'true')
-                        form_data.add_field('extension', 'json')
-                        form_data.add_field('recordId', record_id)
-
-                        # Make upload request
-                        upload_url = f"{nodejs_endpoint}{Routes.STORAGE_UPLOAD.value}"
-                        self.logger.info("📤 Uploading summary to storage for record: %s", record_id)
-
-                        async with session.post(upload_url,
-                                            data=form_data,
-                                            headers=headers) as response:
-                            if response.status != HttpStatusCode.SUCCESS.value:
-                                try:
-                                    error_response = await response.json()
-                                    self.logger.error("❌ Failed to upload summary. Status: %d, Error: %s",
-                                                    response.status, error_response)
-                                except aiohttp.ContentTypeError:
-                                    error_text = await response.text()
-                                    self.logger.error("❌ Failed to upload summary. Status: %d, Response: %s",
-                                                    response.status, error_text[:200])
-                                return None
-
-                            response_data = await response.json()
-                            document_id = response_data.get('_id')
-
-                            if not document_id:
-                                self.logger.error("❌ No document ID in upload response")
-                                return None
-
-                            self.logger.info("✅ Successfully uploaded summary for document: %s", document_id)
-                            return document_id
+                    # Convert summary_doc to JSON string and then to bytes
+                    upload_data = {
+                        "summary": summary_doc,
+                        "virtualRecordId": virtual_record_id
+                    }
+                    json_data = json.dumps(upload_data).encode('utf-8')
+
+                    # Create form data
+                    form_data = aiohttp.FormData()
+                    form_data.add_field('file',
+                                    json_data,
+                                    filename=f'summary_{record_id}.json',
+                                    content_type='application/json')
+                    form_data.add_field('documentName', f'summary_{record_id}')
+                    form_data.add_field('documentPath', 'summaries')
+                    form_data.add_field('isVersionedFile', 'true')
+                    form_data.add_field('extension', 'json')
+                    form_data.add_field('recordId', record_id)
+
+                    # Make upload request
+                    upload_url = f"{nodejs_endpoint}{Routes.STORAGE_UPLOAD.value}"
+                    self.logger.info("📤 Uploading summary to storage for record: %s", record_id)
+
+                    async with self.http_session.post(upload_url,
+                                        data=form_data,
+                                        headers=headers) as response:
+                        if response.status != HttpStatusCode.SUCCESS.value:
+                            try:
+                                error_response = await response.json()
+                                self.logger.error("❌ Failed to upload summary. Status: %d, Error: %s",
+                                                response.status, error_response)
+                            except aiohttp.ContentTypeError:
+                                error_text = await response.text()
+                                self.logger.error("❌ Failed to upload summary. Status: %d, Response: %s",
+                                                response.status, error_text[:200])
+                            return None
+
+                        response_data = await response.json()
+                        document_id = response_data.get('_id')
+
+                        if not document_id:
+                            self.logger.error("❌ No document ID in upload response")
+                            return None
+
+                        self.logger.info("✅ Successfully uploaded summary for document: %s", document_id)
+                        return document_id
 
                 except aiohttp.ClientError as e:
                     self.logger.error("❌ Network error during upload process: %s", str(e))
@@ -888,40 +889,39 @@ class DomainExtractor:
                 }
 
                 try:
-                    async with aiohttp.ClientSession() as session:
-                        # Step 1: Create placeholder
-                        self.logger.info("📝 Creating placeholder for record: %s", record_id)
-                        placeholder_url = f"{nodejs_endpoint}{Routes.STORAGE_PLACEHOLDER.value}"
-                        document = await self._create_placeholder(session, placeholder_url, placeholder_data, headers)
-
-                        document_id = document.get("_id")
-                        if not document_id:
-                            self.logger.error("❌ No document ID in placeholder response")
-                            return None
-
-                        self.logger.info("📄 Created placeholder with ID: %s", document_id)
+                    # Step 1: Create placeholder
+                    self.logger.info("📝 Creating placeholder for record: %s", record_id)
+                    placeholder_url = f"{nodejs_endpoint}{Routes.STORAGE_PLACEHOLDER.value}"
+                    document = await self._create_placeholder(self.http_session, placeholder_url, placeholder_data, headers)
+
+                    document_id = document.get("_id")
+                    if not document_id:
+                        self.logger.error("❌ No document ID in placeholder response")
+                        return None
+
+                    self.logger.info("📄 Created placeholder with ID: %s", document_id)
+
+                    # Step 2: Get signed URL
+                    self.logger.info("🔑 Getting signed URL for document: %s", document_id)
+                    upload_data = {
+                        "summary": summary_doc,
+                        "virtualRecordId": virtual_record_id
+                    }
 
-                        # Step 2: Get signed URL
-                        self.logger.info("🔑 Getting signed URL for document: %s", document_id)
-                        upload_data = {
-                            "summary": summary_doc,
-                            "virtualRecordId": virtual_record_id
-                        }
+                    upload_url = f"{nodejs_endpoint}{Routes.STORAGE_DIRECT_UPLOAD.value.format(documentId=document_id)}"
+                    upload_result = await self._get_signed_url(self.http_session, upload_url, upload_data, headers)
 
-                        upload_url = f"{nodejs_endpoint}{Routes.STORAGE_DIRECT_UPLOAD.value.format(documentId=document_id)}"
-                        upload_result = await self._get_signed_url(session, upload_url, upload_data, headers)
+                    signed_url = upload_result.get('signedUrl')
+                    if not signed_url:
+                        self.logger.error("❌ No signed URL in response for document: %s", document_id)
+                        return None
 
-                        signed_url = upload_result.get('signedUrl')
-                        if not signed_url:
-                            self.logger.error("❌ No signed URL in response for document: %s", document_id)
-                            return None
+                    # Step 3: Upload to signed URL
+                    self.logger.info("📤 Uploading summary to storage for document: %s", document_id)
+                    await self._upload_to_signed_url(self.http_session, signed_url, upload_data)
 
-                        # Step 3: Upload to signed URL
-                        self.logger.info("📤 Uploading summary to storage for document: %s", document_id)
-                        await self._upload_to_signed_url(session, signed_url, upload_data)
-
-                        self.logger.info("✅ Successfully completed summary storage process for document: %s", document_id)
-                        return document_id
+                    self.logger.info("✅ Successfully completed summary storage process for document: %s", document_id)
+                    return document_id
 
                 except aiohttp.ClientError as e:
                     self.logger.error("❌ Network error during storage process: %s", str(e))
@@ -1,17 +1,26 @@
-from typing import Any, Dict, List
-
+import asyncio
+import os
+import time
+import uuid
+from math import ceil
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
 from langchain.schema import Document
 from langchain_experimental.text_splitter import SemanticChunker
-from langchain_qdrant import FastEmbedSparse, QdrantVectorStore, RetrievalMode
+from langchain_qdrant import FastEmbedSparse
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
 from qdrant_client.http.models import FieldCondition, Filter, MatchValue
 from app.utils.aircraft_normalizer import normalize_aircraft
 
-from app.config.configuration_service import config_node_constants
 from app.config.utils.named_constants.arangodb_constants import (
     CollectionNames,
+    QdrantPayloadFields,
 )
+from app.core.accessible_records_cache import AccessibleRecordsCacheInvalidator
+from app.core.answer_cache import AnswerCacheInvalidator
+from app.core.embedding_model_registry import EmbeddingModelInfo, EmbeddingModelRegistry
 from app.exceptions.indexing_exceptions import (
     ChunkingError,
     DocumentProcessingError,
@@ -21,9 +30,56 @@ from app.exceptions.indexing_exceptions import (
     MetadataProcessingError,
     VectorStoreError,
 )
-from app.utils.aimodels import get_default_embedding_model, get_embedding_model
 from app.utils.time_conversion import get_epoch_timestamp_in_ms
 
+# Batches embedded or being upserted at the same time for one document
+INDEXING_INFLIGHT_BATCHES = int(os.getenv("INDEXING_INFLIGHT_BATCHES", "4"))
+# Batches embedded concurrently; upserts of earlier batches overlap with these
+INDEXING_EMBED_CONCURRENCY = int(os.getenv("INDEXING_EMBED_CONCURRENCY", "1"))
+# Connectors, file extensions or mime types (comma separated, "*" for all) whose
+# sentences are merged into semantic chunks with vectors pooled from the
+# chunker's sentence embeddings, e.g. "pdf,docx,GOOGLE_DRIVE"
+EMBEDDING_REUSE_SOURCES = {
+    source.strip().lower()
+    for source in os.getenv("EMBEDDING_REUSE_SOURCES", "").split(",")
+    if source.strip()
+}
+# Sentences above which the chunker pre-merges fixed-size groups before embedding
+CHUNKER_MAX_SENTENCES = int(os.getenv("CHUNKER_MAX_SENTENCES", "5000"))
+
+# Values deduplicated by identity of their own value rather than str()
+_HASHABLE_SCALARS = (str, int, float, bool)
+
+
+def _dedupe_key(value: Any) -> Any:
+    if isinstance(value, _HASHABLE_SCALARS):
+        return (value.__class__, value)
+    return str(value)
+
+
+def _unique_values(values: Iterable[Any]) -> List[Any]:
+    """Unique values in first-seen order; scalars are compared typed, others by str()"""
+    unique_values = []
+    seen = set()
+    for value in values:
+        key = _dedupe_key(value)
+        if key not in seen:
+            seen.add(key)
+            unique_values.append(value)
+    return unique_values
+
+
+def _token_weighted_mean(vectors: np.ndarray, texts: List[str]) -> np.ndarray:
+    """Mean of sentence vectors weighted by their (whitespace) token counts"""
+    weights = np.asarray([max(1, len(text.split())) for text in texts], dtype=np.float32)
+    return weights @ vectors / weights.sum()
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
 
 class CustomChunker(SemanticChunker):
     def __init__(self, logger, *args, **kwargs) -> None:
@@ -35,17 +91,31 @@ class CustomChunker(SemanticChunker):
 
     def split_documents(self, documents: List[Document]) -> List[Document]:
         """Override split_documents to use our custom merging logic with chunk count optimization"""
+        merged_documents, _ = self.split_documents_with_embeddings(documents)
+        return merged_documents
+
+    def split_documents_with_embeddings(
+        self, documents: List[Document], pool_embeddings: bool = False
+    ) -> Tuple[List[Document], List[Optional[List[float]]]]:
+        """
+        Split documents and return, per chunk, the dense embedding computed during
+        breakpoint detection when it is exactly the chunk embedding (single-sentence
+        chunks), or None when the chunk still has to be embedded.
+
+        With pool_embeddings, multi-sentence chunks get the token-weighted mean of
+        their sentence embeddings instead of None, so no chunk is embedded twice.
+        """
         try:
             self.logger.info(f"Splitting {len(documents)} documents")
             if len(documents) <= 1:
-                return documents
+                return documents, [None] * len(documents)
 
             # Check for large document sets and apply chunk count limits
             documents = self._optimize_for_large_documents(documents)
 
             # Calculate distances between adjacent documents
             try:
-                distances, sentences = self._calculate_sentence_distances(
+                distances, sentence_vectors = self._calculate_distances(
                     [doc.page_content for doc in documents]
                 )
             except Exception as e:
@@ -58,12 +128,12 @@ class CustomChunker(SemanticChunker):
             try:
                 if self.number_of_chunks is not None:
                     breakpoint_distance_threshold = self._threshold_from_clusters(
-                        distances
+                        distances.tolist()
                     )
                     breakpoint_array = distances
                 else:
                     breakpoint_distance_threshold, breakpoint_array = (
-                        self._calculate_breakpoint_threshold(distances)
+                        self._calculate_breakpoint_threshold(distances.tolist())
                     )
             except Exception as e:
                 raise ChunkingError(
@@ -71,120 +141,47 @@ class CustomChunker(SemanticChunker):
                     details={"error": str(e)},
                 )
 
-            # Find indices where we should NOT merge (where distance is too high)
-            indices_above_thresh = [
-                i
-                for i, x in enumerate(breakpoint_array)
-                if x > breakpoint_distance_threshold
-            ]
+            # Indices where we should NOT merge (where distance is too high)
+            breakpoints = np.flatnonzero(
+                np.asarray(breakpoint_array) > breakpoint_distance_threshold
+            )
+            group_ends = breakpoints.tolist()
+            if not group_ends or group_ends[-1] != len(documents) - 1:
+                group_ends.append(len(documents) - 1)
 
+            # Merge documents between breakpoints
             merged_documents = []
+            chunk_embeddings = []
             start_index = 0
-
-            # Merge documents between breakpoints
             try:
-                for index in indices_above_thresh:
-                    # Get group of documents to merge
-                    group = documents[start_index : index + 1]
-
-                    # Merge text content
-                    merged_text = " ".join(doc.page_content for doc in group)
-                    # Get bounding boxes directly from metadata
-                    bboxes = [
-                        doc.metadata.get("bounding_box", [])
-                        for doc in group
-                        if doc.metadata.get("bounding_box")
-                    ]
-                    metadata_list = [doc.metadata for doc in group]
-
-                    # Create merged metadata
-                    merged_metadata = self._merge_metadata(metadata_list)
-
-                    # Update block numbers to reflect merged state
-                    if len(group) > 1:
-                        block_nums = []
-                        for doc in group:
-                            nums = doc.metadata.get("blockNum", [])
-                            if isinstance(nums, list):
-                                block_nums.extend(nums)
-                            else:
-                                block_nums.append(nums)
-                        merged_metadata["blockNum"] = sorted(
-                            list(set(block_nums))
-                        )  # Remove duplicates and sort
-
-                    # Merge bounding boxes and add to metadata
-                    merged_metadata["bounding_box"] = (
-                        self._merge_bboxes(bboxes) if bboxes else None
-                    )
-                    # Create merged document
-                    merged_documents.append(
-                        Document(
-                            page_content=merged_text,
-                            metadata=merged_metadata,
+                for end_index in group_ends:
+                    group = documents[start_index : end_index + 1]
+                    merged_documents.append(self._merge_group(group))
+                    if len(group) == 1:
+                        chunk_embeddings.append(sentence_vectors[start_index].tolist())
+                    elif pool_embeddings:
+                        chunk_embeddings.append(
+                            _token_weighted_mean(
+                                sentence_vectors[start_index : end_index + 1],
+                                [doc.page_content for doc in group],
+                            ).tolist()
                         )
-                    )
-
-                    start_index = index + 1
-
-                # Handle the last group
-                if start_index < len(documents):
-                    group = documents[start_index:]
-
-                    merged_text = " ".join(doc.page_content for doc in group)
-
-                    # Get bounding boxes from metadata
-                    bboxes = [
-                        doc.metadata.get("bounding_box", [])
-                        for doc in group
-                        if doc.metadata.get("bounding_box")
-                    ]
-                    metadata_list = [doc.metadata for doc in group]
-
-                    try:
-                        merged_metadata = self._merge_metadata(metadata_list)
-                        if len(group) > 1:
-                            block_nums = []
-                            for doc in group:
-                                nums = doc.metadata.get("blockNum", [])
-                                if isinstance(nums, list):
-                                    block_nums.extend(nums)
-                                else:
-                                    block_nums.append(nums)
-                            merged_metadata["blockNum"] = sorted(
-                                list(set(block_nums))
-                            )  # Remove duplicates and sort
-
-                        # Merge bounding boxes and add to metadata
-                        merged_metadata["bounding_box"] = (
-                            self._merge_bboxes(bboxes) if bboxes else None
-                        )
-
-                        merged_documents.append(
-                            Document(
-                                page_content=merged_text,
-                                metadata=merged_metadata,
-                            )
-                        )
-                    except MetadataProcessingError as e:
-                        raise ChunkingError(
-                            "Failed to process metadata during document merge: "
-                            + str(e),
-                            details={"error": str(e)},
-                        )
-                    except Exception as e:
-                        raise ChunkingError(
-                            "Failed to merge document groups: " + str(e),
-                            details={"error": str(e)},
-                        )
-
-                return merged_documents
+                    else:
+                        chunk_embeddings.append(None)
+                    start_index = end_index + 1
+            except MetadataProcessingError as e:
+                raise ChunkingError(
+                    "Failed to process metadata during document merge: " + str(e),
+                    details={"error": str(e)},
+                )
             except Exception as e:
                 raise ChunkingError(
                     "Failed to merge document groups: " + str(e),
                     details={"error": str(e)},
                 )
 
+            return merged_documents, chunk_embeddings
+
         except ChunkingError:
             raise
         except Exception as e:
@@ -193,6 +190,67 @@ class CustomChunker(SemanticChunker):
                 details={"error": str(e)},
             )
 
+    def _calculate_distances(self, sentences: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Cosine distances between adjacent sentence windows in one vectorized pass.
+
+        Every sentence is embedded once. The window around sentence i (buffer_size
+        sentences on each side) is represented by the mean of its unit sentence
+        vectors, computed incrementally from a cumulative sum, instead of embedding
+        each concatenated window text again.
+
+        Returns:
+            Tuple of the n - 1 adjacent window distances and the (n, dim) sentence embeddings
+        """
+        sentence_vectors = np.asarray(
+            self.embeddings.embed_documents(sentences), dtype=np.float32
+        )
+        unit_vectors = _normalize_rows(sentence_vectors)
+
+        buffer_size = max(0, int(getattr(self, "buffer_size", 1)))
+        if buffer_size:
+            count = len(sentences)
+            cumulative = np.vstack(
+                [np.zeros((1, unit_vectors.shape[1]), dtype=np.float32), np.cumsum(unit_vectors, axis=0)]
+            )
+            positions = np.arange(count)
+            window_start = np.maximum(positions - buffer_size, 0)
+            window_end = np.minimum(positions + buffer_size + 1, count)
+            window_vectors = _normalize_rows(cumulative[window_end] - cumulative[window_start])
+        else:
+            window_vectors = unit_vectors
+
+        similarities = np.einsum("ij,ij->i", window_vectors[:-1], window_vectors[1:])
+        return 1.0 - similarities, sentence_vectors
+
+    def _merge_group(self, group: List[Document]) -> Document:
+        """Merge a run of adjacent documents into a single chunk"""
+        if len(group) == 1:
+            return group[0]
+
+        merged_text = " ".join(doc.page_content for doc in group)
+        merged_metadata = self._merge_metadata([doc.metadata for doc in group])
+
+        # Update block numbers to reflect merged state
+        block_nums = set()
+        for doc in group:
+            nums = doc.metadata.get("blockNum", [])
+            if isinstance(nums, list):
+                block_nums.update(nums)
+            else:
+                block_nums.add(nums)
+        merged_metadata["blockNum"] = sorted(block_nums)  # Remove duplicates and sort
+
+        # Merge bounding boxes and add to metadata
+        bboxes = [
+            doc.metadata.get("bounding_box", [])
+            for doc in group
+            if doc.metadata.get("bounding_box")
+        ]
+        merged_metadata["bounding_box"] = self._merge_bboxes(bboxes) if bboxes else None
+
+        return Document(page_content=merged_text, metadata=merged_metadata)
+
     def _optimize_for_large_documents(self, documents: List[Document]) -> List[Document]:
         """
         Optimize chunk count for large documents to prevent memory issues.
@@ -200,81 +258,39 @@ class CustomChunker(SemanticChunker):
         """
         try:
             doc_count = len(documents)
-            max_recommended_chunks = 800  # Conservative limit to prevent memory issues
-            
+            max_recommended_chunks = CHUNKER_MAX_SENTENCES
+
             if doc_count <= max_recommended_chunks:
                 return documents
-                
+
             self.logger.warning(f"🔍 Large document detected: {doc_count} chunks, applying optimization")
-            
+
             # Calculate merge ratio to get under the limit
             merge_ratio = doc_count / max_recommended_chunks
             target_chunk_size = int(merge_ratio) + 1
-            
+
             self.logger.info(f"📊 Merging documents with ratio ~{merge_ratio:.1f} (target groups of {target_chunk_size})")
-            
+
             optimized_documents = []
             i = 0
-            
+
             while i < len(documents):
                 # Determine group size with some variance for natural breaks
                 base_group_size = target_chunk_size
                 # Add small variance to avoid rigid patterns
                 group_size = min(base_group_size + (i % 3), len(documents) - i)
-                
-                # Get the group of documents to merge
-                group = documents[i:i + group_size]
-                
-                if len(group) == 1:
-                    # Single document, keep as-is
-                    optimized_documents.append(group[0])
-                else:
-                    # Merge the group
-                    merged_text = " ".join(doc.page_content for doc in group)
-                    
-                    # Merge metadata from all documents in group
-                    metadata_list = [doc.metadata for doc in group]
-                    merged_metadata = self._merge_metadata(metadata_list)
-                    
-                    # Merge bounding boxes if present
-                    bboxes = [
-                        doc.metadata.get("bounding_box", [])
-                        for doc in group
-                        if doc.metadata.get("bounding_box")
-                    ]
-                    merged_metadata["bounding_box"] = (
-                        self._merge_bboxes(bboxes) if bboxes else None
-                    )
-                    
-                    # Update block numbers to reflect merged state
-                    if len(group) > 1:
-                        block_nums = []
-                        for doc in group:
-                            nums = doc.metadata.get("blockNum", [])
-                            if isinstance(nums, list):
-                                block_nums.extend(nums)
-                            else:
-                                block_nums.append(nums)
-                        merged_metadata["blockNum"] = sorted(list(set(block_nums)))
-                    
-                    # Create merged document
-                    optimized_documents.append(
-                        Document(
-                            page_content=merged_text,
-                            metadata=merged_metadata,
-                        )
-                    )
-                
+
+                optimized_documents.append(self._merge_group(documents[i:i + group_size]))
                 i += group_size
-            
+
             reduction_pct = ((doc_count - len(optimized_documents)) / doc_count) * 100
             self.logger.info(
                 f"✅ Document optimization complete: {doc_count} → {len(optimized_documents)} chunks "
                 f"({reduction_pct:.1f}% reduction)"
             )
-            
+
             return optimized_documents
-            
+
         except Exception as e:
             self.logger.warning(f"Failed to optimize document chunks, using original: {str(e)}")
             return documents
@@ -353,15 +369,9 @@ class CustomChunker(SemanticChunker):
 
                     # Handle list fields - flatten and get unique values
                     if isinstance(field_values[0], list):
-                        unique_values = []
-                        seen = set()
-                        for value_list in field_values:
-                            for value in value_list:
-                                value_str = str(value)
-                                if value_str not in seen:
-                                    seen.add(value_str)
-                                    unique_values.append(value)
-                        merged_metadata[field] = unique_values
+                        merged_metadata[field] = _unique_values(
+                            value for value_list in field_values for value in value_list
+                        )
 
                     # Handle confidence score - keep maximum
                     elif field == "confidence_score":
@@ -369,21 +379,12 @@ class CustomChunker(SemanticChunker):
 
                     # For all other fields
                     else:
-                        # Convert values to strings for comparison
-                        str_values = [str(v) for v in field_values]
+                        unique_values = _unique_values(field_values)
                         # If all values are the same, keep single value
-                        if len(set(str_values)) == 1:
+                        if len(unique_values) == 1:
                             merged_metadata[field] = field_values[0]
                         # If values differ, keep all unique values in a list
                         else:
-                            # Keep original values but ensure uniqueness
-                            unique_values = []
-                            seen = set()
-                            for value in field_values:
-                                value_str = str(value)
-                                if value_str not in seen:
-                                    seen.add(value_str)
-                                    unique_values.append(value)
                             merged_metadata[field] = unique_values
 
                 return merged_metadata
@@ -413,10 +414,16 @@ class IndexingPipeline:
         arango_service,
         collection_name: str,
         qdrant_client: QdrantClient,
+        answer_cache_invalidator: Optional[AnswerCacheInvalidator] = None,
+        accessible_records_invalidator: Optional[AccessibleRecordsCacheInvalidator] = None,
     ) -> None:
         self.logger = logger
         self.config_service = config_service
         self.arango_service = arango_service
+        # Cached accessible records carry the virtualRecordId set by indexing
+        self.accessible_records_invalidator = accessible_records_invalidator
+        # Drops the query service's cached answers citing re-indexed records
+        self.answer_cache_invalidator = answer_cache_invalidator
         """
         Initialize the indexing pipeline with necessary configurations.
 
@@ -438,6 +445,19 @@ class IndexingPipeline:
             self.qdrant_client = qdrant_client
             self.collection_name = collection_name
             self.vector_store = None
+            # Dense model and vector store, resolved once per embedding config version
+            self.model_registry = EmbeddingModelRegistry(
+                logger, config_service, qdrant_client
+            )
+            self.indexing_stats: Dict[str, Any] = {
+                "documents": 0,
+                "chunks": 0,
+                "seconds": 0.0,
+                "embedSeconds": 0.0,
+                "upsertSeconds": 0.0,
+                "lastChunksPerSecond": 0.0,
+                "reusedDenseVectors": 0,
+            }
 
         except (IndexingError, VectorStoreError):
             raise
@@ -522,6 +542,17 @@ class IndexingPipeline:
                 except Exception as e:
                     # Ignore if already exists or server returns a non-fatal error
                     self.logger.info(f"aircraft_canonical index ensure: {str(e)}")
+                # Permission principals index (root-level), used by principal filtering
+                try:
+                    self.qdrant_client.create_payload_index(
+                        collection_name=self.collection_name,
+                        field_name=QdrantPayloadFields.PERMISSION_PRINCIPALS.value,
+                        field_schema=models.KeywordIndexParams(
+                            type=models.KeywordIndexType.KEYWORD,
+                        ),
+                    )
+                except Exception as e:
+                    self.logger.info(f"permission_principals index ensure: {str(e)}")
             except Exception as e:
                 self.logger.error(
                     f"❌ Error creating collection {self.collection_name}: {str(e)}"
@@ -532,100 +563,78 @@ class IndexingPipeline:
                 )
 
     async def get_embedding_model_instance(self) -> bool:
+        """
+        Resolve the dense model and vector store. Both are cached by the model
+        registry per embedding config version, so this is cheap after the first
+        call and only re-initializes the collection and chunker on config changes.
+        """
         try:
-            self.logger.info("Getting embedding model")
-            dense_embeddings = None
-            ai_models = await self.config_service.get_config(
-                config_node_constants.AI_MODELS.value
+            self.vector_store = await self.model_registry.get_vector_store(
+                self.collection_name,
+                self.sparse_embeddings,
+                on_create=self._on_embedding_model_change,
             )
-            embedding_configs = ai_models["embedding"]
-            if not embedding_configs:
-                dense_embeddings = get_default_embedding_model()
-            else:
-                config = embedding_configs[0]
-                provider = config["provider"]
-                dense_embeddings = get_embedding_model(provider, config)
-
-            # Get the embedding dimensions from the model
-            try:
-                sample_embedding = dense_embeddings.embed_query("test")
-                embedding_size = len(sample_embedding)
-            except Exception as e:
-                self.logger.warning(
-                    f"Error with configured embedding model, falling back to default: {str(e)}"
-                )
-                raise IndexingError(
-                    "Failed to get embedding model: " + str(e),
-                    details={"error": str(e)},
-                )
-
-            # Get model name safely
-            model_name = None
-            if hasattr(dense_embeddings, "model_name"):
-                model_name = dense_embeddings.model_name
-            elif hasattr(dense_embeddings, "model"):
-                model_name = dense_embeddings.model
-            else:
-                model_name = "unknown"
-
-            self.logger.info(
-                f"Using embedding model: {model_name}, embedding_size: {embedding_size}"
+            return True
+        except IndexingError as e:
+            self.logger.error(f"Error getting embedding model: {str(e)}")
+            raise IndexingError(
+                "Failed to get embedding model: " + str(e), details={"error": str(e)}
             )
-
-            # Initialize collection with correct embedding size
-            self._initialize_collection(embedding_size=embedding_size)
-
-            # Initialize vector store with same configuration
-            self.vector_store: QdrantVectorStore = QdrantVectorStore(
-                client=self.qdrant_client,
-                collection_name=self.collection_name,
-                vector_name="dense",
-                sparse_vector_name="sparse",
-                embedding=dense_embeddings,
-                sparse_embedding=self.sparse_embeddings,
-                retrieval_mode=RetrievalMode.HYBRID,
+        except Exception as e:
+            self.logger.error(f"Error getting embedding model: {str(e)}")
+            raise IndexingError(
+                "Failed to get embedding model: " + str(e), details={"error": str(e)}
             )
 
-            # Initialize custom semantic chunker with BGE embeddings
-            try:
-                self.text_splitter = CustomChunker(
-                    logger=self.logger,
-                    embeddings=dense_embeddings,
-                    breakpoint_threshold_type="percentile",
-                    breakpoint_threshold_amount=95,
-                )
-            except IndexingError as e:
-                raise IndexingError(
-                    "Failed to initialize text splitter: " + str(e),
-                    details={"error": str(e)},
-                )
+    def _on_embedding_model_change(self, model: EmbeddingModelInfo) -> None:
+        """Prepare the collection and chunker for a newly resolved embedding model"""
+        self.logger.info(
+            f"Using embedding model: {model.model_name}, embedding_size: {model.dimension}"
+        )
 
-            return True
+        # Initialize collection with correct embedding size
+        self._initialize_collection(embedding_size=model.dimension)
+
+        # Initialize custom semantic chunker with the dense embeddings
+        try:
+            self.text_splitter = CustomChunker(
+                logger=self.logger,
+                embeddings=model.dense_embeddings,
+                breakpoint_threshold_type="percentile",
+                breakpoint_threshold_amount=95,
+            )
         except IndexingError as e:
-            self.logger.error(f"Error getting embedding model: {str(e)}")
             raise IndexingError(
-                "Failed to get embedding model: " + str(e), details={"error": str(e)}
+                "Failed to initialize text splitter: " + str(e),
+                details={"error": str(e)},
             )
 
-    async def _process_embeddings_in_batches(self, chunks: List[Document]) -> None:
+    async def _process_embeddings_in_batches(
+        self, chunks: List[Document], dense_vectors: Optional[List[Optional[List[float]]]] = None
+    ) -> None:
         """
-        Process embeddings in memory-aware batches to handle large documents efficiently.
-        
+        Embed and store chunks in batches through a two-stage pipeline.
+
+        Batches are embedded (dense + sparse) in order while previously embedded
+        batches are upserted to Qdrant, with at most INDEXING_INFLIGHT_BATCHES
+        batches in flight. Each batch is stored with _store_batch_with_retry; a
+        batch that still fails is retried once split in half, and processing is
+        aborted after max_batch_failures consecutive failures, counted in the
+        order batches complete.
+
         Args:
             chunks: List of document chunks to embed
-            
+            dense_vectors: Precomputed dense vectors aligned with chunks; None
+                entries (or no list) are embedded with the dense model
+
         Raises:
             EmbeddingError: If there's an error creating embeddings
             VectorStoreError: If there's an error storing embeddings
         """
-        import gc
-        import asyncio
-        from math import ceil
-        
         try:
             total_chunks = len(chunks)
             self.logger.info(f"🔄 Starting batch processing for {total_chunks} chunks")
-            
+
             # Determine batch size based on chunk count
             # Adaptive batch sizing based on content
             base_batch_size = 50  # Conservative default
@@ -634,7 +643,7 @@ class IndexingPipeline:
                 self.logger.info("📚 Large document detected - using optimized batch size of 30")
             else:
                 batch_size = base_batch_size
-                
+
             # Calculate average content length to adjust batch size
             try:
                 avg_content_length = sum(len(chunk.page_content) for chunk in chunks[:10]) / min(10, len(chunks))
@@ -643,82 +652,113 @@ class IndexingPipeline:
                     self.logger.info(f"📄 Large chunk content detected - reduced batch size to {batch_size}")
             except Exception as e:
                 self.logger.warning(f"Could not calculate average content length: {e}")
-            
+
             num_batches = ceil(total_chunks / batch_size)
-            self.logger.info(f"📊 Processing {total_chunks} chunks in {num_batches} batches of up to {batch_size} chunks each")
-            
-            # Circuit breaker for batch failures
+            self.logger.info(
+                f"📊 Processing {total_chunks} chunks in {num_batches} batches of up to {batch_size} chunks each "
+                f"({INDEXING_INFLIGHT_BATCHES} in flight)"
+            )
+
+            # Circuit breaker for consecutive batch failures
             max_batch_failures = 3
-            batch_failures = 0
-            
-            for batch_idx in range(num_batches):
+            state = {"batch_failures": 0, "completed": 0}
+
+            in_flight = asyncio.Semaphore(max(1, INDEXING_INFLIGHT_BATCHES))
+            embed_slots = asyncio.Semaphore(max(1, INDEXING_EMBED_CONCURRENCY))
+            start_time = time.monotonic()
+
+            async def run_batch(batch_idx: int) -> None:
                 start_idx = batch_idx * batch_size
                 end_idx = min(start_idx + batch_size, total_chunks)
                 batch_chunks = chunks[start_idx:end_idx]
-                
+                batch_vectors = dense_vectors[start_idx:end_idx] if dense_vectors else None
                 batch_info = f"batch {batch_idx + 1}/{num_batches} ({end_idx - start_idx} chunks)"
-                
-                try:
-                    # Process batch
-                    self.logger.info(f"🔄 Processing {batch_info}")
-                    await self._store_batch_with_retry(batch_chunks, batch_info)
-                    
-                    # Reset failure count on success
-                    batch_failures = 0
-                    
-                    # Progress logging
-                    progress_pct = ((batch_idx + 1) / num_batches) * 100
-                    self.logger.info(f"✅ Completed {batch_info} - Progress: {progress_pct:.1f}%")
-                    
-                    # Memory cleanup between batches
-                    if batch_idx < num_batches - 1:  # Don't sleep after last batch
-                        gc.collect()
-                        # Brief pause to allow memory cleanup  
-                        await asyncio.sleep(0.1)
-                
-                except Exception as e:
-                    batch_failures += 1
-                    self.logger.error(f"❌ Failed to process {batch_info}: {str(e)}")
-                    
-                    # Circuit breaker check
-                    if batch_failures >= max_batch_failures:
-                        raise VectorStoreError(
-                            f"Too many batch failures ({batch_failures}/{max_batch_failures}). Aborting embedding process.",
-                            details={"failed_batch": batch_idx, "error": str(e)}
-                        )
-                    
-                    # Exponential backoff with jitter
-                    backoff_time = min(2 ** batch_failures + (batch_failures * 0.1), 10)
-                    self.logger.warning(f"⏳ Retrying after {backoff_time:.1f}s backoff...")
-                    await asyncio.sleep(backoff_time)
-                    
-                    # Retry with smaller batch size
+
+                async with in_flight:
                     try:
-                        if len(batch_chunks) > 1:
-                            # Split failed batch in half
-                            mid_point = len(batch_chunks) // 2
-                            retry_batch_1 = batch_chunks[:mid_point]
-                            retry_batch_2 = batch_chunks[mid_point:]
-                            
-                            self.logger.info(f"🔄 Retrying {batch_info} with reduced batch sizes")
-                            await self._store_batch_with_retry(retry_batch_1, f"{batch_info}-retry-A")
-                            await self._store_batch_with_retry(retry_batch_2, f"{batch_info}-retry-B")
-                        else:
-                            await self._store_batch_with_retry(batch_chunks, f"{batch_info}-retry")
-                        
-                        # Reset failure count on successful retry
-                        batch_failures = 0
-                        self.logger.info(f"✅ Successfully retried {batch_info}")
-                        
-                    except Exception as retry_error:
-                        self.logger.error(f"❌ Retry failed for {batch_info}: {str(retry_error)}")
-                        raise VectorStoreError(
-                            f"Failed to process batch after retry: {str(retry_error)}",
-                            details={"batch_index": batch_idx, "retry_error": str(retry_error)}
+                        self.logger.debug(f"🔄 Processing {batch_info}")
+                        await self._store_batch_with_retry(
+                            batch_chunks, batch_info, dense_vectors=batch_vectors, embed_slots=embed_slots
                         )
-            
-            self.logger.info(f"🎉 Successfully completed all {num_batches} batches for {total_chunks} chunks")
-            
+
+                        # Reset failure count on success, in completion order
+                        state["batch_failures"] = 0
+
+                    except Exception as e:
+                        state["batch_failures"] += 1
+                        self.logger.error(f"❌ Failed to process {batch_info}: {str(e)}")
+
+                        # Circuit breaker check
+                        if state["batch_failures"] >= max_batch_failures:
+                            raise VectorStoreError(
+                                f"Too many batch failures ({state['batch_failures']}/{max_batch_failures}). Aborting embedding process.",
+                                details={"failed_batch": batch_idx, "error": str(e)}
+                            )
+
+                        # Exponential backoff with jitter
+                        backoff_time = min(2 ** state["batch_failures"] + (state["batch_failures"] * 0.1), 10)
+                        self.logger.warning(f"⏳ Retrying after {backoff_time:.1f}s backoff...")
+                        await asyncio.sleep(backoff_time)
+
+                        # Retry with smaller batch size
+                        try:
+                            if len(batch_chunks) > 1:
+                                # Split failed batch in half
+                                mid_point = len(batch_chunks) // 2
+                                retry_batch_1 = batch_chunks[:mid_point]
+                                retry_batch_2 = batch_chunks[mid_point:]
+                                retry_vectors_1 = batch_vectors[:mid_point] if batch_vectors else None
+                                retry_vectors_2 = batch_vectors[mid_point:] if batch_vectors else None
+
+                                self.logger.info(f"🔄 Retrying {batch_info} with reduced batch sizes")
+                                await self._store_batch_with_retry(
+                                    retry_batch_1, f"{batch_info}-retry-A", dense_vectors=retry_vectors_1,
+                                    embed_slots=embed_slots,
+                                )
+                                await self._store_batch_with_retry(
+                                    retry_batch_2, f"{batch_info}-retry-B", dense_vectors=retry_vectors_2,
+                                    embed_slots=embed_slots,
+                                )
+                            else:
+                                await self._store_batch_with_retry(
+                                    batch_chunks, f"{batch_info}-retry", dense_vectors=batch_vectors,
+                                    embed_slots=embed_slots,
+                                )
+
+                            # Reset failure count on successful retry
+                            state["batch_failures"] = 0
+                            self.logger.info(f"✅ Successfully retried {batch_info}")
+
+                        except Exception as retry_error:
+                            self.logger.error(f"❌ Retry failed for {batch_info}: {str(retry_error)}")
+                            raise VectorStoreError(
+                                f"Failed to process batch after retry: {str(retry_error)}",
+                                details={"batch_index": batch_idx, "retry_error": str(retry_error)}
+                            )
+
+                # Progress logging
+                state["completed"] += 1
+                progress_pct = (state["completed"] / num_batches) * 100
+                self.logger.info(f"✅ Completed {batch_info} - Progress: {progress_pct:.1f}%")
+
+            tasks = [asyncio.create_task(run_batch(batch_idx)) for batch_idx in range(num_batches)]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # Stop the batches still queued or in flight
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+
+            elapsed = time.monotonic() - start_time
+            chunks_per_second = total_chunks / elapsed if elapsed > 0 else 0.0
+            self._record_indexing_stats(total_chunks, elapsed)
+            self.logger.info(
+                f"🎉 Successfully completed all {num_batches} batches for {total_chunks} chunks "
+                f"in {elapsed:.2f}s ({chunks_per_second:.1f} chunks/sec)"
+            )
+
         except VectorStoreError:
             raise
         except Exception as e:
@@ -726,8 +766,93 @@ class IndexingPipeline:
                 f"Unexpected error during batch processing: {str(e)}",
                 details={"error": str(e), "total_chunks": len(chunks)}
             )
-    
-    async def _store_batch_with_retry(self, batch_chunks: List[Document], batch_info: str, max_retries: int = 2) -> None:
+
+    async def _embed_batch(
+        self,
+        batch_chunks: List[Document],
+        dense_vectors: Optional[List[Optional[List[float]]]] = None,
+    ) -> List[models.PointStruct]:
+        """
+        Create dense and sparse embeddings for a batch and build its Qdrant points.
+        Chunks with a precomputed dense vector are not sent to the dense model.
+        """
+        vector_store = self.vector_store
+        texts = [chunk.page_content for chunk in batch_chunks]
+        dense_vectors = list(dense_vectors) if dense_vectors else [None] * len(texts)
+        missing = [i for i, vector in enumerate(dense_vectors) if vector is None]
+
+        async def embed_missing() -> None:
+            if not missing:
+                return
+            embedded = await vector_store.embeddings.aembed_documents(
+                [texts[i] for i in missing]
+            )
+            for i, vector in zip(missing, embedded):
+                dense_vectors[i] = vector
+
+        start_time = time.monotonic()
+        _, sparse_vectors = await asyncio.gather(
+            embed_missing(),
+            asyncio.to_thread(self.sparse_embeddings.embed_documents, texts),
+        )
+        self.indexing_stats["embedSeconds"] += time.monotonic() - start_time
+        self.indexing_stats["reusedDenseVectors"] += len(texts) - len(missing)
+
+        return [
+            models.PointStruct(
+                id=uuid.uuid4().hex,
+                vector={
+                    vector_store.vector_name: dense_vector,
+                    vector_store.sparse_vector_name: models.SparseVector(
+                        indices=sparse_vector.indices, values=sparse_vector.values
+                    ),
+                },
+                payload={
+                    vector_store.content_payload_key: chunk.page_content,
+                    vector_store.metadata_payload_key: chunk.metadata,
+                },
+            )
+            for chunk, dense_vector, sparse_vector in zip(batch_chunks, dense_vectors, sparse_vectors)
+        ]
+
+    async def _upsert_points(self, points: List[models.PointStruct], batch_info: str) -> None:
+        """Upsert embedded points off the event loop"""
+        start_time = time.monotonic()
+        self.logger.debug(f"📤 Upserting {batch_info}")
+        await asyncio.to_thread(
+            self.qdrant_client.upsert,
+            collection_name=self.collection_name,
+            points=points,
+        )
+        self.indexing_stats["upsertSeconds"] += time.monotonic() - start_time
+
+    def _record_indexing_stats(self, chunk_count: int, elapsed: float) -> None:
+        stats = self.indexing_stats
+        stats["documents"] += 1
+        stats["chunks"] += chunk_count
+        stats["seconds"] += elapsed
+        stats["lastChunksPerSecond"] = round(chunk_count / elapsed, 2) if elapsed > 0 else 0.0
+
+    def get_indexing_stats(self) -> Dict[str, Any]:
+        """Throughput counters of this pipeline since startup"""
+        stats = dict(self.indexing_stats)
+        stats["chunksPerSecond"] = (
+            round(stats["chunks"] / stats["seconds"], 2) if stats["seconds"] > 0 else 0.0
+        )
+        stats["inflightBatches"] = INDEXING_INFLIGHT_BATCHES
+        stats["embedConcurrency"] = INDEXING_EMBED_CONCURRENCY
+        for key in ("seconds", "embedSeconds", "upsertSeconds"):
+            stats[key] = round(stats[key], 3)
+        return stats
+
+    async def _store_batch_with_retry(
+        self,
+        batch_chunks: List[Document],
+        batch_info: str,
+        max_retries: int = 2,
+        dense_vectors: Optional[List[Optional[List[float]]]] = None,
+        embed_slots: Optional[asyncio.Semaphore] = None,
+    ) -> None:
         """
         Store a batch of chunks with retry logic and exponential backoff.
         
@@ -735,6 +860,9 @@ class IndexingPipeline:
             batch_chunks: Chunks to store in this batch
             batch_info: Description of the batch for logging
             max_retries: Maximum number of retry attempts
+            dense_vectors: Precomputed dense vectors aligned with batch_chunks
+            embed_slots: Semaphore held while embedding, so concurrent batches
+                overlap their upserts with each other's embedding
             
         Raises:
             VectorStoreError: If all retry attempts fail
@@ -742,7 +870,12 @@ class IndexingPipeline:
         for attempt in range(max_retries + 1):
             try:
                 self.logger.debug(f"🔄 Storing {batch_info} (attempt {attempt + 1}/{max_retries + 1})")
-                await self.vector_store.aadd_documents(batch_chunks)
+                if embed_slots is not None:
+                    async with embed_slots:
+                        points = await self._embed_batch(batch_chunks, dense_vectors)
+                else:
+                    points = await self._embed_batch(batch_chunks, dense_vectors)
+                await self._upsert_points(points, batch_info)
                 
                 if attempt > 0:
                     self.logger.info(f"✅ Successfully stored {batch_info} on retry attempt {attempt + 1}")
@@ -762,13 +895,16 @@ class IndexingPipeline:
                     self.logger.warning(f"⚠️ Attempt {attempt + 1} failed for {batch_info}, retrying in {backoff_time}s: {str(e)}")
                     await asyncio.sleep(backoff_time)
 
-    async def _create_embeddings(self, chunks: List[Document]) -> None:
+    async def _create_embeddings(
+        self, chunks: List[Document], dense_vectors: Optional[List[Optional[List[float]]]] = None
+    ) -> None:
         """
         Create both sparse and dense embeddings for document chunks and store them in vector store.
         Uses batch processing to handle large documents efficiently.
 
         Args:
             chunks: List of document chunks to embed
+            dense_vectors: Precomputed dense vectors aligned with chunks, if any
 
         Raises:
             EmbeddingError: If there's an error creating embeddings
@@ -803,7 +939,7 @@ class IndexingPipeline:
             self.logger.debug("Enhanced metadata processed")
 
             # Batch processing for large document sets
-            await self._process_embeddings_in_batches(chunks)
+            await self._process_embeddings_in_batches(chunks, dense_vectors)
 
             # After points are added, set root-level aircraft fields for all points with this virtualRecordId
             try:
@@ -832,9 +968,15 @@ class IndexingPipeline:
             except Exception as e:
                 self.logger.warning(f"Failed to set aircraft payload on new points: {str(e)}")
 
+            # Store who may read these points so queries can filter by principal
+            await self.set_permission_principals(
+                virtual_record_id, record_id=(meta or {}).get("recordId")
+            )
+
             self.logger.info(
                 f"✅ Successfully added {len(chunks)} documents to vector store"
             )
+            await self._invalidate_answers(virtual_record_id)
 
             # Update record with indexing status
             try:
@@ -847,15 +989,15 @@ class IndexingPipeline:
                         doc_id=meta["recordId"],
                     )
 
-                doc = dict(record)
-                doc.update(
-                    {
-                        "indexingStatus": "COMPLETED",
-                            "isDirty": False,
-                            "lastIndexTimestamp": get_epoch_timestamp_in_ms(),
-                            "virtualRecordId": virtual_record_id,
-                        }
-                    )
+                # Only the indexing fields: domain extraction updates the same
+                # record concurrently
+                doc = {
+                    "_key": record["_key"],
+                    "indexingStatus": "COMPLETED",
+                    "isDirty": False,
+                    "lastIndexTimestamp": get_epoch_timestamp_in_ms(),
+                    "virtualRecordId": virtual_record_id,
+                }
 
                 docs = [doc]
 
@@ -867,6 +1009,10 @@ class IndexingPipeline:
                         "Failed to update indexing status", doc_id=meta["recordId"]
                     )
 
+                # Cached accessible records were loaded without this
+                # virtualRecordId; the bumps of a bulk sync are coalesced
+                await self._invalidate_accessible_records(meta.get("orgId"))
+
             except DocumentProcessingError:
                 raise
             except Exception as e:
@@ -889,6 +1035,100 @@ class IndexingPipeline:
                 details={"error": str(e)},
             )
 
+    async def set_permission_principals(
+        self, virtual_record_id: str, record_id: str = None
+    ) -> None:
+        """
+        Set the root-level permission principals payload on every point of a
+        virtualRecordId. Called after indexing and again on updatePermissions
+        record events, which connectors send when a record's permissions change.
+
+        Args:
+            virtual_record_id (str): Virtual record ID whose points to update
+            record_id (str): Record being indexed, if not yet linked in Arango
+        """
+        try:
+            principals = await self.arango_service.get_permission_principals(
+                virtual_record_id, record_id=record_id
+            )
+            self.qdrant_client.set_payload(
+                collection_name=self.collection_name,
+                payload={QdrantPayloadFields.PERMISSION_PRINCIPALS.value: principals},
+                points=None,
+                filter=Filter(
+                    must=[
+                        FieldCondition(
+                            key="metadata.virtualRecordId",
+                            match=MatchValue(value=virtual_record_id),
+                        )
+                    ]
+                ),
+            )
+            self.logger.debug(
+                f"Set {len(principals)} permission principals for {virtual_record_id}"
+            )
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to set permission principals on points: {str(e)}"
+            )
+
+    async def set_domain_metadata(
+        self, virtual_record_id: str, domain_metadata: Dict[str, Any]
+    ) -> None:
+        """
+        Attach domain classification fields to every point of a virtualRecordId.
+
+        Points are indexed while the domain extractor is still running, so the
+        fields are merged into the nested metadata afterwards, together with the
+        root-level aircraft fields, in one batched update.
+
+        Args:
+            virtual_record_id (str): Virtual record ID whose points to update
+            domain_metadata (Dict[str, Any]): Record returned by the domain extractor
+        """
+        fields = self._domain_fields(domain_metadata or {})
+        points_filter = Filter(
+            must=[
+                FieldCondition(
+                    key="metadata.virtualRecordId",
+                    match=MatchValue(value=virtual_record_id),
+                )
+            ]
+        )
+        try:
+            await asyncio.to_thread(
+                self.qdrant_client.batch_update_points,
+                collection_name=self.collection_name,
+                update_operations=[
+                    models.SetPayloadOperation(
+                        set_payload=models.SetPayload(
+                            payload=fields, filter=points_filter, key="metadata"
+                        )
+                    ),
+                    models.SetPayloadOperation(
+                        set_payload=models.SetPayload(
+                            payload={
+                                "aircraft_canonical": fields["aircraft_canonical"],
+                                "aircraft_aliases": fields["aircraft_aliases"],
+                            },
+                            filter=points_filter,
+                        )
+                    ),
+                ],
+            )
+            self.logger.debug(f"Set domain metadata for {virtual_record_id}")
+        except Exception as e:
+            self.logger.warning(f"Failed to set domain metadata on points: {str(e)}")
+        await self._invalidate_answers(virtual_record_id)
+
+    async def _invalidate_answers(self, virtual_record_id: Optional[str]) -> None:
+        if self.answer_cache_invalidator and virtual_record_id:
+            await self.answer_cache_invalidator.invalidate_records([virtual_record_id])
+
+    async def _invalidate_accessible_records(self, org_id: Optional[str]) -> None:
+        if self.accessible_records_invalidator and org_id:
+            await self.accessible_records_invalidator.invalidate_org(org_id)
+
     def _assess_memory_requirements(self, doc_count: int, estimated_size_mb: float) -> Dict[str, Any]:
         """
         Assess memory requirements for processing documents and determine the best strategy.
@@ -939,7 +1179,9 @@ class IndexingPipeline:
             'batch_size': 50
         }
 
-    async def delete_embeddings(self, record_id: str, virtual_record_id: str) -> None:
+    async def delete_embeddings(
+        self, record_id: str, virtual_record_id: str, org_id: Optional[str] = None
+    ) -> None:
         """
         Delete embeddings only if this is the last record with this virtual_record_id.
         If other records exist with the same virtual_record_id, skip deletion.
@@ -947,6 +1189,8 @@ class IndexingPipeline:
         Args:
             record_id (str): ID of the record whose embeddings should be deleted
             virtual_record_id (str): Virtual record ID to check for other records
+            org_id (Optional[str]): Organization of the record, whose cached
+                accessible records are invalidated
 
         Raises:
             EmbeddingDeletionError: If there's an error during the deletion process
@@ -957,6 +1201,10 @@ class IndexingPipeline:
                     "No record ID provided for deletion", record_id=record_id
                 )
 
+            # Cached answers may cite the record even when its points are kept
+            await self._invalidate_answers(virtual_record_id)
+            await self._invalidate_accessible_records(org_id)
+
             self.logger.info(f"🔍 Checking other records with virtual_record_id {virtual_record_id}")
 
             # Get other records with same virtual_record_id
@@ -1027,7 +1275,7 @@ class IndexingPipeline:
             )
 
     async def index_documents(
-        self, sentences: List[Dict[str, Any]], merge_documents: bool = False
+        self, sentences: List[Dict[str, Any]], merge_documents: Optional[bool] = None
     ) -> List[Document]:
         """
         Main method to index documents through the entire pipeline.
@@ -1035,6 +1283,9 @@ class IndexingPipeline:
         Args:
             sentences: List of dictionaries containing text and metadata
                     Each dict should have 'text' and 'metadata' keys
+            merge_documents: Merge sentences into semantic chunks. None merges
+                    only sources selected in EMBEDDING_REUSE_SOURCES; False never
+                    merges (e.g. spreadsheet rows)
 
         Raises:
             DocumentProcessingError: If there's an error processing the documents
@@ -1085,9 +1336,33 @@ class IndexingPipeline:
                     details={"error": str(e)},
                 )
 
+            # Merge sentences into semantic chunks. For selected sources the chunk
+            # vectors are pooled from the sentence embeddings computed for
+            # breakpoint detection instead of embedding every chunk again
+            dense_vectors = None
+            reuse_embeddings = self._reuse_chunker_embeddings(documents)
+            if merge_documents or (merge_documents is None and reuse_embeddings):
+                try:
+                    documents, dense_vectors = await asyncio.to_thread(
+                        self.text_splitter.split_documents_with_embeddings,
+                        documents,
+                        pool_embeddings=reuse_embeddings,
+                    )
+                    self.logger.info(
+                        f"🧩 Chunked {doc_count} sentences into {len(documents)} chunks "
+                        f"({'pooled' if reuse_embeddings else 're-embedded'} chunk vectors)"
+                    )
+                except ChunkingError:
+                    raise
+                except Exception as e:
+                    raise ChunkingError(
+                        "Failed to chunk documents: " + str(e),
+                        details={"error": str(e)},
+                    )
+
             # Create and store embeddings
             try:
-                await self._create_embeddings(documents)
+                await self._create_embeddings(documents, dense_vectors)
             except Exception as e:
                 raise EmbeddingError(
                     "Failed to create or store embeddings: " + str(e),
@@ -1106,6 +1381,23 @@ class IndexingPipeline:
                 details={"error_type": type(e).__name__},
             )
 
+    def _reuse_chunker_embeddings(self, documents: List[Document]) -> bool:
+        """Whether the document's connector, extension or mime type is selected for pooled chunk vectors"""
+        if not EMBEDDING_REUSE_SOURCES or not documents:
+            return False
+        if "*" in EMBEDDING_REUSE_SOURCES:
+            return True
+        metadata = documents[0].metadata or {}
+        sources = (
+            metadata.get("connectorName"),
+            metadata.get("extension"),
+            metadata.get("mimeType"),
+        )
+        return any(
+            isinstance(source, str) and source.lower() in EMBEDDING_REUSE_SOURCES
+            for source in sources
+        )
+
     async def check_embeddings_exist(self, record_id: str, virtual_record_id: str) -> bool:
         """
         Check if embeddings exist for a given virtual record ID.
@@ -1168,6 +1460,31 @@ class IndexingPipeline:
                 details={"error": str(e)},
             )
 
+    def _domain_fields(self, meta: Dict[str, Any]) -> Dict[str, Any]:
+        """Domain classification fields of a point's metadata, defaulted when not extracted"""
+        fields = {
+            "departments": meta.get("departments") or [],
+            "topics": meta.get("topics") or [],
+            "categories": meta.get("categories") or [],
+            "subcategoryLevel1": meta.get("subcategoryLevel1") or [],
+            "subcategoryLevel2": meta.get("subcategoryLevel2") or [],
+            "subcategoryLevel3": meta.get("subcategoryLevel3") or [],
+            "languages": meta.get("languages") or [],
+        }
+
+        # Copy-through raw aircraft (may be empty) and normalized fields inside metadata for downstream use
+        aircraft_raw = meta.get("aircraft", "")
+        fields["aircraft"] = aircraft_raw
+        try:
+            canonical, aliases = normalize_aircraft(aircraft_raw)
+            fields["aircraft_canonical"] = canonical or "unknown"
+            fields["aircraft_aliases"] = aliases or []
+        except Exception:
+            # Non-fatal: default to unknown if normalization fails
+            fields["aircraft_canonical"] = "unknown"
+            fields["aircraft_aliases"] = []
+        return fields
+
     def _process_metadata(self, meta: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process and enhance document metadata.
@@ -1199,29 +1516,10 @@ class IndexingPipeline:
                 "blockNum": meta.get("blockNum", [0]),
                 "blockText": meta.get("blockText", ""),
                 "blockType": str(block_type),
-                "departments": meta.get("departments", []),
-                "topics": meta.get("topics", []),
-                "categories": meta.get("categories", []),
-                "subcategoryLevel1": meta.get("subcategoryLevel1", []),
-                "subcategoryLevel2": meta.get("subcategoryLevel2", []),
-                "subcategoryLevel3": meta.get("subcategoryLevel3", []),
-                "languages": meta.get("languages", []),
                 "extension": meta.get("extension", ""),
                 "mimeType": meta.get("mimeType", ""),
             }
-
-            # Copy-through raw aircraft (may be empty) and normalized fields inside metadata for downstream use
-            try:
-                aircraft_raw = meta.get("aircraft", "")
-                enhanced_metadata["aircraft"] = aircraft_raw
-                canonical, aliases = normalize_aircraft(aircraft_raw)
-                enhanced_metadata["aircraft_canonical"] = canonical or "unknown"
-                enhanced_metadata["aircraft_aliases"] = aliases or []
-            except Exception as e:
-                # Non-fatal: default to unknown if normalization fails
-                enhanced_metadata["aircraft"] = meta.get("aircraft", "")
-                enhanced_metadata["aircraft_canonical"] = "unknown"
-                enhanced_metadata["aircraft_aliases"] = []
+            enhanced_metadata.update(self._domain_fields(meta))
 
             if meta.get("bounding_box"):
                 enhanced_metadata["bounding_box"] = meta.get("bounding_box")
@@ -3,6 +3,8 @@ import subprocess
 import tempfile
 from io import BytesIO
 
+from app.utils.downloaded_file import FileContent, content_path
+
 
 class DocParser:
     """Parser for Microsoft Word .doc and .docx files"""
@@ -10,11 +12,12 @@ class DocParser:
     def __init__(self):
         pass
 
-    def convert_doc_to_docx(self, binary: bytes) -> BytesIO:
+    def convert_doc_to_docx(self, binary: FileContent) -> BytesIO:
         """Convert .doc file to .docx using LibreOffice
 
         Args:
-            binary (bytes): The binary content of the .doc file
+            binary (FileContent): Content of the .doc file; spooled downloads are
+                converted in place
 
         Returns:
             BytesIO: The converted .docx file content as a BytesIO stream
@@ -24,20 +27,15 @@ class DocParser:
             FileNotFoundError: If the converted file is not found
             Exception: For other conversion errors
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory() as temp_dir, content_path(
+            binary, ".doc"
+        ) as temp_doc:
             try:
                 # Check if LibreOffice is installed
                 subprocess.run(
                     ["which", "libreoffice"], check=True, capture_output=True
                 )
 
-                # Create input file path
-                temp_doc = os.path.join(temp_dir, "input.doc")
-
-                # Write binary content to temporary file
-                with open(temp_doc, "wb") as f:
-                    f.write(binary)
-
                 # Convert .doc to .docx using LibreOffice
                 subprocess.run(
                     [
@@ -55,7 +53,10 @@ class DocParser:
                 )
 
                 # Get the docx file path
-                docx_file = os.path.join(temp_dir, "input.docx")
+                docx_file = os.path.join(
+                    temp_dir,
+                    os.path.splitext(os.path.basename(temp_doc))[0] + ".docx",
+                )
 
                 if not os.path.exists(docx_file):
                     raise FileNotFoundError(
@@ -1,18 +1,18 @@
 from docling.datamodel.base_models import DocumentStream
-from docling.document_converter import DocumentConverter
+
+from app.core.parser_model_registry import get_parser_model_registry
 
 
 class DocxParser:
     def __init__(self):
         self.text_content = None
         self.metadata = None
+        self.converter = get_parser_model_registry().document_converter()
 
     def parse(self, file_binary):
         # Create a DocumentStream directly from the bytes
         source = DocumentStream(name="content.docx", stream=file_binary)
-
-        converter = DocumentConverter()
-        doc = converter.convert(source)
+        doc = self.converter.convert(source)
 
         return doc.document
 
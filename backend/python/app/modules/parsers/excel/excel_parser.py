@@ -1,7 +1,7 @@
 import io
 import json
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 from openpyxl import load_workbook
 from openpyxl.cell.cell import MergedCell
@@ -25,6 +25,7 @@ class ExcelParser:
         self.logger = logger
         self.workbook = None
         self.file_binary = None
+        self.file_path = None
 
         # Store prompts
         self.sheet_summary_prompt = sheet_summary_prompt
@@ -36,10 +37,13 @@ class ExcelParser:
         self.min_wait = 1  # seconds
         self.max_wait = 10  # seconds
 
-    def parse(self, file_binary: bytes) -> Dict[str, Any]:
+    def parse(self, file_binary: Union[bytes, str]) -> Dict[str, Any]:
         """
         Parse Excel file and extract all content including sheets, cells, formulas, etc.
 
+        Args:
+            file_binary: Content of the workbook, or the path of a workbook on disk
+
         Returns:
             Dict containing parsed content with structure:
             {
@@ -52,7 +56,10 @@ class ExcelParser:
             }
         """
         try:
-            self.file_binary = file_binary
+            if isinstance(file_binary, str):
+                self.file_path, self.file_binary = file_binary, None
+            else:
+                self.file_binary = file_binary
             # Load workbook from binary or file path
             if self.file_binary:
                 self.workbook = load_workbook(
@@ -2,6 +2,8 @@ import os
 import subprocess
 import tempfile
 
+from app.utils.downloaded_file import FileContent, content_path
+
 
 class XLSParser:
     """Parser for Microsoft Excel .xls files"""
@@ -9,12 +11,13 @@ class XLSParser:
     def __init__(self):
         pass
 
-    def convert_xls_to_xlsx(self, binary: bytes) -> bytes:
+    def convert_xls_to_xlsx(self, binary: FileContent) -> bytes:
         """
         Convert .xls file to .xlsx using LibreOffice and return the xlsx binary content
 
         Args:
-            binary (bytes): The binary content of the XLS file
+            binary (FileContent): Content of the XLS file; spooled downloads are
+                converted in place
 
         Returns:
             bytes: The binary content of the converted XLSX file
@@ -24,20 +27,15 @@ class XLSParser:
             FileNotFoundError: If the converted file is not found
             Exception: For other conversion errors
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory() as temp_dir, content_path(
+            binary, ".xls"
+        ) as temp_input:
             try:
                 # Check if LibreOffice is installed
                 subprocess.run(
                     ["which", "libreoffice"], check=True, capture_output=True
                 )
 
-                # Create input file path
-                temp_input = os.path.join(temp_dir, "input.xls")
-
-                # Write binary data to temporary file
-                with open(temp_input, "wb") as f:
-                    f.write(binary)
-
                 # Convert .xls to .xlsx using LibreOffice
                 subprocess.run(
                     [
@@ -55,7 +53,10 @@ class XLSParser:
                 )
 
                 # Get the xlsx file path
-                xlsx_file = os.path.join(temp_dir, "input.xlsx")
+                xlsx_file = os.path.join(
+                    temp_dir,
+                    os.path.splitext(os.path.basename(temp_input))[0] + ".xlsx",
+                )
 
                 if not os.path.exists(xlsx_file):
                     raise FileNotFoundError(
@@ -1,12 +1,13 @@
 from io import BytesIO
 
 from docling.datamodel.base_models import DocumentStream
-from docling.document_converter import DocumentConverter
+
+from app.core.parser_model_registry import get_parser_model_registry
 
 
 class HTMLParser:
     def __init__(self):
-        self.converter = DocumentConverter()
+        self.converter = get_parser_model_registry().document_converter()
 
     def parse_string(self, html_content: str):
         """
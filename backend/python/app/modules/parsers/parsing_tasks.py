@@ -0,0 +1,135 @@
+"""CPU-bound parsing tasks executed in the parsing worker processes
+
+Every function here runs inside a ParsingPool worker, so arguments and return
+values cross a process boundary: large inputs are passed as file paths where
+possible and results are plain dicts or (picklable) Docling documents.
+
+Parsers are built once per worker by ``init_worker`` and reused for every
+task. The worker also warms up its ParserModelRegistry, so the spaCy
+pipelines of the OCR strategies and the Docling converter are loaded before
+the first document arrives.
+"""
+
+import asyncio
+import os
+import resource
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from app.core.parser_model_registry import get_parser_model_registry
+from app.utils.downloaded_file import DownloadedFile
+from app.utils.logger import create_logger
+
+_worker: Dict[str, Any] = {"logger": None}
+_parsers: Dict[str, Any] = {}
+
+
+def init_worker(memory_limit_mb: int = 0) -> None:
+    """Process initializer: apply the memory cap and preload parsers"""
+    if memory_limit_mb > 0:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    logger = _worker["logger"] = create_logger("parsing_worker")
+    logger.info(f"🚀 Parsing worker {os.getpid()} starting")
+    _load_parsers()
+
+
+def warm_up() -> Dict[str, Any]:
+    """Task used to start every worker ahead of the first document
+
+    Returns the worker's pid and how long each of its models took to load.
+    """
+    return {"pid": os.getpid(), "models": get_parser_model_registry().load_times()}
+
+
+def run_task(func, args: Tuple, kwargs: Dict[str, Any]) -> Tuple[Any, float]:
+    """Run a task and report the worker's peak RSS (MB) with its result"""
+    result = func(*args, **kwargs)
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    # PDF page workers are children of this worker and go down with it
+    page_workers_peak_rss_mb = _worker.get("page_workers_peak_rss_mb")
+    if page_workers_peak_rss_mb is not None:
+        peak_rss_mb = max(peak_rss_mb, page_workers_peak_rss_mb())
+    return result, peak_rss_mb
+
+
+def ocr_pdf(
+    provider: str, handler_kwargs: Dict[str, Any], source: Union[bytes, str]
+) -> Dict[str, Any]:
+    """
+    Extract text and layout of a PDF with the configured OCR provider
+
+    Args:
+        provider (str): OCR provider (OCRProvider value)
+        handler_kwargs (Dict[str, Any]): Provider configuration for OCRHandler
+        source (Union[bytes, str]): PDF content, or the path of a spooled download
+    """
+    from app.modules.parsers.pdf.ocr_handler import OCRHandler
+
+    handler = OCRHandler(_worker["logger"], provider, **handler_kwargs)
+    if isinstance(source, str):
+        with DownloadedFile.from_path(source) as content:
+            return asyncio.run(handler.process_document(content))
+    return asyncio.run(handler.process_document(source))
+
+
+def parse_docx(data: bytes):
+    return _parsers["docx"].parse(BytesIO(data))
+
+
+def parse_pptx(data: bytes):
+    return _parsers["pptx"].parse_binary(data)
+
+
+def parse_markdown(md_content: str):
+    return _parsers["md"].parse_string(md_content)
+
+
+def parse_html(html_content: str):
+    return _parsers["html"].parse_string(html_content)
+
+
+def read_csv(path: str, encodings: List[str]) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+    """Read a CSV trying each encoding in turn; returns rows and the encoding used"""
+    for encoding in encodings:
+        try:
+            return _parsers["csv"].read_file(path, encoding=encoding), encoding
+        except UnicodeDecodeError:
+            continue
+    return None, None
+
+
+def _load_parsers() -> None:
+    from app.modules.parsers.csv.csv_parser import CSVParser
+    from app.modules.parsers.docx.docx_parser import DocxParser
+    from app.modules.parsers.html_parser.html_parser import HTMLParser
+    from app.modules.parsers.markdown.markdown_parser import MarkdownParser
+    from app.modules.parsers.pptx.pptx_parser import PPTXParser
+
+    get_parser_model_registry(_worker["logger"])
+    _parsers.update(
+        {
+            "csv": CSVParser(),
+            "docx": DocxParser(),
+            "html": HTMLParser(),
+            "md": MarkdownParser(),
+            "pptx": PPTXParser(),
+        }
+    )
+    try:
+        import fitz  # noqa: F401
+        import ocrmypdf  # noqa: F401
+
+        from app.modules.parsers.pdf.azure_document_intelligence_processor import (
+            AzureOCRStrategy,
+        )
+        from app.modules.parsers.pdf.pymupdf_ocrmypdf_processor import (
+            PyMuPDFOCRStrategy,
+            page_workers_peak_rss_mb,
+        )
+
+        PyMuPDFOCRStrategy.load_nlp()
+        _worker["page_workers_peak_rss_mb"] = page_workers_peak_rss_mb
+        AzureOCRStrategy.load_nlp()
+    except Exception as e:
+        _worker["logger"].warning(f"⚠️ Could not preload PDF dependencies: {str(e)}")
@@ -1,10 +1,11 @@
 import os
 import time
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
 from io import BytesIO
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import fitz  # PyMuPDF for initial document check
-import spacy
 from azure.ai.formrecognizer.aio import (
     DocumentAnalysisClient as AsyncDocumentAnalysisClient,
 )
@@ -12,12 +13,72 @@ from azure.core.credentials import AzureKeyCredential
 from spacy import Language
 from spacy.tokens import Doc
 
-from app.modules.parsers.pdf.ocr_handler import OCRStrategy
+from app.core.parser_model_registry import get_parser_model_registry
+from app.modules.parsers.pdf.ocr_handler import OCRStrategy, open_pdf
+from app.utils.downloaded_file import DownloadedFile, FileContent
 
 LENGTH_THRESHOLD = 2
 WORD_THRESHOLD = 15
 WORD_OVERLAP_THRESHOLD = 0.9
 
+
+class PageLineIndex:
+    """Lines of one page, indexed for paragraph lookups
+
+    Lines are found by their offset in the analyzed content (Azure spans),
+    which is exact, or, when spans are missing, by vertical extent so that
+    only lines near a paragraph are compared with it.
+    """
+
+    def __init__(
+        self, lines: List[Dict[str, Any]], offsets: Sequence[Optional[int]]
+    ) -> None:
+        self.lines = lines
+        self.has_spans = bool(lines) and all(offset is not None for offset in offsets)
+        if self.has_spans:
+            by_offset = sorted(zip(offsets, range(len(lines))))
+            self._offsets = [offset for offset, _ in by_offset]
+            self._offset_lines = [lines[i] for _, i in by_offset]
+
+        extents = sorted(
+            (_y_extent(line["bounding_box"]), i) for i, line in enumerate(lines)
+        )
+        self._y_mins = [y_min for (y_min, _), _ in extents]
+        self._y_lines = [(y_max, lines[i]) for (_, y_max), i in extents]
+        self._max_height = max(
+            (y_max - y_min for (y_min, y_max), _ in extents), default=0.0
+        )
+
+    def lines_in_spans(self, spans: Sequence[Tuple[int, int]]) -> List[Dict[str, Any]]:
+        """Lines starting inside any of the (offset, length) spans"""
+        found = []
+        for offset, length in spans:
+            start = bisect_left(self._offsets, offset)
+            end = bisect_left(self._offsets, offset + length)
+            found.extend(self._offset_lines[start:end])
+        return found
+
+    def lines_near(self, bbox: Optional[List[Dict[str, float]]]) -> List[Dict[str, Any]]:
+        """Lines whose vertical extent intersects the bounding box"""
+        if not bbox:
+            return []
+        y_min, y_max = _y_extent(bbox)
+        # Lines are sorted by top edge; none starting above y_min minus the
+        # tallest line can reach down into the box
+        start = bisect_left(self._y_mins, y_min - self._max_height)
+        end = bisect_right(self._y_mins, y_max)
+        return [
+            line for line_y_max, line in self._y_lines[start:end] if line_y_max >= y_min
+        ]
+
+
+def _y_extent(bbox: Optional[List[Dict[str, float]]]) -> Tuple[float, float]:
+    if not bbox:
+        return (0.0, 0.0)
+    ys = [point["y"] for point in bbox]
+    return (min(ys), max(ys))
+
+
 class AzureOCRStrategy(OCRStrategy):
     def __init__(
         self, logger, endpoint: str, key: str, model_id: str = "prebuilt-document"
@@ -32,17 +93,17 @@ class AzureOCRStrategy(OCRStrategy):
         self._processed = False
         self.ocr_pdf_content = None  # Store the OCR-processed PDF content
 
-        # Initialize spaCy with custom tokenizer
-        self.logger.info("🧠 Loading spaCy model and creating custom tokenizer...")
-        try:
-            nlp_model = spacy.load("en_core_web_sm")
-        except Exception as e:
-            self.logger.warning(f"spaCy model 'en_core_web_sm' not available, falling back to blank 'en': {e}")
-            nlp_model = spacy.blank("en")
-        self.nlp = self._create_custom_tokenizer(nlp_model)
-        self.logger.info("✅ spaCy tokenizer initialized")
+        # spaCy with custom tokenizer, loaded once per process
+        self.nlp = self.load_nlp()
 
-    async def load_document(self, content: bytes) -> None:
+    @classmethod
+    def load_nlp(cls) -> Language:
+        """spaCy pipeline with the custom tokenizer, shared by every instance"""
+        return get_parser_model_registry().spacy_pipeline(
+            "azure_sentences", cls._create_custom_tokenizer
+        )
+
+    async def load_document(self, content: FileContent) -> None:
         """Load and analyze document using Azure Document Intelligence"""
         self.logger.info("🚀 Starting Azure Document Intelligence document loading")
         self.logger.info(f"📊 Document size: {len(content):,} bytes")
@@ -51,7 +112,7 @@ class AzureOCRStrategy(OCRStrategy):
         self.logger.debug("📄 Opening PDF with PyMuPDF for initial OCR need analysis")
 
         try:
-            with fitz.open(stream=content, filetype="pdf") as temp_doc:
+            with open_pdf(content) as temp_doc:
                 # Check if any page needs OCR
                 self.logger.info("🔍 Analyzing OCR requirements per page...")
                 pages_needing_ocr = []
@@ -97,7 +158,7 @@ class AzureOCRStrategy(OCRStrategy):
         self.logger.info(f"   🔤 Sentences created: {len(result.get('sentences', []))}")
         self.logger.info(f"   📊 Tables detected: {len(result.get('tables', []))}")
 
-    async def _process_with_azure(self, content: bytes) -> None:
+    async def _process_with_azure(self, content: FileContent) -> None:
         """Process document using Azure Document Intelligence"""
         self.logger.info("🤖 Starting Azure Document Intelligence processing...")
 
@@ -108,18 +169,25 @@ class AzureOCRStrategy(OCRStrategy):
             ) as doc_client:
 
                 self.logger.debug("📤 Preparing document for Azure submission")
-                document = BytesIO(content)
+                # Spooled downloads are streamed from disk instead of copied
+                if isinstance(content, DownloadedFile):
+                    document = content.open()
+                else:
+                    document = BytesIO(content)
                 document.seek(0)
 
                 self.logger.info(f"📤 Sending document to Azure DI (model: {self.model_id})")
                 start_time = time.time()
 
-                poller = await doc_client.begin_analyze_document(
-                    model_id=self.model_id, document=document
-                )
+                try:
+                    poller = await doc_client.begin_analyze_document(
+                        model_id=self.model_id, document=document
+                    )
 
-                self.logger.info("⏳ Waiting for Azure analysis to complete...")
-                self.doc = await poller.result()
+                    self.logger.info("⏳ Waiting for Azure analysis to complete...")
+                    self.doc = await poller.result()
+                finally:
+                    document.close()
 
                 processing_time = time.time() - start_time
                 self.logger.info(f"✅ Azure processing completed in {processing_time:.2f} seconds")
@@ -152,12 +220,12 @@ class AzureOCRStrategy(OCRStrategy):
             await self._process_with_pymupdf(content)
             self._needs_ocr = False
 
-    async def _process_with_pymupdf(self, content: bytes) -> None:
+    async def _process_with_pymupdf(self, content: FileContent) -> None:
         """Process document using PyMuPDF"""
         self.logger.info("📚 Starting PyMuPDF processing...")
 
         try:
-            self.doc = fitz.open(stream=content, filetype="pdf")
+            self.doc = open_pdf(content)
             self.logger.info("✅ PyMuPDF document loaded successfully")
             self.logger.info(f"   📄 Page count: {len(self.doc)}")
 
@@ -187,7 +255,7 @@ class AzureOCRStrategy(OCRStrategy):
             self.logger.error(f"❌ PyMuPDF processing failed: {e}")
             raise
 
-    @Language.component("custom_sentence_boundary")
+    @Language.component("azure_sentence_boundary")
     def custom_sentence_boundary(doc) -> Doc:
         for token in doc[:-1]:  # Avoid out-of-bounds errors
             next_token = doc[token.i + 1]
@@ -281,7 +349,8 @@ class AzureOCRStrategy(OCRStrategy):
 
         return doc
 
-    def _create_custom_tokenizer(self, nlp) -> Language:
+    @staticmethod
+    def _create_custom_tokenizer(nlp) -> Language:
         """
         Creates a custom tokenizer that handles special cases for sentence boundaries.
         """
@@ -293,8 +362,8 @@ class AzureOCRStrategy(OCRStrategy):
                 nlp.add_pipe("sentencizer")
 
         # Add custom sentence boundary detection
-        if "custom_sentence_boundary" not in nlp.pipe_names:
-            nlp.add_pipe("custom_sentence_boundary", after="sentencizer")
+        if "azure_sentence_boundary" not in nlp.pipe_names:
+            nlp.add_pipe("azure_sentence_boundary", after="sentencizer")
 
         # Configure the tokenizer to handle special cases
         special_cases = {
@@ -674,6 +743,7 @@ class AzureOCRStrategy(OCRStrategy):
         # Get pages to process
         if needs_ocr:
             doc_pages = self.doc.pages
+            paragraphs_by_page = self._paragraphs_by_page()
         else:
             doc_pages = range(len(self.doc))  # PyMuPDF case
 
@@ -691,7 +761,13 @@ class AzureOCRStrategy(OCRStrategy):
             page_dict = self._extract_page_properties(page, needs_ocr, page_number)
 
             if needs_ocr:
-                self._process_azure_page(page, page_dict, result, page_number)
+                self._process_azure_page(
+                    page,
+                    page_dict,
+                    result,
+                    page_number,
+                    paragraphs_by_page.get(page_number, []),
+                )
             else:
                 self._process_pymupdf_page(page, page_dict, result, page_number)
 
@@ -751,14 +827,80 @@ class AzureOCRStrategy(OCRStrategy):
             "tables": [],
         }
 
-    def _process_azure_page(self, page, page_dict: Dict[str, Any], result: Dict[str, Any], page_number: int) -> None:
-        """Process Azure DI page"""
+    def _paragraphs_by_page(self) -> Dict[int, List[Tuple[int, Any]]]:
+        """Azure paragraphs with their document index, grouped by the pages of
+        their bounding regions"""
+        paragraphs_by_page = defaultdict(list)
+        paragraphs = getattr(self.doc, "paragraphs", None) or []
+        first_page = self.doc.pages[0].page_number if self.doc.pages else 1
+        for idx, paragraph in enumerate(paragraphs):
+            regions = getattr(paragraph, "bounding_regions", None) or []
+            page_numbers = {region.page_number for region in regions} or {first_page}
+            for page_number in sorted(page_numbers):
+                paragraphs_by_page[page_number].append((idx, paragraph))
+        return paragraphs_by_page
+
+    def _assign_lines_to_paragraphs(
+        self,
+        page_paragraphs: List[Tuple[int, Any]],
+        line_index: PageLineIndex,
+        page_width: float,
+        page_height: float,
+    ) -> List[Tuple[int, Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Pair each paragraph of a page with its lines
+
+        Lines are taken from the paragraph's spans when Azure returned spans
+        for both; otherwise only lines vertically near the paragraph are
+        checked for word and bounding box overlap.
+
+        Returns:
+            (paragraph index, processed paragraph, lines sorted top to bottom)
+            for every paragraph with content
+        """
+        assigned = []
+        for idx, paragraph in page_paragraphs:
+            processed_paragraph = self._process_block_text_azure(
+                paragraph, page_width, page_height
+            )
+            if not processed_paragraph:
+                continue
+
+            spans = getattr(paragraph, "spans", None)
+            if spans and line_index.has_spans:
+                paragraph_lines = line_index.lines_in_spans(
+                    [(span.offset, span.length) for span in spans]
+                )
+                paragraph_lines.sort(key=lambda line: _y_extent(line["bounding_box"]))
+            else:
+                paragraph_lines = self._get_lines_for_paragraph(
+                    line_index.lines_near(processed_paragraph["bounding_box"]),
+                    processed_paragraph["content"],
+                    processed_paragraph["bounding_box"],
+                )
+            assigned.append((idx, processed_paragraph, paragraph_lines))
+        return assigned
+
+    def _process_azure_page(
+        self,
+        page,
+        page_dict: Dict[str, Any],
+        result: Dict[str, Any],
+        page_number: int,
+        page_paragraphs: List[Tuple[int, Any]],
+    ) -> None:
+        """Process Azure DI page
+
+        Args:
+            page_paragraphs: (index, paragraph) of the paragraphs on this page,
+                from _paragraphs_by_page
+        """
         self.logger.debug(f"🤖 Processing Azure page {page_number}")
 
         # Process lines
         page_lines = []
+        line_offsets = []
         if hasattr(page, "lines"):
-            self.logger.debug(f"📝 Processing {len(page.lines)} lines from Azure")
             for line_idx, line in enumerate(page.lines):
                 line_data = self._process_line(line, page_dict["width"], page_dict["height"])
                 if line_data:
@@ -767,48 +909,36 @@ class AzureOCRStrategy(OCRStrategy):
                     page_lines.append(line_data)
                     page_dict["lines"].append(line_data)
                     result["lines"].append(line_data)
-
-                    self.logger.debug(f"   Line {line_idx}: '{line_data['content'][:50]}...'")
+                    spans = getattr(line, "spans", None)
+                    line_offsets.append(spans[0].offset if spans else None)
 
         # Process paragraphs
-        if hasattr(self.doc, "paragraphs"):
-            self.logger.debug(f"📚 Processing {len(self.doc.paragraphs)} paragraphs from Azure")
-            for idx, paragraph in enumerate(self.doc.paragraphs):
-                processed_paragraph = self._process_block_text_azure(
-                    paragraph, page_dict["width"], page_dict["height"]
-                )
-                if processed_paragraph:
-                    processed_paragraph["page_number"] = page_number
-                    processed_paragraph["paragraph_number"] = idx
-
-                    self.logger.debug(f"   Paragraph {idx}: '{processed_paragraph['content'][:50]}...'")
-
-                    # Find lines for this paragraph
-                    paragraph_lines = self._get_lines_for_paragraph(
-                        page_lines,
-                        processed_paragraph["content"],
-                        processed_paragraph["bounding_box"],
-                    )
-
-                    self.logger.debug(f"     Found {len(paragraph_lines)} lines for paragraph {idx}")
-
-                    # Process sentences
-                    paragraph_sentences = self._merge_lines_to_sentences(paragraph_lines)
-                    self.logger.debug(f"     Created {len(paragraph_sentences)} sentences from paragraph {idx}")
-
-                    # Add sentences to result
-                    for sent_idx, sentence in enumerate(paragraph_sentences):
-                        sentence_data = {
-                            "content": sentence["sentence"],
-                            "bounding_box": sentence["bounding_box"],
-                            "paragraph_numbers": [idx],
-                            "page_number": page_number,
-                            "sentence_index": sent_idx,
-                        }
-                        result["sentences"].append(sentence_data)
+        line_index = PageLineIndex(page_lines, line_offsets)
+        self.logger.debug(
+            f"📚 Processing {len(page_paragraphs)} paragraphs and {len(page_lines)} lines"
+        )
+        for idx, processed_paragraph, paragraph_lines in self._assign_lines_to_paragraphs(
+            page_paragraphs, line_index, page_dict["width"], page_dict["height"]
+        ):
+            processed_paragraph["page_number"] = page_number
+            processed_paragraph["paragraph_number"] = idx
+
+            # Process sentences
+            paragraph_sentences = self._merge_lines_to_sentences(paragraph_lines)
+
+            # Add sentences to result
+            for sent_idx, sentence in enumerate(paragraph_sentences):
+                sentence_data = {
+                    "content": sentence["sentence"],
+                    "bounding_box": sentence["bounding_box"],
+                    "paragraph_numbers": [idx],
+                    "page_number": page_number,
+                    "sentence_index": sent_idx,
+                }
+                result["sentences"].append(sentence_data)
 
-                    processed_paragraph["sentences"] = paragraph_sentences
-                    result["paragraphs"].append(processed_paragraph)
+            processed_paragraph["sentences"] = paragraph_sentences
+            result["paragraphs"].append(processed_paragraph)
 
         # Process tables
         if hasattr(page, "tables"):
@@ -903,8 +1033,6 @@ class AzureOCRStrategy(OCRStrategy):
 
     def _merge_lines_to_sentences(self, lines_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Merge lines into sentences using spaCy"""
-        self.logger.debug(f"🔤 Starting sentence processing for {len(lines_data)} lines")
-
         if not self.nlp:
             self.logger.error("❌ spaCy model not available for sentence processing")
             return []
@@ -914,16 +1042,12 @@ class AzureOCRStrategy(OCRStrategy):
         line_map = []
         char_index = 0
 
-        self.logger.debug("📝 Building text and line mapping:")
-        for line_idx, line_data in enumerate(lines_data):
+        for line_data in lines_data:
             content = line_data["content"].strip()
 
             if not content:
-                self.logger.debug(f"   Skipping empty line {line_idx}")
                 continue
 
-            self.logger.debug(f"   Line {line_idx}: '{content}' (chars {char_index}-{char_index + len(content)})")
-
             full_text += content + " "
             line_map.append((char_index, char_index + len(content), line_data["bounding_box"]))
             char_index += len(content) + 1
@@ -932,8 +1056,6 @@ class AzureOCRStrategy(OCRStrategy):
         doc = self.nlp(full_text)
         sentences = []
 
-        self.logger.debug(f"🔤 spaCy identified {len(list(doc.sents))} sentences")
-
         # Process each sentence
         for sent_idx, sent in enumerate(doc.sents):
             sent_text = sent.text.strip()
@@ -947,7 +1069,6 @@ class AzureOCRStrategy(OCRStrategy):
                 if start_idx < sent_end and end_idx > sent_start:
                     sentence_bboxes.append(bbox)
                     overlapping_lines.append(line_idx)
-                    self.logger.debug(f"     Including line {line_idx} bbox")
 
             merged_bbox = self._merge_bounding_boxes(sentence_bboxes) if sentence_bboxes else None
 
@@ -958,7 +1079,6 @@ class AzureOCRStrategy(OCRStrategy):
                 "char_span": (sent_start, sent_end)
             })
 
-        self.logger.info(f"✅ Sentence processing completed: {len(sentences)} sentences created from {len(lines_data)} lines")
         return sentences
 
     def _process_table(self, table, page) -> Dict[str, Any]:
@@ -1001,8 +1121,6 @@ class AzureOCRStrategy(OCRStrategy):
         Returns:
             Single bounding box containing 4 points that encompass all input boxes
         """
-        self.logger.debug(f"🚀 Merging bounding boxes: {bboxes}")
-
         # Flatten all points from all boxes
         all_points = [point for box in bboxes for point in box]
 
@@ -1179,7 +1297,6 @@ class AzureOCRStrategy(OCRStrategy):
 
             if word_overlap > WORD_OVERLAP_THRESHOLD and spatial_overlap:
                 paragraph_lines.append(line)
-                self.logger.debug(f"Added line to paragraph: {line_content}")
 
         # Sort lines by vertical position
         paragraph_lines.sort(
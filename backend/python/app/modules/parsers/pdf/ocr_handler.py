@@ -4,6 +4,21 @@ from typing import Any, Dict
 import fitz
 
 from app.config.utils.named_constants.ai_models_named_constants import OCRProvider
+from app.utils.downloaded_file import (
+    DownloadedFile,
+    FileContent,
+    content_head,
+    content_tail,
+)
+
+
+def open_pdf(content: FileContent) -> fitz.Document:
+    """Open a PDF from bytes, or from disk when a download was spooled there"""
+    if isinstance(content, DownloadedFile):
+        if content.in_memory:
+            return fitz.open(stream=content.read_bytes(), filetype="pdf")
+        return fitz.open(content.path, filetype="pdf")
+    return fitz.open(stream=content, filetype="pdf")
 
 
 class OCRStrategy(ABC):
@@ -18,7 +33,7 @@ class OCRStrategy(ABC):
         pass
 
     @abstractmethod
-    async def load_document(self, content: bytes) -> None:
+    async def load_document(self, content: FileContent) -> None:
         """Load document content"""
         pass
 
@@ -155,29 +170,32 @@ class OCRHandler:
             self.logger.error(f"❌ Unsupported OCR strategy: {strategy_type}")
             raise ValueError(f"Unsupported OCR strategy: {strategy_type}")
 
-    def _is_pdf_corrupted(self, content: bytes) -> bool:
+    def _is_pdf_corrupted(self, content: FileContent) -> bool:
         """
         Intelligent PDF corruption detection that checks file structure integrity
         
         Args:
-            content: PDF document content as bytes
+            content: PDF document content as bytes or a DownloadedFile
             
         Returns:
             bool: True if PDF appears corrupted, False otherwise
         """
         try:
+            # Only the head and tail are read, so spooled downloads stay on disk
+            head = content_head(content, 100000)
+
             # Check PDF header
-            if not content.startswith(b'%PDF-'):
+            if not head.startswith(b'%PDF-'):
                 self.logger.debug("❌ Invalid PDF header")
                 return True
             
             # Check for PDF trailer
-            if b'%%EOF' not in content[-1024:]:
+            if b'%%EOF' not in content_tail(content, 1024):
                 self.logger.debug("❌ Missing PDF trailer")
                 return True
             
             # Convert first 100KB to string for pattern matching (safely)
-            content_sample = content[:100000].decode('latin-1', errors='ignore')
+            content_sample = head.decode('latin-1', errors='ignore')
             
             # Check for essential PDF structure elements
             required_elements = ['obj', 'endobj', 'stream', 'endstream']
@@ -224,9 +242,8 @@ class OCRHandler:
             # Additional check: try to validate basic PDF structure with PyMuPDF
             # This will catch MuPDF syntax errors
             try:
-                import fitz
                 # Try to open the entire document to catch syntax errors
-                test_doc = fitz.open(stream=content, filetype="pdf")
+                test_doc = open_pdf(content)
                 # Try to access first page to trigger parsing
                 if len(test_doc) > 0:
                     _ = test_doc[0].get_text()
@@ -247,12 +264,12 @@ class OCRHandler:
             self.logger.error(f"❌ Error checking PDF corruption: {str(e)}")
             return False  # Default to not corrupted if we can't check properly
 
-    async def _fallback_simple_extraction(self, content: bytes) -> Dict[str, Any]:
+    async def _fallback_simple_extraction(self, content: FileContent) -> Dict[str, Any]:
         """
         Fallback method using simple PyMuPDF text extraction without OCR
         
         Args:
-            content: PDF document content as bytes
+            content: PDF document content as bytes or a DownloadedFile
             
         Returns:
             Dict containing basic extracted text and minimal layout information
@@ -260,8 +277,7 @@ class OCRHandler:
         self.logger.info("🔄 Using fallback simple extraction method")
         
         try:
-            import fitz
-            doc = fitz.open(stream=content, filetype="pdf")
+            doc = open_pdf(content)
             
             result = {
                 "pages": [],
@@ -360,12 +376,12 @@ class OCRHandler:
             self.logger.error(f"❌ Fallback extraction failed: {str(e)}")
             raise
 
-    async def process_document(self, content: bytes) -> Dict[str, Any]:
+    async def process_document(self, content: FileContent) -> Dict[str, Any]:
         """
         Process document using the configured OCR strategy with fallback
         
         Args:
-            content: PDF document content as bytes
+            content: PDF document content as bytes or a DownloadedFile
 
         Returns:
             Dict containing extracted text and layout information
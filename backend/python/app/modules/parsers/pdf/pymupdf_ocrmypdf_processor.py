@@ -1,16 +1,55 @@
+import multiprocessing
 import os
+import re
+import resource
+import shutil
 import tempfile
-from typing import Any, Dict, List, Tuple
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.connection import wait
+from typing import Any, Dict, List, Optional, Tuple
 
 import fitz
 import ocrmypdf
-import spacy
 from spacy.language import Language
 from spacy.tokens import Doc
 
-from app.modules.parsers.pdf.ocr_handler import OCRStrategy
+from app.core.parser_model_registry import get_parser_model_registry
+from app.core.parsing_pool import PARSING_POOL_WORKERS
+from app.modules.parsers.pdf.ocr_handler import OCRStrategy, open_pdf
+from app.utils.downloaded_file import FileContent, content_head, content_path
+from app.utils.logger import create_logger
 
 LENGTH_THRESHOLD = 2
+# Page-parallel extraction of large documents; 1 disables it. Every parsing
+# pool worker has its own page pool, so the default shares the CPUs left
+# over by the parsing pool instead of oversubscribing them
+PDF_PAGE_WORKERS = int(
+    os.getenv(
+        "PDF_PAGE_WORKERS",
+        str(min(max(1, (os.cpu_count() or 1) // max(1, PARSING_POOL_WORKERS)), 4)),
+    )
+)
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "50"))
+PDF_PAGES_PER_TASK = int(os.getenv("PDF_PAGES_PER_TASK", "25"))
+# Page-level OCR: pages that need it are rendered and run through Tesseract
+PDF_PARALLEL_MIN_OCR_PAGES = int(os.getenv("PDF_PARALLEL_MIN_OCR_PAGES", "2"))
+PDF_OCR_PAGE_COST = int(os.getenv("PDF_OCR_PAGE_COST", "10"))
+PDF_OCR_DPI = int(os.getenv("PDF_OCR_DPI", "300"))
+PDF_OCR_TESSDATA = os.getenv("PDF_OCR_TESSDATA") or None
+# Pages whose Tesseract text is shorter than this, or has a smaller share of
+# readable words (sideways or skewed scans), are OCR'd again by OCRmyPDF
+# with rotation, deskew and cleaning; a ratio of 0 disables the fallback
+PDF_OCR_MIN_CHARS = int(os.getenv("PDF_OCR_MIN_CHARS", "20"))
+PDF_OCR_MIN_READABLE_RATIO = float(os.getenv("PDF_OCR_MIN_READABLE_RATIO", "0.4"))
+# Also produce a searchable PDF with OCRmyPDF (not needed for indexing)
+PDF_SEARCHABLE_OUTPUT = os.getenv("PDF_SEARCHABLE_OUTPUT", "false").lower() == "true"
+NLP_PIPE_BATCH_SIZE = int(os.getenv("NLP_PIPE_BATCH_SIZE", "64"))
+
+# A word of three or more letters with a vowel, or a token with a digit
+# (part numbers, torque values, ATA references)
+_READABLE_TOKEN_RE = re.compile(r"(?=.*[aeiouyAEIOUY])[A-Za-z][A-Za-z-]{2,}|.*\d.*")
+_TOKEN_PUNCTUATION = ".,;:!?()[]{}\"'"
 
 class PyMuPDFOCRStrategy(OCRStrategy):
     def __init__(self, logger, language: str = "eng") -> None:
@@ -19,16 +58,20 @@ class PyMuPDFOCRStrategy(OCRStrategy):
         self.doc = None
         self._processed_pages = {}
         self._needs_ocr = False
+        # 0-based indexes of the pages extracted through OCR
+        self._ocr_pages = set()
         self.document_analysis_result = None
-        try:
-            nlp_model = spacy.load("en_core_web_sm")
-        except Exception as e:
-            self.logger.warning(f"spaCy model 'en_core_web_sm' not available, falling back to blank 'en': {e}")
-            nlp_model = spacy.blank("en")
-        self.nlp = self._create_custom_tokenizer(nlp_model)
+        self.nlp = self.load_nlp()
         self.ocr_pdf_content = None
 
-    async def load_document(self, content: bytes) -> None:
+    @classmethod
+    def load_nlp(cls) -> Language:
+        """spaCy pipeline with the custom tokenizer, shared by every instance"""
+        return get_parser_model_registry().spacy_pipeline(
+            "pymupdf_sentences", cls._create_custom_tokenizer
+        )
+
+    async def load_document(self, content: FileContent) -> None:
         """Load and analyze document"""
         self.logger.info("🔄 Starting document load...")
 
@@ -45,122 +88,89 @@ class PyMuPDFOCRStrategy(OCRStrategy):
 
         # Load with PyMuPDF first
         self.logger.debug("📄 Initial PyMuPDF load")
-        temp_doc = fitz.open(stream=content, filetype="pdf")
+        self.doc = open_pdf(content)
 
-        # Check which pages need OCR
+        # Check which pages need OCR. Only those pages are rasterized and
+        # recognized, page by page, while the others keep their text layer.
         self.logger.debug("🔍 Checking which pages need OCR")
-        pages_needing_ocr = [i + 1 for i, page in enumerate(temp_doc) if self.needs_ocr(page)]
-        total_pages = len(temp_doc)
-        # Cap OCR effort to avoid runaway processing on very large PDFs
-        max_ocr_pages = min(max(1, int(total_pages * 0.2)), 50)
-        if len(pages_needing_ocr) > max_ocr_pages:
-            self.logger.info(
-                f"🔧 Capping OCR pages from {len(pages_needing_ocr)} to {max_ocr_pages} "
-                f"(20% of {total_pages} pages, max 50)"
-            )
-            pages_needing_ocr = pages_needing_ocr[:max_ocr_pages]
-        needs_ocr = len(pages_needing_ocr) > 0
-        self._needs_ocr = needs_ocr
-        self.logger.debug(f"📊 OCR pages: {pages_needing_ocr} (total {len(pages_needing_ocr)})")
-        self.logger.debug(f"📊 OCR need determination: {needs_ocr}")
-
-        if needs_ocr:
-            self.logger.info("🤖 Document needs OCR, processing with OCRmyPDF")
-            try:
-                self.logger.debug("📝 Creating temporary files for OCR processing")
-                with tempfile.NamedTemporaryFile(
-                    suffix=".pdf", delete=False
-                ) as temp_in, tempfile.NamedTemporaryFile(
-                    suffix=".pdf", delete=False
-                ) as temp_out:
-
-                    self.logger.debug("📤 Writing content to temporary input file")
-                    temp_in.write(content)
-                    temp_in.flush()
-
-                    self.logger.debug("🔄 Running OCRmyPDF")
-                    # Use force_ocr instead of skip_text to avoid Ghostscript issues
-                    # This will OCR all pages regardless of existing text
-                    ocrmypdf.ocr(
-                        temp_in.name,
-                        temp_out.name,
-                        language=self.language,
-                        output_type="pdf",
-                        force_ocr=True,  # Force OCR to avoid Ghostscript 10.0.0 issues
-                        optimize=1,
-                        progress_bar=False,
-                        deskew=True,
-                        clean=True,
-                        quiet=True,
-                        rotate_pages=True,
-                        rotate_pages_threshold=15.0,
-                        tesseract_timeout=60,
-                        jobs=min(os.cpu_count() or 2, 4),
-                        pages=",".join(map(str, pages_needing_ocr)),
-                    )
+        self._ocr_pages = {
+            page_idx for page_idx, page in enumerate(self.doc) if self.needs_ocr(page)
+        }
+        self._needs_ocr = bool(self._ocr_pages)
+        self.logger.info(
+            f"📊 {len(self._ocr_pages)} of {len(self.doc)} pages need OCR"
+        )
 
-                    self.logger.debug("📥 Loading OCR-processed PDF")
-                    with open(temp_out.name, "rb") as f:
-                        ocr_content = f.read()
-                        processed_doc = fitz.open("pdf", ocr_content)
-                        # Store the OCR-processed PDF content
-                        self.ocr_pdf_content = ocr_content
+        if PDF_SEARCHABLE_OUTPUT and self._needs_ocr:
+            self.ocr_pdf_content = self.create_searchable_pdf(content)
 
-                        # # Create output directory if it doesn't exist
-                        # output_dir = "output/searchable/pymupdf"
-                        # os.makedirs(output_dir, exist_ok=True)
-                        # self.logger.debug(f"📁 Using output directory: {output_dir}")
+        self.logger.debug("🔄 Pre-processing document to match Azure's structure")
+        self.document_analysis_result = self._preprocess_document(content)
+        self.logger.info(f"✅ Document loaded with {len(self.doc)} pages")
 
-                        # # Generate unique filename using timestamp
-                        # timestamp = time.strftime("%Y%m%d_%H%M%S")
-                        # output_filename = f"ocr_processed_{timestamp}.pdf"
-                        # output_path = os.path.join(output_dir, output_filename)
+    def create_searchable_pdf(self, content: FileContent) -> Optional[bytes]:
+        """
+        Searchable copy of the PDF with an OCRmyPDF text layer on the OCR pages
 
-                        # # Save the PDF to file
-                        # self.logger.info(
-                        #     f"💾 Saving OCR-processed PDF to: {output_path}")
-                        # with open(output_path, "wb") as ocr_file:
-                        #     ocr_file.write(ocr_content)
+        Text extraction does not depend on it; it is only produced when
+        PDF_SEARCHABLE_OUTPUT is enabled.
 
-                self.logger.info("✅ OCR processing completed successfully")
-                self.doc = processed_doc
+        Returns:
+            Optional[bytes]: The OCR'd PDF, or None if OCRmyPDF failed
+        """
+        pages_needing_ocr = sorted(page_idx + 1 for page_idx in self._ocr_pages)
+        temp_out_path = None
+        try:
+            with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as temp_out:
+                temp_out_path = temp_out.name
+
+            # Spooled downloads are passed to OCRmyPDF in place; raw bytes
+            # are written to a temporary input file
+            with content_path(content, ".pdf") as input_path:
+                self.logger.debug("🔄 Running OCRmyPDF")
+                # Use force_ocr instead of skip_text to avoid Ghostscript issues
+                ocrmypdf.ocr(
+                    input_path,
+                    temp_out_path,
+                    language=self.language,
+                    output_type="pdf",
+                    force_ocr=True,  # Force OCR to avoid Ghostscript 10.0.0 issues
+                    optimize=1,
+                    progress_bar=False,
+                    deskew=True,
+                    clean=True,
+                    quiet=True,
+                    rotate_pages=True,
+                    rotate_pages_threshold=15.0,
+                    tesseract_timeout=60,
+                    jobs=min(os.cpu_count() or 2, 4),
+                    pages=",".join(map(str, pages_needing_ocr)),
+                )
 
-            except Exception as e:
-                self.logger.error(f"❌ OCR processing failed: {str(e)}")
-                self.logger.info("⚠️ Falling back to direct PyMuPDF extraction")
-                self.doc = temp_doc
-                self._needs_ocr = False
-                self.ocr_pdf_content = None
-
-            finally:
-                self.logger.debug("🧹 Cleaning up temporary files")
-                for path in [temp_in.name, temp_out.name]:
-                    if os.path.exists(path):
-                        try:
-                            os.remove(path)
-                        except Exception as e:
-                            self.logger.error(
-                                "❌ Error cleaning up temp file, %s: %s", path, str(e)
-                            )
-        else:
-            self.logger.info(
-                "📝 Document doesn't need OCR, using direct PyMuPDF extraction"
-            )
-            self.doc = temp_doc
-            self.ocr_pdf_content = None
+            with open(temp_out_path, "rb") as f:
+                ocr_content = f.read()
+            self.logger.info("✅ Searchable PDF created")
+            return ocr_content
 
-        if self.doc:
-            self.logger.debug("🔄 Pre-processing document to match Azure's structure")
-            self.document_analysis_result = self._preprocess_document()
-            self.logger.info(f"✅ Document loaded with {len(self.doc)} pages")
-        else:
-            self.logger.warning("⚠️ No document loaded - using minimal structure")
+        except Exception as e:
+            self.logger.error(f"❌ Searchable PDF creation failed: {str(e)}")
+            return None
+
+        finally:
+            if temp_out_path and os.path.exists(temp_out_path):
+                try:
+                    os.remove(temp_out_path)
+                except Exception as e:
+                    self.logger.error(
+                        "❌ Error cleaning up temp file, %s: %s", temp_out_path, str(e)
+                    )
 
-    def _is_severely_corrupted(self, content: bytes) -> bool:
+    def _is_severely_corrupted(self, content: FileContent) -> bool:
         """Quick check for severe PDF corruption that would cause hangs"""
         try:
+            head = content_head(content, 1024 * 1024)
             # Basic PDF structure check
-            if not content.startswith(b'%PDF-'):
+            if not head.startswith(b'%PDF-'):
                 return True
             
             # Try a quick parse with PyMuPDF with timeout
@@ -179,7 +189,7 @@ class PyMuPDFOCRStrategy(OCRStrategy):
                     signal.signal(signal.SIGALRM, timeout_handler)
                     signal.alarm(2)
                 
-                test_doc = fitz.open(stream=content[:min(len(content), 1024*1024)], filetype="pdf")
+                test_doc = fitz.open(stream=head, filetype="pdf")
                 # Try to access first page
                 if len(test_doc) > 0:
                     _ = test_doc[0].get_text()[:100]  # Just get first 100 chars
@@ -246,7 +256,7 @@ class PyMuPDFOCRStrategy(OCRStrategy):
             "key_value_pairs": [],
         }
 
-    @Language.component("custom_sentence_boundary")
+    @Language.component("pymupdf_sentence_boundary")
     def custom_sentence_boundary(doc) -> Doc:
         for token in doc[:-1]:  # Avoid out-of-bounds errors
             next_token = doc[token.i + 1]
@@ -327,7 +337,8 @@ class PyMuPDFOCRStrategy(OCRStrategy):
 
         return doc
 
-    def _create_custom_tokenizer(self, nlp) -> Language:
+    @staticmethod
+    def _create_custom_tokenizer(nlp) -> Language:
         """
         Creates a custom tokenizer that handles special cases for sentence boundaries.
         """
@@ -336,7 +347,7 @@ class PyMuPDFOCRStrategy(OCRStrategy):
             nlp.add_pipe("sentencizer", before="parser")
 
         # Add custom sentence boundary detection
-        nlp.add_pipe("custom_sentence_boundary", after="sentencizer")
+        nlp.add_pipe("pymupdf_sentence_boundary", after="sentencizer")
 
         # Configure the tokenizer to handle special cases
         special_cases = {
@@ -368,17 +379,15 @@ class PyMuPDFOCRStrategy(OCRStrategy):
             {"x": min_x, "y": max_y},  # bottom-left
         ]
 
-    def _merge_lines_to_sentences(
-        self, lines_data: List[Dict[str, Any]]
-    ) -> List[Dict[str, Any]]:
-        """Merge lines into sentences using spaCy"""
-        self.logger.debug("🚀 Merging lines to sentences")
-
+    @staticmethod
+    def _sentence_source(
+        lines_data: List[Dict[str, Any]]
+    ) -> Tuple[str, List[Tuple[int, int, Any]]]:
+        """Text handed to spaCy for a block, and the character span of each line"""
         full_text = ""
         line_map = []
         char_index = 0
 
-        # Log each line being processed
         for line_data in lines_data:
             content = line_data["content"].strip()
             if not content:
@@ -390,7 +399,20 @@ class PyMuPDFOCRStrategy(OCRStrategy):
             )
             char_index += len(content) + 1
 
-        doc = self.nlp(full_text)
+        return full_text, line_map
+
+    def _merge_lines_to_sentences(
+        self, lines_data: List[Dict[str, Any]], doc: Optional[Doc] = None
+    ) -> List[Dict[str, Any]]:
+        """Merge lines into sentences using spaCy
+
+        Args:
+            lines_data: Lines of the block
+            doc: The block's text already run through spaCy, e.g. by nlp.pipe
+        """
+        full_text, line_map = self._sentence_source(lines_data)
+        if doc is None:
+            doc = self.nlp(full_text)
         sentences = []
 
         # Log each sentence being formed
@@ -409,13 +431,26 @@ class PyMuPDFOCRStrategy(OCRStrategy):
 
             sentences.append({"sentence": sent_text, "bounding_box": merged_bbox})
 
-        self.logger.debug(f"✅ Merged into {len(sentences)} sentences")
         return sentences
 
     def _process_block_text(
-        self, block: Dict[str, Any], page_width: float, page_height: float, block_number: int
+        self,
+        block: Dict[str, Any],
+        page_width: float,
+        page_height: float,
+        block_number: int,
+        doc: Optional[Doc] = None,
+    ) -> Dict[str, Any]:
+        """Process a text block to extract lines, sentences, and metadata"""
+        layout = self._extract_block_layout(block, page_width, page_height)
+        return self._build_block_result(
+            block, layout, page_width, page_height, block_number, doc
+        )
+
+    def _extract_block_layout(
+        self, block: Dict[str, Any], page_width: float, page_height: float
     ) -> Dict[str, Any]:
-        """Process a text block to extract lines, sentences, and metadata
+        """Extract the lines, spans, words and metadata of a text block
 
         Handles both single-span and multi-span lines:
         - Single-span: One span containing complete line text
@@ -427,11 +462,10 @@ class PyMuPDFOCRStrategy(OCRStrategy):
             page_height: Height of the page for bbox normalization
 
         Returns:
-            Dictionary containing processed text data including lines, spans, words and metadata
+            Dictionary containing the block's lines, spans, words and metadata
         """
 
         block_lines = []
-        block_text = ""
         block_spans = []
         block_words = []
 
@@ -516,8 +550,27 @@ class PyMuPDFOCRStrategy(OCRStrategy):
             ),
         }
 
+        return {
+            "lines": block_lines,
+            "spans": block_spans,
+            "words": block_words,
+            "metadata": block_metadata,
+        }
+
+    def _build_block_result(
+        self,
+        block: Dict[str, Any],
+        layout: Dict[str, Any],
+        page_width: float,
+        page_height: float,
+        block_number: int,
+        doc: Optional[Doc] = None,
+    ) -> Dict[str, Any]:
+        """Split the block's lines into sentences and build its paragraph"""
+        block_metadata = layout["metadata"]
+
         # Process sentences using the lines
-        sentences = self._merge_lines_to_sentences(block_lines)
+        sentences = self._merge_lines_to_sentences(layout["lines"], doc)
         processed_sentences = []
         block_text = "\n ".join(sentence["sentence"] for sentence in sentences)
         for sentence in sentences:
@@ -538,18 +591,139 @@ class PyMuPDFOCRStrategy(OCRStrategy):
                 block["bbox"], page_width, page_height
             ),
             "block_number": block_number,
-            "spans": block_spans,
-            "words": block_words,
+            "spans": layout["spans"],
+            "words": layout["words"],
             "metadata": block_metadata,
         }
 
         return {
-            "lines": block_lines,
+            "lines": layout["lines"],
             "sentences": processed_sentences,
             "paragraph": paragraph if block_text else None,
-            "words": block_words,
+            "words": layout["words"],
         }
 
+    def _page_text_dict(self, page, page_number: int) -> Dict[str, Any]:
+        """Text of a page recognized by Tesseract, in page.get_text("dict") form
+
+        PyMuPDF renders the page at PDF_OCR_DPI, honouring its /Rotate, and
+        runs Tesseract on it; the resulting text page has the same blocks,
+        lines and spans structure as a native one, so the rest of the
+        extraction is unchanged.
+
+        Tesseract is not told to correct the orientation or skew of the scan
+        itself, which OCRmyPDF did with rotate_pages, deskew and clean. A
+        page whose text comes out near-empty or unreadable is therefore OCR'd
+        again through OCRmyPDF with those options, which costs a few seconds
+        for that page only.
+        """
+        try:
+            textpage = page.get_textpage_ocr(
+                language=self.language,
+                dpi=PDF_OCR_DPI,
+                full=True,
+                tessdata=PDF_OCR_TESSDATA,
+            )
+            text_dict = page.get_text("dict", textpage=textpage)
+        except Exception as e:
+            self.logger.warning(
+                f"⚠️ OCR failed on page {page_number}, using its text layer: {str(e)}"
+            )
+            return page.get_text("dict")
+
+        if PDF_OCR_MIN_READABLE_RATIO <= 0 or self._is_readable(text_dict):
+            return text_dict
+        self.logger.info(
+            f"🔄 OCR text of page {page_number} is unreadable, retrying with "
+            "rotation and deskew"
+        )
+        return self._ocrmypdf_page_text_dict(page, page_number) or text_dict
+
+    @staticmethod
+    def _is_readable(text_dict: Dict[str, Any]) -> bool:
+        """Whether OCR text is long enough and mostly made of readable words"""
+        text = " ".join(
+            span.get("text", "")
+            for block in text_dict.get("blocks", [])
+            for line in block.get("lines", [])
+            for span in line.get("spans", [])
+        )
+        tokens = [token.strip(_TOKEN_PUNCTUATION) for token in text.split()]
+        tokens = [token for token in tokens if token]
+        if sum(len(token) for token in tokens) < PDF_OCR_MIN_CHARS:
+            return False
+        readable = sum(1 for token in tokens if _READABLE_TOKEN_RE.fullmatch(token))
+        return readable / len(tokens) >= PDF_OCR_MIN_READABLE_RATIO
+
+    def _ocrmypdf_page_text_dict(
+        self, page, page_number: int
+    ) -> Optional[Dict[str, Any]]:
+        """OCR a single page with OCRmyPDF, correcting its orientation and
+        skew; coordinates are scaled back to the original page size"""
+        temp_dir = tempfile.mkdtemp(prefix="pdf_page_ocr_")
+        input_path = os.path.join(temp_dir, "page.pdf")
+        output_path = os.path.join(temp_dir, "page_ocr.pdf")
+        try:
+            with fitz.open() as single_page:
+                single_page.insert_pdf(
+                    page.parent, from_page=page.number, to_page=page.number
+                )
+                single_page.save(input_path)
+
+            ocrmypdf.ocr(
+                input_path,
+                output_path,
+                language=self.language,
+                output_type="pdf",
+                force_ocr=True,
+                optimize=0,
+                progress_bar=False,
+                deskew=True,
+                clean=True,
+                quiet=True,
+                rotate_pages=True,
+                rotate_pages_threshold=15.0,
+                tesseract_timeout=60,
+                jobs=1,
+            )
+
+            with fitz.open(output_path) as ocr_doc:
+                ocr_page = ocr_doc[0]
+                text_dict = ocr_page.get_text("dict")
+                scale_x = page.rect.width / ocr_page.rect.width
+                scale_y = page.rect.height / ocr_page.rect.height
+            if (scale_x, scale_y) != (1, 1):
+                self._scale_text_dict(text_dict, scale_x, scale_y)
+            return text_dict
+        except Exception as e:
+            self.logger.warning(
+                f"⚠️ OCRmyPDF fallback failed on page {page_number}: {str(e)}"
+            )
+            return None
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def _scale_text_dict(
+        text_dict: Dict[str, Any], scale_x: float, scale_y: float
+    ) -> None:
+        """Scale the bounding boxes of a rotated page's text to the original
+        page, so normalized coordinates stay within the page"""
+
+        def scale(bbox):
+            x0, y0, x1, y1 = bbox
+            return (x0 * scale_x, y0 * scale_y, x1 * scale_x, y1 * scale_y)
+
+        for block in text_dict.get("blocks", []):
+            block["bbox"] = scale(block["bbox"])
+            for line in block.get("lines", []):
+                line["bbox"] = scale(line["bbox"])
+                for span in line.get("spans", []):
+                    span["bbox"] = scale(span["bbox"])
+                    if "origin" in span:
+                        x, y = span["origin"]
+                        span["origin"] = (x * scale_x, y * scale_y)
+
     def _should_merge_blocks(
         self, block1: Dict[str, Any], block2: Dict[str, Any], word_threshold: int = 15
     ) -> bool:
@@ -576,8 +750,6 @@ class PyMuPDFOCRStrategy(OCRStrategy):
         )
         word_count = len(text1.split())
 
-        self.logger.debug(f"Block word count: {word_count}")
-
         # Merge if word count is below threshold
         return word_count < word_threshold
 
@@ -604,8 +776,16 @@ class PyMuPDFOCRStrategy(OCRStrategy):
 
         return merged_block
 
-    def _preprocess_document(self) -> Dict[str, Any]:
-        """Pre-process document to match Azure's structure"""
+    def _preprocess_document(self, content: FileContent) -> Dict[str, Any]:
+        """Pre-process document to match Azure's structure
+
+        Large documents are split into page ranges that run in the page
+        pool; each range is extracted from the PDF on disk and the results
+        are stitched back in page order.
+
+        Args:
+            content: The PDF self.doc was opened from
+        """
         self.logger.debug("🔄 Starting document pre-processing")
         result = {
             "pages": [],
@@ -616,91 +796,180 @@ class PyMuPDFOCRStrategy(OCRStrategy):
             "key_value_pairs": [],
         }
 
-        block_number = 0
-        for page_idx in range(len(self.doc)):
-            self.logger.debug(f"📄 Processing page {page_idx + 1}")
-            page = self.doc[page_idx]
-            page_width = page.rect.width
-            page_height = page.rect.height
+        total_pages = len(self.doc)
+        page_results = None
+        if PDF_PAGE_WORKERS > 1 and (
+            total_pages >= PDF_PARALLEL_MIN_PAGES
+            or len(self._ocr_pages) >= PDF_PARALLEL_MIN_OCR_PAGES
+        ):
+            page_results = self._extract_pages_in_parallel(content, total_pages)
+        if page_results is None:
+            page_results = [
+                self._extract_page(
+                    self.doc[page_idx], page_idx, ocr=page_idx in self._ocr_pages
+                )
+                for page_idx in range(total_pages)
+            ]
 
-            self.logger.debug("📊 Processing page content")
-            page_dict = {
-                "page_number": page_idx + 1,
-                "width": page_width,
-                "height": page_height,
-                "unit": "pt",
-                "lines": [],
-                "words": [],
-                "tables": [],
-            }
+        # Block numbers run across the whole document
+        block_offset = 0
+        for page_result in page_results:
+            for paragraph in page_result["paragraphs"]:
+                paragraph["block_number"] += block_offset
+                result["paragraphs"].append(paragraph)
+            for sentence in page_result["sentences"]:
+                sentence["block_number"] += block_offset
+                result["sentences"].append(sentence)
+            block_offset += page_result["block_count"]
+            result["pages"].append(page_result["page"])
+
+        self.logger.debug("📊 Final document analysis result:")
+        self.logger.debug(f"- Total pages: {len(result['pages'])}")
+        self.logger.debug(f"- Total paragraphs: {len(result['paragraphs'])}")
+        self.logger.debug(f"- Total sentences: {len(result['sentences'])}")
+
+        return result
 
-            self.logger.debug("📝 Extracting text blocks and paragraphs")
-            text_dict = page.get_text("dict")
-            blocks = text_dict.get("blocks", [])
+    def _extract_pages_in_parallel(
+        self, content: FileContent, total_pages: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Extract page ranges in the page pool; None if the pool is unavailable"""
+        page_ranges = self._page_ranges(total_pages)
+        ocr_pages = sorted(self._ocr_pages)
+        self.logger.info(
+            f"⚡ Extracting {total_pages} pages ({len(ocr_pages)} with OCR) in "
+            f"{len(page_ranges)} ranges with {PDF_PAGE_WORKERS} page workers"
+        )
+        try:
+            with content_path(content, ".pdf") as pdf_path:
+                executor = _page_pool.get_executor()
+                range_results = executor.map(
+                    _extract_page_range,
+                    [pdf_path] * len(page_ranges),
+                    [start for start, _ in page_ranges],
+                    [end for _, end in page_ranges],
+                    [ocr_pages] * len(page_ranges),
+                )
+                pages = []
+                for page_results, peak_rss_mb in range_results:
+                    _page_pool.peak_rss_mb = max(_page_pool.peak_rss_mb, peak_rss_mb)
+                    pages.extend(page_results)
+                return pages
+        except Exception as e:
+            self.logger.warning(
+                f"⚠️ Parallel page extraction failed, extracting sequentially: {str(e)}"
+            )
+            _page_pool.discard()
+            return None
+
+    def _page_ranges(self, total_pages: int) -> List[Tuple[int, int]]:
+        """Split the pages into tasks of similar cost; an OCR page weighs
+        PDF_OCR_PAGE_COST text pages"""
+        page_ranges = []
+        start, cost = 0, 0
+        for page_idx in range(total_pages):
+            cost += PDF_OCR_PAGE_COST if page_idx in self._ocr_pages else 1
+            if cost >= PDF_PAGES_PER_TASK:
+                page_ranges.append((start, page_idx + 1))
+                start, cost = page_idx + 1, 0
+        if start < total_pages:
+            page_ranges.append((start, total_pages))
+        return page_ranges
+
+    def _extract_page(self, page, page_idx: int, ocr: bool = False) -> Dict[str, Any]:
+        """
+        Extract the lines, words, paragraphs and sentences of a page
 
-            # Process and merge blocks
-            merged_blocks = []
-            i = 0
-            while i < len(blocks):
-                current_block = blocks[i]
-                next_index = i + 1
+        Block numbers start at 0 on every page; _preprocess_document offsets
+        them by the blocks of the preceding pages.
 
-                # Keep merging blocks until we have enough words or run out of blocks
-                while next_index < len(blocks) and self._should_merge_blocks(
+        Args:
+            page: PyMuPDF page
+            page_idx: 0-based page index
+            ocr: Rasterize the page and take its text from Tesseract instead
+                of its text layer
+
+        Returns:
+            Dict with the page structure, its paragraphs and sentences, and the
+            number of blocks on the page
+        """
+        page_number = page_idx + 1
+        page_width = page.rect.width
+        page_height = page.rect.height
+
+        page_dict = {
+            "page_number": page_number,
+            "width": page_width,
+            "height": page_height,
+            "unit": "pt",
+            "lines": [],
+            "words": [],
+            "tables": [],
+        }
+        paragraphs = []
+        sentences = []
+
+        text_dict = self._page_text_dict(page, page_number) if ocr else page.get_text("dict")
+        blocks = text_dict.get("blocks", [])
+
+        # Process and merge blocks
+        merged_blocks = []
+        i = 0
+        while i < len(blocks):
+            current_block = blocks[i]
+            next_index = i + 1
+
+            # Keep merging blocks until we have enough words or run out of blocks
+            while next_index < len(blocks) and self._should_merge_blocks(
+                current_block, blocks[next_index]
+            ):
+                current_block = self._merge_block_content(
                     current_block, blocks[next_index]
-                ):
-                    self.logger.debug(f"Merging blocks {i} and {next_index}")
-                    current_block = self._merge_block_content(
-                        current_block, blocks[next_index]
-                    )
-                    next_index += 1
+                )
+                next_index += 1
 
-                merged_blocks.append(current_block)
-                i = next_index if next_index > i + 1 else i + 1
+            merged_blocks.append(current_block)
+            i = next_index if next_index > i + 1 else i + 1
 
-            # Process merged blocks
-            for block in merged_blocks:
-                if block.get("type") == 0:  # Text block
-                    processed_block = self._process_block_text(
-                        block, page_width, page_height, block_number
-                    )
+        # Sentence-split all text blocks of the page in one spaCy batch
+        text_blocks = [
+            (block_number, block, self._extract_block_layout(block, page_width, page_height))
+            for block_number, block in enumerate(merged_blocks)
+            if block.get("type") == 0
+        ]
+        docs = self.nlp.pipe(
+            (self._sentence_source(layout["lines"])[0] for _, _, layout in text_blocks),
+            batch_size=NLP_PIPE_BATCH_SIZE,
+        )
 
-                    # Add to page-level collections
-                    page_dict["lines"].extend(processed_block["lines"])
-                    page_dict["words"].extend(processed_block["words"])
-
-                    # Add to document-level collections
-                    if processed_block["paragraph"]:
-                        processed_block["paragraph"]["page_number"] = page_idx + 1
-                        result["paragraphs"].append(processed_block["paragraph"])
-                        self.logger.debug(
-                            "📚 Added paragraph to document collection (Page %s, Block %s)",
-                            page_idx + 1,
-                            processed_block["paragraph"]["block_number"],
-                        )
-
-                    for sentence in processed_block["sentences"]:
-                        sentence["page_number"] = page_idx + 1
-                        result["sentences"].append(sentence)
-                        self.logger.debug(
-                            "📑 Added sentence to document collection (Page %s, Block %s)",
-                            page_idx + 1,
-                            sentence["block_number"],
-                        )
-                block_number += 1
-
-            self.logger.debug(f"✅ Completed processing page {page_idx + 1}")
-            self.logger.debug("📊 Page statistics:")
-            self.logger.debug(f"- Lines: {len(page_dict['lines'])}")
-            self.logger.debug(f"- Words: {len(page_dict['words'])}")
-            result["pages"].append(page_dict)
+        for (block_number, block, layout), doc in zip(text_blocks, docs):
+            processed_block = self._build_block_result(
+                block, layout, page_width, page_height, block_number, doc
+            )
 
-        self.logger.debug("📊 Final document analysis result:")
-        self.logger.debug(f"- Total pages: {len(result['pages'])}")
-        self.logger.debug(f"- Total paragraphs: {len(result['paragraphs'])}")
-        self.logger.debug(f"- Total sentences: {len(result['sentences'])}")
+            # Add to page-level collections
+            page_dict["lines"].extend(processed_block["lines"])
+            page_dict["words"].extend(processed_block["words"])
 
-        return result
+            # Add to document-level collections
+            if processed_block["paragraph"]:
+                processed_block["paragraph"]["page_number"] = page_number
+                paragraphs.append(processed_block["paragraph"])
+
+            for sentence in processed_block["sentences"]:
+                sentence["page_number"] = page_number
+                sentences.append(sentence)
+
+        self.logger.debug(
+            f"✅ Page {page_number}: {len(page_dict['lines'])} lines, "
+            f"{len(page_dict['words'])} words, {len(sentences)} sentences"
+        )
+        return {
+            "page": page_dict,
+            "paragraphs": paragraphs,
+            "sentences": sentences,
+            "block_count": len(merged_blocks),
+        }
 
     async def extract_text(self) -> Dict[str, Any]:
         """Extract text and layout information"""
@@ -887,3 +1156,75 @@ class PyMuPDFOCRStrategy(OCRStrategy):
         debug_doc.save(output_path)
         debug_doc.close()
         self.logger.info(f"✅ Debug PDF saved to {output_path}")
+
+
+class _PagePool:
+    """
+    Page workers of the current process, spawned lazily by the first large
+    document and kept for the lifetime of the process. Each page worker holds
+    its own strategy, whose spaCy pipeline comes from the worker's
+    ParserModelRegistry.
+    """
+
+    def __init__(self) -> None:
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.lock = threading.Lock()
+        # Highest peak RSS reported by a page worker, in MB
+        self.peak_rss_mb = 0.0
+        # Set in page workers only
+        self.strategy: Optional[PyMuPDFOCRStrategy] = None
+
+    def get_executor(self) -> ProcessPoolExecutor:
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(
+                    max_workers=PDF_PAGE_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_page_worker,
+                )
+            return self.executor
+
+    def discard(self) -> None:
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+
+
+_page_pool = _PagePool()
+
+
+def page_workers_peak_rss_mb() -> float:
+    """Peak RSS of this process's page workers, for the parsing pool's
+    recycling, which otherwise only sees the parsing worker itself"""
+    return _page_pool.peak_rss_mb
+
+
+def _init_page_worker() -> None:
+    # One Tesseract thread per worker; the pool provides the parallelism
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    _page_pool.strategy = PyMuPDFOCRStrategy(create_logger("pdf_page_worker"))
+
+    # Exit with the parent, e.g. when the parsing pool terminates a worker
+    # after a timeout; the executor would otherwise leave this process behind
+    parent = multiprocessing.parent_process()
+    if parent is not None:
+        threading.Thread(
+            target=lambda: (wait([parent.sentinel]), os._exit(0)), daemon=True
+        ).start()
+
+
+def _extract_page_range(
+    pdf_path: str, start: int, end: int, ocr_pages: List[int]
+) -> Tuple[List[Dict[str, Any]], float]:
+    """Extract pages [start, end) of the PDF at pdf_path in a page worker;
+    returns the pages and the worker's peak RSS (MB)"""
+    ocr_pages = set(ocr_pages)
+    with fitz.open(pdf_path, filetype="pdf") as doc:
+        pages = [
+            _page_pool.strategy._extract_page(
+                doc[page_idx], page_idx, ocr=page_idx in ocr_pages
+            )
+            for page_idx in range(start, end)
+        ]
+    return pages, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
@@ -2,6 +2,8 @@ import os
 import subprocess
 import tempfile
 
+from app.utils.downloaded_file import FileContent, content_path
+
 
 class PPTParser:
     """Parser for Microsoft PowerPoint .ppt files"""
@@ -9,11 +11,12 @@ class PPTParser:
     def __init__(self):
         pass
 
-    def convert_ppt_to_pptx(self, binary: bytes) -> bytes:
+    def convert_ppt_to_pptx(self, binary: FileContent) -> bytes:
         """Convert .ppt file to .pptx using LibreOffice
 
         Args:
-            binary (bytes): The binary content of the .ppt file
+            binary (FileContent): Content of the .ppt file; spooled downloads are
+                converted in place
 
         Returns:
             bytes: The converted .pptx file content as bytes
@@ -23,20 +26,15 @@ class PPTParser:
             FileNotFoundError: If the converted file is not found
             Exception: For other conversion errors
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
+        with tempfile.TemporaryDirectory() as temp_dir, content_path(
+            binary, ".ppt"
+        ) as temp_ppt:
             try:
                 # Check if LibreOffice is installed
                 subprocess.run(
                     ["which", "libreoffice"], check=True, capture_output=True
                 )
 
-                # Create input file path
-                temp_ppt = os.path.join(temp_dir, "input.ppt")
-
-                # Write binary content to temporary file
-                with open(temp_ppt, "wb") as f:
-                    f.write(binary)
-
                 # Convert .ppt to .pptx using LibreOffice
                 subprocess.run(
                     [
@@ -54,7 +52,10 @@ class PPTParser:
                 )
 
                 # Get the pptx file path
-                pptx_file = os.path.join(temp_dir, "input.pptx")
+                pptx_file = os.path.join(
+                    temp_dir,
+                    os.path.splitext(os.path.basename(temp_ppt))[0] + ".pptx",
+                )
 
                 if not os.path.exists(pptx_file):
                     raise FileNotFoundError(
@@ -0,0 +1,155 @@
+"""Compact serialization of retrieved chunks for the QnA prompt
+
+Every chunk's metadata carries the record, file and domain fields of its
+document, and rendering it whole puts hundreds of tokens of ids, timestamps
+and category lists into the prompt for each chunk. The context below names
+each record once, in a short header, and lists its chunks beneath it with
+their blockText only.
+
+Chunks are taken in rank order until QNA_CONTEXT_MAX_TOKENS is reached.
+Chunk indexes are positions in the returned list of kept chunks, which is
+what citations must be resolved against.
+"""
+
+import os
+from typing import Any, Dict, List, Tuple
+
+from app.modules.qna.prompt_templates import QNA_PROMPT_TEMPLATE
+
+# Token budget of the serialized chunks, headers included
+QNA_CONTEXT_MAX_TOKENS = int(os.getenv("QNA_CONTEXT_MAX_TOKENS", "12000"))
+# Longest text kept per chunk
+QNA_CONTEXT_CHUNK_MAX_TOKENS = int(os.getenv("QNA_CONTEXT_CHUNK_MAX_TOKENS", "800"))
+
+CHARS_PER_TOKEN = 4  # Rough estimate: 4 chars per token
+
+# Header fields of a record, in display order, with their labels
+_HEADER_FIELDS = (
+    ("recordName", "Record"),
+    ("connector", "Source"),
+    ("recordType", "Type"),
+    ("aircraft_canonical", "Aircraft"),
+    ("categories", "Category"),
+)
+_EMPTY_VALUES = ("", "unknown", None)
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _record_key(metadata: Dict[str, Any]) -> str:
+    return (
+        metadata.get("recordId")
+        or metadata.get("virtualRecordId")
+        or metadata.get("recordName")
+        or ""
+    )
+
+
+def _record_header(metadata: Dict[str, Any]) -> str:
+    parts = []
+    for field, label in _HEADER_FIELDS:
+        value = metadata.get(field)
+        if field == "connector":
+            value = value or metadata.get("origin")
+        if isinstance(value, list):
+            value = ", ".join(str(v) for v in value if v)
+        if value not in _EMPTY_VALUES:
+            parts.append(f"{label}: {value}")
+    return " | ".join(parts) or "Record"
+
+
+def _chunk_location(metadata: Dict[str, Any]) -> str:
+    page = metadata.get("pageNum")
+    if isinstance(page, list):
+        page = page[0] if page else None
+    if page:
+        return f" (page {page})"
+    if metadata.get("sheetName"):
+        return f" (sheet {metadata['sheetName']})"
+    return ""
+
+
+def _block_text(metadata: Dict[str, Any]) -> str:
+    # Chunks merged by the semantic chunker keep every distinct blockText of
+    # their sentences in a list
+    block_text = metadata.get("blockText")
+    if isinstance(block_text, list):
+        unique = dict.fromkeys(str(text) for text in block_text if text)
+        return " ".join(unique)
+    return block_text if isinstance(block_text, str) else ""
+
+
+def _chunk_text(chunk: Dict[str, Any], max_chars: int) -> str:
+    # blockText is what the model has always been shown: the raw row JSON
+    # with exact values for sheets and CSVs, the surrounding context for
+    # DOCX. content, the embedded text, is only a fallback
+    metadata = chunk.get("metadata") or {}
+    content = chunk.get("content")
+    text = _block_text(metadata) or (content if isinstance(content, str) else "")
+    text = " ".join(text.split())
+    if len(text) > max_chars:
+        text = text[:max_chars].rsplit(" ", 1)[0] + " …"
+    return text
+
+
+def build_qna_context(
+    chunks: List[Dict[str, Any]],
+    max_tokens: int = QNA_CONTEXT_MAX_TOKENS,
+    chunk_max_tokens: int = QNA_CONTEXT_CHUNK_MAX_TOKENS,
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Serialize ranked chunks grouped under one header per record
+
+    Args:
+        chunks: Reranked search results, best first
+        max_tokens: Token budget of the whole context
+        chunk_max_tokens: Longest text kept per chunk
+
+    Returns:
+        The context text and the chunks it contains; "Chunk Index" n in the
+        text is chunk n - 1 of that list
+    """
+    records: Dict[str, Dict[str, Any]] = {}
+    kept: List[Dict[str, Any]] = []
+    used_tokens = 0
+
+    for chunk in chunks:
+        metadata = chunk.get("metadata") or {}
+        key = _record_key(metadata)
+        line = (
+            f"  - Chunk Index: {len(kept) + 1}{_chunk_location(metadata)}: "
+            f"{_chunk_text(chunk, chunk_max_tokens * CHARS_PER_TOKEN)}"
+        )
+        cost = estimate_tokens(line)
+        if key not in records:
+            header = f"- {_record_header(metadata)}"
+            cost += estimate_tokens(header)
+        if used_tokens + cost > max_tokens:
+            break
+
+        if key not in records:
+            records[key] = {"header": header, "lines": []}
+        records[key]["lines"].append(line)
+        kept.append(chunk)
+        used_tokens += cost
+
+    context = "\n".join(
+        "\n".join([record["header"], *record["lines"]]) for record in records.values()
+    )
+    return context, kept
+
+
+def render_qna_prompt(
+    user_data: str, query: str, chunks: List[Dict[str, Any]]
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """Render the QnA prompt; returns it and the chunks citations refer to"""
+    context, kept = build_qna_context(chunks)
+    prompt = QNA_PROMPT_TEMPLATE.render(
+        user_data=user_data,
+        query=query,
+        rephrased_queries=[],
+        context=context,
+    )
+    return prompt, kept
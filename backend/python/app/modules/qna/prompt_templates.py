@@ -1,5 +1,6 @@
 from typing import List, Literal
 
+from jinja2 import Template
 from pydantic import BaseModel
 
 
@@ -26,12 +27,8 @@ qna_prompt = """
   Rephrased queries: {{ rephrased_queries }}
 
   ** These instructions are applicable even for followup conversations **
-      Context for Current Query:
-      {% for chunk in chunks %}
-      - Chunk Index: {{ loop.index }}
-      - Chunk Content: {{ chunk.metadata.blockText }}
-      - Chunk Metadata: {{ chunk.metadata }}
-      {% endfor %}
+      Context for Current Query (chunks grouped by the record they come from):
+{{ context }}
 </context>
 
 <instructions>
@@ -106,3 +103,6 @@ qna_prompt = """
 ***Your entire response/output is going to consist of a single JSON, and you will NOT wrap it within JSON md markers***
 
 """
+
+# Compiled once; render through app.modules.qna.context_builder.render_qna_prompt
+QNA_PROMPT_TEMPLATE = Template(qna_prompt)
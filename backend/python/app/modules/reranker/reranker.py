@@ -1,13 +1,121 @@
-from typing import Any, Dict, List, Optional
+"""Cross-encoder reranking of retrieval results
 
+Scoring runs on a dedicated worker thread so the event loop keeps serving
+other chats while a batch is in the model. Pairs of concurrent rerank calls
+are collected for up to RERANKER_BATCH_WAIT_MS and scored as one micro-batch,
+and passages are cut to RERANKER_MAX_PASSAGE_TOKENS before scoring.
+
+On CPU the model runs through ONNX Runtime (fastembed) or, when the model has
+no ONNX export, as a dynamically int8-quantized torch model. Plain torch is
+the fallback and the GPU backend.
+
+Routes can rerank through a RerankCascade: a cheap first stage (the fused
+hybrid retrieval score or a small MiniLM cross-encoder) prunes candidates to
+top_n, and the expensive model stops scoring once no remaining candidate can
+still enter the top_k.
+"""
+
+import asyncio
+import heapq
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 import torch
 from sentence_transformers import CrossEncoder
 
+from app.utils.logger import create_logger
+
+# auto (onnx on CPU, torch on GPU) | onnx | int8 | torch
+RERANKER_BACKEND = os.getenv("RERANKER_BACKEND", "auto").lower()
+# Token budget of each passage; 0 scores passages untruncated
+RERANKER_MAX_PASSAGE_TOKENS = int(os.getenv("RERANKER_MAX_PASSAGE_TOKENS", "256"))
+# Pairs collected from concurrent requests before a micro-batch is scored
+RERANKER_MAX_BATCH_PAIRS = int(os.getenv("RERANKER_MAX_BATCH_PAIRS", "256"))
+RERANKER_BATCH_WAIT_MS = float(os.getenv("RERANKER_BATCH_WAIT_MS", "5"))
+# Pairs per forward pass of the model
+RERANKER_PREDICT_BATCH_SIZE = int(os.getenv("RERANKER_PREDICT_BATCH_SIZE", "32"))
+
+# Small cross-encoder of the "minilm" cascade first stage
+RERANKER_CASCADE_MODEL = os.getenv(
+    "RERANKER_CASCADE_MODEL", "cross-encoder/ms-marco-MiniLM-L-6-v2"
+)
+
+# Weights of the retriever and reranker scores in the final score
+RETRIEVER_SCORE_WEIGHT = 0.3
+RERANKER_SCORE_WEIGHT = 0.7
+# Reranker scores are sigmoid outputs
+_MAX_RERANKER_SCORE = 1.0
+
+# Passages are clipped to this many characters per token of budget first,
+# so very long chunks are never tokenized in full
+_CHARS_PER_TOKEN = 8
+
+# Backends tried, in order, for each RERANKER_BACKEND value
+_BACKEND_FALLBACKS = {
+    "onnx": ("onnx", "int8", "torch"),
+    "int8": ("int8", "torch"),
+    "torch": ("torch",),
+}
+
+Pair = Tuple[str, str]
+PredictFn = Callable[[Sequence[Pair]], np.ndarray]
+
+
+def _env_flag(value: str) -> bool:
+    return value.lower() in ("1", "true", "yes")
+
+
+@dataclass(frozen=True)
+class RerankCascade:
+    """Two-stage rerank settings of a route
+
+    Attributes:
+        first_stage: "score" orders candidates by their fused hybrid retrieval
+            score, "minilm" by a small cross-encoder, "none" keeps retrieval
+            order without pruning
+        top_n: Candidates passed to the expensive reranker (at least top_k)
+        adaptive_cutoff: Stop scoring once no remaining candidate can enter top_k
+        chunk_size: Candidates scored per step after the first top_k
+    """
+
+    first_stage: str = "score"
+    top_n: int = 64
+    adaptive_cutoff: bool = True
+    chunk_size: int = 16
+
+    @classmethod
+    def from_env(cls, route: str) -> "RerankCascade":
+        """Settings from RERANKER_CASCADE_<ROUTE>_* env vars, then RERANKER_CASCADE_*"""
+        prefix = f"RERANKER_CASCADE_{route.upper()}_"
+
+        def setting(name: str, default: str) -> str:
+            return os.getenv(prefix + name, os.getenv(f"RERANKER_CASCADE_{name}", default))
+
+        return cls(
+            first_stage=setting("FIRST_STAGE", cls.first_stage).lower(),
+            top_n=int(setting("TOP_N", str(cls.top_n))),
+            adaptive_cutoff=_env_flag(setting("ADAPTIVE_CUTOFF", "true")),
+            chunk_size=max(1, int(setting("CHUNK_SIZE", str(cls.chunk_size)))),
+        )
+
 
 class RerankerService:
     """Service for reranking retrieval results"""
 
-    def __init__(self, model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2"):
+    def __init__(
+        self,
+        model_name: str = "cross-encoder/ms-marco-MiniLM-L-6-v2",
+        logger=None,
+        backend: str = RERANKER_BACKEND,
+        max_passage_tokens: int = RERANKER_MAX_PASSAGE_TOKENS,
+        max_batch_pairs: int = RERANKER_MAX_BATCH_PAIRS,
+        batch_wait_ms: float = RERANKER_BATCH_WAIT_MS,
+        predict_batch_size: int = RERANKER_PREDICT_BATCH_SIZE,
+    ):
         """
         Initialize the reranker service with a specific model
 
@@ -17,18 +125,296 @@ class RerankerService:
                 - "cross-encoder/ms-marco-MiniLM-L-6-v2" (fast)
                 - "BAAI/bge-reranker-base" (balanced)
                 - "BAAI/bge-reranker-large" (more accurate)
+            backend: auto, onnx, int8 or torch
+            max_passage_tokens: Token budget of each passage (0 for none)
+            max_batch_pairs: Pairs per micro-batch across concurrent requests
+            batch_wait_ms: How long a micro-batch waits for more requests
+            predict_batch_size: Pairs per forward pass of the model
         """
+        self.logger = logger or create_logger("reranker")
         self.model_name = model_name
-        # Load model with half precision for faster inference if supported
+        self.max_passage_tokens = max_passage_tokens
+        self.max_batch_pairs = max_batch_pairs
+        self.batch_wait = batch_wait_ms / 1000
+        self.predict_batch_size = predict_batch_size
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        self.model = CrossEncoder(model_name, device=self.device)
+
+        # Set by the backend loaders, used to cut passages to the token budget
+        self.tokenizer = None
+        self.backend, self._predict = self._load_backend(backend)
+
+        # Model calls are serialized on one thread; torch and ONNX Runtime
+        # parallelize each batch internally and release the GIL
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reranker")
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._batcher: Optional[asyncio.Task] = None
+
+        # Small cross-encoder of the "minilm" first stage, loaded on first use
+        self._cascade_model: Optional["RerankerService"] = None
+        self._cascade_model_lock = asyncio.Lock()
+
+        self.batches = 0
+        self.pairs_scored = 0
+        self.predict_seconds = 0.0
+        self.cascade_pairs_scored = 0
+        self.cascade_pairs_saved = 0
+
+    def _load_backend(self, backend: str) -> Tuple[str, PredictFn]:
+        if backend == "auto":
+            backend = "torch" if self.device == "cuda" else "onnx"
+        candidates = _BACKEND_FALLBACKS.get(backend, ("torch",))
+        for name in candidates:
+            try:
+                predict = getattr(self, f"_load_{name}")()
+                # Warm-up call: loads lazy sessions and rejects a broken backend now
+                predict([("warm up", "warm up")])
+                self.logger.info(f"✅ Reranker {self.model_name} loaded with the {name} backend")
+                return name, predict
+            except Exception as e:
+                if name == candidates[-1]:
+                    raise
+                self.logger.warning(
+                    f"⚠️ Reranker {name} backend unavailable, falling back: {str(e)}"
+                )
+
+    def _load_torch(self) -> PredictFn:
+        model = CrossEncoder(self.model_name, device=self.device)
 
         # For faster inference with larger batch sizes on GPU
         if self.device == "cuda":
-            self.model.model = self.model.model.half()
+            model.model = model.model.half()
+
+        self.tokenizer = model.tokenizer
+        return lambda pairs: model.predict(
+            pairs, batch_size=self.predict_batch_size, show_progress_bar=False
+        )
+
+    def _load_int8(self) -> PredictFn:
+        if self.device != "cpu":
+            raise ValueError("int8 dynamic quantization runs on CPU only")
+        model = CrossEncoder(self.model_name, device="cpu")
+        model.model = torch.ao.quantization.quantize_dynamic(
+            model.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+        self.tokenizer = model.tokenizer
+        return lambda pairs: model.predict(
+            pairs, batch_size=self.predict_batch_size, show_progress_bar=False
+        )
+
+    def _load_onnx(self) -> PredictFn:
+        if self.device != "cpu":
+            raise ValueError("the ONNX backend runs on CPU only")
+        from fastembed.rerank.cross_encoder import TextCrossEncoder
+        from transformers import AutoTokenizer
+
+        model = TextCrossEncoder(self.model_name)
+
+        def predict(pairs: Sequence[Pair]) -> np.ndarray:
+            logits = np.fromiter(
+                model.rerank_pairs(pairs, batch_size=self.predict_batch_size),
+                dtype=np.float32,
+            )
+            # Same activation CrossEncoder applies to single-label models
+            return 1 / (1 + np.exp(-logits))
+
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        return predict
+
+    def _truncate(self, passages: List[str]) -> List[str]:
+        """Cut passages to max_passage_tokens at a token boundary"""
+        if self.max_passage_tokens <= 0 or self.tokenizer is None:
+            return passages
+        clipped = [p[: self.max_passage_tokens * _CHARS_PER_TOKEN] for p in passages]
+        encoded = self.tokenizer(
+            clipped,
+            add_special_tokens=False,
+            truncation=True,
+            max_length=self.max_passage_tokens,
+            return_offsets_mapping=True,
+        )
+        truncated = []
+        for text, offsets in zip(clipped, encoded["offset_mapping"]):
+            if len(offsets) < self.max_passage_tokens:
+                truncated.append(text)
+            else:
+                truncated.append(text[: offsets[-1][1]])
+        return truncated
+
+    def _score_batch(self, pairs: List[Pair]) -> np.ndarray:
+        """Score a micro-batch on the worker thread"""
+        start = time.monotonic()
+        passages = self._truncate([passage for _, passage in pairs])
+        # Length-sorted so each forward pass pads to similar lengths
+        order = sorted(range(len(pairs)), key=lambda i: len(passages[i]))
+        sorted_scores = self._predict([(pairs[i][0], passages[i]) for i in order])
+        scores = np.empty(len(pairs), dtype=np.float32)
+        scores[order] = sorted_scores
+
+        self.batches += 1
+        self.pairs_scored += len(pairs)
+        self.predict_seconds += time.monotonic() - start
+        return scores
+
+    def _ensure_batcher(self, loop: asyncio.AbstractEventLoop) -> None:
+        if self._loop is not loop or self._batcher is None or self._batcher.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._batcher = loop.create_task(self._run_batcher())
+
+    async def _run_batcher(self) -> None:
+        """Collect requests into micro-batches and score them on the worker thread"""
+        loop = asyncio.get_running_loop()
+        while True:
+            requests = [await self._queue.get()]
+            pair_count = len(requests[0][0])
+            deadline = loop.time() + self.batch_wait
+            while pair_count < self.max_batch_pairs:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    request = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                requests.append(request)
+                pair_count += len(request[0])
+
+            pairs = [pair for request_pairs, _ in requests for pair in request_pairs]
+            try:
+                scores = await loop.run_in_executor(self._executor, self._score_batch, pairs)
+            except Exception as e:
+                self.logger.error(f"❌ Reranker batch of {len(pairs)} pairs failed: {str(e)}")
+                for _, future in requests:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for request_pairs, future in requests:
+                # Callers that were cancelled while waiting are skipped
+                if not future.done():
+                    future.set_result(scores[offset : offset + len(request_pairs)])
+                offset += len(request_pairs)
+
+    async def score(self, query: str, passages: List[str]) -> np.ndarray:
+        """Relevance scores of passages for a query, micro-batched with other requests"""
+        if not passages:
+            return np.empty(0, dtype=np.float32)
+        loop = asyncio.get_running_loop()
+        self._ensure_batcher(loop)
+        future = loop.create_future()
+        self._queue.put_nowait(([(query, passage) for passage in passages], future))
+        return await future
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "batches": self.batches,
+            "pairsScored": self.pairs_scored,
+            "meanBatchPairs": self.pairs_scored / self.batches if self.batches else 0,
+            "predictSeconds": self.predict_seconds,
+            "cascadePairsScored": self.cascade_pairs_scored,
+            "cascadePairsSaved": self.cascade_pairs_saved,
+        }
+
+    @staticmethod
+    def _final_score(doc: Dict[str, Any], reranker_score: float) -> float:
+        # If there was a previous score, we can combine them
+        if "score" in doc:
+            # Weighted combination of retriever and reranker scores
+            return RETRIEVER_SCORE_WEIGHT * doc["score"] + RERANKER_SCORE_WEIGHT * reranker_score
+        return reranker_score
+
+    async def _score_documents(self, query: str, documents: List[Dict[str, Any]]) -> None:
+        """Add reranker and final scores to documents"""
+        scores = await self.score(query, [doc.get("content", "") for doc in documents])
+        for doc, score in zip(documents, scores):
+            doc["reranker_score"] = float(score)
+            doc["final_score"] = self._final_score(doc, doc["reranker_score"])
+
+    async def _get_cascade_model(self) -> "RerankerService":
+        async with self._cascade_model_lock:
+            if self._cascade_model is None:
+                self._cascade_model = await asyncio.to_thread(
+                    RerankerService,
+                    RERANKER_CASCADE_MODEL,
+                    logger=self.logger,
+                    max_passage_tokens=self.max_passage_tokens,
+                )
+        return self._cascade_model
+
+    async def _first_stage(
+        self, query: str, documents: List[Dict[str, Any]], cascade: RerankCascade, top_k: int
+    ) -> List[Dict[str, Any]]:
+        """Candidates for the expensive reranker, most promising first"""
+        if cascade.first_stage == "none":
+            return documents
+        if cascade.first_stage == "minilm":
+            model = await self._get_cascade_model()
+            scores = await model.score(query, [doc.get("content", "") for doc in documents])
+            for doc, score in zip(documents, scores):
+                doc["first_stage_score"] = float(score)
+            ranked = sorted(documents, key=lambda d: d["first_stage_score"], reverse=True)
+        else:
+            ranked = sorted(documents, key=lambda d: d.get("score", 0), reverse=True)
+        return ranked[: max(cascade.top_n, top_k)]
+
+    async def _rerank_cascade(
+        self,
+        query: str,
+        documents: List[Dict[str, Any]],
+        top_k: int,
+        cascade: RerankCascade,
+    ) -> List[Dict[str, Any]]:
+        """Score the first stage's candidates until the top_k cannot change"""
+        candidates = await self._first_stage(query, documents, cascade, top_k)
+
+        if not cascade.adaptive_cutoff:
+            await self._score_documents(query, candidates)
+            scored = candidates
+        else:
+            # Best final score each candidate could still reach, and its
+            # maximum over all candidates from each position on
+            remaining_bound = [
+                self._final_score(doc, _MAX_RERANKER_SCORE) for doc in candidates
+            ]
+            for i in range(len(remaining_bound) - 2, -1, -1):
+                remaining_bound[i] = max(remaining_bound[i], remaining_bound[i + 1])
+
+            top_scores: List[float] = []
+            start = 0
+            while start < len(candidates):
+                if len(top_scores) == top_k and remaining_bound[start] < top_scores[0]:
+                    break
+                # A full top_k is needed before anything can be cut off
+                end = start + (max(top_k, cascade.chunk_size) if start == 0 else cascade.chunk_size)
+                chunk = candidates[start:end]
+                await self._score_documents(query, chunk)
+                for doc in chunk:
+                    if len(top_scores) < top_k:
+                        heapq.heappush(top_scores, doc["final_score"])
+                    elif doc["final_score"] > top_scores[0]:
+                        heapq.heapreplace(top_scores, doc["final_score"])
+                start = end
+            scored = candidates[:start]
+
+        saved = len(documents) - len(scored)
+        self.cascade_pairs_scored += len(scored)
+        self.cascade_pairs_saved += saved
+        self.logger.info(
+            f"✂️ Rerank cascade ({cascade.first_stage}) scored {len(scored)} of "
+            f"{len(documents)} candidates, saved {saved} pairs"
+        )
+        return scored
 
     async def rerank(
-        self, query: str, documents: List[Dict[str, Any]], top_k: Optional[int] = None
+        self,
+        query: str,
+        documents: List[Dict[str, Any]],
+        top_k: Optional[int] = None,
+        cascade: Optional[RerankCascade] = None,
     ) -> List[Dict[str, Any]]:
         """
         Rerank documents based on relevance to the query
@@ -37,6 +423,8 @@ class RerankerService:
             query: The search query
             documents: List of document dictionaries from the retriever
             top_k: Number of top documents to return (None for all)
+            cascade: Two-stage settings of the calling route; every document
+                is scored when None or when top_k is None
 
         Returns:
             Reranked list of documents with scores
@@ -44,25 +432,15 @@ class RerankerService:
         if not documents:
             return []
 
-        # Create document-query pairs for scoring
-        doc_query_pairs = [(query, doc.get("content", "")) for doc in documents]
-
-        # Get relevance scores
-        scores = self.model.predict(doc_query_pairs)
-
-        # Add scores to documents
-        for i, doc in enumerate(documents):
-            doc["reranker_score"] = float(scores[i])
-            # If there was a previous score, we can combine them
-            if "score" in doc:
-                # Weighted combination of retriever and reranker scores
-                doc["final_score"] = 0.3 * doc["score"] + 0.7 * doc["reranker_score"]
-            else:
-                doc["final_score"] = doc["reranker_score"]
+        if cascade is not None and top_k:
+            scored = await self._rerank_cascade(query, documents, top_k, cascade)
+        else:
+            await self._score_documents(query, documents)
+            scored = documents
 
         # Sort by final score
         reranked_docs = sorted(
-            documents, key=lambda d: d.get("final_score", 0), reverse=True
+            scored, key=lambda d: d.get("final_score", 0), reverse=True
         )
 
         # Return top_k if specified
@@ -7,6 +7,7 @@ from app.config.utils.named_constants.arangodb_constants import (
     CollectionNames,
     RecordTypes,
 )
+from app.core.arango_executor import get_arango_executor
 
 
 class ArangoService:
@@ -19,6 +20,8 @@ class ArangoService:
         self.config_service = config
         self.client = arango_client
         self.db = None
+        # AQL calls are offloaded so they never block the event loop
+        self.executor = get_arango_executor()
 
     async def connect(self) -> bool:
         """Connect to ArangoDB and initialize collections"""
@@ -40,16 +43,24 @@ class ArangoService:
 
             # Connect to system db to ensure our db exists
             self.logger.debug("Connecting to system db")
-            sys_db = self.client.db(
-                "_system", username=arango_user, password=arango_password, verify=True
+            sys_db = await self.executor.run(
+                self.client.db,
+                "_system",
+                username=arango_user,
+                password=arango_password,
+                verify=True,
             )
             self.logger.debug("System DB: %s", sys_db)
             self.logger.info("✅ Database created successfully")
 
             # Connect to our database
             self.logger.debug("Connecting to our database")
-            self.db = self.client.db(
-                arango_db, username=arango_user, password=arango_password, verify=True
+            self.db = await self.executor.run(
+                self.client.db,
+                arango_db,
+                username=arango_user,
+                password=arango_password,
+                verify=True,
             )
             self.logger.debug("Our DB: %s", self.db)
 
@@ -86,8 +97,7 @@ class ArangoService:
 
             bind_vars = {"active": active}
 
-            cursor = self.db.aql.execute(query, bind_vars=bind_vars)
-            return list(cursor)
+            return await self.executor.execute(self.db, query, bind_vars=bind_vars)
         except Exception as e:
             self.logger.error(f"Failed to get organizations: {str(e)}")
             raise
@@ -100,16 +110,46 @@ class ArangoService:
                 FILTER doc._key == @document_key
                 RETURN doc
             """
-            cursor = self.db.aql.execute(
+            return await self.executor.execute_first(
+                self.db,
                 query,
                 bind_vars={"document_key": document_key, "@collection": collection},
             )
-            result = list(cursor)
-            return result[0] if result else None
         except Exception as e:
             self.logger.error("❌ Error getting document: %s", str(e))
             return None
 
+    async def get_documents_by_keys(
+        self, document_keys: List[str], collection: str
+    ) -> Dict[str, Dict]:
+        """
+        Get several documents of a collection in one round-trip
+
+        Args:
+            document_keys (List[str]): Keys of the documents to fetch
+            collection (str): Collection name
+
+        Returns:
+            Dict[str, Dict]: Found documents by key; missing keys are omitted
+        """
+        if not document_keys:
+            return {}
+        try:
+            query = """
+            FOR doc IN @@collection
+                FILTER doc._key IN @document_keys
+                RETURN doc
+            """
+            documents = await self.executor.execute(
+                self.db,
+                query,
+                bind_vars={"document_keys": list(document_keys), "@collection": collection},
+            )
+            return {doc["_key"]: doc for doc in documents if doc}
+        except Exception as e:
+            self.logger.error("❌ Error getting documents by keys: %s", str(e))
+            return {}
+
     async def get_accessible_records(
         self, user_id: str, org_id: str, filters: dict = None
     ) -> list:
@@ -339,14 +379,14 @@ class ArangoService:
                     ]  # Lowercase app names
 
             # Execute with profiling enabled
-            cursor = self.db.aql.execute(
+            result = await self.executor.execute(
+                self.db,
                 query,
                 bind_vars=bind_vars,
                 profile=2,
                 fail_on_warning=False,
                 stream=True
             )
-            result = list(cursor)
             
             # Clean up None values from the result
             if result:
@@ -368,6 +408,61 @@ class ArangoService:
             self.logger.error(f"Failed to get accessible records: {str(e)}")
             raise
 
+    async def get_user_principals(self, user_id: str, org_id: str) -> List[str]:
+        """
+        Get the permission principals a user acts as
+
+        These mirror the permission paths of get_accessible_records and match the
+        `permission_principals` payload stored on Qdrant points at indexing time.
+
+        Args:
+            user_id (str): The userId field value in users collection
+            org_id (str): The organization ID
+
+        Returns:
+            List[str]: Arango _ids of the user, their groups, orgs and knowledge
+                bases, plus the org's `anyone` principal
+        """
+        try:
+            query = f"""
+            LET userDoc = FIRST(
+                FOR user IN @@users
+                FILTER user.userId == @userId
+                RETURN user
+            )
+
+            LET groupsAndOrgs = (
+                FOR entity, edge IN 1..1 ANY userDoc._id {CollectionNames.BELONGS_TO.value}
+                FILTER edge.entityType IN ['GROUP', 'ORGANIZATION']
+                RETURN entity._id
+            )
+
+            LET knowledgeBases = (
+                FOR kb IN 1..1 ANY userDoc._id {CollectionNames.PERMISSIONS_TO_KNOWLEDGE_BASE.value}
+                RETURN kb._id
+            )
+
+            RETURN userDoc == null ? [] : UNION_DISTINCT(
+                [userDoc._id],
+                groupsAndOrgs,
+                knowledgeBases,
+                [CONCAT('{CollectionNames.ANYONE.value}/', @orgId)]
+            )
+            """
+            principals = await self.executor.execute_first(
+                self.db,
+                query,
+                bind_vars={
+                    "userId": user_id,
+                    "orgId": org_id,
+                    "@users": CollectionNames.USERS.value,
+                },
+            )
+            return principals or []
+        except Exception as e:
+            self.logger.error(f"Failed to get user principals: {str(e)}")
+            raise
+
     async def get_user_by_user_id(self, user_id: str) -> Optional[Dict]:
         """Get user by user ID"""
         try:
@@ -376,9 +471,9 @@ class ArangoService:
                     FILTER user.userId == @user_id
                     RETURN user
             """
-            cursor = self.db.aql.execute(query, bind_vars={"user_id": user_id})
-            result = next(cursor, None)
-            return result
+            return await self.executor.execute_first(
+                self.db, query, bind_vars={"user_id": user_id}
+            )
         except Exception as e:
             self.logger.error(f"Error getting user by user ID: {str(e)}")
             return None
@@ -481,8 +576,9 @@ class ArangoService:
                 "@anyone": CollectionNames.ANYONE.value,
             }
 
-            cursor = self.db.aql.execute(access_query, bind_vars=bind_vars)
-            access_result = next(cursor, None)
+            access_result = await self.executor.execute_first(
+                self.db, access_query, bind_vars=bind_vars
+            )
 
             if not access_result:
                 return None
@@ -583,10 +679,9 @@ class ArangoService:
                 languages: languages
             }}
             """
-            metadata_cursor = self.db.aql.execute(
-                metadata_query, bind_vars={"recordId": record_id}
+            metadata_result = await self.executor.execute_first(
+                self.db, metadata_query, bind_vars={"recordId": record_id}
             )
-            metadata_result = next(metadata_cursor, None)
 
             # Get knowledge base info if record is in a KB
             kb_info = None
@@ -677,8 +772,7 @@ class ArangoService:
             if accessible_record_ids:
                 bind_vars["accessible_record_ids"] = accessible_record_ids
 
-            cursor = self.db.aql.execute(query, bind_vars=bind_vars)
-            results = list(cursor)
+            results = await self.executor.execute(self.db, query, bind_vars=bind_vars)
 
             self.logger.info(
                 "✅ Found %d records with virtualRecordId %s",
@@ -1,12 +1,23 @@
 import asyncio
+import os
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from langchain.chat_models.base import BaseChatModel
 from langchain.embeddings.base import Embeddings
-from langchain_qdrant import FastEmbedSparse, QdrantVectorStore, RetrievalMode
+from langchain_qdrant import FastEmbedSparse, QdrantVectorStore
 from qdrant_client import QdrantClient
-from qdrant_client.http.models import FieldCondition, Filter, MatchValue
+from qdrant_client.http.models import (
+    FieldCondition,
+    Filter,
+    Fusion,
+    FusionQuery,
+    MatchAny,
+    MatchValue,
+    Prefetch,
+    QueryRequest,
+    SparseVector,
+)
 
 from app.config.configuration_service import config_node_constants
 from app.config.utils.named_constants.ai_models_named_constants import (
@@ -15,17 +26,25 @@ from app.config.utils.named_constants.ai_models_named_constants import (
 from app.config.utils.named_constants.arangodb_constants import (
     CollectionNames,
     Connectors,
+    QdrantPayloadFields,
     RecordTypes,
 )
-from app.exceptions.embedding_exceptions import EmbeddingModelCreationError
+from app.core.accessible_records_cache import AccessibleRecordsCache
+from app.core.answer_cache import scope_fingerprint
+from app.core.embedding_cache import EmbeddingCache
+from app.core.embedding_model_registry import EmbeddingModelInfo, EmbeddingModelRegistry
 from app.exceptions.fastapi_responses import Status
-from app.exceptions.indexing_exceptions import IndexingError
 from app.modules.retrieval.retrieval_arango import ArangoService
-from app.utils.aimodels import (
-    get_default_embedding_model,
-    get_embedding_model,
-    get_generator_model,
-)
+from app.utils.aimodels import get_generator_model
+
+# How search results are restricted to what the user may read:
+# "records" enumerates accessible virtualRecordIds, "principals" matches the
+# permission_principals payload written on each point at indexing time
+PERMISSION_FILTER_MODE = os.getenv("QDRANT_PERMISSION_FILTER_MODE", "records").lower()
+# Maximum number of virtualRecordIds sent in a single MatchAny condition
+MATCH_ANY_CHUNK_SIZE = int(os.getenv("QDRANT_MATCH_ANY_CHUNK_SIZE", "1000"))
+# Run all decomposed queries as one Qdrant query_batch_points hybrid request
+QDRANT_BATCH_SEARCH = os.getenv("QDRANT_BATCH_SEARCH", "true").lower() in ("1", "true", "yes")
 
 
 class RetrievalService:
@@ -35,6 +54,10 @@ class RetrievalService:
         config_service,
         collection_name: str,
         qdrant_client: QdrantClient,
+        accessible_records_cache: Optional[AccessibleRecordsCache] = None,
+        permission_filter_mode: str = PERMISSION_FILTER_MODE,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        model_registry: Optional[EmbeddingModelRegistry] = None,
     ) -> None:
         """
         Initialize the retrieval service with necessary configurations.
@@ -43,11 +66,18 @@ class RetrievalService:
             collection_name: Name of the Qdrant collection
             qdrant_api_key: API key for Qdrant
             qdrant_host: Qdrant server host URL
+            accessible_records_cache: Optional per-user accessible records cache
+            permission_filter_mode: "records" or "principals" Qdrant permission filtering
+            embedding_cache: Optional cache of dense and sparse query embeddings
+            model_registry: Registry caching the dense model and vector store per config version
         """
 
         self.logger = logger
         self.config_service = config_service
         self.llm = None
+        self.accessible_records_cache = accessible_records_cache
+        self.permission_filter_mode = permission_filter_mode
+        self.embedding_cache = embedding_cache
 
         # Initialize sparse embeddings
         try:
@@ -62,6 +92,9 @@ class RetrievalService:
         self.collection_name = collection_name
         self.logger.info(f"Retrieval service initialized with collection name: {self.collection_name}")
         self.vector_store = None
+        self.model_registry = model_registry or EmbeddingModelRegistry(
+            logger, config_service, qdrant_client
+        )
 
     async def get_llm_instance(self) -> Optional[BaseChatModel]:
         try:
@@ -90,45 +123,8 @@ class RetrievalService:
 
     async def get_embedding_model_instance(self) -> Optional[Embeddings]:
         try:
-            self.logger.info("Getting embedding model")
-            embedding_model = await self.get_current_embedding_model_name()
-            try:
-                if not embedding_model or embedding_model == DEFAULT_EMBEDDING_MODEL:
-                    self.logger.info("Using default embedding model")
-                    embedding_model = DEFAULT_EMBEDDING_MODEL
-                    dense_embeddings = get_default_embedding_model()
-                else:
-                    self.logger.info(f"Using embedding model: {getattr(embedding_model, 'model', embedding_model)}")
-                    ai_models = await self.config_service.get_config(
-                        config_node_constants.AI_MODELS.value
-                    )
-                    dense_embeddings = None
-                    if ai_models["embedding"]:
-                        config = ai_models["embedding"][0]
-                        dense_embeddings = get_embedding_model(config["provider"], config)
-
-            except Exception as e:
-                self.logger.error(f"Error creating embedding model: {str(e)}")
-                raise EmbeddingModelCreationError(
-                    f"Failed to create embedding model: {str(e)}"
-                ) from e
-
-            # Get the embedding dimensions from the model
-            try:
-                sample_embedding = await dense_embeddings.aembed_query("test")
-                embedding_size = len(sample_embedding)
-            except Exception as e:
-                self.logger.warning(
-                    f"Error with configured embedding model: {str(e)}"
-                )
-                raise IndexingError(
-                    "Failed to get embedding model: " + str(e),
-                )
-
-            self.logger.info(
-                f"Using embedding model: {getattr(embedding_model, 'model', embedding_model)}, embedding_size: {embedding_size}"
-            )
-            return dense_embeddings
+            model = await self.model_registry.get_model()
+            return model.dense_embeddings
         except Exception as e:
             self.logger.error(f"Error getting embedding model: {str(e)}")
             return None
@@ -160,19 +156,21 @@ class RetrievalService:
         else:
             return None
 
-    async def _preprocess_query(self, query: str) -> str:
+    async def _preprocess_query(self, query: str, model_name: Optional[str] = None) -> str:
         """
         Preprocess the query text.
 
         Args:
             query: Raw query text
+            model_name: Current embedding model name, read from config when not given
 
         Returns:
             Preprocessed query text
         """
         try:
             # Get current model name from config
-            model_name = await self.get_current_embedding_model_name()
+            if model_name is None:
+                model_name = await self.get_current_embedding_model_name()
 
             # Check if using BGE model before adding the prefix
             if model_name and "bge" in model_name.lower():
@@ -182,24 +180,12 @@ class RetrievalService:
             self.logger.error(f"Error in query preprocessing: {str(e)}")
             return query.strip()
 
-    def _format_results(self, results: List[tuple]) -> List[Dict[str, Any]]:
-        """Format search results into a consistent structure with flattened metadata."""
-        formatted_results = []
-        for doc, score in results:
-            formatted_result = {
-                "content": doc.page_content,
-                "score": float(score),
-                "citationType": "vectordb|document",
-                "metadata": doc.metadata,
-            }
-            formatted_results.append(formatted_result)
-        return formatted_results
-
     def _build_qdrant_filter(
         self,
         org_id: str,
         accessible_virtual_record_ids: List[str],
         aircraft_canonical: Optional[str] = None,
+        principals: Optional[List[str]] = None,
     ) -> Filter:
         """
         Build Qdrant filter for accessible records with both org_id and record_id conditions,
@@ -209,22 +195,27 @@ class RetrievalService:
             org_id: Organization ID to filter
             accessible_virtual_record_ids: List of virtual record IDs the user has access to
             aircraft_canonical: Optional canonical aircraft code to scope results
+            principals: Permission principals of the user. When given, access is
+                checked against the points' permission_principals payload instead
+                of enumerating accessible_virtual_record_ids
 
         Returns:
             Qdrant Filter object
         """
+        if principals is not None:
+            access_condition = FieldCondition(
+                key=QdrantPayloadFields.PERMISSION_PRINCIPALS.value,
+                match=MatchAny(any=principals),
+            )
+        else:
+            access_condition = self._build_virtual_record_id_condition(
+                accessible_virtual_record_ids
+            )
         must_conditions = [
             FieldCondition(  # org_id condition
                 key="metadata.orgId", match=MatchValue(value=org_id)
             ),
-            Filter(  # recordId must be one of the accessible_records
-                should=[
-                    FieldCondition(
-                        key="metadata.virtualRecordId", match=MatchValue(value=virtual_record_id)
-                    )
-                    for virtual_record_id in accessible_virtual_record_ids
-                ]
-            ),
+            access_condition,
         ]
         if aircraft_canonical:
             must_conditions.append(
@@ -234,6 +225,25 @@ class RetrievalService:
             )
         return Filter(must=must_conditions)
 
+    def _build_virtual_record_id_condition(
+        self, virtual_record_ids: List[str]
+    ) -> Union[FieldCondition, Filter]:
+        """
+        virtualRecordId must be one of the accessible ones. Ids are sent as
+        MatchAny conditions of at most MATCH_ANY_CHUNK_SIZE values each.
+        """
+        unique_ids = list(dict.fromkeys(virtual_record_ids))
+        conditions = [
+            FieldCondition(
+                key="metadata.virtualRecordId",
+                match=MatchAny(any=unique_ids[i : i + MATCH_ANY_CHUNK_SIZE]),
+            )
+            for i in range(0, len(unique_ids), MATCH_ANY_CHUNK_SIZE)
+        ]
+        if len(conditions) == 1:
+            return conditions[0]
+        return Filter(should=conditions)
+
     async def search_with_filters(
         self,
         queries: List[str],
@@ -243,6 +253,7 @@ class RetrievalService:
         limit: int = 20,
         aircraft_canonical: Optional[str] = None,
         arango_service: Optional[ArangoService] = None,
+        bypass_cache: bool = False,
     ) -> List[Dict[str, Any]]:
         """Perform semantic search on accessible records with multiple queries."""
 
@@ -264,15 +275,25 @@ class RetrievalService:
                     arango_filters[metadata_key] = values
 
 
+            # Principal filtering cannot express the Arango-side category/topic filters
+            use_principals = self.permission_filter_mode == "principals" and not any(
+                filter_groups.values()
+            )
+
             self.logger.info("Starting parallel initialization tasks")
             init_tasks = [
-                self._get_accessible_records_task(user_id, org_id, filter_groups, arango_service),
+                self._get_accessible_records_task(
+                    user_id, org_id, filter_groups, arango_service, bypass_cache
+                ),
                 self._get_vector_store_task(),
-                arango_service.get_user_by_user_id(user_id)  # Get user info in parallel
+                arango_service.get_user_by_user_id(user_id),  # Get user info in parallel
             ]
+            if use_principals:
+                init_tasks.append(arango_service.get_user_principals(user_id, org_id))
 
             self.logger.info("Executing parallel tasks")
-            accessible_records, vector_store, user = await asyncio.gather(*init_tasks)
+            accessible_records, vector_store, user, *principals = await asyncio.gather(*init_tasks)
+            principals = (principals[0] or None) if use_principals else None
             self.logger.info(f"Parallel tasks completed. Records: {len(accessible_records) if accessible_records else 0}, User: {user is not None}")
 
             # Clean filter: Remove any None records immediately after reading from ArangoDB
@@ -294,14 +315,27 @@ class RetrievalService:
                 virtual_id = record.get("virtualRecordId")
                 if virtual_id is not None:
                     accessible_virtual_record_ids.append(virtual_id)
+            if not accessible_virtual_record_ids and not principals:
+                return self._create_empty_response("No indexed records accessible for this user with provided filters.")
+
             # Build Qdrant filter (with optional aircraft constraint)
-            qdrant_filter =  self._build_qdrant_filter(
+            qdrant_filter_start = time.monotonic()
+            qdrant_filter = self._build_qdrant_filter(
                 org_id,
                 accessible_virtual_record_ids,
-                aircraft_canonical=aircraft_canonical
+                aircraft_canonical=aircraft_canonical,
+                principals=principals,
+            )
+            self.logger.debug(
+                f"Built {'principal' if principals else 'record'} Qdrant filter for "
+                f"{len(accessible_virtual_record_ids)} virtualRecordIds in "
+                f"{time.monotonic() - qdrant_filter_start:.4f}s"
             )
 
-            search_results = await self._execute_parallel_searches(queries, qdrant_filter, limit, vector_store)
+            if QDRANT_BATCH_SEARCH:
+                search_results = await self._execute_batched_searches(queries, qdrant_filter, limit, vector_store)
+            else:
+                search_results = await self._execute_parallel_searches(queries, qdrant_filter, limit, vector_store)
 
             # Defensive post-filter: drop any hit that explicitly declares a mismatching aircraft_canonical
             # Keep results that do not have aircraft_canonical in metadata (backfilled points may only have root-level field)
@@ -335,6 +369,25 @@ class RetrievalService:
             if not unique_record_ids:
                 return self._create_empty_response("No accessible records found for this user with provided filters.")
 
+            # Principal payloads are written by the indexing service and may lag
+            # behind permission changes; only hits on accessible records are kept
+            search_results = [
+                result
+                for result in search_results
+                if ((result or {}).get("metadata") or {}).get("virtualRecordId")
+                in virtual_to_record_map
+            ]
+
+            # Index accessible records by key once instead of scanning per result
+            records_by_key = {
+                record["_key"]: record for record in accessible_records if record.get("_key")
+            }
+
+            # Records without their own webUrl fall back to the file/mail document
+            fallback_web_urls = await self._get_fallback_web_urls(
+                unique_record_ids, records_by_key, arango_service
+            )
+
             # Replace virtualRecordId with first accessible record ID in search results
             for result in search_results:
                 if not result or not result.get("metadata"):
@@ -343,43 +396,21 @@ class RetrievalService:
                 if virtual_id and virtual_id in virtual_to_record_map:
                     record_id = virtual_to_record_map[virtual_id]
                     result["metadata"]["recordId"] = record_id
-                    record = next((r for r in accessible_records if r["_key"] == record_id), None)
+                    record = records_by_key.get(record_id)
                     if record:
                         result["metadata"]["origin"] = record.get("origin")
                         result["metadata"]["connector"] = record.get("connectorName")
-                        weburl = record.get("webUrl")
-                        if weburl and weburl.startswith("https://mail.google.com/mail?authuser="):
-                            weburl = weburl.replace("{user.email}", user["email"])
-                        result["metadata"]["webUrl"] = weburl
-
-                        if not weburl and record.get("recordType", "") == RecordTypes.FILE.value:
-                            files = await arango_service.get_document(
-                                record_id, CollectionNames.FILES.value
-                            )
-                            if files:  # Add null check
-                                weburl = files.get("webUrl")
-                                if weburl and record.get("connectorName", "") == Connectors.GOOGLE_MAIL.value:
-                                    weburl = weburl.replace("{user.email}", user["email"])
-                            result["metadata"]["webUrl"] = weburl
-
-                        if not weburl and record.get("recordType", "") == RecordTypes.MAIL.value:
-                            mail = await arango_service.get_document(
-                                record_id, CollectionNames.MAILS.value
-                            )
-                            if mail:  # Add null check
-                                weburl = mail.get("webUrl")
-                                if weburl and weburl.startswith("https://mail.google.com/mail?authuser="):
-                                    weburl = weburl.replace("{user.email}", user["email"])
-                            result["metadata"]["webUrl"] = weburl
-
-            # Get full record documents from Arango
-            records = []
-            if unique_record_ids:
-                for record_id in unique_record_ids:
-                    record = next((r for r in accessible_records if r["_key"] == record_id), None)
-                    # Only append non-None records
-                    if record:
-                        records.append(record)
+                        weburl = record.get("webUrl") or fallback_web_urls.get(record_id)
+                        result["metadata"]["webUrl"] = self._format_web_url(
+                            weburl, record, user
+                        )
+
+            # Get full record documents from the accessible records
+            records = [
+                records_by_key[record_id]
+                for record_id in unique_record_ids
+                if record_id in records_by_key
+            ]
 
             if search_results or records:
                 return {
@@ -416,7 +447,65 @@ class RetrievalService:
             }
 
 
-    async def _get_accessible_records_task(self, user_id, org_id, filter_groups, arango_service) -> List[Dict[str, Any]]:
+    async def _get_fallback_web_urls(
+        self,
+        record_ids: set,
+        records_by_key: Dict[str, Dict[str, Any]],
+        arango_service: ArangoService,
+    ) -> Dict[str, str]:
+        """
+        Fetch webUrls of FILE and MAIL records that do not carry one themselves,
+        with a single batched query per collection.
+        """
+        keys_by_collection = {
+            CollectionNames.FILES.value: [],
+            CollectionNames.MAILS.value: [],
+        }
+        for record_id in record_ids:
+            record = records_by_key.get(record_id)
+            if not record or record.get("webUrl"):
+                continue
+            record_type = record.get("recordType", "")
+            if record_type == RecordTypes.FILE.value:
+                keys_by_collection[CollectionNames.FILES.value].append(record_id)
+            elif record_type == RecordTypes.MAIL.value:
+                keys_by_collection[CollectionNames.MAILS.value].append(record_id)
+
+        lookups = [
+            (collection, keys)
+            for collection, keys in keys_by_collection.items()
+            if keys
+        ]
+        if not lookups:
+            return {}
+
+        documents = await asyncio.gather(
+            *(
+                arango_service.get_documents_by_keys(keys, collection)
+                for collection, keys in lookups
+            )
+        )
+        web_urls = {}
+        for documents_by_key in documents:
+            for key, document in documents_by_key.items():
+                if document and document.get("webUrl"):
+                    web_urls[key] = document["webUrl"]
+        return web_urls
+
+    def _format_web_url(
+        self, weburl: Optional[str], record: Dict[str, Any], user: Dict[str, Any]
+    ) -> Optional[str]:
+        """Fill in the user's email in Gmail links"""
+        if weburl and (
+            weburl.startswith("https://mail.google.com/mail?authuser=")
+            or record.get("connectorName", "") == Connectors.GOOGLE_MAIL.value
+        ):
+            return weburl.replace("{user.email}", user["email"])
+        return weburl
+
+    async def _get_accessible_records_task(
+        self, user_id, org_id, filter_groups, arango_service, bypass_cache=False
+    ) -> List[Dict[str, Any]]:
         """Separate task for getting accessible records"""
         filter_groups = filter_groups or {}
         arango_filters = {}
@@ -426,87 +515,251 @@ class RetrievalService:
                 metadata_key = key.lower()
                 arango_filters[metadata_key] = values
 
-        return await arango_service.get_accessible_records(
-            user_id=user_id, org_id=org_id, filters=arango_filters
+        async def load_accessible_records() -> List[Dict[str, Any]]:
+            return await arango_service.get_accessible_records(
+                user_id=user_id, org_id=org_id, filters=arango_filters
+            )
+
+        if not self.accessible_records_cache:
+            return await load_accessible_records()
+
+        return await self.accessible_records_cache.get_or_load(
+            org_id,
+            user_id,
+            arango_filters,
+            load_accessible_records,
+            bypass=bypass_cache,
+        )
+
+    async def get_accessible_scope(
+        self, user_id, org_id, filter_groups, arango_service, bypass_cache=False
+    ) -> Optional[str]:
+        """Fingerprint of the records the user may read with the filters, None if none"""
+        accessible_records = await self._get_accessible_records_task(
+            user_id, org_id, filter_groups, arango_service, bypass_cache
+        )
+        accessible_records = [r for r in accessible_records or [] if r]
+        if not accessible_records:
+            return None
+        return scope_fingerprint(accessible_records)
+
+    async def embed_question(self, query: str) -> Tuple[List[float], Optional[str]]:
+        """Dense embedding of a question and the name of the model producing it"""
+        vector_store = await self._get_vector_store_task()
+        model_name = await self.get_current_embedding_model_name()
+        processed_query = await self._preprocess_query(query, model_name)
+        [embedding] = await self._embed_dense_queries(
+            [processed_query], vector_store.embeddings, model_name
         )
+        return embedding, self.get_embedding_model_name(vector_store.embeddings) or model_name
 
 
     async def _get_vector_store_task(self) -> QdrantVectorStore:
-        """Cached vector store retrieval"""
-        if not self.vector_store:
-            # Check collection exists
-            try:
-                collections = self.qdrant_client.get_collections()
-                collection_exists = any(col.name == self.collection_name for col in collections.collections)
-                
-                if not collection_exists:
-                    raise ValueError(f"Collection '{self.collection_name}' not found in Qdrant")
-                
-                collection_info = self.qdrant_client.get_collection(self.collection_name)
-                
-                if not collection_info:
-                    raise ValueError(f"Could not retrieve collection info for '{self.collection_name}'")
-                
-                if hasattr(collection_info, 'points_count') and collection_info.points_count == 0:
-                    self.logger.warning(f"Collection '{self.collection_name}' exists but has no points")
-                    # Don't raise error, allow empty collection for now
-                
-            except Exception as e:
-                self.logger.error(f"Error checking Qdrant collection: {str(e)}")
-                raise ValueError(f"Vector DB collection check failed: {str(e)}")
-
-            # Get cached embedding model
-            dense_embeddings = await self.get_embedding_model_instance()
-            if not dense_embeddings:
-                raise ValueError("No dense embeddings found")
-
-            self.vector_store = QdrantVectorStore(
-                client=self.qdrant_client,
-                collection_name=self.collection_name,
-                vector_name="dense",
-                sparse_vector_name="sparse",
-                embedding=dense_embeddings,
-                sparse_embedding=self.sparse_embeddings,
-                retrieval_mode=RetrievalMode.HYBRID,
-            )
-
+        """Vector store of the current embedding model, cached per config version"""
+        self.vector_store = await self.model_registry.get_vector_store(
+            self.collection_name,
+            self.sparse_embeddings,
+            on_create=self._check_collection,
+        )
         return self.vector_store
 
+    def _check_collection(self, model: EmbeddingModelInfo) -> None:
+        """Make sure the collection exists before the first search with a model"""
+        try:
+            collections = self.qdrant_client.get_collections()
+            collection_exists = any(col.name == self.collection_name for col in collections.collections)
 
-    async def _execute_parallel_searches(self, queries, qdrant_filter, limit, vector_store) -> List[Dict[str, Any]]:
-        """Execute all searches in parallel"""
-        all_results = []
-        seen_chunks = set()
-
-        # Process all queries in parallel
-        search_tasks = [
-            vector_store.asimilarity_search_with_score(
-                query=await self._preprocess_query(query),
-                k=limit,
-                filter=qdrant_filter
-            )
-            for query in queries
+            if not collection_exists:
+                raise ValueError(f"Collection '{self.collection_name}' not found in Qdrant")
+
+            collection_info = self.qdrant_client.get_collection(self.collection_name)
+
+            if not collection_info:
+                raise ValueError(f"Could not retrieve collection info for '{self.collection_name}'")
+
+            if hasattr(collection_info, 'points_count') and collection_info.points_count == 0:
+                self.logger.warning(f"Collection '{self.collection_name}' exists but has no points")
+                # Don't raise error, allow empty collection for now
+
+        except Exception as e:
+            self.logger.error(f"Error checking Qdrant collection: {str(e)}")
+            raise ValueError(f"Vector DB collection check failed: {str(e)}")
+
+        self.logger.info(
+            f"Vector store ready for {self.collection_name} with {model.model_name} ({model.dimension} dims)"
+        )
+
+
+    async def _execute_batched_searches(self, queries, qdrant_filter, limit, vector_store) -> List[Dict[str, Any]]:
+        """
+        Execute all searches as a single Qdrant batch request.
+
+        Each query becomes a hybrid (dense + sparse prefetch, RRF fusion)
+        request of one query_batch_points round trip.
+        """
+        requests = await self._build_hybrid_requests(queries, qdrant_filter, limit, vector_store)
+        if not requests:
+            return []
+
+        start_time = time.monotonic()
+        batch_responses = await asyncio.to_thread(
+            self.qdrant_client.query_batch_points,
+            collection_name=self.collection_name,
+            requests=requests,
+        )
+        self.logger.debug(
+            f"Batched VectorDB lookup for {len(requests)} queries took "
+            f"{time.monotonic() - start_time:.3f} seconds."
+        )
+        return self._format_points(batch_responses, vector_store)
+
+    async def _build_hybrid_requests(
+        self, queries, qdrant_filter, limit, vector_store
+    ) -> List[QueryRequest]:
+        """
+        Hybrid (dense + sparse prefetch, RRF fusion) request per query,
+        mirroring the langchain HYBRID query. Queries are embedded
+        concurrently, dense and sparse, through the embedding cache.
+        """
+        model_name = await self.get_current_embedding_model_name()
+        processed_queries = [
+            await self._preprocess_query(query, model_name) for query in queries
         ]
+        if not processed_queries:
+            return []
 
         start_time = time.monotonic()
-        search_results = await asyncio.gather(*search_tasks)
-        elapsed = time.monotonic() - start_time
-        self.logger.debug(f"VectorDB lookup for {len(queries)} queries took {elapsed:.3f} seconds.")
+        dense_vectors, sparse_vectors = await asyncio.gather(
+            self._embed_dense_queries(processed_queries, vector_store.embeddings, model_name),
+            self._embed_sparse_queries(processed_queries),
+        )
+        self.logger.debug(
+            f"Embedded {len(processed_queries)} queries in "
+            f"{time.monotonic() - start_time:.3f} seconds."
+        )
 
-        # Deduplicate results with null checking
-        for results in search_results:
-            if results is None:
+        sparse_vectors = [
+            SparseVector(indices=sparse["indices"], values=sparse["values"])
+            for sparse in sparse_vectors
+        ]
+        return [
+            QueryRequest(
+                prefetch=[
+                    Prefetch(
+                        query=dense_vector,
+                        using=vector_store.vector_name,
+                        filter=qdrant_filter,
+                        limit=limit,
+                    ),
+                    Prefetch(
+                        query=sparse_vector,
+                        using=vector_store.sparse_vector_name,
+                        filter=qdrant_filter,
+                        limit=limit,
+                    ),
+                ],
+                query=FusionQuery(fusion=Fusion.RRF),
+                filter=qdrant_filter,
+                limit=limit,
+                with_payload=True,
+            )
+            for dense_vector, sparse_vector in zip(dense_vectors, sparse_vectors)
+        ]
+
+    def _format_points(self, responses, vector_store) -> List[Dict[str, Any]]:
+        """Flatten query responses, keeping the first (per query order) hit of each point"""
+        all_results = []
+        seen_points = set()
+        for response in responses:
+            if response is None:
                 self.logger.warning("Search results returned None, skipping")
                 continue
-            for doc, score in results:
-                if doc is None or not hasattr(doc, 'page_content'):
-                    self.logger.warning("Document is None or missing page_content, skipping")
+            for point in response.points:
+                if point.id in seen_points or not point.payload:
                     continue
-                if doc.page_content not in seen_chunks:
-                    all_results.append((doc, score))
-                    seen_chunks.add(doc.page_content)
+                seen_points.add(point.id)
+                metadata = dict(point.payload.get(vector_store.metadata_payload_key) or {})
+                metadata["_id"] = point.id
+                metadata["_collection_name"] = self.collection_name
+                all_results.append(
+                    {
+                        "content": point.payload.get(vector_store.content_payload_key, ""),
+                        "score": float(point.score),
+                        "citationType": "vectordb|document",
+                        "metadata": metadata,
+                    }
+                )
+
+        return all_results
+
+    async def _embed_dense_queries(
+        self, queries: List[str], dense_embeddings: Embeddings, model_name: Optional[str]
+    ) -> List[List[float]]:
+        """
+        Dense query vectors, served from the cache when possible
+
+        Queries go through aembed_query: asymmetric models embed them
+        differently from documents (Cohere search_query, Gemini
+        RETRIEVAL_QUERY).
+        """
+
+        async def _embed(texts: List[str]) -> List[List[float]]:
+            return list(
+                await asyncio.gather(*(dense_embeddings.aembed_query(text) for text in texts))
+            )
+
+        if not self.embedding_cache:
+            return await _embed(queries)
+        cache_model_name = self.get_embedding_model_name(dense_embeddings) or model_name
+        return await self.embedding_cache.get_or_embed(
+            f"dense_query:{cache_model_name}", queries, _embed
+        )
+
+    async def _embed_sparse_queries(self, queries: List[str]) -> List[Dict[str, List]]:
+        """BM25 query vectors as indices/values dicts, computed off the event loop"""
+
+        def _embed(texts: List[str]) -> List[Dict[str, List]]:
+            vectors = []
+            for text in texts:
+                sparse = self.sparse_embeddings.embed_query(text)
+                vectors.append(
+                    {"indices": list(sparse.indices), "values": list(sparse.values)}
+                )
+            return vectors
+
+        async def _embed_off_loop(texts: List[str]) -> List[Dict[str, List]]:
+            return await asyncio.to_thread(_embed, texts)
+
+        if not self.embedding_cache:
+            return await _embed_off_loop(queries)
+        sparse_model_name = getattr(self.sparse_embeddings, "model_name", "Qdrant/BM25")
+        return await self.embedding_cache.get_or_embed(
+            f"sparse:{sparse_model_name}", queries, _embed_off_loop
+        )
+
+    async def _execute_parallel_searches(self, queries, qdrant_filter, limit, vector_store) -> List[Dict[str, Any]]:
+        """Execute the same hybrid requests as the batched path, one Qdrant call per query in parallel"""
+        requests = await self._build_hybrid_requests(queries, qdrant_filter, limit, vector_store)
+
+        start_time = time.monotonic()
+        responses = await asyncio.gather(
+            *(
+                asyncio.to_thread(
+                    self.qdrant_client.query_points,
+                    collection_name=self.collection_name,
+                    prefetch=request.prefetch,
+                    query=request.query,
+                    query_filter=request.filter,
+                    limit=request.limit,
+                    with_payload=True,
+                )
+                for request in requests
+            )
+        )
+        elapsed = time.monotonic() - start_time
+        self.logger.debug(f"VectorDB lookup for {len(requests)} queries took {elapsed:.3f} seconds.")
 
-        return self._format_results(all_results)
+        return self._format_points(responses, vector_store)
 
 
     def _create_empty_response(self, message: str) -> Dict[str, Any]:
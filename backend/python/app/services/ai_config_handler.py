@@ -111,6 +111,9 @@ class RetrievalAiConfigHandler:
         try:
             self.logger.info("📥 Processing embedding model configured event")
 
+            # Drop the cached model and vector store, then warm up the new ones
+            self.retrieval_service.model_registry.invalidate()
+            self.retrieval_service.vector_store = None
             await self.retrieval_service.get_embedding_model_instance()
             self.logger.info("✅ Successfully updated embedding model in all services")
             return True
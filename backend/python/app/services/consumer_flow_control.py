@@ -0,0 +1,153 @@
+"""Flow control helpers for the batched record-events consumer
+
+* PartitionOffsetTracker computes, per partition, the highest offset that can
+  be committed: every message before it has finished processing, even when
+  messages complete out of order.
+* AdaptiveConcurrencyLimiter bounds how many messages are processed at once
+  and moves that bound between a minimum and a maximum (AIMD) based on CPU,
+  memory and the observed per-message processing latency.
+"""
+
+import asyncio
+import time
+from collections import defaultdict
+from typing import Any, Dict, Hashable, Iterable, Optional, Set
+
+import psutil
+
+
+class PartitionOffsetTracker:
+    """Tracks in-flight offsets per partition to commit only finished work"""
+
+    def __init__(self) -> None:
+        self._pending: Dict[Hashable, Set[int]] = defaultdict(set)
+        self._highest_done: Dict[Hashable, int] = {}
+        self._committed: Dict[Hashable, int] = {}
+
+    def begin(self, partition: Hashable, offset: int) -> None:
+        self._pending[partition].add(offset)
+
+    def complete(self, partition: Hashable, offset: int) -> None:
+        self._pending[partition].discard(offset)
+        if offset > self._highest_done.get(partition, -1):
+            self._highest_done[partition] = offset
+
+    def committable(self) -> Dict[Hashable, int]:
+        """Next offset to commit per partition, for partitions that advanced"""
+        offsets = {}
+        for partition, highest_done in self._highest_done.items():
+            pending = self._pending.get(partition)
+            next_offset = min(pending) if pending else highest_done + 1
+            if next_offset > self._committed.get(partition, -1):
+                offsets[partition] = next_offset
+        return offsets
+
+    def mark_committed(self, offsets: Dict[Hashable, int]) -> None:
+        self._committed.update(offsets)
+
+    def forget(self, partitions: Iterable[Hashable]) -> None:
+        """Drop state of partitions that are no longer assigned"""
+        for partition in partitions:
+            self._pending.pop(partition, None)
+            self._highest_done.pop(partition, None)
+            self._committed.pop(partition, None)
+
+    def in_flight(self) -> int:
+        return sum(len(offsets) for offsets in self._pending.values())
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limit that grows while resources are idle and backs off under pressure"""
+
+    def __init__(
+        self,
+        logger,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        cpu_high_percent: float = 85.0,
+        memory_high_percent: float = 85.0,
+        latency_factor: float = 2.0,
+        adjust_interval_seconds: float = 5.0,
+    ) -> None:
+        self.logger = logger
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = min(max(initial, self.minimum), self.maximum)
+        self.cpu_high_percent = cpu_high_percent
+        self.memory_high_percent = memory_high_percent
+        self.latency_factor = latency_factor
+        self.adjust_interval_seconds = adjust_interval_seconds
+
+        self.in_flight = 0
+        self.latency_ewma: Optional[float] = None
+        self.baseline_latency: Optional[float] = None
+        self._saturated = False
+        self._last_adjust = time.monotonic()
+        self._condition = asyncio.Condition()
+        # Prime psutil so the first reading covers the interval since startup
+        psutil.cpu_percent(interval=None)
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+            if self.in_flight >= self.limit:
+                self._saturated = True
+
+    async def release(self, latency_seconds: Optional[float] = None) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            if latency_seconds is not None:
+                self._observe_latency(latency_seconds)
+            self._maybe_adjust()
+            self._condition.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "limit": self.limit,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "inFlight": self.in_flight,
+            "latencyEwmaSeconds": round(self.latency_ewma or 0.0, 3),
+            "baselineLatencySeconds": round(self.baseline_latency or 0.0, 3),
+        }
+
+    def _observe_latency(self, latency_seconds: float) -> None:
+        if self.latency_ewma is None:
+            self.latency_ewma = latency_seconds
+        else:
+            self.latency_ewma = 0.8 * self.latency_ewma + 0.2 * latency_seconds
+        if self.baseline_latency is None or self.latency_ewma < self.baseline_latency:
+            self.baseline_latency = self.latency_ewma
+        else:
+            # Let the baseline drift up slowly so a changed workload is not penalized forever
+            self.baseline_latency *= 1.01
+
+    def _maybe_adjust(self) -> None:
+        now = time.monotonic()
+        if now - self._last_adjust < self.adjust_interval_seconds:
+            return
+        self._last_adjust = now
+
+        cpu_percent = psutil.cpu_percent(interval=None)
+        memory_percent = psutil.virtual_memory().percent
+        latency_degraded = (
+            self.latency_ewma is not None
+            and self.baseline_latency
+            and self.latency_ewma > self.latency_factor * self.baseline_latency
+        )
+
+        previous = self.limit
+        if cpu_percent > self.cpu_high_percent or memory_percent > self.memory_high_percent or latency_degraded:
+            self.limit = max(self.minimum, int(self.limit * 0.75))
+        elif self._saturated and cpu_percent < self.cpu_high_percent - 20:
+            self.limit = min(self.maximum, self.limit + 1)
+        self._saturated = self.in_flight >= self.limit
+
+        if self.limit != previous:
+            self.logger.info(
+                f"Consumer concurrency {previous} -> {self.limit} "
+                f"(cpu {cpu_percent:.0f}%, memory {memory_percent:.0f}%, "
+                f"latency {self.latency_ewma or 0:.2f}s vs baseline {self.baseline_latency or 0:.2f}s)"
+            )
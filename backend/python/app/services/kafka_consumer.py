@@ -1,7 +1,9 @@
 import asyncio
 import json
+import os
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Set
+from typing import Any, Dict, List, Optional, Set
 
 import aiohttp
 from aiokafka import AIOKafkaConsumer
@@ -22,59 +24,85 @@ from app.config.utils.named_constants.arangodb_constants import (
 )
 from app.config.utils.named_constants.http_status_code_constants import HttpStatusCode
 from app.exceptions.indexing_exceptions import IndexingError
+from app.services.consumer_flow_control import (
+    AdaptiveConcurrencyLimiter,
+    PartitionOffsetTracker,
+)
 
-# Concurrency control settings
-MAX_CONCURRENT_TASKS = 5  # Maximum number of messages to process concurrently
-RATE_LIMIT_PER_SECOND = 2  # Maximum number of new tasks to start per second
+# Records fetched per poll
+KAFKA_MAX_POLL_RECORDS = int(os.getenv("KAFKA_MAX_POLL_RECORDS", "100"))
+# Messages processed concurrently: starts at the initial value and adapts
+# between min and max to CPU, memory and processing latency
+KAFKA_INITIAL_CONCURRENCY = int(os.getenv("KAFKA_INITIAL_CONCURRENCY", "5"))
+KAFKA_MIN_CONCURRENCY = int(os.getenv("KAFKA_MIN_CONCURRENCY", "2"))
+KAFKA_MAX_CONCURRENCY = int(
+    os.getenv("KAFKA_MAX_CONCURRENCY", str(max(4, (os.cpu_count() or 2) * 2)))
+)
+# Processing a message can take minutes for large documents
+KAFKA_MAX_POLL_INTERVAL_MS = int(os.getenv("KAFKA_MAX_POLL_INTERVAL_MS", "900000"))
 
 
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=15))
-async def make_api_call(signed_url_route: str, token: str) -> dict:
+async def make_api_call(
+    session: aiohttp.ClientSession, signed_url_route: str, token: str
+) -> dict:
     """
     Make an API call with the JWT token.
 
     Args:
+        session (aiohttp.ClientSession): Shared connection-pooled session
         signed_url_route (str): The route to send the request to
         token (str): The JWT token to use for authentication
 
     Returns:
         dict: The response from the API
     """
-    try:
-        async with aiohttp.ClientSession() as session:
-            url = signed_url_route
-
-            # Add the JWT to the Authorization header
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json",
-            }
-
-            # Make the request
-            async with session.get(url, headers=headers) as response:
-                content_type = response.headers.get("Content-Type", "").lower()
-
-                if response.status == HttpStatusCode.SUCCESS.value and "application/json" in content_type:
-                    data = await response.json()
-                    return {"is_json": True, "data": data}
-                else:
-                    data = await response.read()
-                    return {"is_json": False, "data": data}
-    except Exception:
-        raise
+    # Add the JWT to the Authorization header
+    headers = {
+        "Authorization": f"Bearer {token}",
+        "Content-Type": "application/json",
+    }
+
+    # Make the request
+    async with session.get(signed_url_route, headers=headers) as response:
+        content_type = response.headers.get("Content-Type", "").lower()
+
+        if response.status == HttpStatusCode.SUCCESS.value and "application/json" in content_type:
+            data = await response.json()
+            return {"is_json": True, "data": data}
+        else:
+            data = await response.read()
+            return {"is_json": False, "data": data}
 
 
 class KafkaConsumerManager:
-    def __init__(self, logger, config_service: ConfigurationService, event_processor, redis_scheduler) -> None:
+    def __init__(
+        self,
+        logger,
+        config_service: ConfigurationService,
+        event_processor,
+        redis_scheduler,
+        http_session: aiohttp.ClientSession,
+    ) -> None:
         self.logger = logger
         self.consumer = None
         self.running = False
         self.event_processor = event_processor
         self.config_service = config_service
+        self.http_session = http_session
         # Concurrency control
-        self.semaphore = asyncio.Semaphore(MAX_CONCURRENT_TASKS)
+        self.concurrency = AdaptiveConcurrencyLimiter(
+            logger,
+            initial=KAFKA_INITIAL_CONCURRENCY,
+            minimum=KAFKA_MIN_CONCURRENCY,
+            maximum=KAFKA_MAX_CONCURRENCY,
+        )
         self.active_tasks: Set[asyncio.Task] = set()
-        self.rate_limiter = RateLimiter(RATE_LIMIT_PER_SECOND)
+        # Last task per recordId, so events of a record are processed in order
+        self.record_tasks: Dict[str, asyncio.Task] = {}
+        # Offsets are committed only once every earlier message has been processed
+        self.offset_tracker = PartitionOffsetTracker()
+        self.committed_count = 0
 
         # Message tracking
         self.processed_messages: Dict[str, List[int]] = {}
@@ -95,7 +123,8 @@ class KafkaConsumerManager:
                     "bootstrap_servers": ",".join(brokers),  # aiokafka uses bootstrap_servers
                     "group_id": "record_consumer_group",
                     "auto_offset_reset": "earliest",
-                    "enable_auto_commit": True,
+                    "enable_auto_commit": False,
+                    "max_poll_interval_ms": KAFKA_MAX_POLL_INTERVAL_MS,
                     "client_id": KafkaConfig.CLIENT_ID_MAIN.value,
                 }
 
@@ -118,27 +147,54 @@ class KafkaConsumerManager:
             )
             raise
 
-    async def process_message_wrapper(self, message) -> bool | None:
-        """Wrapper to handle async task cleanup and semaphore release"""
+    async def process_message_wrapper(
+        self, topic_partition, message, previous_task: Optional[asyncio.Task] = None
+    ) -> bool | None:
+        """Wrapper to handle ordering, offset tracking and concurrency slot release
+
+        A message queued behind previous_task takes its concurrency slot only
+        once that task is done; otherwise the slot was taken by
+        start_processing_task.
+        """
         # Extract message identifiers for logging
         topic = message.topic
         partition = message.partition
         offset = message.offset
         message_id = f"{topic}-{partition}-{offset}"
+        start_time = time.monotonic()
+        finished = False
+        holds_slot = previous_task is None
 
         try:
+            # Wait for the previous event of the same record
+            if previous_task is not None:
+                if not previous_task.done():
+                    await asyncio.wait([previous_task])
+                await self.concurrency.acquire()
+                holds_slot = True
+
             self.logger.info(f"Starting to process message: {message_id}")
+            start_time = time.monotonic()
             success = await self._process_message(message)
+            finished = True
             self.logger.info(
                 f"Finished processing message {message_id}: {'Success' if success else 'Failed'}"
             )
             return success
+        except asyncio.CancelledError:
+            # Not committed, the message is redelivered after a restart
+            raise
         except Exception as e:
+            # Failures are recorded on the record by _process_message
+            finished = True
             self.logger.error(f"Error in process_message_wrapper for {message_id}: {e}")
             return False
         finally:
-            # Release the semaphore to allow a new task to start
-            self.semaphore.release()
+            if finished:
+                self.offset_tracker.complete(topic_partition, offset)
+            # Release the concurrency slot to allow a new task to start
+            if holds_slot:
+                await self.concurrency.release(time.monotonic() - start_time)
 
     async def _process_message(self, message) -> bool | None:
         start_time = datetime.now()
@@ -196,7 +252,19 @@ class KafkaConsumerManager:
             # Handle delete event
             if event_type == EventTypes.DELETE_RECORD.value:
                 self.logger.info(f"🗑️ Deleting embeddings for record {record_id}")
-                await self.event_processor.processor.indexing_pipeline.delete_embeddings(record_id, virtual_record_id)
+                await self.event_processor.processor.indexing_pipeline.delete_embeddings(
+                    record_id, virtual_record_id, org_id=payload_data.get("orgId")
+                )
+                return True
+
+            # Refresh the permission principals payload of the record's points;
+            # records not indexed yet get theirs when their embeddings are created
+            if event_type == EventTypes.UPDATE_PERMISSIONS.value:
+                if virtual_record_id:
+                    self.logger.info(f"🔐 Updating permission principals for record {record_id}")
+                    await self.event_processor.processor.indexing_pipeline.set_permission_principals(
+                        virtual_record_id, record_id=record_id
+                    )
                 return True
 
             if event_type == EventTypes.UPDATE_RECORD.value:
@@ -304,7 +372,7 @@ class KafkaConsumerManager:
                     self.logger.debug(f"Generated JWT token for message {message_id}")
 
                     response = await make_api_call(
-                        payload_data["signedUrlRoute"], token
+                        self.http_session, payload_data["signedUrlRoute"], token
                     )
                     self.logger.debug(
                         f"Received signed URL response for message {message_id}"
@@ -383,26 +451,93 @@ class KafkaConsumerManager:
             if task.exception():
                 self.logger.error(f"Task completed with exception: {task.exception()}")
 
-    async def start_processing_task(self, message) -> None:
-        """Start a new task for processing a message with semaphore control"""
-        # Wait for the rate limiter
-        await self.rate_limiter.wait()
-
-        # Wait for a semaphore slot to become available
-        await self.semaphore.acquire()
+    def _ordering_key(self, message) -> str:
+        """recordId of a message (the producer's message key), used to keep its events ordered"""
+        if message.key:
+            return message.key.decode("utf-8") if isinstance(message.key, bytes) else str(message.key)
+        try:
+            value = message.value
+            if isinstance(value, bytes):
+                value = value.decode("utf-8")
+            data = json.loads(value)
+            if isinstance(data, str):
+                data = json.loads(data)
+            record_id = data.get("payload", {}).get("recordId")
+            if record_id:
+                return str(record_id)
+        except Exception:
+            pass
+        return f"{message.topic}-{message.partition}-{message.offset}"
+
+    async def start_processing_task(self, topic_partition, message) -> None:
+        """Start a new task for processing a message with concurrency control"""
+        record_key = self._ordering_key(message)
+        previous_task = self.record_tasks.get(record_key)
+        if previous_task is not None and previous_task.done():
+            previous_task = None
+
+        # Wait for a concurrency slot to become available. An event queued
+        # behind an earlier event of its record takes its slot once that one
+        # is done, so a burst of events for one record does not fill every
+        # slot with idle waiters
+        if previous_task is None:
+            await self.concurrency.acquire()
 
         # Create and start a new task
-        task = asyncio.create_task(self.process_message_wrapper(message))
+        self.offset_tracker.begin(topic_partition, message.offset)
+        task = asyncio.create_task(
+            self.process_message_wrapper(topic_partition, message, previous_task)
+        )
         self.active_tasks.add(task)
+        self.record_tasks[record_key] = task
+        task.add_done_callback(
+            lambda done, key=record_key: self._release_record_task(key, done)
+        )
 
         # Clean up completed tasks
         self.cleanup_completed_tasks()
 
         # Log current task count
         self.logger.debug(
-            f"Active tasks: {len(self.active_tasks)}/{MAX_CONCURRENT_TASKS}"
+            f"Active tasks: {len(self.active_tasks)}/{self.concurrency.limit}"
         )
 
+    def _release_record_task(self, record_key: str, task: asyncio.Task) -> None:
+        """Forget the last task of a record once it is done and no newer event is queued"""
+        if self.record_tasks.get(record_key) is task:
+            del self.record_tasks[record_key]
+
+    async def commit_processed_offsets(self) -> None:
+        """Commit offsets up to the first message that is still being processed"""
+        offsets = self.offset_tracker.committable()
+        if not offsets:
+            return
+        assigned = self.consumer.assignment()
+        revoked = [tp for tp in offsets if tp not in assigned]
+        if revoked:
+            # Another consumer owns these partitions now and will redeliver
+            self.offset_tracker.forget(revoked)
+            offsets = {tp: offset for tp, offset in offsets.items() if tp in assigned}
+            if not offsets:
+                return
+        try:
+            await self.consumer.commit(offsets)
+            self.offset_tracker.mark_committed(offsets)
+            self.committed_count += 1
+            self.logger.debug(f"Committed offsets: {offsets}")
+        except Exception as e:
+            self.logger.warning(f"Failed to commit offsets {offsets}: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Concurrency and offset tracking state of the consumer"""
+        return {
+            "concurrency": self.concurrency.stats(),
+            "activeTasks": len(self.active_tasks),
+            "uncommittedMessages": self.offset_tracker.in_flight(),
+            "commits": self.committed_count,
+            "maxPollRecords": KAFKA_MAX_POLL_RECORDS,
+        }
+
     async def consume_messages(self) -> None:
         """Main consumption loop."""
         start_time = datetime.now()
@@ -414,9 +549,12 @@ class KafkaConsumerManager:
             while self.running:
                 try:
                     # Get messages asynchronously with timeout
-                    message_batch = await self.consumer.getmany(timeout_ms=100, max_records=1)
+                    message_batch = await self.consumer.getmany(
+                        timeout_ms=100, max_records=KAFKA_MAX_POLL_RECORDS
+                    )
 
                     if not message_batch:
+                        await self.commit_processed_offsets()
                         await asyncio.sleep(0.1)
                         continue
 
@@ -424,7 +562,7 @@ class KafkaConsumerManager:
                     for topic_partition, messages in message_batch.items():
                         for message in messages:
                             try:
-                                await self.start_processing_task(message)
+                                await self.start_processing_task(topic_partition, message)
                                 processed_count += 1
 
                                 # Log statistics periodically
@@ -443,6 +581,8 @@ class KafkaConsumerManager:
                                 self.logger.error(f"Error starting processing task: {e}")
                                 continue
 
+                    await self.commit_processed_offsets()
+
                 except asyncio.CancelledError:
                     self.logger.info("Kafka consumer task cancelled")
                     break
@@ -473,6 +613,11 @@ class KafkaConsumerManager:
                 )
                 await asyncio.gather(*self.active_tasks, return_exceptions=True)
 
+            try:
+                await self.commit_processed_offsets()
+            except Exception as e:
+                self.logger.error(f"Error committing final offsets: {e}")
+
             await self._cleanup()
 
     async def _cleanup(self) -> None:
@@ -570,7 +715,7 @@ class KafkaConsumerManager:
                                 self.logger.debug(f"Generated JWT token for record {record_id}")
 
                                 response = await make_api_call(
-                                    payload_data["signedUrlRoute"], token
+                                    self.http_session, payload_data["signedUrlRoute"], token
                                 )
                                 self.logger.debug(
                                     f"Received signed URL response for record {record_id}"
@@ -708,35 +853,3 @@ class KafkaConsumerManager:
                 f"❌ Error cleaning up IN_PROGRESS documents: {str(e)}"
             )
 
-
-class RateLimiter:
-    """Simple rate limiter to control how many tasks start per second"""
-
-    def __init__(self, rate_limit_per_second) -> None:
-        self.rate = rate_limit_per_second
-        self.last_check = datetime.now()
-        self.tokens = rate_limit_per_second
-        self.lock = asyncio.Lock()
-
-    async def wait(self) -> None:
-        """Wait until a token is available"""
-        async with self.lock:
-            while True:
-                now = datetime.now()
-                time_passed = (now - self.last_check).total_seconds()
-
-                # Add new tokens based on time passed
-                self.tokens += time_passed * self.rate
-                self.last_check = now
-
-                # Cap tokens at the maximum rate
-                if self.tokens > self.rate:
-                    self.tokens = self.rate
-
-                if self.tokens >= 1:
-                    # Consume a token
-                    self.tokens -= 1
-                    break
-
-                # Wait for some tokens to accumulate
-                await asyncio.sleep(1.0 / self.rate)
@@ -58,6 +58,8 @@ from app.connectors.sources.google.google_drive.drive_webhook_handler import (
     IndividualDriveWebhookHandler,
 )
 from app.connectors.utils.rate_limiter import GoogleAPIRateLimiter
+from app.core.accessible_records_cache import AccessibleRecordsCacheInvalidator
+from app.core.arango_executor import create_arango_http_client
 from app.core.celery_app import CeleryApp
 from app.core.signed_url import SignedUrlConfig, SignedUrlHandler
 from app.modules.parsers.google_files.google_docs_parser import GoogleDocsParser
@@ -598,7 +600,7 @@ class AppContainer(containers.DeclarativeContainer):
             config_node_constants.ARANGODB.value
         )
         hosts = arangodb_config["url"]
-        return ArangoClient(hosts=hosts)
+        return ArangoClient(hosts=hosts, http_client=create_arango_http_client())
 
     async def _create_redis_client(config_service) -> Redis:
         """Async method to initialize RedisClient."""
@@ -637,12 +639,20 @@ class AppContainer(containers.DeclarativeContainer):
         arango_service=arango_service,
     )
 
+    # Invalidates the query service's accessible records cache
+    accessible_records_invalidator = providers.Singleton(
+        AccessibleRecordsCacheInvalidator,
+        logger=logger,
+        redis_client=redis_client,
+    )
+
     # Change Handlers
     drive_change_handler = providers.Singleton(
         DriveChangeHandler,
         logger=logger,
         config_service=config_service,
         arango_service=arango_service,
+        cache_invalidator=accessible_records_invalidator,
     )
 
     gmail_change_handler = providers.Singleton(
@@ -650,6 +660,7 @@ class AppContainer(containers.DeclarativeContainer):
         logger=logger,
         config_service=config_service,
         arango_service=arango_service,
+        cache_invalidator=accessible_records_invalidator,
     )
 
     # Celery and Tasks
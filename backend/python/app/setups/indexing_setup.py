@@ -6,6 +6,7 @@ from arango import ArangoClient
 from dependency_injector import containers, providers
 from dotenv import load_dotenv
 from qdrant_client import QdrantClient
+from redis import asyncio as aioredis
 from redis.asyncio import Redis
 from redis.exceptions import RedisError
 
@@ -19,7 +20,13 @@ from app.config.utils.named_constants.arangodb_constants import (
     QdrantCollectionNames,
 )
 from app.config.utils.named_constants.http_status_code_constants import HttpStatusCode
+from app.core.accessible_records_cache import CoalescingAccessibleRecordsInvalidator
 from app.core.ai_arango_service import ArangoService
+from app.core.answer_cache import AnswerCacheInvalidator
+from app.core.arango_executor import create_arango_http_client
+from app.core.http_client import http_session_resource
+from app.core.parse_result_cache import ParseResultCache
+from app.core.parsing_pool import parsing_pool_resource
 from app.core.redis_scheduler import RedisScheduler
 from app.events.events import EventProcessor
 from app.events.processor import Processor
@@ -27,14 +34,10 @@ from app.modules.extraction.domain_extraction import DomainExtractor
 from app.modules.indexing.run import IndexingPipeline
 from app.modules.parsers.csv.csv_parser import CSVParser
 from app.modules.parsers.docx.docparser import DocParser
-from app.modules.parsers.docx.docx_parser import DocxParser
 from app.modules.parsers.excel.excel_parser import ExcelParser
 from app.modules.parsers.excel.xls_parser import XLSParser
-from app.modules.parsers.html_parser.html_parser import HTMLParser
-from app.modules.parsers.markdown.markdown_parser import MarkdownParser
 from app.modules.parsers.markdown.mdx_parser import MDXParser
 from app.modules.parsers.pptx.ppt_parser import PPTParser
-from app.modules.parsers.pptx.pptx_parser import PPTXParser
 from app.services.kafka_consumer import KafkaConsumerManager
 from app.utils.logger import create_logger
 
@@ -62,7 +65,7 @@ class AppContainer(containers.DeclarativeContainer):
     async def _create_arango_client(config_service) -> ArangoClient:
         """Async factory method to initialize ArangoClient."""
         hosts = await AppContainer._fetch_arango_host(config_service)
-        return ArangoClient(hosts=hosts)
+        return ArangoClient(hosts=hosts, http_client=create_arango_http_client())
 
     arango_client = providers.Resource(
         _create_arango_client, config_service=config_service
@@ -115,8 +118,44 @@ class AppContainer(containers.DeclarativeContainer):
         qdrant_config=qdrant_config,
     )
 
+    # Shared connection-pooled HTTP session, closed on container shutdown
+    http_session = providers.Resource(http_session_resource, logger=logger)
+
+    async def _create_redis_client(config_service) -> Redis:
+        """Async factory method to initialize the Redis client."""
+        redis_config = await config_service.get_config(
+            config_node_constants.REDIS.value
+        )
+        url = f"redis://{redis_config['host']}:{redis_config['port']}/{RedisConfig.REDIS_DB.value}"
+        return await aioredis.from_url(url, encoding="utf-8", decode_responses=True)
+
+    redis_client = providers.Resource(
+        _create_redis_client, config_service=config_service
+    )
+
+    # Invalidates the query service's cached answers
+    answer_cache_invalidator = providers.Singleton(
+        AnswerCacheInvalidator,
+        logger=logger,
+        redis_client=redis_client,
+    )
+
+    # Invalidates the query service's accessible records cache
+    accessible_records_invalidator = providers.Singleton(
+        CoalescingAccessibleRecordsInvalidator,
+        logger=logger,
+        redis_client=redis_client,
+    )
+
     # Indexing pipeline
-    async def _create_indexing_pipeline(logger, config_service, arango_service, qdrant_client) -> IndexingPipeline:
+    async def _create_indexing_pipeline(
+        logger,
+        config_service,
+        arango_service,
+        qdrant_client,
+        answer_cache_invalidator,
+        accessible_records_invalidator,
+    ) -> IndexingPipeline:
         """Async factory for IndexingPipeline"""
         pipeline = IndexingPipeline(
             logger=logger,
@@ -124,6 +163,8 @@ class AppContainer(containers.DeclarativeContainer):
             arango_service=arango_service,
             collection_name=QdrantCollectionNames.RECORDS.value,
             qdrant_client=qdrant_client,
+            answer_cache_invalidator=answer_cache_invalidator,
+            accessible_records_invalidator=accessible_records_invalidator,
         )
         return pipeline
 
@@ -133,12 +174,14 @@ class AppContainer(containers.DeclarativeContainer):
         config_service=config_service,
         arango_service=arango_service,
         qdrant_client=qdrant_client,
+        answer_cache_invalidator=answer_cache_invalidator,
+        accessible_records_invalidator=accessible_records_invalidator,
     )
 
     # Domain extraction service - depends on arango_service
-    async def _create_domain_extractor(logger, arango_service, config_service) -> DomainExtractor:
+    async def _create_domain_extractor(logger, arango_service, config_service, http_session) -> DomainExtractor:
         """Async factory for DomainExtractor"""
-        extractor = DomainExtractor(logger, arango_service, config_service)
+        extractor = DomainExtractor(logger, arango_service, config_service, http_session)
         # Add any necessary async initialization
         return extractor
 
@@ -147,18 +190,16 @@ class AppContainer(containers.DeclarativeContainer):
         logger=logger,
         arango_service=arango_service,
         config_service=config_service,
+        http_session=http_session,
     )
 
-    # Parsers
+    # Parsers used in the service process; DOCX, PPTX, HTML and Markdown
+    # parsing happen in the parsing pool workers
     async def _create_parsers(logger) -> dict:
         """Async factory for Parsers"""
         parsers = {
-            ExtensionTypes.DOCX.value: DocxParser(),
             ExtensionTypes.DOC.value: DocParser(),
-            ExtensionTypes.PPTX.value: PPTXParser(),
             ExtensionTypes.PPT.value: PPTParser(),
-            ExtensionTypes.HTML.value: HTMLParser(),
-            ExtensionTypes.MD.value: MarkdownParser(),
             ExtensionTypes.MDX.value: MDXParser(),
             ExtensionTypes.CSV.value: CSVParser(),
             ExtensionTypes.XLSX.value: ExcelParser(logger),
@@ -168,6 +209,11 @@ class AppContainer(containers.DeclarativeContainer):
 
     parsers = providers.Resource(_create_parsers, logger=logger)
 
+    # Worker processes for CPU-bound parsing and OCR
+    parsing_pool = providers.Resource(parsing_pool_resource, logger=logger)
+    # Content-addressed OCR and parsing results
+    parse_cache = providers.Singleton(ParseResultCache, logger=logger)
+
     # Processor - depends on domain_extractor, indexing_pipeline, and arango_service
     async def _create_processor(
         logger,
@@ -176,6 +222,8 @@ class AppContainer(containers.DeclarativeContainer):
         indexing_pipeline,
         arango_service,
         parsers,
+        parsing_pool,
+        parse_cache,
     ) -> Processor:
         """Async factory for Processor"""
         processor = Processor(
@@ -185,6 +233,8 @@ class AppContainer(containers.DeclarativeContainer):
             indexing_pipeline=indexing_pipeline,
             arango_service=arango_service,
             parsers=parsers,
+            parsing_pool=parsing_pool,
+            parse_cache=parse_cache,
         )
         # Add any necessary async initialization
         return processor
@@ -197,13 +247,18 @@ class AppContainer(containers.DeclarativeContainer):
         indexing_pipeline=indexing_pipeline,
         arango_service=arango_service,
         parsers=parsers,
+        parsing_pool=parsing_pool,
+        parse_cache=parse_cache,
     )
 
     # Event processor - depends on processor
-    async def _create_event_processor(logger, processor, arango_service) -> EventProcessor:
+    async def _create_event_processor(logger, processor, arango_service, http_session) -> EventProcessor:
         """Async factory for EventProcessor"""
         event_processor = EventProcessor(
-            logger=logger, processor=processor, arango_service=arango_service
+            logger=logger,
+            processor=processor,
+            arango_service=arango_service,
+            http_session=http_session,
         )
         # Add any necessary async initialization
         return event_processor
@@ -213,6 +268,7 @@ class AppContainer(containers.DeclarativeContainer):
         logger=logger,
         processor=processor,
         arango_service=arango_service,
+        http_session=http_session,
     )
 
     # Redis scheduler
@@ -231,13 +287,14 @@ class AppContainer(containers.DeclarativeContainer):
     )
 
     # Kafka consumer with async initialization
-    async def _create_kafka_consumer(logger, config_service, event_processor, redis_scheduler) -> KafkaConsumerManager:
+    async def _create_kafka_consumer(logger, config_service, event_processor, redis_scheduler, http_session) -> KafkaConsumerManager:
         """Async factory for KafkaConsumerManager"""
         consumer = KafkaConsumerManager(
             logger=logger,
             config_service=config_service,
             event_processor=event_processor,
             redis_scheduler=redis_scheduler,
+            http_session=http_session,
         )
         # Add any necessary async initialization
         return consumer
@@ -248,6 +305,7 @@ class AppContainer(containers.DeclarativeContainer):
         config_service=config_service,
         event_processor=event_processor,
         redis_scheduler=redis_scheduler,
+        http_session=http_session,
     )
 
     # Wire everything up
@@ -1,9 +1,19 @@
 from arango import ArangoClient
 from dependency_injector import containers, providers
 from qdrant_client import QdrantClient
-
-from app.config.configuration_service import ConfigurationService, config_node_constants
+from redis import asyncio as aioredis
+from redis.asyncio import Redis
+
+from app.config.configuration_service import (
+    ConfigurationService,
+    RedisConfig,
+    config_node_constants,
+)
 from app.config.utils.named_constants.arangodb_constants import QdrantCollectionNames
+from app.core.accessible_records_cache import AccessibleRecordsCache
+from app.core.answer_cache import AnswerCache
+from app.core.arango_executor import create_arango_http_client
+from app.core.embedding_cache import EmbeddingCache
 from app.modules.reranker.reranker import RerankerService
 from app.modules.retrieval.retrieval_arango import ArangoService
 from app.modules.retrieval.retrieval_service import RetrievalService
@@ -32,7 +42,7 @@ class AppContainer(containers.DeclarativeContainer):
     async def _create_arango_client(config_service) -> ArangoClient:
         """Async factory method to initialize ArangoClient."""
         hosts = await AppContainer._fetch_arango_host(config_service)
-        return ArangoClient(hosts=hosts)
+        return ArangoClient(hosts=hosts, http_client=create_arango_http_client())
 
     arango_client = providers.Resource(
         _create_arango_client, config_service=config_service
@@ -52,6 +62,32 @@ class AppContainer(containers.DeclarativeContainer):
         config=config_service,
     )
 
+    async def _create_redis_client(config_service) -> Redis:
+        """Async factory method to initialize the Redis client."""
+        redis_config = await config_service.get_config(
+            config_node_constants.REDIS.value
+        )
+        url = f"redis://{redis_config['host']}:{redis_config['port']}/{RedisConfig.REDIS_DB.value}"
+        return await aioredis.from_url(url, encoding="utf-8", decode_responses=True)
+
+    redis_client = providers.Resource(
+        _create_redis_client, config_service=config_service
+    )
+
+    # Per-user accessible records cache, invalidated through Redis generations
+    accessible_records_cache = providers.Singleton(
+        AccessibleRecordsCache,
+        logger=logger,
+        redis_client=redis_client,
+    )
+
+    # Semantic cache of chat answers, invalidated through Redis generations
+    answer_cache = providers.Singleton(
+        AnswerCache,
+        logger=logger,
+        redis_client=redis_client,
+    )
+
     # Vector search service
     async def _get_qdrant_config(config_service: ConfigurationService) -> dict:
         """Async factory method to get Qdrant configuration."""
@@ -85,14 +121,25 @@ class AppContainer(containers.DeclarativeContainer):
         qdrant_config=qdrant_config,
     )
 
+    # Query embedding cache, optionally shared between replicas through Redis
+    embedding_cache = providers.Singleton(
+        EmbeddingCache,
+        logger=logger,
+        redis_client=redis_client,
+    )
+
     # Vector search service
-    async def _create_retrieval_service(config_service, logger, qdrant_client) -> RetrievalService:
+    async def _create_retrieval_service(
+        config_service, logger, qdrant_client, accessible_records_cache, embedding_cache
+    ) -> RetrievalService:
         """Async factory for RetrievalService"""
         service = RetrievalService(
             logger=logger,
             config_service=config_service,
             collection_name=QdrantCollectionNames.RECORDS.value,
             qdrant_client=qdrant_client,
+            accessible_records_cache=accessible_records_cache,
+            embedding_cache=embedding_cache,
         )
         return service
 
@@ -101,6 +148,8 @@ class AppContainer(containers.DeclarativeContainer):
         config_service=config_service,
         logger=logger,
         qdrant_client=qdrant_client,
+        accessible_records_cache=accessible_records_cache,
+        embedding_cache=embedding_cache,
     )
 
     llm_config_handler = providers.Singleton(
@@ -110,7 +159,9 @@ class AppContainer(containers.DeclarativeContainer):
         retrieval_service=retrieval_service,
     )
 
+    # Cross-encoder scoring runs micro-batched on its own worker thread
     reranker_service = providers.Singleton(
         RerankerService,
         model_name="BAAI/bge-reranker-base",  # Choose model based on speed/accuracy needs
+        logger=logger,
     )
@@ -59,50 +59,56 @@ def fix_json_string(json_str) -> str:
 
 
 
+CITATION_RE = re.compile(r"\[(\d+)\]")
+
+
+class CitationTracker:
+    """
+    Incremental normalize_citations_and_chunks for streamed answers.
+
+    Keeps the mapping from the LLM's citation numbers to sequential ones
+    between calls, so each call only scans the newly appended text. Text must
+    be passed in order and never split inside a citation.
+    """
+
+    def __init__(self, final_results: List[Dict[str, Any]]) -> None:
+        self.final_results = final_results
+        self.citation_mapping: Dict[int, int] = {}
+        self.citations: List[Dict[str, Any]] = []
+
+    def normalize(self, text: str) -> tuple[str, List[Dict[str, Any]]]:
+        """Normalize appended text; returns it and the citations it introduced"""
+        new_citations = []
+
+        def renumber(match: re.Match) -> str:
+            old_citation_num = int(match.group(1))
+            if old_citation_num not in self.citation_mapping:
+                new_citation_num = len(self.citation_mapping) + 1
+                self.citation_mapping[old_citation_num] = new_citation_num
+
+                # Get the corresponding chunk from final_results
+                chunk_index = old_citation_num - 1  # Convert to 0-based index
+                if 0 <= chunk_index < len(self.final_results):
+                    doc = self.final_results[chunk_index]
+                    citation = {
+                        "content": doc.get("content", ""),
+                        "chunkIndex": new_citation_num,  # Use new sequential number
+                        "metadata": doc.get("metadata", {}),
+                        "citationType": "vectordb|document",
+                    }
+                    self.citations.append(citation)
+                    new_citations.append(citation)
+            return f"[{self.citation_mapping[old_citation_num]}]"
+
+        return CITATION_RE.sub(renumber, text), new_citations
+
+
 def normalize_citations_and_chunks(answer_text: str, final_results: List[Dict[str, Any]]) -> tuple[str, List[Dict[str, Any]]]:
     """
     Normalize citation numbers in answer text to be sequential (1,2,3...)
     and create corresponding citation chunks with correct mapping
     """
-    # Extract all citation numbers from the answer text
-    citation_pattern = r'\[(\d+)\]'
-    matches = re.findall(citation_pattern, answer_text)
-
-    if not matches:
-        return answer_text, []
-
-    # Get unique citation numbers in order of appearance
-    unique_citations = []
-    seen = set()
-    for match in matches:
-        citation_num = int(match)
-        if citation_num not in seen:
-            unique_citations.append(citation_num)
-            seen.add(citation_num)
-
-    # Create mapping from old citation numbers to new sequential numbers
-    citation_mapping = {}
-    new_citations = []
-
-    for i, old_citation_num in enumerate(unique_citations):
-        new_citation_num = i + 1
-        citation_mapping[old_citation_num] = new_citation_num
-
-        # Get the corresponding chunk from final_results
-        chunk_index = old_citation_num - 1  # Convert to 0-based index
-        if 0 <= chunk_index < len(final_results):
-            doc = final_results[chunk_index]
-            new_citations.append({
-                "content": doc.get("content", ""),
-                "chunkIndex": new_citation_num,  # Use new sequential number
-                "metadata": doc.get("metadata", {}),
-                "citationType": "vectordb|document",
-            })
-
-    # Replace citation numbers in answer text
-    normalized_answer = re.sub(citation_pattern, lambda m: f"[{citation_mapping[int(m.group(1))]}]", answer_text)
-
-    return normalized_answer, new_citations
+    return CitationTracker(final_results).normalize(answer_text)
 
 
 def process_citations(llm_response, documents: List[Dict[str, Any]]) -> Dict[str, Any]:
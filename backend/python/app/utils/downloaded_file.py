@@ -0,0 +1,221 @@
+"""Spooled storage for downloaded record files
+
+Downloads used to be accumulated in a BytesIO and copied out with getvalue(),
+then handed as bytes to parsers that often wrote them back to /tmp. A few
+concurrent large PDFs were enough to exhaust the indexing pod's memory.
+
+DownloadedFile works like tempfile.SpooledTemporaryFile: small files stay in
+memory and larger ones spill to disk once they exceed
+DOWNLOAD_SPOOL_MAX_MEMORY_BYTES. Unlike SpooledTemporaryFile, the spilled file
+is named, so processors that read from a path (PyMuPDF, OCRmyPDF, pandas,
+openpyxl, LibreOffice) open it directly and never hold the payload in Python
+memory. The MD5 checksum and the SHA-256 digest used by the parse result
+cache are computed while streaming.
+"""
+
+import hashlib
+import mmap
+import os
+import tempfile
+from contextlib import contextmanager
+from io import BytesIO
+from typing import BinaryIO, Iterator, List, Optional, Union
+
+DOWNLOAD_SPOOL_MAX_MEMORY_BYTES = int(
+    os.getenv("DOWNLOAD_SPOOL_MAX_MEMORY_BYTES", str(8 * 1024 * 1024))
+)
+# Directory of spilled downloads; the system temp directory by default
+DOWNLOAD_TEMP_DIR = os.getenv("DOWNLOAD_TEMP_DIR") or None
+
+
+class DownloadedFile:
+    """File content held in memory up to a threshold and on disk beyond it"""
+
+    def __init__(
+        self,
+        suffix: str = "",
+        max_memory_bytes: int = DOWNLOAD_SPOOL_MAX_MEMORY_BYTES,
+        temp_dir: Optional[str] = DOWNLOAD_TEMP_DIR,
+    ) -> None:
+        self.suffix = suffix
+        self.max_memory_bytes = max_memory_bytes
+        self.temp_dir = temp_dir
+        self.size = 0
+        self._md5 = hashlib.md5()
+        self._sha256 = hashlib.sha256()
+        self._buffer: Optional[bytearray] = bytearray()
+        self._file: Optional[BinaryIO] = None
+        self._path: Optional[str] = None
+        self._mmaps: List[mmap.mmap] = []
+        self._owned = True
+
+    @classmethod
+    def from_path(cls, path: str) -> "DownloadedFile":
+        """Read-only view of an existing file, e.g. one spooled by another process"""
+        downloaded = cls(suffix=os.path.splitext(path)[1])
+        downloaded._buffer = None
+        downloaded._path = path
+        downloaded._file = open(path, "rb")
+        downloaded._owned = False
+        downloaded.size = os.path.getsize(path)
+        return downloaded
+
+    @classmethod
+    def from_bytes(cls, data: bytes, suffix: str = "") -> "DownloadedFile":
+        downloaded = cls(suffix=suffix)
+        downloaded.write(data)
+        return downloaded
+
+    @property
+    def in_memory(self) -> bool:
+        return self._path is None
+
+    @property
+    def md5_hexdigest(self) -> str:
+        return self._md5.hexdigest()
+
+    @property
+    def sha256_hexdigest(self) -> str:
+        return self._sha256.hexdigest()
+
+    @property
+    def path(self) -> str:
+        """Path of the content on disk, spilling it from memory if needed"""
+        if self._path is None:
+            self._spill()
+        self._file.flush()
+        return self._path
+
+    def write(self, chunk: bytes) -> None:
+        self._md5.update(chunk)
+        self._sha256.update(chunk)
+        self.size += len(chunk)
+        if self._path is None:
+            self._buffer.extend(chunk)
+            if len(self._buffer) > self.max_memory_bytes:
+                self._spill()
+        else:
+            self._file.write(chunk)
+
+    def view(self) -> memoryview:
+        """Zero-copy read-only view; memory-mapped when the file is on disk"""
+        if self._path is None:
+            return memoryview(self._buffer).toreadonly()
+        if not self.size:
+            return memoryview(b"")
+        self._file.flush()
+        mapped = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._mmaps.append(mapped)
+        return memoryview(mapped)
+
+    def head(self, length: int) -> bytes:
+        return self._read_range(0, length)
+
+    def tail(self, length: int) -> bytes:
+        start = max(0, self.size - length)
+        return self._read_range(start, self.size - start)
+
+    def read_bytes(self) -> bytes:
+        """Full content as bytes, for consumers that cannot read a path or stream"""
+        return self._read_range(0, self.size)
+
+    def open(self) -> BinaryIO:
+        """New binary stream over the content, positioned at the start"""
+        if self._path is None:
+            return BytesIO(self._buffer)
+        self._file.flush()
+        return open(self._path, "rb")
+
+    def close(self) -> None:
+        for mapped in self._mmaps:
+            try:
+                mapped.close()
+            except BufferError:
+                # A view is still exported; the map is released with it
+                pass
+        self._mmaps.clear()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._owned and self._path is not None and os.path.exists(self._path):
+            os.remove(self._path)
+        self._buffer = None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __enter__(self) -> "DownloadedFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _spill(self) -> None:
+        self._file = tempfile.NamedTemporaryFile(
+            suffix=self.suffix, dir=self.temp_dir, delete=False
+        )
+        self._path = self._file.name
+        self._file.write(self._buffer)
+        self._buffer = None
+
+    def _read_range(self, start: int, length: int) -> bytes:
+        if self._path is None:
+            return bytes(self._buffer[start : start + length])
+        self._file.flush()
+        with open(self._path, "rb") as f:
+            f.seek(start)
+            return f.read(length)
+
+
+FileContent = Union[bytes, bytearray, DownloadedFile]
+
+
+def content_bytes(content: FileContent) -> bytes:
+    """Bytes of either a DownloadedFile or raw content"""
+    if isinstance(content, DownloadedFile):
+        return content.read_bytes()
+    return content
+
+
+def content_sha256(content: Union[FileContent, str]) -> str:
+    """SHA-256 hex digest of the content; text is hashed as UTF-8"""
+    if isinstance(content, DownloadedFile):
+        return content.sha256_hexdigest
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+def content_head(content: FileContent, length: int) -> bytes:
+    if isinstance(content, DownloadedFile):
+        return content.head(length)
+    return bytes(content[:length])
+
+
+def content_tail(content: FileContent, length: int) -> bytes:
+    if isinstance(content, DownloadedFile):
+        return content.tail(length)
+    return bytes(content[-length:])
+
+
+@contextmanager
+def content_path(content: FileContent, suffix: str = "") -> Iterator[str]:
+    """
+    Path of the content on disk for the duration of the block
+
+    DownloadedFile content is used in place; raw bytes are written to a
+    temporary file that is removed afterwards.
+    """
+    if isinstance(content, DownloadedFile):
+        yield content.path
+        return
+
+    with tempfile.NamedTemporaryFile(
+        suffix=suffix, dir=DOWNLOAD_TEMP_DIR, delete=False
+    ) as temp_file:
+        temp_file.write(content)
+    try:
+        yield temp_file.name
+    finally:
+        if os.path.exists(temp_file.name):
+            os.remove(temp_file.name)
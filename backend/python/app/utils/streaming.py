@@ -3,20 +3,34 @@ import re
 from typing import Any, AsyncGenerator, Dict, Union
 
 from app.modules.qna.prompt_templates import AnswerWithMetadata
-from app.utils.citations import normalize_citations_and_chunks
+from app.utils.citations import (
+    CITATION_RE,
+    CitationTracker,
+    normalize_citations_and_chunks,
+)
 
 
 def find_unescaped_quote(text: str) -> int:
     """Return index of first un-escaped quote (") or -1 if none."""
-    escaped = False
-    for i, ch in enumerate(text):
+    return scan_unescaped_quote(text)[0]
+
+
+def scan_unescaped_quote(text: str, start: int = 0, escaped: bool = False) -> tuple[int, bool]:
+    """
+    Find the first un-escaped quote (") from start, resuming a previous scan.
+
+    Returns the quote's index (or -1) and whether the text ends in an escape,
+    to pass back as escaped when scanning the text appended next.
+    """
+    for i in range(start, len(text)):
+        ch = text[i]
         if escaped:
             escaped = False
         elif ch == '\\':
             escaped = True
         elif ch == '"':
-            return i
-    return -1
+            return i, escaped
+    return -1, escaped
 
 
 def escape_ctl(raw: str) -> str:
@@ -69,7 +83,9 @@ async def stream_llm_response(
 ) -> AsyncGenerator[Dict[str, Any], None]:
     """
     Incrementally stream the answer portion of an LLM JSON response.
-    For each chunk we also emit the citations visible so far.
+
+    Each answer_chunk event carries only the newly streamed text and the
+    citations it introduced; the complete event carries the full answer.
     """
     full_json_buf: str = ""         # whole JSON as it trickles in
     answer_buf: str = ""            # the running "answer" value (no quotes)
@@ -79,7 +95,12 @@ async def stream_llm_response(
     INCOMPLETE_CITE_RE = re.compile(r'\[[^\]]*$')
 
     WORD_ITER = re.compile(r'\S+').finditer
-    prev_norm_len = 0  # length of the previous normalised answer
+    # Citation numbering carries over between chunks, so each chunk only
+    # normalizes the raw answer text streamed since the previous one
+    citation_tracker = CitationTracker(final_results)
+    normalized_upto = 0  # raw answer characters already sent
+    quote_scan_upto = 0  # raw answer characters searched for the closing quote
+    quote_escaped = False
     emit_upto = 0
     words_in_chunk = 0
     # Check if the LLM supports structured output
@@ -107,7 +128,10 @@ async def stream_llm_response(
                 answer_buf += token
 
             if not answer_done:
-                end_idx = find_unescaped_quote(answer_buf)
+                end_idx, quote_escaped = scan_unescaped_quote(
+                    answer_buf, quote_scan_upto, quote_escaped
+                )
+                quote_scan_upto = len(answer_buf)
                 if end_idx != -1:
                     answer_done = True
                     answer_buf = answer_buf[:end_idx]
@@ -124,23 +148,19 @@ async def stream_llm_response(
                         emit_upto = char_end
                         words_in_chunk = 0
 
-                        current_raw = answer_buf[:emit_upto]
-                        if INCOMPLETE_CITE_RE.search(current_raw):
+                        # Wait until a citation split across tokens is complete
+                        new_raw = answer_buf[normalized_upto:emit_upto]
+                        if INCOMPLETE_CITE_RE.search(new_raw):
                             continue
 
-                        normalized, cites = normalize_citations_and_chunks(
-                            current_raw, final_results
-                        )
-
-                        chunk_text = normalized[prev_norm_len:]
-                        prev_norm_len = len(normalized)
+                        chunk_text, new_citations = citation_tracker.normalize(new_raw)
+                        normalized_upto = emit_upto
 
                         yield {
                             "event": "answer_chunk",
                             "data": {
                                 "chunk": chunk_text,
-                                "accumulated": normalized,
-                                "citations": cites,
+                                "citations": new_citations,
                             },
                         }
 
@@ -180,6 +200,46 @@ async def stream_llm_response(
         }
 
 
+async def replay_answer(
+    answer: Dict[str, Any],
+    target_words_per_chunk: int = 5,
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """
+    Replay a finished answer as the events stream_llm_response emits.
+
+    answer is a complete event payload; its answer text is already
+    normalized, so citation [n] is the citation with chunkIndex n.
+    """
+    text = answer.get("answer") or ""
+    citations = answer.get("citations") or []
+    by_index = {citation.get("chunkIndex"): citation for citation in citations}
+    sent = set()
+    CITE_BLOCK_RE = re.compile(r'(?:\s*\[\d+])+')
+
+    emit_from = 0
+    words = list(re.finditer(r'\S+', text))
+    for i in range(target_words_per_chunk - 1, len(words), target_words_per_chunk):
+        char_end = words[i].end()
+        if m := CITE_BLOCK_RE.match(text[char_end:]):
+            char_end += m.end()
+        if char_end <= emit_from:
+            continue
+        chunk_text = text[emit_from:char_end]
+        emit_from = char_end
+        new_citations = []
+        for match in CITATION_RE.finditer(chunk_text):
+            number = int(match.group(1))
+            if number in by_index and number not in sent:
+                sent.add(number)
+                new_citations.append(by_index[number])
+        yield {
+            "event": "answer_chunk",
+            "data": {"chunk": chunk_text, "citations": new_citations},
+        }
+
+    yield {"event": "complete", "data": answer}
+
+
 def create_sse_event(event_type: str, data: Union[str, dict, list]) -> str:
     """Create Server-Sent Event format"""
     return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Hit rate and wrong answers of the semantic answer cache per threshold
+
+Asks groups of paraphrased maintenance questions in random order. Each group
+has its own answer; a lookup that returns another group's answer is a wrong
+hit. Groups come in near-miss pairs (same task, other component or aircraft)
+that must not share answers. Every miss stores an answer worth --llm-tokens.
+
+Questions are embedded with a fastembed model, the same ONNX runtime the
+query service uses for sparse vectors; pass the dense model of the
+deployment to tune ANSWER_CACHE_SIMILARITY_THRESHOLD for it. Generations are
+kept in the Redis at --redis-url:
+
+    python benchmarks/answer_cache.py --model BAAI/bge-small-en-v1.5 \
+        --thresholds 0.85,0.9,0.95
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import sys
+import time
+from typing import Dict, List
+
+from fastembed import TextEmbedding
+from redis import asyncio as aioredis
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.answer_cache import AnswerCache  # noqa: E402
+
+QUESTION_GROUPS: Dict[str, List[str]] = {
+    "a320_mlg_actuator_torque": [
+        "What is the torque value for the main landing gear actuator bolts on the A320?",
+        "torque value for MLG actuator bolts A320",
+        "A320 main gear actuator bolt torque?",
+        "How tight should the main landing gear actuator bolts be torqued on an A320?",
+    ],
+    "a320_nlg_actuator_torque": [
+        "What is the torque value for the nose landing gear actuator bolts on the A320?",
+        "torque value for NLG actuator bolts A320",
+        "A320 nose gear actuator bolt torque?",
+    ],
+    "a320_brake_wear": [
+        "What is the brake wear pin limit on the A320?",
+        "A320 brake wear indicator pin minimum length",
+        "When do A320 brakes need replacing based on the wear pin?",
+    ],
+    "b737_brake_wear": [
+        "What is the brake wear pin limit on the 737?",
+        "737 brake wear indicator pin minimum length",
+        "When do Boeing 737 brakes need replacing based on the wear pin?",
+    ],
+    "a320_engine_oil": [
+        "Which engine oil is approved for the A320 CFM56?",
+        "approved oil type for CFM56 engines on A320",
+        "What oil do I put in the A320 CFM56 engine?",
+    ],
+    "a320_engine_oil_quantity": [
+        "How much oil does the A320 CFM56 engine hold?",
+        "CFM56 oil tank capacity on A320",
+        "What is the oil quantity of the A320 CFM56 engine?",
+    ],
+}
+
+
+async def run(args: argparse.Namespace, threshold: float, vectors: Dict[str, List[float]]) -> None:
+    redis_client = await aioredis.from_url(args.redis_url, encoding="utf-8", decode_responses=True)
+    cache = AnswerCache(
+        logging.getLogger("answer_cache_benchmark"),
+        redis_client,
+        similarity_threshold=threshold,
+        enabled=True,
+    )
+    bucket = cache.bucket_key("org", "scope", "A320", args.model, "benchmark")
+    asked = [
+        (group, question)
+        for group, questions in QUESTION_GROUPS.items()
+        for question in questions
+    ] * args.rounds
+    random.Random(args.seed).shuffle(asked)
+
+    correct = wrong = 0
+    lookup_seconds = 0.0
+    for group, question in asked:
+        start = time.perf_counter()
+        answer = await cache.lookup(bucket, vectors[question])
+        lookup_seconds += time.perf_counter() - start
+        if answer is None:
+            await cache.store(
+                bucket,
+                vectors[question],
+                question,
+                {
+                    "answer": group,
+                    "citations": [
+                        {"chunkIndex": 1, "metadata": {"virtualRecordId": f"benchmark-{group}"}}
+                    ],
+                },
+                llm_tokens=args.llm_tokens,
+            )
+        elif answer["answer"] == group:
+            correct += 1
+        else:
+            wrong += 1
+
+    stats = cache.stats()
+    print(
+        f"{threshold:>9.2f} {stats['hitRatio']:>8.2%} {correct:>8} {wrong:>6} "
+        f"{stats['llmTokensSaved']:>11,} {lookup_seconds / len(asked) * 1000:>11.3f}"
+    )
+    await redis_client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Answer cache benchmark")
+    parser.add_argument("--model", default="BAAI/bge-small-en-v1.5")
+    parser.add_argument("--thresholds", default="0.85,0.9,0.95")
+    parser.add_argument("--rounds", type=int, default=3, help="Times each question is asked")
+    parser.add_argument("--llm-tokens", type=int, default=15000, help="Prompt and answer tokens per LLM call")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/0")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    questions = [q for group in QUESTION_GROUPS.values() for q in group]
+    model = TextEmbedding(args.model)
+    vectors = {q: v.tolist() for q, v in zip(questions, model.embed(questions))}
+
+    print(f"{len(questions)} questions in {len(QUESTION_GROUPS)} groups, asked {args.rounds} times")
+    print(f"{'threshold':>9} {'hit rate':>8} {'correct':>8} {'wrong':>6} {'tokens saved':>11} {'lookup (ms)':>11}")
+    for threshold in (float(t) for t in args.thresholds.split(",")):
+        asyncio.run(run(args, threshold, vectors))
+
+
+if __name__ == "__main__":
+    main()
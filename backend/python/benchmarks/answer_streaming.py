@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Server CPU and SSE bytes of streaming a long cited answer
+
+Streams a synthetic JSON answer of --tokens tokens, with a citation every few
+sentences, from a fake LLM through:
+
+* "previous": the former stream_llm_response loop, which re-normalized the
+  whole accumulated answer every 5 words and sent it, with every citation so
+  far, in each answer_chunk event
+* "incremental": stream_llm_response, which normalizes only the new text and
+  sends it with the citations it introduced
+
+Both are serialized with create_sse_event as the /chat/stream route does.
+
+    python benchmarks/answer_streaming.py --tokens 2000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import time
+from typing import Any, AsyncGenerator, Dict, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.utils.citations import normalize_citations_and_chunks  # noqa: E402
+from app.utils.streaming import (  # noqa: E402
+    aiter_llm_stream,
+    create_sse_event,
+    find_unescaped_quote,
+    stream_llm_response,
+)
+
+WORDS = (
+    "the main landing gear actuator must be inspected for hydraulic leaks and "
+    "the seal kit replaced when seepage exceeds the limits of the manual"
+).split()
+
+
+class FakeLLM:
+    """Streams a fixed JSON answer token by token"""
+
+    def __init__(self, tokens: List[str]) -> None:
+        self.tokens = tokens
+
+    async def astream(self, messages) -> AsyncGenerator[str, None]:
+        for token in self.tokens:
+            yield token
+
+
+def build_tokens(count: int, results: int, seed: int) -> List[str]:
+    rng = random.Random(seed)
+    tokens = ['{"answer": "']
+    for i in range(count):
+        tokens.append(rng.choice(WORDS) + " ")
+        if i % 25 == 24:
+            tokens.append(f"[{rng.randint(1, results)}]. ")
+    tokens.append('", "reason": "synthetic", "confidence": "High"}')
+    return tokens
+
+
+async def previous_stream_llm_response(
+    llm, messages, final_results, target_words_per_chunk: int = 5
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """The answer_chunk loop before incremental citation normalization"""
+    full_json_buf = ""
+    answer_buf = ""
+    answer_done = False
+    ANSWER_KEY_RE = re.compile(r'"answer"\s*:\s*"')
+    CITE_BLOCK_RE = re.compile(r'(?:\s*\[\d+])+')
+    INCOMPLETE_CITE_RE = re.compile(r'\[[^\]]*$')
+    WORD_ITER = re.compile(r'\S+').finditer
+    prev_norm_len = 0
+    emit_upto = 0
+    words_in_chunk = 0
+
+    async for token in aiter_llm_stream(llm, messages):
+        full_json_buf += token
+        if not answer_buf:
+            match = ANSWER_KEY_RE.search(full_json_buf)
+            if match:
+                answer_buf += full_json_buf[match.end():]
+        elif not answer_done:
+            answer_buf += token
+        if not answer_done:
+            end_idx = find_unescaped_quote(answer_buf)
+            if end_idx != -1:
+                answer_done = True
+                answer_buf = answer_buf[:end_idx]
+        if answer_buf:
+            for match in WORD_ITER(answer_buf[emit_upto:]):
+                words_in_chunk += 1
+                if words_in_chunk == target_words_per_chunk:
+                    char_end = emit_upto + match.end()
+                    if m := CITE_BLOCK_RE.match(answer_buf[char_end:]):
+                        char_end += m.end()
+                    emit_upto = char_end
+                    words_in_chunk = 0
+                    current_raw = answer_buf[:emit_upto]
+                    if INCOMPLETE_CITE_RE.search(current_raw):
+                        continue
+                    normalized, cites = normalize_citations_and_chunks(current_raw, final_results)
+                    chunk_text = normalized[prev_norm_len:]
+                    prev_norm_len = len(normalized)
+                    yield {
+                        "event": "answer_chunk",
+                        "data": {"chunk": chunk_text, "accumulated": normalized, "citations": cites},
+                    }
+
+    parsed = json.loads(full_json_buf)
+    normalized, cites = normalize_citations_and_chunks(parsed["answer"], final_results)
+    yield {"event": "complete", "data": {"answer": normalized, "citations": cites}}
+
+
+async def measure(stream) -> Dict[str, Any]:
+    start_cpu = time.process_time()
+    total_bytes = events = 0
+    streamed = ""
+    answer = ""
+    async for event in stream:
+        payload = create_sse_event(event["event"], event["data"])
+        total_bytes += len(payload.encode("utf-8"))
+        events += 1
+        if event["event"] == "answer_chunk":
+            streamed += event["data"]["chunk"]
+        elif event["event"] == "complete":
+            answer = event["data"]["answer"]
+    return {
+        "cpu": time.process_time() - start_cpu,
+        "bytes": total_bytes,
+        "events": events,
+        "prefix_ok": answer.startswith(streamed),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Answer streaming benchmark")
+    parser.add_argument("--tokens", type=int, default=2000)
+    parser.add_argument("--results", type=int, default=50, help="Retrieved chunks that can be cited")
+    parser.add_argument("--content-chars", type=int, default=1500, help="Characters per cited chunk")
+    args = parser.parse_args()
+
+    tokens = build_tokens(args.tokens, args.results, seed=7)
+    final_results = [
+        {"content": ("chunk %d " % i) * (args.content_chars // 8), "metadata": {"recordId": str(i)}}
+        for i in range(args.results)
+    ]
+
+    print(f"{'mode':>11} {'cpu (s)':>8} {'SSE bytes':>12} {'events':>7} {'chunks match answer':>20}")
+    for name, stream_fn in (
+        ("previous", previous_stream_llm_response),
+        ("incremental", stream_llm_response),
+    ):
+        result = await measure(stream_fn(FakeLLM(tokens), [], final_results))
+        print(
+            f"{name:>11} {result['cpu']:>8.3f} {result['bytes']:>12,} "
+            f"{result['events']:>7} {str(result['prefix_ok']):>20}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Paragraph-to-line matching of AzureOCRStrategy on a synthetic analysis result
+
+Builds an Azure Document Intelligence-like result (pages with lines,
+document-level paragraphs with bounding regions and spans) and times:
+
+* "all-pairs": the previous loop, which compared every paragraph of the
+  document with every line of every page (word overlap and bounding box
+  overlap per pair)
+* "spans": paragraphs bucketed by page, lines found through span offsets
+* "spatial": paragraphs bucketed by page, lines without spans looked up by
+  vertical extent before the overlap checks
+
+All-pairs grows with pages x paragraphs x lines, so it runs on the first
+--baseline-pages pages only; the indexed modes run on the whole document.
+
+    python benchmarks/azure_paragraph_matching.py --pages 500
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.modules.parsers.pdf.azure_document_intelligence_processor import (  # noqa: E402
+    AzureOCRStrategy,
+    PageLineIndex,
+)
+
+WORDS = "inspect torque actuator seal hydraulic valve panel bracket fitting harness".split()
+
+
+def polygon(x0: float, y0: float, x1: float, y1: float) -> list:
+    return [
+        SimpleNamespace(x=x0, y=y0),
+        SimpleNamespace(x=x1, y=y0),
+        SimpleNamespace(x=x1, y=y1),
+        SimpleNamespace(x=x0, y=y1),
+    ]
+
+
+def build_result(pages: int, paragraphs_per_page: int, lines_per_paragraph: int):
+    """Synthetic analysis result in inches on 8.5 x 11 pages"""
+    result_pages, paragraphs = [], []
+    offset = 0
+    line_height = 9.0 / (paragraphs_per_page * (lines_per_paragraph + 1))
+    for page_number in range(1, pages + 1):
+        lines = []
+        y = 1.0
+        for paragraph_idx in range(paragraphs_per_page):
+            paragraph_start, paragraph_y = offset, y
+            contents = []
+            for line_idx in range(lines_per_paragraph):
+                words = [
+                    WORDS[(page_number + paragraph_idx * 3 + line_idx + k) % len(WORDS)]
+                    for k in range(8)
+                ]
+                content = f"{page_number}-{paragraph_idx}-{line_idx} " + " ".join(words)
+                lines.append(
+                    SimpleNamespace(
+                        content=content,
+                        polygon=polygon(1.0, y, 7.5, y + line_height * 0.8),
+                        spans=[SimpleNamespace(offset=offset, length=len(content))],
+                    )
+                )
+                contents.append(content)
+                offset += len(content) + 1
+                y += line_height
+            paragraphs.append(
+                SimpleNamespace(
+                    content="\n".join(contents),
+                    role=None,
+                    bounding_regions=[
+                        SimpleNamespace(
+                            page_number=page_number,
+                            polygon=polygon(1.0, paragraph_y, 7.5, y),
+                        )
+                    ],
+                    spans=[SimpleNamespace(offset=paragraph_start, length=offset - paragraph_start)],
+                )
+            )
+            y += line_height
+        result_pages.append(
+            SimpleNamespace(
+                page_number=page_number, width=8.5, height=11.0, unit="inch", lines=lines
+            )
+        )
+    return SimpleNamespace(pages=result_pages, paragraphs=paragraphs)
+
+
+def make_strategy(doc) -> AzureOCRStrategy:
+    # Only the matching helpers are used: no Azure client or spaCy pipeline
+    strategy = AzureOCRStrategy.__new__(AzureOCRStrategy)
+    strategy.logger = logging.getLogger("azure_paragraph_matching")
+    strategy.doc = doc
+    return strategy
+
+
+def page_lines(strategy: AzureOCRStrategy, page, with_spans: bool) -> PageLineIndex:
+    lines, offsets = [], []
+    for line in page.lines:
+        line_data = strategy._process_line(line, page.width, page.height)
+        lines.append(line_data)
+        offsets.append(line.spans[0].offset if with_spans else None)
+    return PageLineIndex(lines, offsets)
+
+
+def all_pairs(strategy: AzureOCRStrategy, pages: list) -> int:
+    matched = 0
+    for page in pages:
+        line_index = page_lines(strategy, page, with_spans=False)
+        for paragraph in strategy.doc.paragraphs:
+            processed = strategy._process_block_text_azure(paragraph, page.width, page.height)
+            matched += len(
+                strategy._get_lines_for_paragraph(
+                    line_index.lines, processed["content"], processed["bounding_box"]
+                )
+            )
+    return matched
+
+
+def indexed(strategy: AzureOCRStrategy, pages: list, with_spans: bool) -> int:
+    matched = 0
+    paragraphs_by_page = strategy._paragraphs_by_page()
+    for page in pages:
+        line_index = page_lines(strategy, page, with_spans)
+        for _, _, lines in strategy._assign_lines_to_paragraphs(
+            paragraphs_by_page.get(page.page_number, []), line_index, page.width, page.height
+        ):
+            matched += len(lines)
+    return matched
+
+
+def timed(label: str, pages: int, fn) -> None:
+    start = time.perf_counter()
+    matched = fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:>10} {pages:>6} {elapsed:>9.2f} {matched:>14}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Azure paragraph matching benchmark")
+    parser.add_argument("--pages", type=int, default=500)
+    parser.add_argument("--paragraphs-per-page", type=int, default=12)
+    parser.add_argument("--lines-per-paragraph", type=int, default=4)
+    parser.add_argument("--baseline-pages", type=int, default=30)
+    args = parser.parse_args()
+
+    doc = build_result(args.pages, args.paragraphs_per_page, args.lines_per_paragraph)
+    strategy = make_strategy(doc)
+    baseline_pages = doc.pages[: args.baseline_pages]
+    print(
+        f"{args.pages} pages, {len(doc.paragraphs)} paragraphs, "
+        f"{args.pages * args.paragraphs_per_page * args.lines_per_paragraph} lines"
+    )
+    print(f"{'mode':>10} {'pages':>6} {'seconds':>9} {'lines matched':>14}")
+    timed("all-pairs", len(baseline_pages), lambda: all_pairs(strategy, baseline_pages))
+    timed("spans", len(baseline_pages), lambda: indexed(strategy, baseline_pages, True))
+    timed("spans", args.pages, lambda: indexed(strategy, doc.pages, True))
+    timed("spatial", args.pages, lambda: indexed(strategy, doc.pages, False))
+
+
+if __name__ == "__main__":
+    main()
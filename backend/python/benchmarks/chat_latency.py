@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Chat latency benchmark for the query service
+
+Fires POST /api/v1/chat at a fixed concurrency and reports p50/p99 latency.
+Run it against a query service that is already up (with a valid user token):
+
+    python benchmarks/chat_latency.py --url http://localhost:8000 \
+        --token "$JWT" --query "torque value for main gear axle nut"
+
+By default it runs 1, 16 and 64 concurrent requests, which is enough to see
+whether ArangoDB round-trips are serialized on the event loop or overlapped.
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import aiohttp
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def _chat_once(session: aiohttp.ClientSession, url: str, body: dict) -> float:
+    start = time.perf_counter()
+    async with session.post(url, json=body) as response:
+        await response.read()
+        response.raise_for_status()
+    return time.perf_counter() - start
+
+
+async def run_level(
+    url: str, token: str, body: dict, concurrency: int, requests_per_worker: int
+) -> List[float]:
+    headers = {"Authorization": f"Bearer {token}"}
+    timeout = aiohttp.ClientTimeout(total=600)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    latencies: List[float] = []
+
+    async with aiohttp.ClientSession(
+        headers=headers, timeout=timeout, connector=connector
+    ) as session:
+
+        async def worker() -> None:
+            for _ in range(requests_per_worker):
+                latencies.append(await _chat_once(session, url, body))
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    return latencies
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--token", required=True, help="Bearer token of a test user")
+    parser.add_argument("--query", default="What is the tire pressure for the main gear?")
+    parser.add_argument("--levels", default="1,16,64", help="Comma separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=4, help="Requests per concurrent worker")
+    parser.add_argument("--quick", action="store_true", help="Use quickMode (skip decomposition and rerank)")
+    args = parser.parse_args()
+
+    url = f"{args.url.rstrip('/')}/api/v1/chat"
+    body = {"query": args.query, "limit": 20, "quickMode": args.quick}
+
+    print(f"{'concurrency':>11} {'requests':>9} {'p50 (s)':>9} {'p99 (s)':>9} {'mean (s)':>9} {'req/s':>7}")
+    for level in (int(x) for x in args.levels.split(",")):
+        start = time.perf_counter()
+        latencies = await run_level(url, args.token, body, level, args.requests)
+        wall = time.perf_counter() - start
+        print(
+            f"{level:>11} {len(latencies):>9} {percentile(latencies, 50):>9.3f} "
+            f"{percentile(latencies, 99):>9.3f} {statistics.mean(latencies):>9.3f} "
+            f"{len(latencies) / wall:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
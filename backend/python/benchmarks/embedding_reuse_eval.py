@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Offline evaluation of pooled chunk embeddings
+
+Compares the two ways IndexingPipeline can get chunk vectors after semantic
+chunking:
+
+* re-embed  - embed every merged chunk again with the dense model
+* pooled    - token-weighted mean of the sentence embeddings the chunker
+              already computed for breakpoint detection (EMBEDDING_REUSE_SOURCES)
+
+Both paths chunk the same sentences with CustomChunker. Retrieval quality is
+measured as recall@k of an in-memory cosine search over the chunk vectors:
+each query must retrieve the chunk containing its expected text. Queries come
+from a JSONL file ({"query": ..., "expected": ...}) or, by default, from
+sampled sentences of the document itself.
+
+    python benchmarks/embedding_reuse_eval.py --text manual.txt \
+        --queries manual_queries.jsonl --model BAAI/bge-large-en-v1.5
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import re
+import sys
+import time
+from typing import List, Tuple
+
+import numpy as np
+from langchain.schema import Document
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.config.utils.named_constants.ai_models_named_constants import (  # noqa: E402
+    DEFAULT_EMBEDDING_MODEL,
+)
+from app.modules.indexing.run import CustomChunker  # noqa: E402
+
+SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+
+
+def load_sentences(path: str) -> List[Document]:
+    with open(path, encoding="utf-8") as f:
+        text = f.read()
+    sentences = [s.strip() for s in SENTENCE_SPLIT.split(text) if s.strip()]
+    return [
+        Document(page_content=sentence, metadata={"blockNum": [i]})
+        for i, sentence in enumerate(sentences)
+    ]
+
+
+def load_queries(path: str, sentences: List[Document], sample: int, seed: int) -> List[Tuple[str, str]]:
+    if path:
+        with open(path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+        return [(row["query"], row["expected"]) for row in rows]
+    rng = random.Random(seed)
+    picked = rng.sample(sentences, min(sample, len(sentences)))
+    return [(doc.page_content, doc.page_content) for doc in picked]
+
+
+def recall_at_k(
+    chunk_vectors: np.ndarray,
+    chunks: List[Document],
+    query_vectors: np.ndarray,
+    queries: List[Tuple[str, str]],
+    k: int,
+) -> float:
+    def unit(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    scores = unit(query_vectors) @ unit(chunk_vectors).T
+    top_k = np.argsort(-scores, axis=1)[:, :k]
+    hits = 0
+    for (_, expected), ranked in zip(queries, top_k):
+        if any(expected in chunks[index].page_content for index in ranked):
+            hits += 1
+    return hits / len(queries) if queries else 0.0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pooled vs re-embedded chunk vectors")
+    parser.add_argument("--text", required=True, help="Plain text of a document")
+    parser.add_argument("--queries", help="JSONL with query and expected fields")
+    parser.add_argument("--model", default=DEFAULT_EMBEDDING_MODEL)
+    parser.add_argument("--sample", type=int, default=200, help="Sampled queries without --queries")
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    embeddings = HuggingFaceEmbeddings(
+        model_name=args.model,
+        model_kwargs={"device": "cpu"},
+        encode_kwargs={"normalize_embeddings": True},
+    )
+    chunker = CustomChunker(
+        logger=logging.getLogger("embedding-reuse-eval"),
+        embeddings=embeddings,
+        breakpoint_threshold_type="percentile",
+        breakpoint_threshold_amount=95,
+    )
+
+    sentences = load_sentences(args.text)
+    queries = load_queries(args.queries, sentences, args.sample, args.seed)
+    print(f"{len(sentences)} sentences, {len(queries)} queries, model {args.model}")
+
+    # Pooled: chunking already produces every chunk vector
+    start = time.perf_counter()
+    chunks, pooled_vectors = chunker.split_documents_with_embeddings(
+        sentences, pool_embeddings=True
+    )
+    pooled_time = time.perf_counter() - start
+
+    # Re-embed: chunk, then embed the chunks that are not single sentences
+    start = time.perf_counter()
+    chunks_reembedded, vectors = chunker.split_documents_with_embeddings(sentences)
+    missing = [i for i, vector in enumerate(vectors) if vector is None]
+    for i, vector in zip(
+        missing, embeddings.embed_documents([chunks_reembedded[i].page_content for i in missing])
+    ):
+        vectors[i] = vector
+    reembed_time = time.perf_counter() - start
+
+    query_vectors = np.asarray(
+        embeddings.embed_documents([query for query, _ in queries]), dtype=np.float32
+    )
+    pooled_recall = recall_at_k(
+        np.asarray(pooled_vectors, dtype=np.float32), chunks, query_vectors, queries, args.k
+    )
+    reembed_recall = recall_at_k(
+        np.asarray(vectors, dtype=np.float32), chunks_reembedded, query_vectors, queries, args.k
+    )
+
+    print(f"{'mode':>9} {'chunks':>7} {'index time (s)':>15} {f'recall@{args.k}':>10}")
+    print(f"{'re-embed':>9} {len(chunks_reembedded):>7} {reembed_time:>15.2f} {reembed_recall:>10.3f}")
+    print(f"{'pooled':>9} {len(chunks):>7} {pooled_time:>15.2f} {pooled_recall:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Per-message ClientSession vs the shared pooled session of the indexing service
+
+Simulates small-file record events against a local aiohttp server: each event
+resolves a signed URL (JSON) and then downloads the file, as the Kafka
+consumer and EventProcessor do. The "per-call" mode opens a new ClientSession
+for each request like the previous code; the "shared" mode uses the session
+from app.core.http_client.create_http_session. Connections opened are counted
+with an aiohttp TraceConfig.
+
+    python benchmarks/http_client_reuse.py --events 1000 --concurrency 10
+
+Against a remote storage endpoint the gap is larger than on localhost, since
+every new connection also pays DNS resolution, network round trips and TLS.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import aiohttp
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.core.http_client import create_http_session  # noqa: E402
+
+
+async def start_server(file_size: int, port: int) -> web.AppRunner:
+    payload = os.urandom(file_size)
+
+    async def signed_url(request: web.Request) -> web.Response:
+        record_id = request.match_info["record_id"]
+        return web.json_response(
+            {"signedUrl": f"http://127.0.0.1:{port}/files/{record_id}"}
+        )
+
+    async def download(request: web.Request) -> web.Response:
+        return web.Response(body=payload, content_type="application/octet-stream")
+
+    app = web.Application()
+    app.router.add_get("/signed-url/{record_id}", signed_url)
+    app.router.add_get("/files/{record_id}", download)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    return runner
+
+
+def connection_counter() -> tuple:
+    counter = {"connections": 0}
+
+    async def on_connection_create_end(session, context, params) -> None:
+        counter["connections"] += 1
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_end.append(on_connection_create_end)
+    return trace_config, counter
+
+
+async def run_events(base_url: str, events: int, concurrency: int, get_json, get_bytes) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def handle_event(index: int) -> None:
+        async with semaphore:
+            resolved = await get_json(f"{base_url}/signed-url/record-{index}")
+            await get_bytes(resolved["signedUrl"])
+
+    start = time.perf_counter()
+    await asyncio.gather(*(handle_event(i) for i in range(events)))
+    return time.perf_counter() - start
+
+
+async def per_call_mode(base_url: str, args) -> tuple:
+    trace_config, counter = connection_counter()
+
+    async def get_json(url: str) -> dict:
+        async with aiohttp.ClientSession(trace_configs=[trace_config]) as session:
+            async with session.get(url) as response:
+                return await response.json()
+
+    async def get_bytes(url: str) -> bytes:
+        async with aiohttp.ClientSession(trace_configs=[trace_config]) as session:
+            async with session.get(url) as response:
+                return await response.read()
+
+    elapsed = await run_events(base_url, args.events, args.concurrency, get_json, get_bytes)
+    return elapsed, counter["connections"]
+
+
+async def shared_mode(base_url: str, args) -> tuple:
+    trace_config, counter = connection_counter()
+    session = create_http_session(trace_configs=[trace_config])
+
+    async def get_json(url: str) -> dict:
+        async with session.get(url) as response:
+            return await response.json()
+
+    async def get_bytes(url: str) -> bytes:
+        async with session.get(url) as response:
+            return await response.read()
+
+    try:
+        elapsed = await run_events(base_url, args.events, args.concurrency, get_json, get_bytes)
+    finally:
+        await session.close()
+    return elapsed, counter["connections"]
+
+
+async def main_async(args) -> None:
+    runner = await start_server(args.file_size, args.port)
+    base_url = f"http://127.0.0.1:{args.port}"
+    try:
+        print(f"{args.events} events, {args.file_size} byte files, concurrency {args.concurrency}")
+        print(f"{'mode':>9} {'seconds':>8} {'events/s':>9} {'connections':>12}")
+        for name, mode in (("per-call", per_call_mode), ("shared", shared_mode)):
+            elapsed, connections = await mode(base_url, args)
+            print(f"{name:>9} {elapsed:>8.2f} {args.events / elapsed:>9.1f} {connections:>12}")
+    finally:
+        await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HTTP session reuse benchmark")
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--file-size", type=int, default=16 * 1024)
+    parser.add_argument("--port", type=int, default=8765)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
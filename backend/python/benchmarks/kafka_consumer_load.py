@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Load test for the record-events consumer against a local Kafka stand-in
+
+Feeds KafkaConsumerManager.consume_messages from an in-memory consumer that
+implements the part of the AIOKafkaConsumer API the manager uses (getmany,
+commit, assignment, stop). Messages are keyed by recordId and partitioned by
+key like the connector producer does; processing is simulated with a sleep
+(downstream latency) plus optional CPU work in a thread.
+
+It reports throughput, per-record ordering violations and whether the
+committed offsets cover every message:
+
+    python benchmarks/kafka_consumer_load.py --messages 2000 --records 300 \
+        --latency-ms 200 --cpu-ms 20
+
+Approximate the previous consumer with --max-records 1 --concurrency 5:5:5.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+import zlib
+from collections import defaultdict, namedtuple
+from typing import Dict, List
+
+from aiokafka.structs import TopicPartition
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.services import kafka_consumer  # noqa: E402
+from app.services.kafka_consumer import KafkaConsumerManager  # noqa: E402
+
+TOPIC = "record-events"
+Message = namedtuple("Message", ["topic", "partition", "offset", "key", "value"])
+
+
+class LocalKafka:
+    """In-memory stand-in for AIOKafkaConsumer"""
+
+    def __init__(self, partitions: Dict[TopicPartition, List[Message]]) -> None:
+        self.partitions = partitions
+        self.positions = {tp: 0 for tp in partitions}
+        self.committed: Dict[TopicPartition, int] = {}
+
+    async def getmany(self, timeout_ms: int = 0, max_records: int = None) -> Dict[TopicPartition, List[Message]]:
+        batch: Dict[TopicPartition, List[Message]] = {}
+        remaining = max_records or sum(len(m) for m in self.partitions.values())
+        for tp, messages in self.partitions.items():
+            if remaining <= 0:
+                break
+            start = self.positions[tp]
+            taken = messages[start : start + remaining]
+            if taken:
+                batch[tp] = taken
+                self.positions[tp] += len(taken)
+                remaining -= len(taken)
+        if not batch:
+            await asyncio.sleep(timeout_ms / 1000)
+        return batch
+
+    def assignment(self) -> set:
+        return set(self.partitions)
+
+    async def commit(self, offsets: Dict[TopicPartition, int]) -> None:
+        self.committed.update(offsets)
+
+    async def stop(self) -> None:
+        pass
+
+
+class LoadTestConsumer(KafkaConsumerManager):
+    """KafkaConsumerManager whose message processing is simulated"""
+
+    def __init__(self, logger, latency_ms: float, cpu_ms: float) -> None:
+        super().__init__(
+            logger,
+            config_service=None,
+            event_processor=None,
+            redis_scheduler=None,
+            http_session=None,
+        )
+        self.latency_ms = latency_ms
+        self.cpu_ms = cpu_ms
+        self.last_sequence: Dict[str, int] = defaultdict(lambda: -1)
+        self.ordering_violations = 0
+        self.processed = 0
+
+    async def _process_message(self, message) -> bool:
+        data = json.loads(message.value)
+        record_id = data["payload"]["recordId"]
+        sequence = data["payload"]["sequence"]
+        if sequence < self.last_sequence[record_id]:
+            self.ordering_violations += 1
+        self.last_sequence[record_id] = sequence
+
+        if self.cpu_ms:
+            await asyncio.to_thread(_burn_cpu, self.cpu_ms / 1000)
+        await asyncio.sleep(random.uniform(0.5, 1.5) * self.latency_ms / 1000)
+        self.processed += 1
+        return True
+
+
+def _burn_cpu(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def build_partitions(messages: int, records: int, partitions: int, seed: int) -> Dict[TopicPartition, List[Message]]:
+    rng = random.Random(seed)
+    by_partition: Dict[TopicPartition, List[Message]] = {
+        TopicPartition(TOPIC, p): [] for p in range(partitions)
+    }
+    sequences: Dict[str, int] = defaultdict(int)
+    for _ in range(messages):
+        record_id = f"record-{rng.randrange(records)}"
+        tp = TopicPartition(TOPIC, zlib.crc32(record_id.encode()) % partitions)
+        value = json.dumps(
+            {
+                "eventType": "newRecord",
+                "payload": {"recordId": record_id, "sequence": sequences[record_id]},
+            }
+        ).encode("utf-8")
+        sequences[record_id] += 1
+        offset = len(by_partition[tp])
+        by_partition[tp].append(Message(TOPIC, tp.partition, offset, record_id.encode("utf-8"), value))
+    return by_partition
+
+
+async def run(args) -> None:
+    logging.basicConfig(level=logging.WARNING)
+    initial, minimum, maximum = (int(x) for x in args.concurrency.split(":"))
+    kafka_consumer.KAFKA_MAX_POLL_RECORDS = args.max_records
+    kafka_consumer.KAFKA_INITIAL_CONCURRENCY = initial
+    kafka_consumer.KAFKA_MIN_CONCURRENCY = minimum
+    kafka_consumer.KAFKA_MAX_CONCURRENCY = maximum
+
+    partitions = build_partitions(args.messages, args.records, args.partitions, args.seed)
+    manager = LoadTestConsumer(logging.getLogger("kafka-load"), args.latency_ms, args.cpu_ms)
+    manager.concurrency.adjust_interval_seconds = 1.0
+    manager.consumer = LocalKafka(partitions)
+    manager.running = True
+
+    start = time.perf_counter()
+    consume_task = asyncio.create_task(manager.consume_messages())
+    while manager.processed < args.messages:
+        await asyncio.sleep(0.05)
+    elapsed = time.perf_counter() - start
+    manager.running = False
+    await consume_task
+
+    expected = {tp: len(messages) for tp, messages in partitions.items() if messages}
+    fully_committed = all(
+        manager.consumer.committed.get(tp) == end for tp, end in expected.items()
+    )
+    print(f"messages:             {args.messages}")
+    print(f"elapsed:              {elapsed:.2f}s")
+    print(f"throughput:           {args.messages / elapsed:.1f} msg/s")
+    print(f"ordering violations:  {manager.ordering_violations}")
+    print(f"offsets committed:    {'all' if fully_committed else 'INCOMPLETE'}")
+    print(f"final concurrency:    {manager.concurrency.stats()}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="record-events consumer load test")
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--records", type=int, default=300, help="Distinct recordIds")
+    parser.add_argument("--partitions", type=int, default=6)
+    parser.add_argument("--latency-ms", type=float, default=200, help="Simulated downstream latency")
+    parser.add_argument("--cpu-ms", type=float, default=0, help="Simulated CPU work per message")
+    parser.add_argument("--max-records", type=int, default=100)
+    parser.add_argument("--concurrency", default="5:2:32", help="initial:min:max")
+    parser.add_argument("--seed", type=int, default=13)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
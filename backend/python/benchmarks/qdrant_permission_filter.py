@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Qdrant permission filter benchmark
+
+Compares the three ways search results can be restricted to accessible records:
+
+* legacy      - one FieldCondition(MatchValue) per virtualRecordId in a `should`
+* match_any   - chunked MatchAny over the virtualRecordIds (records mode)
+* principals  - MatchAny over the user's permission principals (principals mode)
+
+For 100, 10k and 100k accessible records it reports filter build time and the
+gRPC-serialized filter size. With --qdrant-host it also runs a hybrid-less dense
+query against an existing collection to measure query latency:
+
+    python benchmarks/qdrant_permission_filter.py --qdrant-host localhost \
+        --collection records --org-id <orgId>
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+import uuid
+from typing import Callable, List
+
+from qdrant_client import QdrantClient
+from qdrant_client.conversions.conversion import RestToGrpc
+from qdrant_client.http.models import FieldCondition, Filter, MatchValue
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.modules.retrieval.retrieval_service import RetrievalService  # noqa: E402
+
+
+def legacy_filter(org_id: str, virtual_record_ids: List[str]) -> Filter:
+    return Filter(
+        must=[
+            FieldCondition(key="metadata.orgId", match=MatchValue(value=org_id)),
+            Filter(
+                should=[
+                    FieldCondition(
+                        key="metadata.virtualRecordId", match=MatchValue(value=vrid)
+                    )
+                    for vrid in virtual_record_ids
+                ]
+            ),
+        ]
+    )
+
+
+def timed(fn: Callable[[], Filter], repeat: int) -> tuple:
+    samples = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append(time.perf_counter() - start)
+    return result, statistics.median(samples)
+
+
+def query_latency(
+    client: QdrantClient, collection: str, qdrant_filter: Filter, dim: int, repeat: int
+) -> float:
+    vector = [0.01] * dim
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        client.query_points(
+            collection_name=collection,
+            query=vector,
+            using="dense",
+            query_filter=qdrant_filter,
+            limit=20,
+        )
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Qdrant permission filter benchmark")
+    parser.add_argument("--sizes", default="100,10000,100000")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--org-id", default="benchmark-org")
+    parser.add_argument("--qdrant-host")
+    parser.add_argument("--qdrant-grpc-port", type=int, default=6334)
+    parser.add_argument("--qdrant-api-key")
+    parser.add_argument("--collection", default="records")
+    args = parser.parse_args()
+
+    # Only the filter builders are exercised, no embeddings are loaded
+    service = RetrievalService.__new__(RetrievalService)
+    principals = [f"users/{uuid.uuid4()}", f"organizations/{args.org_id}"] + [
+        f"groups/{uuid.uuid4()}" for _ in range(5)
+    ]
+
+    client = None
+    dim = 0
+    if args.qdrant_host:
+        client = QdrantClient(
+            host=args.qdrant_host,
+            grpc_port=args.qdrant_grpc_port,
+            api_key=args.qdrant_api_key,
+            prefer_grpc=True,
+            https=False,
+            timeout=180,
+        )
+        dim = client.get_collection(args.collection).config.params.vectors["dense"].size
+
+    header = f"{'records':>8} {'mode':>11} {'build (ms)':>11} {'filter bytes':>13}"
+    if client:
+        header += f" {'query (ms)':>11}"
+    print(header)
+
+    for size in (int(x) for x in args.sizes.split(",")):
+        virtual_record_ids = [str(uuid.uuid4()) for _ in range(size)]
+        builders = {
+            "legacy": lambda: legacy_filter(args.org_id, virtual_record_ids),
+            "match_any": lambda: service._build_qdrant_filter(
+                args.org_id, virtual_record_ids
+            ),
+            "principals": lambda: service._build_qdrant_filter(
+                args.org_id, virtual_record_ids, principals=principals
+            ),
+        }
+        for mode, build in builders.items():
+            qdrant_filter, build_time = timed(build, args.repeat)
+            size_bytes = RestToGrpc.convert_filter(qdrant_filter).ByteSize()
+            line = f"{size:>8} {mode:>11} {build_time * 1000:>11.2f} {size_bytes:>13}"
+            if client:
+                latency = query_latency(
+                    client, args.collection, qdrant_filter, dim, args.repeat
+                )
+                line += f" {latency * 1000:>11.2f}"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Prompt size, cost and render time of the QnA prompt
+
+Builds --results reranked chunks whose metadata carries the record, file and
+domain fields the indexing pipeline stores on every point, and renders the
+QnA prompt. Every --merged-every chunk carries a list blockText, as chunks
+merged by the semantic chunker do:
+
+* "previous": the former template, which listed every chunk with its full
+  metadata and was compiled with Template(qna_prompt) on each request
+* "compact": render_qna_prompt, one header per record, short chunk bodies
+  and the QNA_CONTEXT_MAX_TOKENS budget
+
+Reports estimated prompt tokens, input cost per answer at --usd-per-mtok and
+render time. Time to first token grows with prompt tokens but needs a live
+LLM, so it is not measured here.
+
+    python benchmarks/qna_context_size.py --results 50 --chunks-per-record 5
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Any, Dict, List
+
+from jinja2 import Template
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.modules.qna.context_builder import (  # noqa: E402
+    build_qna_context,
+    estimate_tokens,
+    render_qna_prompt,
+)
+from app.modules.qna.prompt_templates import qna_prompt  # noqa: E402
+
+PREVIOUS_CONTEXT = """      Context for Current Query:
+      {% for chunk in chunks %}
+      - Chunk Index: {{ loop.index }}
+      - Chunk Content: {{ chunk.metadata.blockText }}
+      - Chunk Metadata: {{ chunk.metadata }}
+      {% endfor %}"""
+COMPACT_CONTEXT = """      Context for Current Query (chunks grouped by the record they come from):
+{{ context }}"""
+
+WORDS = (
+    "inspect torque actuator seal hydraulic valve panel bracket fitting harness "
+    "landing gear brake assembly pressure limit leak check replace install "
+    "remove manual task card wing flap spoiler fuel pump filter sensor"
+).split()
+
+
+def build_results(
+    count: int, per_record: int, words: int, merged_every: int, seed: int
+) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    results = []
+    for i in range(count):
+        record = i // per_record
+        text = " ".join(rng.choice(WORDS) for _ in range(words))
+        metadata = {
+            "_key": f"rec-{record}",
+            "recordId": f"rec-{record}",
+            "virtualRecordId": f"vrec-{record}",
+            "orgId": "org-1",
+            "recordName": f"AMM chapter {record} task cards.pdf",
+            "recordType": "FILE",
+            "origin": "UPLOAD",
+            "connector": "LOCAL_STORAGE",
+            "version": 1,
+            "createdAtTimestamp": 1718000000000 + record,
+            "updatedAtTimestamp": 1718000500000 + record,
+            "sourceCreatedAtTimestamp": 1718000000000,
+            "lastIndexTimestamp": 1718001000000,
+            "indexingStatus": "COMPLETED",
+            "extractionStatus": "COMPLETED",
+            "isDeleted": False,
+            "isArchived": False,
+            "isLatestVersion": True,
+            "webUrl": f"https://example.com/records/rec-{record}",
+            "mimeType": "application/pdf",
+            "extension": "pdf",
+            "sizeInBytes": 1048576,
+            "departments": ["Maintenance", "Engineering"],
+            "categories": ["Landing Gear"],
+            "subcategoryLevel1": ["Actuators"],
+            "subcategoryLevel2": ["Seals"],
+            "subcategoryLevel3": [],
+            "topics": ["hydraulic leaks", "seal replacement", "inspection limits"],
+            "languages": ["English"],
+            "aircraft_canonical": "A320",
+            "aircraft_aliases": ["A320-200", "A320neo"],
+            "pageNum": [rng.randint(1, 400)],
+            "blockNum": [i],
+            "blockType": "text",
+            "blockText": text,
+        }
+        if i % merged_every == 0:
+            # Merged by the semantic chunker: differing blockTexts become a list
+            metadata["blockText"] = [text, " ".join(rng.choice(WORDS) for _ in range(words))]
+        results.append({"content": text, "score": 1 - i / count, "metadata": metadata})
+    return results
+
+
+def check_merged_chunk() -> None:
+    merged = {"content": "x", "metadata": {"recordId": "r", "blockText": ["a", "b", "a"]}}
+    context, kept = build_qna_context([merged])
+    if not context.endswith("Chunk Index: 1: a b") or len(kept) != 1:
+        raise SystemExit(f"Merged chunk rendered as {context!r}")
+
+
+def render_previous(user_data: str, query: str, results: List[Dict[str, Any]]) -> str:
+    template = Template(qna_prompt.replace(COMPACT_CONTEXT, PREVIOUS_CONTEXT))
+    return template.render(
+        user_data=user_data, query=query, rephrased_queries=[], chunks=results
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="QnA prompt size benchmark")
+    parser.add_argument("--results", type=int, default=50, help="Reranked chunks in the prompt")
+    parser.add_argument("--chunks-per-record", type=int, default=5)
+    parser.add_argument("--words", type=int, default=120, help="Words per chunk")
+    parser.add_argument(
+        "--merged-every", type=int, default=4, help="Every nth chunk is a merged chunk"
+    )
+    parser.add_argument("--usd-per-mtok", type=float, default=3.0, help="Input price per 1M tokens")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    if COMPACT_CONTEXT not in qna_prompt:
+        raise SystemExit("qna_prompt context section changed; update this benchmark")
+    check_merged_chunk()
+
+    results = build_results(
+        args.results, args.chunks_per_record, args.words, args.merged_every, seed=7
+    )
+    user_data = "Technician at Line Maintenance"
+    query = "What is the leak limit for the main landing gear actuator seal?"
+
+    print(f"{'mode':>9} {'tokens':>8} {'chunks':>7} {'$/answer':>9} {'render (ms)':>12}")
+    for name, render in (
+        ("previous", lambda: (render_previous(user_data, query, results), results)),
+        ("compact", lambda: render_qna_prompt(user_data, query, results)),
+    ):
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            prompt, kept = render()
+        elapsed = (time.perf_counter() - start) / args.repeat
+        tokens = estimate_tokens(prompt)
+        print(
+            f"{name:>9} {tokens:>8,} {len(kept):>7} "
+            f"{tokens * args.usd_per_mtok / 1_000_000:>9.4f} {elapsed * 1000:>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
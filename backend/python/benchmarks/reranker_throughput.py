@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Reranker throughput and latency under concurrent chats
+
+Each simulated chat reranks --candidates retrieval results of synthetic
+maintenance text, --turns times in a row, with --concurrency chats at once.
+Modes:
+
+* "blocking": the previous RerankerService behaviour, CrossEncoder.predict on
+  the event loop with full untruncated passages
+* one mode per --backends entry: RerankerService with that backend, scoring
+  on its worker thread with micro-batching and the passage token budget
+
+Reports pairs scored per second of wall time and p50/p99 latency of a single
+rerank call:
+
+    python benchmarks/reranker_throughput.py --concurrency 32 \
+        --backends onnx,int8,torch
+"""
+import argparse
+import asyncio
+import logging
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Awaitable, Callable, List
+
+from sentence_transformers import CrossEncoder
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.modules.reranker.reranker import RerankerService  # noqa: E402
+
+WORDS = (
+    "inspect torque actuator seal hydraulic valve panel bracket fitting harness "
+    "landing gear brake assembly pressure limit leak check replace install "
+    "remove manual task card wing flap spoiler fuel pump filter sensor"
+).split()
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def build_candidates(count: int, min_words: int, max_words: int, seed: int) -> List[dict]:
+    rng = random.Random(seed)
+    return [
+        {
+            "content": " ".join(rng.choice(WORDS) for _ in range(rng.randint(min_words, max_words))),
+            "score": rng.random(),
+        }
+        for _ in range(count)
+    ]
+
+
+async def run_chats(
+    rerank: Callable[[str, List[dict]], Awaitable[List[dict]]],
+    args: argparse.Namespace,
+) -> List[float]:
+    latencies: List[float] = []
+
+    async def chat(chat_idx: int) -> None:
+        for turn in range(args.turns):
+            candidates = build_candidates(
+                args.candidates, args.min_words, args.max_words, seed=chat_idx * 1000 + turn
+            )
+            query = f"torque limit for the {WORDS[chat_idx % len(WORDS)]} after replacement"
+            start = time.perf_counter()
+            await rerank(query, candidates)
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(chat(i) for i in range(args.concurrency)))
+    return latencies
+
+
+def blocking_rerank(model: CrossEncoder):
+    async def rerank(query: str, documents: List[dict]) -> List[dict]:
+        scores = model.predict([(query, doc["content"]) for doc in documents])
+        for doc, score in zip(documents, scores):
+            doc["reranker_score"] = float(score)
+        return documents
+
+    return rerank
+
+
+def report(mode: str, latencies: List[float], wall: float, pairs: int) -> None:
+    print(
+        f"{mode:>9} {pairs / wall:>10.1f} {percentile(latencies, 50):>9.3f} "
+        f"{percentile(latencies, 99):>9.3f} {statistics.mean(latencies):>9.3f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Reranker throughput benchmark")
+    parser.add_argument("--model", default="BAAI/bge-reranker-base")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--turns", type=int, default=3, help="Rerank calls per chat")
+    parser.add_argument("--candidates", type=int, default=40, help="Results reranked per call")
+    parser.add_argument("--min-words", type=int, default=80)
+    parser.add_argument("--max-words", type=int, default=600)
+    parser.add_argument("--backends", default="onnx,int8,torch")
+    parser.add_argument("--skip-blocking", action="store_true")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logger = logging.getLogger("reranker_throughput")
+    pairs = args.concurrency * args.turns * args.candidates
+    print(f"{args.concurrency} chats x {args.turns} turns x {args.candidates} candidates = {pairs} pairs")
+    print(f"{'mode':>9} {'pairs/s':>10} {'p50 (s)':>9} {'p99 (s)':>9} {'mean (s)':>9}")
+
+    if not args.skip_blocking:
+        model = CrossEncoder(args.model, device="cpu")
+        start = time.perf_counter()
+        latencies = asyncio.run(run_chats(blocking_rerank(model), args))
+        report("blocking", latencies, time.perf_counter() - start, pairs)
+
+    for backend in args.backends.split(","):
+        service = RerankerService(args.model, logger=logger, backend=backend)
+        start = time.perf_counter()
+        latencies = asyncio.run(run_chats(service.rerank, args))
+        report(service.backend, latencies, time.perf_counter() - start, pairs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Whole-document OCRmyPDF vs page-level OCR of PyMuPDFOCRStrategy
+
+Builds a synthetic PDF mixing digital pages (with a text layer) and scanned
+pages (the same kind of text rendered to an image, no text layer), then:
+
+* "ocrmypdf": the previous load path. Pages needing OCR are capped at 20% of
+  the document (max 50), OCRmyPDF regenerates the PDF with force_ocr, deskew,
+  clean and optimize=1, and the output is re-read and re-opened with PyMuPDF.
+* "page-level": PyMuPDFOCRStrategy.load_document, which rasterizes only the
+  flagged pages and runs Tesseract on them in the page pool.
+
+Pages covered counts the scanned pages whose text ends up extracted. Needs
+Tesseract (and OCRmyPDF's Ghostscript for the first mode):
+
+    python benchmarks/selective_ocr.py --pages 200 --scanned-every 4
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+
+import fitz
+import ocrmypdf
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.modules.parsers.pdf.pymupdf_ocrmypdf_processor import (  # noqa: E402
+    PyMuPDFOCRStrategy,
+)
+
+PARAGRAPH = (
+    "Inspect the main landing gear actuator for hydraulic fluid leaks before "
+    "each flight. Replace the seal kit if seepage exceeds the limits given in "
+    "the component maintenance manual, then torque the end fitting and record "
+    "the task in the aircraft technical log. "
+)
+
+
+def build_pdf(pages: int, scanned_every: int, dpi: int) -> tuple:
+    """Mixed PDF bytes and the 0-based indexes of its scanned pages"""
+    doc = fitz.open()
+    scanned = set()
+    for page_idx in range(pages):
+        text = f"Task {page_idx + 1}. " + PARAGRAPH * 8
+        if scanned_every and page_idx % scanned_every == scanned_every - 1:
+            source = fitz.open()
+            source_page = source.new_page()
+            source_page.insert_textbox(source_page.rect + (50, 50, -50, -50), text, fontsize=11)
+            pixmap = source_page.get_pixmap(dpi=dpi)
+            page = doc.new_page()
+            page.insert_image(page.rect, pixmap=pixmap)
+            source.close()
+            scanned.add(page_idx)
+        else:
+            page = doc.new_page()
+            page.insert_textbox(page.rect + (50, 50, -50, -50), text, fontsize=11)
+    data = doc.tobytes()
+    doc.close()
+    return data, scanned
+
+
+def whole_document_ocr(pdf: bytes, strategy: PyMuPDFOCRStrategy) -> set:
+    """Previous behaviour: capped OCRmyPDF run, then re-open the output"""
+    doc = fitz.open(stream=pdf, filetype="pdf")
+    pages_needing_ocr = [i + 1 for i, page in enumerate(doc) if strategy.needs_ocr(page)]
+    max_ocr_pages = min(max(1, int(len(doc) * 0.2)), 50)
+    pages_needing_ocr = pages_needing_ocr[:max_ocr_pages]
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        input_path = os.path.join(temp_dir, "input.pdf")
+        output_path = os.path.join(temp_dir, "output.pdf")
+        with open(input_path, "wb") as f:
+            f.write(pdf)
+        ocrmypdf.ocr(
+            input_path,
+            output_path,
+            language="eng",
+            output_type="pdf",
+            force_ocr=True,
+            optimize=1,
+            progress_bar=False,
+            deskew=True,
+            clean=True,
+            quiet=True,
+            rotate_pages=True,
+            rotate_pages_threshold=15.0,
+            tesseract_timeout=60,
+            jobs=min(os.cpu_count() or 2, 4),
+            pages=",".join(map(str, pages_needing_ocr)),
+        )
+        with open(output_path, "rb") as f:
+            ocr_doc = fitz.open("pdf", f.read())
+        covered = {i for i, page in enumerate(ocr_doc) if page.get_text().strip()}
+        ocr_doc.close()
+    return covered
+
+
+def page_level_ocr(pdf: bytes, strategy: PyMuPDFOCRStrategy) -> set:
+    asyncio.run(strategy.load_document(pdf))
+    result = strategy.document_analysis_result
+    return {page["page_number"] - 1 for page in result["pages"] if page["lines"]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Selective OCR benchmark")
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--scanned-every", type=int, default=4)
+    parser.add_argument("--dpi", type=int, default=150, help="Resolution of the scanned pages")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logger = logging.getLogger("selective_ocr")
+
+    pdf, scanned = build_pdf(args.pages, args.scanned_every, args.dpi)
+    print(f"{args.pages} pages, {len(scanned)} scanned, {len(pdf) / 1e6:.1f} MB")
+    print(f"{'mode':>11} {'seconds':>8} {'scanned pages covered':>22}")
+
+    for name, run in (("ocrmypdf", whole_document_ocr), ("page-level", page_level_ocr)):
+        strategy = PyMuPDFOCRStrategy(logger)
+        start = time.perf_counter()
+        covered = run(pdf, strategy)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>11} {elapsed:>8.2f} {len(covered & scanned):>14} / {len(scanned)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Semantic chunker benchmark
+
+Times CustomChunker.split_documents on synthetic 1k, 10k and 50k-sentence
+documents and compares its distance computation with LangChain's
+SemanticChunker (which embeds every buffered window text and computes cosine
+distances pair by pair in Python).
+
+A deterministic hashing embedder stands in for the dense model so the numbers
+isolate chunker overhead; pass --model to embed with a real sentence-transformers
+model instead (expect the LangChain path to embed ~3x the text):
+
+    python benchmarks/semantic_chunker.py --sizes 1000,10000,50000
+"""
+import argparse
+import hashlib
+import logging
+import os
+import sys
+import time
+from typing import List
+
+import numpy as np
+from langchain.schema import Document
+from langchain_experimental.text_splitter import SemanticChunker
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.modules.indexing import run  # noqa: E402
+from app.modules.indexing.run import CustomChunker  # noqa: E402
+
+TOPICS = ["hydraulic", "landing gear", "avionics", "fuel system", "engine", "cabin"]
+
+
+class HashingEmbeddings:
+    """Deterministic bag-of-words embeddings, cheap enough to not dominate timings"""
+
+    def __init__(self, dim: int = 384) -> None:
+        self.dim = dim
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in text.split():
+                digest = hashlib.blake2b(word.encode("utf-8"), digest_size=4).digest()
+                vectors[row, int.from_bytes(digest, "little") % self.dim] += 1.0
+        return vectors.tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+
+def synthetic_documents(count: int) -> List[Document]:
+    documents = []
+    for i in range(count):
+        topic = TOPICS[(i // 25) % len(TOPICS)]
+        documents.append(
+            Document(
+                page_content=f"Inspect the {topic} component {i % 40} per task {i // 7} before flight.",
+                metadata={
+                    "recordId": "benchmark-record",
+                    "virtualRecordId": "benchmark-virtual-record",
+                    "pageNum": [i // 40 + 1],
+                    "blockNum": [i],
+                    "blockType": "text",
+                    "confidence_score": 0.9,
+                    "bounding_box": [
+                        {"x": 0.1, "y": (i % 40) / 40},
+                        {"x": 0.9, "y": (i % 40) / 40},
+                        {"x": 0.9, "y": (i % 40 + 1) / 40},
+                        {"x": 0.1, "y": (i % 40 + 1) / 40},
+                    ],
+                },
+            )
+        )
+    return documents
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Semantic chunker benchmark")
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    parser.add_argument("--model", help="sentence-transformers model name to embed with")
+    parser.add_argument("--skip-langchain", action="store_true", help="Only time CustomChunker")
+    args = parser.parse_args()
+
+    if args.model:
+        from langchain_huggingface import HuggingFaceEmbeddings
+
+        embeddings = HuggingFaceEmbeddings(model_name=args.model)
+    else:
+        embeddings = HashingEmbeddings()
+
+    logger = logging.getLogger("chunker-benchmark")
+    sizes = [int(x) for x in args.sizes.split(",")]
+    # Measure the chunker itself rather than the pre-merge cap
+    run.CHUNKER_MAX_SENTENCES = max(sizes)
+
+    print(f"{'sentences':>9} {'chunks':>7} {'distances (s)':>14} {'split (s)':>10} {'langchain distances (s)':>24}")
+    for size in sizes:
+        documents = synthetic_documents(size)
+        texts = [doc.page_content for doc in documents]
+        chunker = CustomChunker(
+            logger=logger,
+            embeddings=embeddings,
+            breakpoint_threshold_type="percentile",
+            breakpoint_threshold_amount=95,
+        )
+
+        start = time.perf_counter()
+        chunker._calculate_distances(texts)
+        distance_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        chunks = chunker.split_documents(documents)
+        split_time = time.perf_counter() - start
+
+        langchain_time = float("nan")
+        if not args.skip_langchain:
+            start = time.perf_counter()
+            SemanticChunker._calculate_sentence_distances(chunker, texts)
+            langchain_time = time.perf_counter() - start
+
+        print(
+            f"{size:>9} {len(chunks):>7} {distance_time:>14.3f} {split_time:>10.3f} "
+            f"{langchain_time:>24.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
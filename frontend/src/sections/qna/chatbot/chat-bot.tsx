@@ -280,9 +280,10 @@ class StreamingManager {
 
     const currentState = this.conversationStates[conversationKey];
     const updatedAccumulatedContent = (currentState?.accumulatedContent || '') + newChunk;
+    // Each answer_chunk only carries the citations it introduced
     const { processedContent, processedCitations } = processStreamingContentLegacy(
       updatedAccumulatedContent,
-      citations.length > 0 ? citations : currentState?.citations || []
+      [...(currentState?.citations || []), ...citations]
     );
 
     this.updateConversationState(conversationKey, {